@@ -3,7 +3,7 @@ from __future__ import annotations
 import os
 from contextvars import ContextVar
 from functools import lru_cache
-from typing import Any, Mapping
+from typing import Any, Callable, Mapping
 
 from deepagents import create_deep_agent
 from langgraph.types import Command
@@ -16,6 +16,7 @@ from app.agents.deep_chat_agent_utils import (
     extract_interrupt_requests_from_state,
     extract_latest_tool_payload,
     resolve_thread_id,
+    stream_graph_turn,
 )
 from app.agents.prompts import get_agent_system_prompt, get_default_agent_system_prompt
 from app.agents.subagents import get_agent_subagents
@@ -150,13 +151,19 @@ class DeepChatAgent:
         self._last_assistant_answer_ctx.set(answer)
         return answer or FALLBACK_EMPTY_RESPONSE
 
-    def execute_turn(self, user_message: str, thread_id: str | None = None) -> dict[str, Any]:
+    def execute_turn(
+        self,
+        user_message: str,
+        thread_id: str | None = None,
+        delta_callback: Callable[[str], None] | None = None,
+    ) -> dict[str, Any]:
         """
         사용자 입력 1턴을 실행하고 완료/인터럽트 상태를 반환한다.
 
         Args:
             user_message: 사용자 입력 문장
             thread_id: LangGraph short-term memory 스레드 식별자
+            delta_callback: 모델 delta 스트리밍 콜백(선택)
 
         Returns:
             실행 결과 사전
@@ -171,6 +178,7 @@ class DeepChatAgent:
         result = self._invoke_graph(
             payload=payload,
             thread_id=normalized_thread_id,
+            delta_callback=delta_callback,
         )
         return self._build_turn_response(
             result=result,
@@ -261,20 +269,29 @@ class DeepChatAgent:
         """
         return self._last_raw_model_content_ctx.get()
 
-    def _invoke_graph(self, payload: dict[str, Any] | Command, thread_id: str) -> Mapping[str, Any] | object:
+    def _invoke_graph(
+        self,
+        payload: dict[str, Any] | Command,
+        thread_id: str,
+        delta_callback: Callable[[str], None] | None = None,
+    ) -> Mapping[str, Any] | object:
         """
-        내부 graph invoke를 공통 실행한다.
+        내부 graph invoke를 공통 실행한다(delta 콜백이 있으면 스트리밍 실행).
 
         Args:
             payload: graph 입력 페이로드
             thread_id: 스레드 식별자
+            delta_callback: 모델 delta 스트리밍 콜백(선택)
 
         Returns:
             graph invoke 결과 객체
         """
         if is_prompt_trace_enabled():
             logger.info("prompt_trace.agent_invoke_payload: %s", payload)
-        return self._graph.invoke(payload, config={"configurable": {"thread_id": thread_id}})
+        config = {"configurable": {"thread_id": thread_id}}
+        if callable(delta_callback):
+            return stream_graph_turn(graph=self._graph, payload=payload, config=config, delta_callback=delta_callback)
+        return self._graph.invoke(payload, config=config)
 
     def _build_turn_response(self, result: object, thread_id: str, user_message: str = "") -> dict[str, Any]:
         """
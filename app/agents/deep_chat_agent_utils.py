@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Any, Mapping
+from typing import Any, Callable, Mapping
 
 from langchain_core.messages import BaseMessage
 
 from app.agents.tool_payload_selector import extract_preferred_tool_payload_from_messages
 from app.core.intent_rules import is_mail_search_query
+from app.core.llm_runtime_stream import extract_delta_text
 
 
 def extract_text_from_content(content: object) -> str:
@@ -175,3 +176,63 @@ def resolve_thread_id(thread_id: str | None) -> str:
     if normalized:
         return normalized
     return f"outlook_{int(datetime.now(tz=timezone.utc).timestamp())}"
+
+
+def stream_graph_turn(
+    graph: Any,
+    payload: object,
+    config: dict[str, Any],
+    delta_callback: Callable[[str], None],
+) -> Mapping[str, Any] | object:
+    """
+    graph를 스트리밍 실행해 최상위 agent 모델 delta를 전달하고 invoke와 같은 결과를 반환한다.
+
+    Args:
+        graph: LangGraph 컴파일 graph
+        payload: graph 입력 페이로드
+        config: graph 실행 config
+        delta_callback: 모델 delta 콜백
+
+    Returns:
+        최종 state(인터럽트 발생 시 `__interrupt__` 포함)
+    """
+    latest: Mapping[str, Any] | object = {}
+    interrupts: list[Any] = []
+    for mode, chunk in graph.stream(payload, config=config, stream_mode=["messages", "updates", "values"]):
+        if mode == "messages":
+            delta = _extract_top_level_model_delta(chunk=chunk)
+            if delta:
+                delta_callback(delta)
+        elif mode == "updates":
+            if isinstance(chunk, Mapping) and chunk.get("__interrupt__"):
+                interrupts.extend(list(chunk["__interrupt__"]))
+        elif mode == "values":
+            latest = chunk
+    if interrupts and isinstance(latest, Mapping):
+        return {**latest, "__interrupt__": interrupts}
+    return latest
+
+
+def _extract_top_level_model_delta(chunk: object) -> str:
+    """
+    messages 스트림 chunk에서 최상위 agent 모델의 텍스트 delta만 추출한다.
+
+    subagent/tool 내부 모델(중첩 namespace) 출력과 tool 메시지는 제외한다.
+
+    Args:
+        chunk: `(message_chunk, metadata)` 튜플
+
+    Returns:
+        텍스트 delta(대상이 아니면 빈 문자열)
+    """
+    if not isinstance(chunk, tuple) or len(chunk) != 2:
+        return ""
+    message, metadata = chunk
+    if str(getattr(message, "type", "") or "") not in {"AIMessageChunk", "ai"}:
+        return ""
+    namespace = ""
+    if isinstance(metadata, Mapping):
+        namespace = str(metadata.get("langgraph_checkpoint_ns") or metadata.get("checkpoint_ns") or "")
+    if "|" in namespace:
+        return ""
+    return extract_delta_text(content=getattr(message, "content", ""))
@@ -0,0 +1,381 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from app.agents.intent_parse_cache import (
+    DEFAULT_INTENT_PARSE_CACHE_TTL_SEC,
+    INTENT_PARSE_CACHE_TTL_SEC_ENV,
+    MemoryIntentParseCache,
+)
+from app.agents.intent_parser_utils import build_date_filter, infer_intent_dimensions
+from app.agents.intent_schema import ExecutionStep, IntentDecomposition
+from app.core.env_config import resolve_positive_int_env
+from app.core.intent_rules import extract_summary_line_target
+from app.core.logging_config import get_logger
+from app.core.query_features import get_query_features
+from app.services.mail_vector_embedding import build_hash_embedding, cosine_similarities
+
+INTENT_NEAR_DUPLICATE_ENABLED_ENV = "MOLDUBOT_INTENT_NEAR_DUPLICATE_ENABLED"
+INTENT_SIMILARITY_THRESHOLD_ENV = "MOLDUBOT_INTENT_SIMILARITY_THRESHOLD"
+DEFAULT_INTENT_SIMILARITY_THRESHOLD = 0.9
+DEFAULT_NEAR_DUPLICATE_MAX_ENTRIES = 512
+LINE_SLOT = "{lines}"
+DATE_SLOT = "{date}"
+LINE_SLOT_PATTERN = re.compile(r"\d{1,2}\s*(?:줄|개|가지)")
+DATE_SLOT_PATTERNS: tuple[re.Pattern[str], ...] = (
+    re.compile(r"\d{4}-\d{1,2}-\d{1,2}"),
+    re.compile(r"최근\s*\d{1,2}\s*주"),
+    re.compile(r"\d{1,2}\s*주\s*전"),
+    re.compile(r"(?:\d{4}\s*년\s*)?\d{1,2}\s*월(?:달)?(?:\s*\d{1,2}\s*일)?"),
+    re.compile(r"오늘|어제|내일|이번\s*주|지난\s*주|최근"),
+)
+PARTICLE_SUFFIXES: tuple[str, ...] = ("에서", "으로", "을", "를", "은", "는", "이", "가", "의", "에", "로", "와", "과", "도", "만")
+REQUEST_ENDING_PATTERN = re.compile(
+    r"(?:(?:해|아|어)?(?:주세요|줘요|줄래요?|주실래요|줘|주라)|부탁해요?|부탁드립니다|부탁드려요|좀)$"
+)
+PUNCTUATION_PATTERN = re.compile(r"[?!.,~…\"'`]+")
+# 유사도 단계는 글자 bigram만 보므로 `표로`/`번역`처럼 한두 글자 차이로 의도가 바뀌는 질의를 가르지 못한다.
+# 아래 작업 키워드 그룹과 규칙 추출 차원이 모두 같을 때만 유사도 재사용을 허용한다.
+TASK_KEYWORD_GROUPS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("reply", ("회신", "답장", "reply")),
+    ("draft", ("초안", "작성", "써줘", "draft")),
+    ("summary", ("요약", "정리", "summary", "summarize")),
+    ("search", ("찾아", "검색", "search")),
+    ("extract", ("추출", "수신자", "참조")),
+    ("schedule", ("일정", "예약", "등록")),
+)
+# 예약/일정 생성은 시간·인원 등 문장 속 값이 슬롯이라 근사 재사용하면 누락 슬롯이 틀어진다.
+NON_REUSABLE_STEPS = frozenset({ExecutionStep.BOOK_MEETING_ROOM, ExecutionStep.BOOK_CALENDAR_EVENT})
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class IntentQuerySignature:
+    """
+    질의의 정규화 시그니처와 추출 슬롯.
+
+    Attributes:
+        template: 공백/조사/요청 어미/슬롯 값을 지운 정규형(`{lines}`/`{date}` 자리표시자 포함)
+        has_line_slot: 요약 줄 수 표현이 있었는지 여부
+        has_date_slot: 날짜 표현이 있었는지 여부
+        summary_line_target: 질의에서 추출한 요약 줄 수
+        rule_features: 규칙 추출 의도 특징(질의 플래그, 작업/출력 형식/관심 주제, 작업 키워드 그룹)
+    """
+
+    template: str
+    has_line_slot: bool
+    has_date_slot: bool
+    summary_line_target: int
+    rule_features: tuple[Any, ...]
+
+
+def build_intent_query_signature(sanitized_query: str) -> IntentQuerySignature:
+    """
+    질의를 표기 차이(띄어쓰기, 조사, 요청 어미, 줄 수/날짜 값)에 둔감한 시그니처로 바꾼다.
+
+    Args:
+        sanitized_query: sanitize된 사용자 질의
+
+    Returns:
+        정규화 시그니처
+    """
+    text = str(sanitized_query or "").strip().lower()
+    text, line_count = LINE_SLOT_PATTERN.subn(f" {LINE_SLOT} ", text)
+    date_count = 0
+    for pattern in DATE_SLOT_PATTERNS:
+        text, replaced = pattern.subn(f" {DATE_SLOT} ", text)
+        date_count += replaced
+    text = PUNCTUATION_PATTERN.sub(" ", text)
+    tokens = [_strip_particle(token=token) for token in text.split() if token not in PARTICLE_SUFFIXES]
+    compact = "".join(tokens)
+    previous = ""
+    while compact and compact != previous:
+        previous = compact
+        compact = REQUEST_ENDING_PATTERN.sub("", compact)
+    return IntentQuerySignature(
+        template=compact,
+        has_line_slot=line_count > 0,
+        has_date_slot=date_count > 0,
+        summary_line_target=extract_summary_line_target(user_message=sanitized_query),
+        rule_features=build_rule_feature_key(sanitized_query=sanitized_query),
+    )
+
+
+def build_rule_feature_key(sanitized_query: str) -> tuple[Any, ...]:
+    """
+    유사도 재사용 허용 여부를 가를 규칙 기반 의도 특징을 만든다.
+
+    Args:
+        sanitized_query: sanitize된 사용자 질의
+
+    Returns:
+        `QueryFeatures` 플래그, 규칙 추론 작업/출력 형식/관심 주제, 작업 키워드 그룹을 묶은 튜플
+    """
+    features = get_query_features(user_message=sanitized_query)
+    task_type, output_format, focus_topics, _ = infer_intent_dimensions(user_message=sanitized_query, steps=[])
+    lowered = str(sanitized_query or "").lower()
+    task_groups = tuple(name for name, tokens in TASK_KEYWORD_GROUPS if any(token in lowered for token in tokens))
+    return (
+        features.is_mail_summary_skill,
+        features.is_explicit_skill,
+        features.is_code_review,
+        features.is_translation_like,
+        features.has_current_mail_anchor,
+        features.is_current_mail_summary,
+        task_type,
+        output_format,
+        tuple(focus_topics),
+        task_groups,
+    )
+
+
+def resubstitute_intent_slots(
+    cached: IntentDecomposition,
+    signature: IntentQuerySignature,
+    sanitized_query: str,
+) -> IntentDecomposition | None:
+    """
+    근사 일치한 캐시 구조분해에 새 질의의 원문/줄 수/날짜 슬롯을 다시 채운다.
+
+    캐시 값이 자기 원문의 규칙 추출 결과와 다르면(LLM이 문맥으로 다르게 해석한 경우) 값을
+    안전하게 바꿀 수 없으므로 재사용하지 않는다.
+
+    Args:
+        cached: 근사 일치한 캐시 구조분해
+        signature: 새 질의 시그니처
+        sanitized_query: 새 질의
+
+    Returns:
+        슬롯을 치환한 구조분해(재사용 불가 시 None)
+    """
+    if any(step in NON_REUSABLE_STEPS for step in cached.steps):
+        return None
+    cached_signature = build_intent_query_signature(sanitized_query=cached.original_query)
+    if (cached_signature.has_line_slot, cached_signature.has_date_slot) != (signature.has_line_slot, signature.has_date_slot):
+        return None
+    update: dict[str, Any] = {"original_query": sanitized_query, "origin": "llm_cached"}
+    if signature.has_line_slot:
+        if cached.summary_line_target != cached_signature.summary_line_target:
+            return None
+        update["summary_line_target"] = signature.summary_line_target
+    if signature.has_date_slot:
+        if cached.date_filter != build_date_filter(user_message=cached.original_query):
+            return None
+        update["date_filter"] = build_date_filter(user_message=sanitized_query)
+    return cached.model_copy(update=update, deep=True)
+
+
+class NearDuplicateIntentIndex:
+    """
+    정확 일치 캐시 다음 단계로 쓰는 근사 중복 질의 인덱스.
+
+    1) 같은 시그니처면 슬롯만 치환해 재사용하고, 2) 마지막 수단으로 규칙 추출 의도 특징이 같은 항목 중
+    시그니처 글자 bigram의 해시 임베딩 유사도가 임계값 이상인 항목을 재사용한다.
+    """
+
+    def __init__(
+        self,
+        similarity_threshold: float = DEFAULT_INTENT_SIMILARITY_THRESHOLD,
+        max_entries: int = DEFAULT_NEAR_DUPLICATE_MAX_ENTRIES,
+        ttl_sec: int = DEFAULT_INTENT_PARSE_CACHE_TTL_SEC,
+    ) -> None:
+        """
+        인덱스를 초기화한다.
+
+        Args:
+            similarity_threshold: 유사도 재사용 임계값(1 초과면 유사도 단계 비활성)
+            max_entries: 최대 보관 시그니처 수
+            ttl_sec: 항목 보존 시간(초)
+        """
+        self._similarity_threshold = float(similarity_threshold)
+        self._max_entries = max(1, int(max_entries))
+        self._entries = MemoryIntentParseCache(max_entries=self._max_entries, ttl_sec=ttl_sec)
+        self._vectors: OrderedDict[str, tuple[str, tuple[Any, ...], bool, bool, list[float]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"signature_hits": 0, "similarity_hits": 0, "misses": 0, "rejected": 0}
+
+    def lookup(self, sanitized_query: str, namespace: str) -> IntentDecomposition | None:
+        """
+        근사 중복 질의의 구조분해를 찾아 슬롯을 치환해 반환한다.
+
+        Args:
+            sanitized_query: sanitize된 사용자 질의
+            namespace: 선택메일 namespace와 파서 버전을 합친 구분자
+
+        Returns:
+            재사용 가능한 구조분해(없으면 None)
+        """
+        signature = build_intent_query_signature(sanitized_query=sanitized_query)
+        if not signature.template:
+            return None
+        key = _build_signature_key(namespace=namespace, template=signature.template)
+        stat_name = "signature_hits"
+        cached = self._entries.get(key=key)
+        if cached is None:
+            key = self._find_similar_key(signature=signature, namespace=namespace)
+            cached = self._entries.get(key=key) if key else None
+            stat_name = "similarity_hits"
+        if cached is None:
+            self._increment(name="misses")
+            return None
+        reused = resubstitute_intent_slots(cached=cached, signature=signature, sanitized_query=sanitized_query)
+        self._increment(name=stat_name if reused is not None else "rejected")
+        if reused is not None:
+            logger.info("intent_near_duplicate.hit: kind=%s template=%s", stat_name, signature.template)
+        return reused
+
+    def remember(self, sanitized_query: str, namespace: str, decomposition: IntentDecomposition) -> None:
+        """
+        파싱 결과를 시그니처 기준으로 기록한다.
+
+        Args:
+            sanitized_query: sanitize된 사용자 질의
+            namespace: 선택메일 namespace와 파서 버전을 합친 구분자
+            decomposition: 저장할 구조분해
+        """
+        signature = build_intent_query_signature(sanitized_query=sanitized_query)
+        if not signature.template or any(step in NON_REUSABLE_STEPS for step in decomposition.steps):
+            return
+        key = _build_signature_key(namespace=namespace, template=signature.template)
+        self._entries.put(key=key, decomposition=decomposition.model_copy(update={"original_query": sanitized_query}))
+        vector = build_hash_embedding(text=_to_bigram_text(template=signature.template))
+        with self._lock:
+            self._vectors[key] = (
+                namespace,
+                signature.rule_features,
+                signature.has_line_slot,
+                signature.has_date_slot,
+                vector,
+            )
+            self._vectors.move_to_end(key)
+            while len(self._vectors) > self._max_entries:
+                self._vectors.popitem(last=False)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        근사 중복 단계 hit/miss 카운터를 반환한다.
+
+        Returns:
+            카운터 사전(hit_rate/임계값 포함)
+        """
+        with self._lock:
+            stats: dict[str, Any] = dict(self._stats)
+            stats["entries"] = len(self._vectors)
+        lookups = stats["signature_hits"] + stats["similarity_hits"] + stats["misses"] + stats["rejected"]
+        hits = stats["signature_hits"] + stats["similarity_hits"]
+        stats["hit_rate"] = round(hits / lookups, 4) if lookups else 0.0
+        stats["similarity_threshold"] = self._similarity_threshold
+        return stats
+
+    def _find_similar_key(self, signature: IntentQuerySignature, namespace: str) -> str:
+        """
+        같은 namespace·규칙 의도 특징·슬롯 구성 항목 중 유사도가 임계값 이상인 최고 항목 키를 찾는다.
+
+        Args:
+            signature: 새 질의 시그니처
+            namespace: 선택메일 namespace와 파서 버전을 합친 구분자
+
+        Returns:
+            항목 키(없으면 빈 문자열)
+        """
+        if self._similarity_threshold > 1.0:
+            return ""
+        with self._lock:
+            candidates = [
+                (key, vector)
+                for key, (entry_namespace, rule_features, has_line_slot, has_date_slot, vector) in self._vectors.items()
+                if entry_namespace == namespace
+                and rule_features == signature.rule_features
+                and has_line_slot == signature.has_line_slot
+                and has_date_slot == signature.has_date_slot
+            ]
+        if not candidates:
+            return ""
+        query_vector = build_hash_embedding(text=_to_bigram_text(template=signature.template))
+        scores = cosine_similarities(query=query_vector, vectors=[vector for _, vector in candidates])
+        best_index = max(range(len(scores)), key=scores.__getitem__)
+        if scores[best_index] < self._similarity_threshold:
+            return ""
+        return candidates[best_index][0]
+
+    def _increment(self, name: str) -> None:
+        """
+        카운터를 1 증가시킨다.
+
+        Args:
+            name: 카운터 이름
+        """
+        with self._lock:
+            self._stats[name] += 1
+
+
+def build_near_duplicate_intent_index() -> NearDuplicateIntentIndex | None:
+    """
+    환경변수 설정으로 근사 중복 인덱스를 만든다.
+
+    Returns:
+        인덱스(비활성화 시 None)
+    """
+    enabled = str(os.getenv(INTENT_NEAR_DUPLICATE_ENABLED_ENV, "1")).strip().lower()
+    if enabled in {"0", "false", "off", "no"}:
+        return None
+    raw_threshold = str(os.getenv(INTENT_SIMILARITY_THRESHOLD_ENV, "")).strip()
+    try:
+        threshold = float(raw_threshold) if raw_threshold else DEFAULT_INTENT_SIMILARITY_THRESHOLD
+    except ValueError:
+        threshold = DEFAULT_INTENT_SIMILARITY_THRESHOLD
+    ttl_sec = resolve_positive_int_env(INTENT_PARSE_CACHE_TTL_SEC_ENV, DEFAULT_INTENT_PARSE_CACHE_TTL_SEC)
+    return NearDuplicateIntentIndex(similarity_threshold=threshold, ttl_sec=ttl_sec)
+
+
+def _strip_particle(token: str) -> str:
+    """
+    토큰 끝 조사를 제거한다(남는 어간이 2글자 이상일 때만).
+
+    Args:
+        token: 공백 기준 토큰
+
+    Returns:
+        조사를 제거한 토큰
+    """
+    for particle in PARTICLE_SUFFIXES:
+        if token.endswith(particle) and len(token) - len(particle) >= 2:
+            return token[: -len(particle)]
+    return token
+
+
+def _to_bigram_text(template: str) -> str:
+    """
+    띄어쓰기와 무관한 유사도를 위해 시그니처를 글자 bigram 토큰열로 바꾼다.
+
+    Args:
+        template: 정규화 시그니처
+
+    Returns:
+        공백으로 구분한 bigram 문자열
+    """
+    text = re.sub(r"[^가-힣A-Za-z0-9]", "", template)
+    if len(text) < 2:
+        return text
+    return " ".join(text[index : index + 2] for index in range(len(text) - 1))
+
+
+def _build_signature_key(namespace: str, template: str) -> str:
+    """
+    namespace와 시그니처를 결합한 항목 키를 만든다.
+
+    Args:
+        namespace: 선택메일 namespace와 파서 버전을 합친 구분자
+        template: 정규화 시그니처
+
+    Returns:
+        sha256 16진수 키
+    """
+    return hashlib.sha256(f"{namespace}|{template}".encode("utf-8")).hexdigest()
@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Protocol
+
+from pydantic import ValidationError
+
+from app.agents.intent_schema import IntentDecomposition
+from app.core.env_config import resolve_positive_int_env
+from app.core.llm_response_cache import LLMResponseCache
+from app.core.logging_config import get_logger
+
+INTENT_PARSE_CACHE_BACKEND_ENV = "MOLDUBOT_INTENT_PARSE_CACHE_BACKEND"
+INTENT_PARSE_CACHE_SIZE_ENV = "MOLDUBOT_INTENT_PARSE_CACHE_SIZE"
+INTENT_PARSE_CACHE_TTL_SEC_ENV = "MOLDUBOT_INTENT_PARSE_CACHE_TTL_SEC"
+INTENT_PARSE_CACHE_PATH_ENV = "MOLDUBOT_INTENT_PARSE_CACHE_PATH"
+INTENT_PARSE_CACHE_MAX_ENTRIES_ENV = "MOLDUBOT_INTENT_PARSE_CACHE_MAX_ENTRIES"
+INTENT_PARSE_CACHE_BACKEND_MEMORY = "memory"
+INTENT_PARSE_CACHE_BACKEND_SQLITE = "sqlite"
+DEFAULT_INTENT_PARSE_CACHE_SIZE = 128
+DEFAULT_INTENT_PARSE_CACHE_TTL_SEC = 24 * 60 * 60
+DEFAULT_INTENT_PARSE_CACHE_MAX_ENTRIES = 20000
+ROOT_DIR = Path(__file__).resolve().parents[2]
+DEFAULT_INTENT_PARSE_CACHE_PATH = ROOT_DIR / "data" / "sqlite" / "intent_parse_cache.db"
+
+logger = get_logger(__name__)
+
+
+class IntentParseCache(Protocol):
+    """intent 구조분해 캐시 backend 인터페이스."""
+
+    def get(self, key: str) -> IntentDecomposition | None:
+        """키에 해당하는 구조분해 사본을 반환한다(miss/만료 시 None)."""
+
+    def put(self, key: str, decomposition: IntentDecomposition) -> None:
+        """구조분해를 저장한다."""
+
+    def get_stats(self) -> dict[str, Any]:
+        """hit/miss 카운터를 반환한다."""
+
+
+def build_intent_parse_cache_key(
+    sanitized_query: str,
+    has_selected_mail: bool,
+    selected_message_id_exists: bool,
+    version: str,
+) -> str:
+    """
+    질의/선택메일 namespace/파서 버전을 결합한 캐시 키를 만든다.
+
+    Args:
+        sanitized_query: sanitize된 사용자 질의
+        has_selected_mail: selected_mail namespace 플래그
+        selected_message_id_exists: selected_message_id namespace 플래그
+        version: 프롬프트/스키마/모델 버전 태그
+
+    Returns:
+        sha256 16진수 키
+    """
+    namespace = (
+        f"has_selected_mail={int(bool(has_selected_mail))}|"
+        f"selected_message_id_exists={int(bool(selected_message_id_exists))}"
+    )
+    return hashlib.sha256(f"{version}|{namespace}|{sanitized_query}".encode("utf-8")).hexdigest()
+
+
+class MemoryIntentParseCache:
+    """
+    lock으로 보호되는 프로세스 내 TTL LRU 캐시.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_INTENT_PARSE_CACHE_SIZE,
+        ttl_sec: int = DEFAULT_INTENT_PARSE_CACHE_TTL_SEC,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        캐시를 초기화한다.
+
+        Args:
+            max_entries: 최대 보관 건수(초과 시 가장 오래 사용하지 않은 항목 축출)
+            ttl_sec: 항목 보존 시간(초)
+            clock: 단조 시계(테스트 주입용)
+        """
+        self._max_entries = max(1, int(max_entries))
+        self._ttl_sec = max(1, int(ttl_sec))
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[IntentDecomposition, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "writes": 0, "expired": 0, "evictions": 0}
+
+    def get(self, key: str) -> IntentDecomposition | None:
+        """
+        캐시된 구조분해 사본을 반환한다.
+
+        Args:
+            key: `build_intent_parse_cache_key` 결과
+
+        Returns:
+            구조분해 사본(miss/만료 시 None)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            decomposition, expires_at = entry
+            if self._clock() >= expires_at:
+                self._entries.pop(key, None)
+                self._stats["misses"] += 1
+                self._stats["expired"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+        return decomposition.model_copy(deep=True)
+
+    def put(self, key: str, decomposition: IntentDecomposition) -> None:
+        """
+        구조분해 사본을 저장하고 초과 항목을 축출한다.
+
+        Args:
+            key: `build_intent_parse_cache_key` 결과
+            decomposition: 저장할 구조분해
+        """
+        stored = decomposition.model_copy(deep=True)
+        with self._lock:
+            self._entries[key] = (stored, self._clock() + self._ttl_sec)
+            self._entries.move_to_end(key)
+            self._stats["writes"] += 1
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        hit/miss 카운터를 반환한다.
+
+        Returns:
+            카운터 사전(hit_rate/현재 건수 포함)
+        """
+        with self._lock:
+            stats: dict[str, Any] = dict(self._stats)
+            stats["entries"] = len(self._entries)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        return stats
+
+
+class SqliteIntentParseCache:
+    """
+    여러 worker 프로세스가 공유하는 SQLite 구조분해 캐시.
+
+    저장/만료/축출은 `LLMResponseCache`를 그대로 쓰고, 값은 구조분해 JSON으로 보관한다.
+    """
+
+    def __init__(self, db_path: Path, ttl_sec: int, max_entries: int) -> None:
+        """
+        캐시를 초기화한다.
+
+        Args:
+            db_path: 캐시 sqlite 경로
+            ttl_sec: 항목 보존 시간(초)
+            max_entries: 최대 보관 건수
+        """
+        self._store = LLMResponseCache(db_path=db_path, ttl_sec=ttl_sec, max_entries=max_entries)
+
+    def get(self, key: str) -> IntentDecomposition | None:
+        """
+        캐시된 구조분해를 역직렬화해 반환한다.
+
+        Args:
+            key: `build_intent_parse_cache_key` 결과
+
+        Returns:
+            구조분해(miss/만료/손상 시 None)
+        """
+        cached = self._store.get(key=key)
+        if cached is None:
+            return None
+        try:
+            return IntentDecomposition.model_validate_json(cached)
+        except ValidationError as exc:
+            logger.warning("intent_parse_cache_invalid: %s", exc)
+            return None
+
+    def put(self, key: str, decomposition: IntentDecomposition) -> None:
+        """
+        구조분해를 JSON으로 저장한다.
+
+        Args:
+            key: `build_intent_parse_cache_key` 결과
+            decomposition: 저장할 구조분해
+        """
+        self._store.put(key=key, response_text=decomposition.model_dump_json())
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        hit/miss 카운터를 반환한다.
+
+        Returns:
+            카운터 사전(hit_rate/db_path 포함)
+        """
+        return self._store.get_stats()
+
+
+class TieredIntentParseCache:
+    """
+    메모리 LRU를 앞단에 두고 miss 시 공유 SQLite를 조회하는 2단 캐시.
+    """
+
+    def __init__(self, memory: MemoryIntentParseCache, disk: SqliteIntentParseCache) -> None:
+        """
+        캐시를 초기화한다.
+
+        Args:
+            memory: 프로세스 내 LRU
+            disk: 공유 SQLite 캐시
+        """
+        self._memory = memory
+        self._disk = disk
+
+    def get(self, key: str) -> IntentDecomposition | None:
+        """
+        메모리→SQLite 순으로 조회하고 SQLite hit는 메모리로 올린다.
+
+        Args:
+            key: `build_intent_parse_cache_key` 결과
+
+        Returns:
+            구조분해 사본(miss 시 None)
+        """
+        cached = self._memory.get(key=key)
+        if cached is not None:
+            return cached
+        cached = self._disk.get(key=key)
+        if cached is not None:
+            self._memory.put(key=key, decomposition=cached)
+        return cached
+
+    def put(self, key: str, decomposition: IntentDecomposition) -> None:
+        """
+        두 단계 모두에 저장한다.
+
+        Args:
+            key: `build_intent_parse_cache_key` 결과
+            decomposition: 저장할 구조분해
+        """
+        self._memory.put(key=key, decomposition=decomposition)
+        self._disk.put(key=key, decomposition=decomposition)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        단계별 카운터와 전체 hit_rate를 반환한다.
+
+        Returns:
+            `memory`/`sqlite` 카운터와 전체 hit_rate
+        """
+        memory_stats = self._memory.get_stats()
+        disk_stats = self._disk.get_stats()
+        lookups = memory_stats["hits"] + memory_stats["misses"]
+        hits = memory_stats["hits"] + disk_stats["hits"]
+        return {
+            "memory": memory_stats,
+            "sqlite": disk_stats,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+def build_intent_parse_cache() -> IntentParseCache:
+    """
+    환경변수 설정에 맞는 intent 구조분해 캐시 backend를 만든다.
+
+    Returns:
+        캐시 backend(`sqlite`면 메모리+SQLite 2단, 그 외 값은 메모리 LRU)
+    """
+    backend = str(os.getenv(INTENT_PARSE_CACHE_BACKEND_ENV, INTENT_PARSE_CACHE_BACKEND_MEMORY)).strip().lower()
+    ttl_sec = resolve_positive_int_env(INTENT_PARSE_CACHE_TTL_SEC_ENV, DEFAULT_INTENT_PARSE_CACHE_TTL_SEC)
+    memory = MemoryIntentParseCache(
+        max_entries=resolve_positive_int_env(INTENT_PARSE_CACHE_SIZE_ENV, DEFAULT_INTENT_PARSE_CACHE_SIZE),
+        ttl_sec=ttl_sec,
+    )
+    if backend != INTENT_PARSE_CACHE_BACKEND_SQLITE:
+        return memory
+    db_path = str(os.getenv(INTENT_PARSE_CACHE_PATH_ENV, "")).strip() or str(DEFAULT_INTENT_PARSE_CACHE_PATH)
+    disk = SqliteIntentParseCache(
+        db_path=Path(db_path),
+        ttl_sec=ttl_sec,
+        max_entries=resolve_positive_int_env(INTENT_PARSE_CACHE_MAX_ENTRIES_ENV, DEFAULT_INTENT_PARSE_CACHE_MAX_ENTRIES),
+    )
+    return TieredIntentParseCache(memory=memory, disk=disk)
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import os
-from collections import OrderedDict
 from functools import lru_cache
 from typing import Any
 
-from langchain.chat_models import init_chat_model
 from pydantic import ValidationError
 
 from app.agents.intent_parser_utils import (
@@ -21,14 +21,23 @@ from app.agents.intent_parser_utils import (
     serialize_intent_result,
     try_simple_fast_path,
 )
+from app.agents.intent_near_duplicate import NearDuplicateIntentIndex, build_near_duplicate_intent_index
+from app.agents.intent_parse_cache import (
+    IntentParseCache,
+    MemoryIntentParseCache,
+    build_intent_parse_cache,
+    build_intent_parse_cache_key,
+)
 from app.agents.intent_schema import IntentDecomposition, create_default_decomposition
+from app.agents.intent_turn_context import try_acquire_intent_llm_parse
 from app.core.intent_rules import sanitize_user_query
-from app.core.llm_runtime import normalize_model_name, resolve_env_model
+from app.core.llm_response_cache import lookup_llm_response_cache, store_llm_response_cache
+from app.core.llm_runtime import get_chat_model, normalize_model_name, resolve_env_model
 from app.core.logging_config import get_logger, is_prompt_trace_enabled
 
 DEFAULT_INTENT_BASE_URL = ""
 DEFAULT_INTENT_MODEL = "azure_openai:gpt-4o-mini"
-INTENT_PARSE_CACHE_SIZE = 128
+INTENT_PARSE_CACHE_VERSION = "1"
 DEFAULT_INTENT_TIMEOUT_SEC = 60
 
 logger = get_logger(__name__)
@@ -45,8 +54,10 @@ class IntentParser:
         fast_path_mode: str = DEFAULT_INTENT_FAST_PATH_MODE,
         max_steps: int = DEFAULT_INTENT_MAX_STEPS,
         timeout_sec: int = DEFAULT_INTENT_TIMEOUT_SEC,
+        parse_cache: IntentParseCache | None = None,
+        near_duplicate_index: NearDuplicateIntentIndex | None = None,
     ) -> None:
-        """의도 파서 인스턴스를 초기화한다."""
+        """의도 파서 인스턴스를 초기화한다(캐시 미지정 시 프로세스 내 LRU, 근사 중복 인덱스는 지정 시에만)."""
         self._model_name = model_name
         self._base_url = base_url
         self._temperature = temperature
@@ -54,7 +65,9 @@ class IntentParser:
         self._max_steps = normalize_max_steps(raw_max_steps=max_steps)
         self._timeout_sec = max(1, int(timeout_sec))
         self._structured_model: Any = None
-        self._parse_cache: OrderedDict[str, IntentDecomposition] = OrderedDict()
+        self._parse_cache: IntentParseCache = parse_cache if parse_cache is not None else MemoryIntentParseCache()
+        self._near_duplicate_index = near_duplicate_index
+        self._cache_version = self._build_cache_version()
 
     def parse(
         self,
@@ -96,6 +109,16 @@ class IntentParser:
             self._write_cached_decomposition(cache_key=cache_key, decomposition=final_decomposition)
             return final_decomposition
 
+        near_duplicate_namespace = self._build_cache_key(
+            sanitized_query="",
+            has_selected_mail=has_selected_mail,
+            selected_message_id_exists=selected_message_id_exists,
+        )
+        near_duplicate = self._lookup_near_duplicate(sanitized_query=sanitized_query, namespace=near_duplicate_namespace)
+        if near_duplicate is not None:
+            self._write_cached_decomposition(cache_key=cache_key, decomposition=near_duplicate)
+            return apply_step_limit_to_decomposition(decomposition=near_duplicate, max_steps=self._max_steps)
+
         prompt = self._build_prompt(user_message=sanitized_query)
         parsed = self._invoke_structured_llm(prompt=prompt)
         if parsed is None:
@@ -140,6 +163,12 @@ class IntentParser:
 
         logger.info("LLM 구조분해 성공: steps=%s", [step.value for step in decomposition.steps])
         self._write_cached_decomposition(cache_key=cache_key, decomposition=decomposition)
+        if self._near_duplicate_index is not None:
+            self._near_duplicate_index.remember(
+                sanitized_query=sanitized_query,
+                namespace=near_duplicate_namespace,
+                decomposition=decomposition,
+            )
         return decomposition
 
     def _build_cache_key(
@@ -148,27 +177,47 @@ class IntentParser:
         has_selected_mail: bool,
         selected_message_id_exists: bool,
     ) -> str:
-        """질의/선택메일 namespace를 결합한 intent cache key를 생성한다."""
-        namespace = (
-            f"has_selected_mail={int(bool(has_selected_mail))}|"
-            f"selected_message_id_exists={int(bool(selected_message_id_exists))}"
+        """질의/선택메일 namespace/파서 버전을 결합한 intent cache key를 생성한다."""
+        return build_intent_parse_cache_key(
+            sanitized_query=sanitized_query,
+            has_selected_mail=has_selected_mail,
+            selected_message_id_exists=selected_message_id_exists,
+            version=self._cache_version,
         )
-        return f"{sanitized_query}|{namespace}"
+
+    def _build_cache_version(self) -> str:
+        """프롬프트/스키마/모델/fast-path 설정이 바뀌면 달라지는 캐시 버전 태그를 만든다."""
+        payload = "|".join(
+            [
+                INTENT_PARSE_CACHE_VERSION,
+                _resolve_intent_schema_tag(),
+                normalize_model_name(model_name=self._model_name, default_model=DEFAULT_INTENT_MODEL),
+                self._fast_path_mode,
+                self._build_prompt(user_message=""),
+            ]
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
 
     def _read_cached_decomposition(self, cache_key: str) -> IntentDecomposition | None:
         """동일 질의에 대한 구조분해 캐시를 조회한다."""
-        cached = self._parse_cache.get(cache_key)
-        if cached is None:
-            return None
-        self._parse_cache.move_to_end(cache_key)
-        return cached.model_copy(deep=True)
+        return self._parse_cache.get(key=cache_key)
 
     def _write_cached_decomposition(self, cache_key: str, decomposition: IntentDecomposition) -> None:
-        """구조분해 결과를 LRU 캐시에 저장한다."""
-        self._parse_cache[cache_key] = decomposition.model_copy(deep=True)
-        self._parse_cache.move_to_end(cache_key)
-        while len(self._parse_cache) > INTENT_PARSE_CACHE_SIZE:
-            self._parse_cache.popitem(last=False)
+        """구조분해 결과를 캐시 backend에 저장한다."""
+        self._parse_cache.put(key=cache_key, decomposition=decomposition)
+
+    def _lookup_near_duplicate(self, sanitized_query: str, namespace: str) -> IntentDecomposition | None:
+        """정확 일치 miss 질의를 근사 중복 인덱스(시그니처→유사도)에서 찾는다."""
+        if self._near_duplicate_index is None:
+            return None
+        return self._near_duplicate_index.lookup(sanitized_query=sanitized_query, namespace=namespace)
+
+    def get_cache_stats(self) -> dict[str, Any]:
+        """구조분해 캐시(정확 일치/근사 중복) hit/miss 카운터를 반환한다."""
+        stats = self._parse_cache.get_stats()
+        if self._near_duplicate_index is not None:
+            stats["near_duplicate"] = self._near_duplicate_index.get_stats()
+        return stats
 
     def _get_structured_model(self) -> Any:
         """의도 구조분해 structured output 모델 인스턴스를 재사용한다."""
@@ -178,14 +227,13 @@ class IntentParser:
             model_name=self._model_name,
             default_model=DEFAULT_INTENT_MODEL,
         )
-        model_kwargs: dict[str, Any] = {
-            "model": normalized_model,
-            "temperature": self._temperature,
-            "timeout": self._timeout_sec,
-        }
-        if normalized_model.startswith("ollama:") and str(self._base_url or "").strip():
-            model_kwargs["base_url"] = self._base_url.strip()
-        model = init_chat_model(**model_kwargs)
+        base_url = self._base_url if normalized_model.startswith("ollama:") else ""
+        model = get_chat_model(
+            model_name=normalized_model,
+            timeout_sec=self._timeout_sec,
+            temperature=self._temperature,
+            base_url=base_url,
+        )
         self._structured_model = model.with_structured_output(IntentDecomposition)
         return self._structured_model
 
@@ -264,6 +312,27 @@ class IntentParser:
         )
 
     def _invoke_structured_llm(self, prompt: str) -> IntentDecomposition | None:
+        """구조화 출력 LLM 호출로 구조분해 결과를 얻는다(응답 캐시 활성화 시 재사용, 턴당 호출 예산 적용)."""
+        cache, cache_key, cached = lookup_llm_response_cache(
+            enabled=True,
+            model_name=normalize_model_name(model_name=self._model_name, default_model=DEFAULT_INTENT_MODEL),
+            messages=[{"role": "user", "content": prompt}],
+            temperature=self._temperature,
+            schema=_resolve_intent_schema_tag(),
+        )
+        if cached is not None:
+            try:
+                return IntentDecomposition.model_validate_json(cached)
+            except ValidationError as exc:
+                logger.warning("intent_response_cache_invalid: %s", exc)
+        if not try_acquire_intent_llm_parse():
+            return None
+        parsed = self._invoke_structured_llm_uncached(prompt=prompt)
+        if parsed is not None:
+            store_llm_response_cache(cache=cache, cache_key=cache_key, content=parsed.model_dump_json())
+        return parsed
+
+    def _invoke_structured_llm_uncached(self, prompt: str) -> IntentDecomposition | None:
         """구조화 출력 LLM 호출로 구조분해 결과를 얻는다."""
         structured_model = self._get_structured_model()
 
@@ -293,6 +362,13 @@ class IntentParser:
             return None
 
 
+@lru_cache(maxsize=1)
+def _resolve_intent_schema_tag() -> str:
+    """응답 캐시 키에 쓸 구조분해 스키마 버전 태그(JSON schema 해시)를 반환한다."""
+    serialized = json.dumps(IntentDecomposition.model_json_schema(), ensure_ascii=False, sort_keys=True)
+    return f"IntentDecomposition:{hashlib.sha256(serialized.encode('utf-8')).hexdigest()[:16]}"
+
+
 @lru_cache(maxsize=1)
 def get_intent_parser() -> IntentParser:
     """애플리케이션 전역에서 재사용할 의도 파서를 반환한다."""
@@ -331,4 +407,6 @@ def get_intent_parser() -> IntentParser:
         fast_path_mode=fast_path_mode,
         max_steps=max_steps,
         timeout_sec=timeout_sec,
+        parse_cache=build_intent_parse_cache(),
+        near_duplicate_index=build_near_duplicate_intent_index(),
     )
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Iterator
+
+from app.agents.intent_schema import IntentDecomposition
+from app.core.intent_rules import sanitize_user_query
+from app.core.logging_config import get_logger
+
+MAX_LLM_PARSES_PER_TURN = 1
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class IntentTurnContext:
+    """
+    채팅 1턴 동안 공유하는 intent 구조분해 상태.
+
+    Attributes:
+        query: 구조분해 대상 질의(sanitize 결과)
+        decomposition: 턴에서 확정된 구조분해(파싱 실패 시 None)
+        resolved: 구조분해가 확정됐는지 여부(None 결과 포함)
+        llm_parse_count: 이번 턴에서 실제 호출한 intent LLM 횟수
+    """
+
+    query: str = ""
+    decomposition: IntentDecomposition | None = None
+    resolved: bool = False
+    llm_parse_count: int = 0
+
+
+_INTENT_TURN_CTX: ContextVar[IntentTurnContext | None] = ContextVar("intent_turn_context", default=None)
+_STATS_LOCK = threading.Lock()
+_STATS: dict[str, int] = {"turns": 0, "llm_parses": 0, "reused": 0, "blocked_llm_parses": 0}
+
+
+@contextmanager
+def intent_turn() -> Iterator[IntentTurnContext]:
+    """
+    채팅 1턴 범위의 intent 컨텍스트를 연다.
+
+    flow가 기록한 구조분해를 미들웨어/정책 모듈이 재사용하고, 턴당 intent LLM 호출을
+    `MAX_LLM_PARSES_PER_TURN`회로 제한한다.
+
+    Yields:
+        이번 턴 intent 컨텍스트
+    """
+    context = IntentTurnContext()
+    token = _INTENT_TURN_CTX.set(context)
+    _increment_stat(name="turns")
+    try:
+        yield context
+    finally:
+        _INTENT_TURN_CTX.reset(token)
+
+
+def get_intent_turn_context() -> IntentTurnContext | None:
+    """
+    현재 턴 intent 컨텍스트를 반환한다.
+
+    Returns:
+        턴 컨텍스트(턴 밖이면 None)
+    """
+    return _INTENT_TURN_CTX.get()
+
+
+def record_intent_turn_decomposition(user_message: str, decomposition: IntentDecomposition | None) -> None:
+    """
+    턴에서 확정된 구조분해를 기록한다(턴 밖이면 무시).
+
+    Args:
+        user_message: 구조분해 대상 질의
+        decomposition: 확정된 구조분해(파싱 실패 시 None)
+    """
+    context = _INTENT_TURN_CTX.get()
+    if context is None:
+        return
+    context.query = sanitize_user_query(user_message=user_message)
+    context.decomposition = decomposition.model_copy(deep=True) if decomposition is not None else None
+    context.resolved = True
+
+
+def lookup_intent_turn_decomposition(user_message: str) -> tuple[bool, IntentDecomposition | None]:
+    """
+    같은 질의로 이번 턴에 확정된 구조분해를 조회한다.
+
+    Args:
+        user_message: 조회할 질의(scope prefix 제거 후)
+
+    Returns:
+        (턴 기록 사용 여부, 구조분해 사본 또는 None)
+    """
+    context = _INTENT_TURN_CTX.get()
+    if context is None or not context.resolved:
+        return (False, None)
+    if sanitize_user_query(user_message=user_message) != context.query:
+        return (False, None)
+    _increment_stat(name="reused")
+    decomposition = context.decomposition
+    return (True, decomposition.model_copy(deep=True) if decomposition is not None else None)
+
+
+def try_acquire_intent_llm_parse() -> bool:
+    """
+    intent LLM 호출 예산을 1회 차감한다.
+
+    턴 안에서 이미 예산을 다 썼으면 호출을 막고(규칙 기반 분해로 대체) False를 반환한다.
+
+    Returns:
+        LLM 호출을 진행해도 되면 True
+    """
+    context = _INTENT_TURN_CTX.get()
+    if context is not None and context.llm_parse_count >= MAX_LLM_PARSES_PER_TURN:
+        _increment_stat(name="blocked_llm_parses")
+        logger.warning("intent_turn.llm_parse_blocked: count=%s", context.llm_parse_count)
+        return False
+    if context is not None:
+        context.llm_parse_count += 1
+    _increment_stat(name="llm_parses")
+    return True
+
+
+def get_intent_turn_stats() -> dict[str, Any]:
+    """
+    턴 단위 intent 파싱 카운터를 반환한다.
+
+    Returns:
+        턴 수, LLM 호출 수, 턴 기록 재사용 수, 차단된 LLM 호출 수와 턴당 평균 LLM 호출 수
+    """
+    with _STATS_LOCK:
+        stats: dict[str, Any] = dict(_STATS)
+    stats["llm_parses_per_turn"] = round(stats["llm_parses"] / stats["turns"], 4) if stats["turns"] else 0.0
+    return stats
+
+
+def reset_intent_turn_stats() -> None:
+    """카운터를 0으로 되돌린다(테스트 격리용)."""
+    with _STATS_LOCK:
+        for name in _STATS:
+            _STATS[name] = 0
+
+
+def _increment_stat(name: str) -> None:
+    """
+    카운터를 1 증가시킨다.
+
+    Args:
+        name: 카운터 이름
+    """
+    with _STATS_LOCK:
+        _STATS[name] += 1
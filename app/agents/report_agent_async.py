@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import os
+
+from openai import OpenAIError
+
+from app.agents.report_agent import (
+    DEFAULT_REPORT_MODEL,
+    _build_fast_report_messages,
+    _build_weekly_report_messages,
+    _ensure_weekly_bullet_sublines,
+    _resolve_report_timeout_sec,
+    _strip_code_fence,
+)
+from app.core.azure_openai_client import has_azure_openai_config, normalize_azure_deployment_name
+from app.core.llm_runtime import ainvoke_text_messages
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+async def agenerate_report_html_fast(
+    email_subject: str,
+    email_content: str,
+    report_date: str,
+    report_author: str,
+) -> str:
+    """
+    단일 비동기 모델 호출로 현재 메일 기반 보고서 HTML을 생성한다.
+
+    Args:
+        email_subject: 보고서 제목(메일 제목)
+        email_content: 보고서 작성 근거 원문
+        report_date: 표지 날짜(일반적으로 현재 날짜)
+        report_author: 작성자 이름/조직
+
+    Returns:
+        생성된 HTML 문자열(모델 오류/타임아웃 시 빈 문자열)
+
+    Raises:
+        ValueError: Azure OpenAI 필수 환경변수가 누락된 경우
+    """
+    model_name = _resolve_report_model_name()
+    messages = _build_fast_report_messages(
+        email_subject=email_subject,
+        email_content=email_content,
+        report_date=report_date,
+        report_author=report_author,
+    )
+    content = await _ainvoke_report_model(model_name=model_name, messages=messages, log_prefix="report_agent")
+    normalized = _strip_code_fence(content)
+    logger.info(
+        "report_agent.async_path_completed: model=%s input_length=%s html_length=%s",
+        model_name,
+        len(str(email_content or "")),
+        len(normalized),
+    )
+    return normalized
+
+
+async def agenerate_weekly_report_html_fast(
+    mail_items: list[dict[str, str]],
+    week_offset: int,
+    report_author: str,
+    reference_date: str = "",
+) -> str:
+    """
+    단일 비동기 모델 호출로 주간보고 HTML을 생성한다.
+
+    Args:
+        mail_items: 실적 기간 메일 목록
+        week_offset: 몇 주 전 기준인지 나타내는 오프셋
+        report_author: 보고서 작성자
+        reference_date: 기준일
+
+    Returns:
+        생성된 HTML 문자열(모델 오류/타임아웃 시 빈 문자열)
+
+    Raises:
+        ValueError: Azure OpenAI 필수 환경변수가 누락된 경우
+    """
+    model_name = _resolve_report_model_name()
+    messages = _build_weekly_report_messages(
+        mail_items=mail_items,
+        week_offset=week_offset,
+        report_author=report_author,
+        reference_date=reference_date,
+    )
+    content = await _ainvoke_report_model(model_name=model_name, messages=messages, log_prefix="weekly_report_agent")
+    normalized = _ensure_weekly_bullet_sublines(_strip_code_fence(content))
+    logger.info(
+        "weekly_report_agent.async_path_completed: model=%s items=%s html_length=%s",
+        model_name,
+        len(mail_items),
+        len(normalized),
+    )
+    return normalized
+
+
+def _resolve_report_model_name() -> str:
+    """
+    보고서 생성용 Azure OpenAI 배포명을 해석한다.
+
+    Returns:
+        provider 접두어가 제거된 배포명
+    """
+    return normalize_azure_deployment_name(
+        model_name=str(os.getenv("SUMMARIZATION_MODEL", DEFAULT_REPORT_MODEL)).strip(),
+        default_deployment=DEFAULT_REPORT_MODEL,
+    )
+
+
+async def _ainvoke_report_model(model_name: str, messages: list[dict[str, str]], log_prefix: str) -> str:
+    """
+    Azure OpenAI 배포를 비동기 호출해 응답 텍스트를 반환한다.
+
+    Args:
+        model_name: Azure OpenAI 배포명
+        messages: role/content 배열
+        log_prefix: 실패 로그 prefix
+
+    Returns:
+        응답 텍스트(모델 오류/타임아웃 시 빈 문자열)
+
+    Raises:
+        ValueError: Azure OpenAI 필수 환경변수가 누락된 경우
+    """
+    if not has_azure_openai_config():
+        raise ValueError("missing_azure_openai_config")
+    try:
+        return await ainvoke_text_messages(
+            model_name=f"azure_openai:{model_name}",
+            messages=messages,
+            timeout_sec=_resolve_report_timeout_sec(),
+        )
+    except (OpenAIError, TimeoutError) as exc:
+        logger.warning("%s.async_path_failed: %s", log_prefix, exc)
+        return ""
@@ -12,8 +12,13 @@ from fastapi import APIRouter, HTTPException, Query, Request
 from fastapi.responses import Response, StreamingResponse
 
 from app.api.contracts import ChatEvalPipelineRunRequest, ChatEvalRunRequest, WeeklyReportExportRequest
+from app.agents.intent_parser import get_intent_parser
+from app.agents.intent_turn_context import get_intent_turn_stats
 from app.api.data_access import CLIENT_LOG_PATH, write_ndjson
+from app.core.llm_response_cache import get_llm_response_cache_stats
 from app.core.logging_config import get_logger
+from app.core.query_features import get_query_features_stats
+from app.integrations.microsoft_graph.graph_transport import get_graph_transport_stats
 from app.integrations.microsoft_graph.mail_client import GraphMailClient
 from app.services.chat_eval_service import (
     DEFAULT_JUDGE_MODEL,
@@ -214,6 +219,78 @@ def mail_sync_recent(
     }
 
 
+@router.post("/ops/mail-sync/delta")
+def mail_sync_delta(
+    folder: str = Query(default="inbox", min_length=1, max_length=200),
+    page_size: int = Query(default=50, ge=1, le=1000),
+) -> dict[str, Any]:
+    """
+    Graph 메일 delta 증분 sync를 관리용으로 실행한다.
+
+    Args:
+        folder: 메일 폴더 ID 또는 well-known 이름
+        page_size: delta 페이지당 최대 메일 수
+
+    Returns:
+        sync 실행 결과
+    """
+    result = MailSyncService(
+        db_path=ROOT_DIR / "data" / "sqlite" / "emails.db",
+        graph_client=GraphMailClient(),
+    ).sync_delta(folder_id=folder, page_size=page_size)
+    return {
+        "status": "completed" if result.completed else "incomplete",
+        "folder": folder,
+        "result": result.as_dict(),
+    }
+
+
+@router.get("/ops/llm-response-cache/stats")
+def llm_response_cache_stats() -> dict[str, Any]:
+    """
+    LLM 응답 캐시의 프로세스 단위 hit/miss 카운터를 조회한다.
+
+    Returns:
+        활성화 여부와 카운터 사전
+    """
+    return get_llm_response_cache_stats()
+
+
+@router.get("/ops/graph-transport/stats")
+def graph_transport_stats() -> dict[str, Any]:
+    """
+    Graph 공유 전송 계층의 tenant/endpoint별 지연·재시도·throttle 지표를 조회한다.
+
+    Returns:
+        tenant -> endpoint -> 지표 사전
+    """
+    return {"tenants": get_graph_transport_stats()}
+
+
+@router.get("/ops/intent-turn/stats")
+def intent_turn_stats() -> dict[str, Any]:
+    """
+    채팅 턴 단위 intent 파싱 카운터(LLM 호출/턴 기록 재사용/차단)를 조회한다.
+
+    Returns:
+        카운터 사전(`query_features`: 규칙 플래그 캐시 hit/miss)
+    """
+    stats = get_intent_turn_stats()
+    stats["query_features"] = get_query_features_stats()
+    return stats
+
+
+@router.get("/ops/intent-parse-cache/stats")
+def intent_parse_cache_stats() -> dict[str, Any]:
+    """
+    intent 구조분해 캐시(메모리 LRU/공유 SQLite)의 hit/miss 카운터를 조회한다.
+
+    Returns:
+        backend별 카운터와 hit_rate
+    """
+    return get_intent_parser().get_cache_stats()
+
+
 @router.post("/qa/chat-eval/run")
 def run_chat_eval(payload: ChatEvalRunRequest, request: Request) -> dict[str, Any]:
     """
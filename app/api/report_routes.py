@@ -11,11 +11,8 @@ from typing import Any, AsyncIterator
 from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import FileResponse, HTMLResponse, StreamingResponse
 
-from app.agents.report_agent import (
-    compute_weekly_windows,
-    generate_report_html_fast,
-    generate_weekly_report_html_fast,
-)
+from app.agents.report_agent import compute_weekly_windows
+from app.agents.report_agent_async import agenerate_report_html_fast, agenerate_weekly_report_html_fast
 from app.api.contracts import ReportGenerateRequest, WeeklyReportGenerateRequest
 from app.core.logging_config import get_logger
 from app.services.mail_search_service import MailSearchService
@@ -240,12 +237,11 @@ async def generate_report(request: ReportGenerateRequest) -> StreamingResponse:
 
             yield _encode_sse_data({"type": "step", "step": "3", "label": STEP_LABELS["3"], "status": "running"})
             model_started_at = time.perf_counter()
-            report_html = await asyncio.to_thread(
-                generate_report_html_fast,
-                subject,
-                report_input,
-                report_date,
-                author,
+            report_html = await agenerate_report_html_fast(
+                email_subject=subject,
+                email_content=report_input,
+                report_date=report_date,
+                report_author=author,
             )
             model_elapsed_ms = round((time.perf_counter() - model_started_at) * 1000.0, 1)
             if not report_html:
@@ -321,12 +317,11 @@ async def generate_weekly_report(request: WeeklyReportGenerateRequest) -> Stream
             yield _encode_sse_data({"type": "step", "step": "2", "label": "주요 내용 정리 완료", "status": "done"})
 
             yield _encode_sse_data({"type": "step", "step": "3", "label": "주간보고 작성 중...", "status": "running"})
-            report_html = await asyncio.to_thread(
-                generate_weekly_report_html_fast,
-                mail_items,
-                week_offset,
-                author,
-                "",
+            report_html = await agenerate_weekly_report_html_fast(
+                mail_items=mail_items,
+                week_offset=week_offset,
+                report_author=author,
+                reference_date="",
             )
             if not report_html:
                 report_html = _build_template_weekly_report_html(
@@ -7,14 +7,18 @@ from fastapi import APIRouter, Request
 from fastapi.responses import Response, StreamingResponse
 
 from app.agents.deep_chat_agent import get_deep_chat_agent, is_openai_key_configured
+from app.agents.intent_turn_context import intent_turn
 from app.agents.tools import clear_current_mail
 from app.api import search_chat_flow
+from app.api import search_chat_stream_async
 from app.api import search_chat_stream_utils
 from app.api.contracts import ChatRequest, MailContextRequest
 from app.api.data_access import ADDIN_MANIFEST_PATH, resolve_public_base_url
 from app.agents.tools import prime_current_mail
 from app.core.logging_config import get_logger
+from app.core.sqlite_pool import get_sqlite_pool
 from app.services.mail_context_service import build_mail_context_service
+from app.services.mail_schema_registry import get_emails_schema
 from app.services.mail_text_utils import extract_recipients_from_body, extract_sender_display_name
 from app.services.answer_postprocessor import postprocess_final_answer
 
@@ -63,11 +67,13 @@ def _run_search_chat(
     search_chat_flow.clear_current_mail = clear_current_mail
     search_chat_flow.execute_agent_turn = _execute_agent_turn
     search_chat_flow.postprocess_final_answer = postprocess_final_answer
-    return search_chat_flow.run_search_chat(
-        payload=payload,
-        log_prefix=log_prefix,
-        token_callback=token_callback,
-    )
+    # 턴 단위 intent 컨텍스트: flow가 파싱한 구조분해를 미들웨어/정책이 재사용하고 LLM 파싱을 턴당 1회로 제한한다.
+    with intent_turn():
+        return search_chat_flow.run_search_chat(
+            payload=payload,
+            log_prefix=log_prefix,
+            token_callback=token_callback,
+        )
 
 
 def _resolve_mail_importance_label(message_id: str) -> str:
@@ -86,36 +92,44 @@ def _resolve_mail_importance_label(message_id: str) -> str:
     db_path = search_chat_flow.MAIL_DB_PATH
     if not db_path.exists():
         return ""
-    conn = sqlite3.connect(str(db_path))
     try:
-        has_category = any(
-            str(row[1]).lower() == "category"
-            for row in conn.execute("PRAGMA table_info(emails)").fetchall()
-        )
-        if not has_category:
+        if not get_emails_schema(db_path).has_category:
             return ""
-        row = conn.execute(
-            "SELECT COALESCE(category, '') AS category_text FROM emails WHERE message_id = ? LIMIT 1",
-            (normalized_message_id,),
-        ).fetchone()
+        with get_sqlite_pool(db_path).read() as conn:
+            row = conn.execute(
+                "SELECT COALESCE(category, '') AS category_text FROM emails WHERE message_id = ? LIMIT 1",
+                (normalized_message_id,),
+            ).fetchone()
         return str(row[0] if row else "").strip()
     except sqlite3.Error as exc:
         logger.warning("mail_context.importance_lookup_failed: message_id=%s error=%s", normalized_message_id, exc)
         return ""
-    finally:
-        conn.close()
 
 
-def _execute_agent_turn(agent: Any, user_message: str, thread_id: str) -> dict[str, Any]:
+def _execute_agent_turn(
+    agent: Any,
+    user_message: str,
+    thread_id: str,
+    delta_callback: Any | None = None,
+) -> dict[str, Any]:
     """agent 실행 인터페이스 호환 래퍼(`execute_turn` 우선, `respond` fallback)."""
-    return _FLOW_EXECUTE_AGENT_TURN(agent=agent, user_message=user_message, thread_id=thread_id)
+    return _FLOW_EXECUTE_AGENT_TURN(
+        agent=agent,
+        user_message=user_message,
+        thread_id=thread_id,
+        delta_callback=delta_callback,
+    )
 
 
 @router.post("/search/chat/stream")
-def search_chat_stream(payload: ChatRequest) -> StreamingResponse:
-    """채팅 요청을 진행상태/토큰/최종 완료 이벤트로 전달한다."""
+async def search_chat_stream(payload: ChatRequest, request: Request) -> StreamingResponse:
+    """채팅 요청을 진행상태/토큰/최종 완료 이벤트로 전달한다(연결 종료 시 턴 취소)."""
     return StreamingResponse(
-        search_chat_stream_utils.stream_search_chat_events(payload=payload, runner=_run_search_chat),
+        search_chat_stream_async.astream_search_chat_events(
+            payload=payload,
+            runner=_run_search_chat,
+            is_disconnected=request.is_disconnected,
+        ),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
@@ -150,6 +164,7 @@ def mail_context(payload: MailContextRequest) -> dict[str, Any]:
                 "importance": importance_label,
                 "category": importance_label,
             },
+            "summary_pending": result.summary_pending,
         }
     return {
         "status": result.status,
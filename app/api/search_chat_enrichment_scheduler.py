@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import contextvars
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from app.api.search_chat_stream_async import CHAT_STREAM_MAX_CONCURRENCY_ENV, DEFAULT_CHAT_STREAM_MAX_CONCURRENCY
+from app.core.env_config import resolve_positive_int_env
+from app.core.logging_config import get_logger
+
+ENRICHMENT_PARALLEL_ENV = "MOLDUBOT_ENRICHMENT_PARALLEL"
+ENRICHMENT_BUDGET_MS_ENV = "MOLDUBOT_ENRICHMENT_BUDGET_MS"
+ENRICHMENT_STAGE_TIMEOUT_MS_ENV = "MOLDUBOT_ENRICHMENT_STAGE_TIMEOUT_MS"
+ENRICHMENT_MAX_WORKERS_ENV = "MOLDUBOT_ENRICHMENT_MAX_WORKERS"
+DEFAULT_ENRICHMENT_BUDGET_MS = 6000
+DEFAULT_ENRICHMENT_MAX_WORKERS = 8
+DEFAULT_ENRICHMENT_STAGE_TIMEOUT_MS: dict[str, int] = {
+    "next_actions": 3000,
+    "web_sources": 5000,
+    "related_mail": 4000,
+}
+FALLBACK_ENRICHMENT_STAGE_TIMEOUT_MS = 4000
+# 아직 시작하지 않은 단계가 있으면 시작 시각이 정해지는 대로 마감을 다시 계산하도록 짧게 깨어난다.
+_QUEUED_STAGE_POLL_SEC = 0.05
+
+logger = get_logger(__name__)
+
+_EXECUTOR: ThreadPoolExecutor | None = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True)
+class EnrichmentStage:
+    """
+    서로 독립적으로 실행할 수 있는 후처리 enrichment 단계.
+
+    Attributes:
+        name: 단계 이름(`stage_timings`의 `<name>_ms`/`<name>_timed_out` 키로 기록)
+        run: 단계 본문(인자 없는 callable)
+        fallback: 시간 초과 시 대신 쓸 부분 결과
+    """
+
+    name: str
+    run: Callable[[], Any]
+    fallback: Any = None
+
+
+def run_enrichment_stages(stages: list[EnrichmentStage], stage_timings: dict[str, float]) -> dict[str, Any]:
+    """
+    enrichment 단계를 동시에 실행하고 단계별 결과를 모은다.
+
+    단계 제한 시간(`MOLDUBOT_ENRICHMENT_STAGE_TIMEOUT_MS`, 미설정 시 단계별 기본값)과 전체 예산
+    `MOLDUBOT_ENRICHMENT_BUDGET_MS` 중 짧은 쪽을 단계가 worker에서 실제로 시작한 시각부터 잰다.
+    동시 턴이 몰려 pool 대기열에 머무는 시간은 단계 제한 시간에 포함하지 않고, 전체 예산이 지나도록
+    시작하지 못한 단계만 대기 시간 초과로 본다. 넘긴 단계는 `fallback`을 결과로 쓰고
+    `stage_timings["<name>_timed_out"] = 1.0`으로 표시한다. 이미 시작한 단계는 중단할 수 없으므로
+    결과만 버린다. 단계 예외(턴 취소 포함)는 그대로 전파한다.
+
+    Args:
+        stages: 실행할 단계 목록
+        stage_timings: 단계별 시간 기록 dict(in-place 갱신)
+
+    Returns:
+        단계 이름 → 결과(시간 초과 시 fallback)
+    """
+    if not stages:
+        return {}
+    if not _is_parallel_enabled():
+        return _run_sequentially(stages=stages, stage_timings=stage_timings)
+    budget_ms = resolve_positive_int_env(ENRICHMENT_BUDGET_MS_ENV, DEFAULT_ENRICHMENT_BUDGET_MS)
+    executor = _get_executor()
+    submitted_at = time.perf_counter()
+    stage_started_at: dict[str, float] = {}
+    futures: dict[Future[tuple[Any, float]], EnrichmentStage] = {}
+    for stage in stages:
+        context = contextvars.copy_context()
+        future = executor.submit(context.run, _run_started_stage, stage, stage_started_at)
+        futures[future] = stage
+    results: dict[str, Any] = {}
+    pending = set(futures)
+    while pending:
+        deadlines = {
+            future: _resolve_stage_deadline(
+                stage=futures[future],
+                started_at=stage_started_at.get(futures[future].name),
+                submitted_at=submitted_at,
+                budget_ms=budget_ms,
+            )
+            for future in pending
+        }
+        timeout = max(0.0, min(deadlines.values()) - time.perf_counter())
+        if any(futures[future].name not in stage_started_at for future in pending):
+            timeout = min(timeout, _QUEUED_STAGE_POLL_SEC)
+        done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+        for future in done:
+            stage = futures[future]
+            result, elapsed_ms = future.result()
+            results[stage.name] = result
+            stage_timings[f"{stage.name}_ms"] = elapsed_ms
+        now = time.perf_counter()
+        expired = {future for future in pending if deadlines[future] <= now}
+        for future in expired:
+            stage = futures[future]
+            future.cancel()
+            started_at = stage_started_at.get(stage.name)
+            results[stage.name] = stage.fallback
+            stage_timings[f"{stage.name}_ms"] = round((now - (started_at or submitted_at)) * 1000, 1)
+            stage_timings[f"{stage.name}_timed_out"] = 1.0
+            logger.warning(
+                "enrichment_stage_timed_out: stage=%s started=%s waited_ms=%.1f budget_ms=%s",
+                stage.name,
+                started_at is not None,
+                stage_timings[f"{stage.name}_ms"],
+                budget_ms,
+            )
+        pending -= expired
+    return results
+
+
+def _resolve_stage_deadline(
+    stage: EnrichmentStage,
+    started_at: float | None,
+    submitted_at: float,
+    budget_ms: int,
+) -> float:
+    """
+    단계 마감 시각을 계산한다.
+
+    Args:
+        stage: 대상 단계
+        started_at: worker에서 단계가 시작한 시각(아직 대기 중이면 None)
+        submitted_at: 단계를 pool에 제출한 시각
+        budget_ms: 전체 예산(ms)
+
+    Returns:
+        `time.perf_counter()` 기준 마감 시각(시작 전이면 제출 시각 + 전체 예산)
+    """
+    if started_at is None:
+        return submitted_at + budget_ms / 1000
+    return started_at + min(_resolve_stage_timeout_ms(stage.name), budget_ms) / 1000
+
+
+def _run_sequentially(stages: list[EnrichmentStage], stage_timings: dict[str, float]) -> dict[str, Any]:
+    """
+    병렬 실행을 끈 경우 단계를 순서대로 제한 시간 없이 실행한다.
+
+    Args:
+        stages: 실행할 단계 목록
+        stage_timings: 단계별 시간 기록 dict(in-place 갱신)
+
+    Returns:
+        단계 이름 → 결과
+    """
+    results: dict[str, Any] = {}
+    for stage in stages:
+        result, elapsed_ms = _run_timed(stage.run)
+        results[stage.name] = result
+        stage_timings[f"{stage.name}_ms"] = elapsed_ms
+    return results
+
+
+def _run_timed(run: Callable[[], Any]) -> tuple[Any, float]:
+    """
+    단계 본문을 실행하고 소요 시간을 함께 반환한다.
+
+    Args:
+        run: 단계 본문
+
+    Returns:
+        (결과, 소요 ms)
+    """
+    started_at = time.perf_counter()
+    result = run()
+    return result, round((time.perf_counter() - started_at) * 1000, 1)
+
+
+def _run_started_stage(stage: EnrichmentStage, stage_started_at: dict[str, float]) -> tuple[Any, float]:
+    """
+    worker에서 단계 시작 시각을 기록한 뒤 단계를 실행한다.
+
+    Args:
+        stage: 실행할 단계
+        stage_started_at: 단계 이름 → 시작 시각 기록 dict(호출자와 공유)
+
+    Returns:
+        (결과, 소요 ms)
+    """
+    stage_started_at[stage.name] = time.perf_counter()
+    return _run_timed(stage.run)
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """
+    프로세스 공유 enrichment thread pool을 반환한다.
+
+    시간 초과 단계가 끝날 때까지 호출자가 기다리지 않도록 턴마다 `with`로 만들지 않고 공유한다.
+    동시 스트리밍 턴이 모두 enrichment에 들어와도 단계가 대기열에 밀리지 않도록 크기는
+    `MOLDUBOT_ENRICHMENT_MAX_WORKERS`와 (동시 턴 상한 × 단계 수) 중 큰 값으로 잡는다.
+
+    Returns:
+        thread pool
+    """
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(max_workers=_resolve_max_workers(), thread_name_prefix="chat-enrichment")
+        return _EXECUTOR
+
+
+def _resolve_max_workers() -> int:
+    """
+    enrichment thread pool 크기를 계산한다.
+
+    Returns:
+        설정 worker 수와 동시 스트리밍 턴 상한 × 단계 수 중 큰 값
+    """
+    configured = resolve_positive_int_env(ENRICHMENT_MAX_WORKERS_ENV, DEFAULT_ENRICHMENT_MAX_WORKERS)
+    turn_concurrency = resolve_positive_int_env(CHAT_STREAM_MAX_CONCURRENCY_ENV, DEFAULT_CHAT_STREAM_MAX_CONCURRENCY)
+    return max(configured, turn_concurrency * len(DEFAULT_ENRICHMENT_STAGE_TIMEOUT_MS))
+
+
+def _is_parallel_enabled() -> bool:
+    """
+    병렬 enrichment 활성화 여부를 반환한다.
+
+    Returns:
+        `MOLDUBOT_ENRICHMENT_PARALLEL`이 꺼짐 값이 아니면 True
+    """
+    return str(os.getenv(ENRICHMENT_PARALLEL_ENV, "1")).strip().lower() not in {"0", "false", "off", "no"}
+
+
+def _resolve_stage_timeout_ms(stage_name: str) -> int:
+    """
+    단계 제한 시간을 계산한다.
+
+    Args:
+        stage_name: 단계 이름
+
+    Returns:
+        제한 시간(ms, 환경변수가 있으면 모든 단계 공통 값)
+    """
+    default_value = DEFAULT_ENRICHMENT_STAGE_TIMEOUT_MS.get(stage_name, FALLBACK_ENRICHMENT_STAGE_TIMEOUT_MS)
+    return resolve_positive_int_env(ENRICHMENT_STAGE_TIMEOUT_MS_ENV, default_value)
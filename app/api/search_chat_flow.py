@@ -1,9 +1,11 @@
 from __future__ import annotations
+import asyncio
 import time
 from pathlib import Path
 from typing import Any, Callable
 from app.agents.deep_chat_agent import FALLBACK_EMPTY_RESPONSE, get_deep_chat_agent, is_openai_key_configured
 from app.agents.intent_parser import get_intent_parser
+from app.agents.intent_turn_context import record_intent_turn_decomposition
 from app.agents.tools import clear_current_mail, prime_current_mail, run_mail_post_action
 from app.agents.tools import reset_search_scope_contract, set_search_scope_contract
 from app.api.answer_format_metadata import build_answer_format_metadata
@@ -50,6 +52,13 @@ from app.api.search_chat_next_actions_runtime import (
     normalize_next_action_id,
     resolve_forced_next_action_query,
 )
+from app.api.search_chat_stage_events import (
+    STAGE_STATUS_COMPLETED,
+    STAGE_STATUS_STARTED,
+    guard_turn_callback,
+    publish_stage_event,
+    publish_stream_replace,
+)
 from app.api.search_chat_stream_utils import resolve_thread_id
 from app.api.search_chat_runtime_helpers import (
     build_current_mail_summary_fastpath_decomposition,
@@ -69,7 +78,9 @@ from app.api.search_chat_response_helpers import (
 from app.core.logging_config import get_logger
 from app.core.intent_rules import is_mail_summary_skill_query
 from app.core.llm_runtime import invoke_text_messages
+from app.core.llm_runtime_stream import stream_text_messages
 from app.core.metrics import get_chat_metrics_tracker
+from app.services.answer_stream_preview import AnswerStreamPreview
 from app.services.code_review_quality_service import refine_code_review_answer_with_metadata
 from app.services.mail_context_service import build_mail_context_service
 from app.services.mail_search_service import MailSearchService
@@ -197,6 +208,8 @@ def run_search_chat(
         )
     is_meeting_room_hil = bool(runtime_options.get("meeting_room_hil"))
     selected_message_id = "" if is_meeting_room_hil else selected_email_id
+    publish_stage_event(stage="intent_parse", status=STAGE_STATUS_STARTED)
+    intent_parse_started_at = time.perf_counter()
     intent_decomposition = build_current_mail_summary_fastpath_decomposition(
         user_message=text,
         is_current_mail_mode=is_current_mail_mode,
@@ -217,7 +230,11 @@ def run_search_chat(
             intent_decomposition.task_type.value,
             [step.value for step in intent_decomposition.steps],
         )
-    stage_timings["intent_parse"] = round((time.perf_counter() - started_at) * 1000, 1)
+    record_intent_turn_decomposition(user_message=text, decomposition=intent_decomposition)
+    intent_parse_finished_at = time.perf_counter()
+    stage_timings["intent_parse"] = round((intent_parse_finished_at - intent_parse_started_at) * 1000, 1)
+    stage_timings["intent_parse_offset_ms"] = round((intent_parse_finished_at - started_at) * 1000, 1)
+    publish_stage_event(stage="intent_parse", status=STAGE_STATUS_COMPLETED, elapsed_ms=stage_timings["intent_parse"])
     preliminary_scope = resolve_default_scope(is_current_mail_mode=is_current_mail_mode)
     intent_clarification = build_intent_clarification(
         user_message=text,
@@ -259,6 +276,8 @@ def run_search_chat(
     search_result_count: int | None = None
     tool_payload: dict[str, Any] = {}
     code_review_quality: dict[str, Any] = {}
+    publish_stage_event(stage="context_fetch", status=STAGE_STATUS_STARTED)
+    context_fetch_started_at = time.perf_counter()
     context_state = hydrate_selected_mail_context(
         selected_message_id=selected_message_id,
         is_current_mail_mode=is_current_mail_mode,
@@ -280,7 +299,10 @@ def run_search_chat(
     loaded_evidence = context_state.get("evidence_mails")
     if isinstance(loaded_evidence, list):
         evidence_mails = loaded_evidence
-    stage_timings["context_fetch"] = round((time.perf_counter() - started_at) * 1000, 1)
+    context_fetch_finished_at = time.perf_counter()
+    stage_timings["context_fetch"] = round((context_fetch_finished_at - context_fetch_started_at) * 1000, 1)
+    stage_timings["context_fetch_offset_ms"] = round((context_fetch_finished_at - started_at) * 1000, 1)
+    publish_stage_event(stage="context_fetch", status=STAGE_STATUS_COMPLETED, elapsed_ms=stage_timings["context_fetch"])
     if next_action_id == ACTION_ID_WEB_SEARCH:
         mail_subject = str(getattr(selected_mail, "subject", "") or "").strip()
         mail_summary = str(getattr(selected_mail, "summary_text", "") or "").strip()
@@ -332,7 +354,10 @@ def run_search_chat(
         success = True
         llm_call_1_ms = 0.0
         llm_call_2_ms = 0.0
+        answer_preview = AnswerStreamPreview(emit=token_callback) if callable(token_callback) else None
+        delta_callback = guard_turn_callback(answer_preview.feed) if answer_preview is not None else None
         scope_token: object | None = None
+        publish_stage_event(stage="llm_call", status=STAGE_STATUS_STARTED)
         try:
             scope_token = set_search_scope_contract(scope_contract)
             prompt_variant = select_prompt_variant_from_intent(
@@ -365,6 +390,8 @@ def run_search_chat(
                         allowed_action_ids=FAST_LANE_SUGGESTED_ACTION_IDS,
                         invoke_text_messages_fn=invoke_text_messages,
                         run_mail_post_action_fn=run_mail_post_action,
+                        delta_callback=delta_callback,
+                        stream_text_messages_fn=stream_text_messages,
                     )
                     llm_call_2_ms = llm_elapsed_ms
                     raw_model_content = str(fast_answer or "").strip() or FALLBACK_EMPTY_RESPONSE
@@ -380,7 +407,7 @@ def run_search_chat(
                         raw_model_content=raw_model_content,
                         tool_payload=tool_payload,
                     )
-                    emit_answer_tokens(answer=answer, token_callback=token_callback)
+                    emit_answer_tokens(answer=answer, token_callback=token_callback, stream_preview=answer_preview)
                     stage_timings["llm_call_1"] = round(llm_call_1_ms, 1)
                     stage_timings["llm_call_2"] = round(llm_call_2_ms, 1)
                     logger.info("%s 처리 완료: source=%s answer_length=%s", log_prefix, source, len(answer))
@@ -398,6 +425,7 @@ def run_search_chat(
                     agent=agent,
                     user_message=scoped_message,
                     thread_id=agent_thread_id,
+                    delta_callback=delta_callback,
                 )
                 llm_call_1_ms = (time.perf_counter() - llm_call_1_started_at) * 1000
                 turn_status = str(turn_result.get("status") or "").strip()
@@ -407,11 +435,15 @@ def run_search_chat(
                     turn_result=turn_result,
                 ):
                     _dismiss_pending_interrupts(agent=agent, turn_result=turn_result)
+                    if answer_preview is not None and answer_preview.has_output:
+                        answer_preview.reset()
+                        publish_stream_replace(text="")
                     retry_started_at = time.perf_counter()
                     turn_result = execute_agent_turn(
                         agent=agent,
                         user_message=scoped_message,
                         thread_id=agent_thread_id,
+                        delta_callback=delta_callback,
                     )
                     llm_call_2_ms = (time.perf_counter() - retry_started_at) * 1000
                     turn_status = str(turn_result.get("status") or "").strip()
@@ -451,7 +483,7 @@ def run_search_chat(
                     if isinstance(metadata, dict):
                         metadata["elapsed_ms"] = round(elapsed_ms, 1)
                         metadata["ui_render_mode"] = ui_render_mode
-                    emit_answer_tokens(answer=answer, token_callback=token_callback)
+                    emit_answer_tokens(answer=answer, token_callback=token_callback, stream_preview=answer_preview)
                     return response_payload
                 answer = str(turn_result.get("answer") or "").strip() or FALLBACK_EMPTY_RESPONSE
                 raw_answer = answer
@@ -468,7 +500,7 @@ def run_search_chat(
                     raw_model_content=raw_model_content,
                     tool_payload=tool_payload,
                 )
-                emit_answer_tokens(answer=answer, token_callback=token_callback)
+                emit_answer_tokens(answer=answer, token_callback=token_callback, stream_preview=answer_preview)
                 tool_action = extract_tool_action(tool_payload=tool_payload)
                 tool_evidence, tool_aggregated_summary, tool_search_result_count = extract_tool_result_metadata(
                     tool_payload=tool_payload
@@ -486,6 +518,10 @@ def run_search_chat(
                     tool_payload=tool_payload,
                 )
                 logger.info("%s 처리 완료: source=%s answer_length=%s", log_prefix, source, len(answer))
+        except asyncio.CancelledError:
+            if selected_message_id and not did_clear_current_mail:
+                clear_current_mail()
+            raise
         except Exception as exc:
             logger.exception("%s 처리 중 내부 오류: %s", log_prefix, exc)
             answer = "LLM 호출 또는 내부 오류가 발생했습니다. 잠시 후 다시 시도해 주세요."
@@ -497,6 +533,11 @@ def run_search_chat(
         finally:
             if scope_token is not None:
                 reset_search_scope_contract(scope_token)
+        publish_stage_event(
+            stage="llm_call",
+            status=STAGE_STATUS_COMPLETED,
+            elapsed_ms=float(stage_timings["llm_call_1"]) + float(stage_timings["llm_call_2"]),
+        )
 
     # NOTE: elapsed_ms는 메인 응답 생성 구간만 포함하며, 아래 후속 enrichment/추천 계산 시간은 제외한다.
     elapsed_ms = (time.perf_counter() - started_at) * 1000
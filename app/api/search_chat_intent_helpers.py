@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Any
+import inspect
+from typing import Any, Callable
 
 from app.agents.deep_chat_agent import FALLBACK_EMPTY_RESPONSE
 from app.agents.intent_schema import (
@@ -9,12 +10,7 @@ from app.agents.intent_schema import (
     IntentOutputFormat,
     IntentTaskType,
 )
-from app.core.intent_rules import (
-    CHAT_MODE_SKILL,
-    is_code_review_query,
-    is_mail_summary_skill_query,
-    resolve_chat_mode,
-)
+from app.core.query_features import get_query_features
 from app.services.intent_decomposition_service import (
     is_current_mail_scope_value,
     parse_intent_decomposition_safely as _parse_intent_decomposition_safely,
@@ -51,11 +47,11 @@ def select_prompt_variant_from_intent(
     query = str(user_message or "").strip()
     if not query and decomposition is not None:
         query = str(decomposition.original_query or "").strip()
-    chat_mode = resolve_chat_mode(user_message=query)
-    if chat_mode == CHAT_MODE_SKILL:
-        if is_mail_summary_skill_query(user_message=query):
+    query_features = get_query_features(user_message=query)
+    if query_features.is_explicit_skill:
+        if query_features.is_mail_summary_skill:
             return "quality_structured_json_strict"
-        if is_code_review_query(user_message=query):
+        if query_features.is_code_review:
             return "code_review_expert"
         if decomposition is None:
             return "quality_structured"
@@ -173,11 +169,19 @@ def build_hitl_confirm_metadata(
     }
 
 
-def execute_agent_turn(agent: Any, user_message: str, thread_id: str) -> dict[str, Any]:
-    """agent 실행 인터페이스 호환 래퍼(`execute_turn` 우선, `respond` fallback)."""
+def execute_agent_turn(
+    agent: Any,
+    user_message: str,
+    thread_id: str,
+    delta_callback: Callable[[str], None] | None = None,
+) -> dict[str, Any]:
+    """agent 실행 인터페이스 호환 래퍼(`execute_turn` 우선, `respond` fallback, delta 콜백 지원 시 스트리밍)."""
     execute_turn = getattr(agent, "execute_turn", None)
     if callable(execute_turn):
-        result = execute_turn(user_message=user_message, thread_id=thread_id)
+        kwargs: dict[str, Any] = {"user_message": user_message, "thread_id": thread_id}
+        if callable(delta_callback) and _accepts_keyword(func=execute_turn, name="delta_callback"):
+            kwargs["delta_callback"] = delta_callback
+        result = execute_turn(**kwargs)
         if isinstance(result, dict):
             return result
     respond = getattr(agent, "respond", None)
@@ -185,3 +189,12 @@ def execute_agent_turn(agent: Any, user_message: str, thread_id: str) -> dict[st
         answer = str(respond(user_message=user_message, thread_id=thread_id) or "").strip() or FALLBACK_EMPTY_RESPONSE
         return {"status": "completed", "answer": answer, "thread_id": thread_id, "interrupts": []}
     return {"status": "failed", "answer": FALLBACK_EMPTY_RESPONSE, "thread_id": thread_id, "interrupts": []}
+
+
+def _accepts_keyword(func: Any, name: str) -> bool:
+    """호출 대상이 지정 keyword 인자(또는 **kwargs)를 받는지 확인한다."""
+    try:
+        parameters = inspect.signature(func).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    return any(item.name == name or item.kind is inspect.Parameter.VAR_KEYWORD for item in parameters)
@@ -20,28 +20,46 @@ from app.api.search_chat_metadata import (
     extract_evidence_from_tool_payload,
     extract_tool_action,
 )
+from app.api.search_chat_enrichment_scheduler import EnrichmentStage, run_enrichment_stages
 from app.api.search_chat_next_actions_runtime import should_suppress_internal_mail_evidence
+from app.api.search_chat_stage_events import (
+    STAGE_STATUS_COMPLETED,
+    STAGE_STATUS_STARTED,
+    publish_stage_event,
+    raise_if_turn_cancelled,
+)
 from app.core.llm_runtime import invoke_text_messages, resolve_env_model
+from app.core.llm_runtime_stream import stream_text_messages
 from app.core.logging_config import get_logger
 from app.core.intent_rules import resolve_chat_mode
 from app.services.answer_postprocessor import postprocess_final_answer
 from app.services.answer_postprocessor_summary import is_current_mail_summary_request
+from app.services.answer_stream_preview import AnswerStreamPreview
 from app.services.visible_answer_service import iter_answer_stream_chunks, sanitize_visible_answer_text
 from app.services.next_action_recommender import recommend_next_actions
 
 logger = get_logger(__name__)
 
 
-def emit_answer_tokens(answer: str, token_callback: Callable[[str], None] | None) -> None:
+def emit_answer_tokens(
+    answer: str,
+    token_callback: Callable[[str], None] | None,
+    stream_preview: AnswerStreamPreview | None = None,
+) -> None:
     """
     최종 답변을 청크로 분해해 토큰 콜백으로 전송한다.
 
+    모델 delta가 이미 미리보기로 스트리밍됐다면 재전송하지 않는다(교정은 스트림 계층의 replace 이벤트).
+
     Args:
         answer: 사용자 노출 최종 답변
         token_callback: 스트림 토큰 콜백
+        stream_preview: 모델 delta 미리보기 변환기(선택)
     """
     if not callable(token_callback):
         return
+    if stream_preview is not None and stream_preview.has_output:
+        return
     for chunk in iter_answer_stream_chunks(text=answer):
         normalized = str(chunk or "")
         if not normalized:
@@ -149,6 +167,8 @@ def invoke_current_mail_summary_fast_lane(
     allowed_action_ids: tuple[str, ...],
     invoke_text_messages_fn: Callable[..., str] = invoke_text_messages,
     run_mail_post_action_fn: Callable[..., Any] = run_mail_post_action,
+    delta_callback: Callable[[str], None] | None = None,
+    stream_text_messages_fn: Callable[..., str] = stream_text_messages,
 ) -> tuple[str, dict[str, Any], float]:
     """
     현재메일 요약 요청을 단일 LLM 호출 fast-lane으로 처리한다.
@@ -159,6 +179,7 @@ def invoke_current_mail_summary_fast_lane(
         summary_line_target: 요약 줄 수 목표
         default_fast_lane_model: 기본 모델명
         allowed_action_ids: 허용 suggested action ID 목록
+        delta_callback: 모델 delta 스트리밍 콜백(지정 시 스트리밍 호출)
 
     Returns:
         (응답 텍스트, tool_payload, llm 호출 elapsed_ms)
@@ -194,16 +215,21 @@ def invoke_current_mail_summary_fast_lane(
         f"[tool_result]\n{json.dumps(tool_payload, ensure_ascii=False)}\n\n"
         f"[user]\n{user_message.strip()}"
     )
+    messages = [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_prompt},
+    ]
     llm_started_at = time.perf_counter()
-    response_text = invoke_text_messages_fn(
-        model_name=model_name,
-        messages=[
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt},
-        ],
-        timeout_sec=60,
-        temperature=0.0,
-    )
+    if callable(delta_callback):
+        response_text = stream_text_messages_fn(
+            model_name=model_name,
+            messages=messages,
+            timeout_sec=60,
+            temperature=0.0,
+            delta_callback=delta_callback,
+        )
+    else:
+        response_text = invoke_text_messages_fn(model_name=model_name, messages=messages, timeout_sec=60, temperature=0.0)
     elapsed_ms = (time.perf_counter() - llm_started_at) * 1000
     return response_text, tool_payload, elapsed_ms
 
@@ -253,6 +279,9 @@ def finalize_response_enrichment(
     """
     최종 응답 후처리 확장(후속 액션/웹출처/근거/계약 렌더)을 일괄 수행한다.
 
+    독립 단계(후속 액션/웹 출처/연관 메일)는 `run_enrichment_stages`로 동시에 실행해
+    꼬리 지연을 단계 합이 아닌 가장 느린 단계(최대 전체 예산)로 제한한다.
+
     Args:
         log_prefix: 로그 prefix
         user_message: 사용자 입력
@@ -271,6 +300,7 @@ def finalize_response_enrichment(
     Returns:
         메타데이터 병합용 dict
     """
+    publish_stage_event(stage="postprocess", status=STAGE_STATUS_STARTED)
     suppress_internal_evidence = should_suppress_internal_mail_evidence(next_action_id=next_action_id)
     mutable_evidence_mails = [] if suppress_internal_evidence else list(evidence_mails)
 
@@ -290,37 +320,7 @@ def finalize_response_enrichment(
         postprocess_policy.skip_related_mail_enrichment,
     )
 
-    next_actions = precomputed_next_actions or []
-    if not next_actions:
-        next_actions = recommend_next_actions_fn(
-            user_message=user_message,
-            answer=answer,
-            tool_payload=tool_payload,
-            intent_task_type=intent_decomposition.task_type.value if intent_decomposition is not None else "",
-            intent_output_format=intent_output_format,
-            selector_mode_override="score",
-            allow_embeddings=False,
-        )
-
-    web_sources_started_at = time.perf_counter()
-    web_sources: list[dict[str, str]] = []
-    web_verification_reasons: list[str] = []
-    if not postprocess_policy.skip_web_sources:
-        web_sources, web_verification_reasons = resolve_web_sources_for_answer_fn(
-            user_message=user_message,
-            intent_task_type=intent_decomposition.task_type.value if intent_decomposition is not None else "",
-            resolved_scope=resolved_scope,
-            tool_payload=tool_payload,
-            intent_confidence=intent_decomposition.confidence if intent_decomposition is not None else None,
-            model_answer=answer,
-            next_action_id=next_action_id,
-        )
-    stage_timings["web_sources_ms"] = round((time.perf_counter() - web_sources_started_at) * 1000, 1)
-
-    if isinstance(code_review_quality, dict) and code_review_quality.get("enabled"):
-        code_review_quality["web_source_count"] = len(web_sources)
-        code_review_quality["has_sources"] = bool(web_sources)
-
+    intent_task_type = intent_decomposition.task_type.value if intent_decomposition is not None else ""
     answer_format = build_answer_format_metadata_fn(
         user_message=user_message,
         answer=answer,
@@ -332,14 +332,71 @@ def finalize_response_enrichment(
         tool_payload=tool_payload,
         evidence_mails=mutable_evidence_mails,
     )
-    related_mail_started_at = time.perf_counter()
+    raise_if_turn_cancelled()
+
+    # 후속 액션/웹 출처/연관 메일은 서로 독립이므로 동시에 실행하고 예산을 넘긴 단계는 부분 결과를 쓴다.
+    stages: list[EnrichmentStage] = []
+    next_actions = precomputed_next_actions or []
+    if not next_actions:
+        stages.append(
+            EnrichmentStage(
+                name="next_actions",
+                run=lambda: recommend_next_actions_fn(
+                    user_message=user_message,
+                    answer=answer,
+                    tool_payload=tool_payload,
+                    intent_task_type=intent_task_type,
+                    intent_output_format=intent_output_format,
+                    selector_mode_override="score",
+                    allow_embeddings=False,
+                ),
+                fallback=[],
+            )
+        )
+    if not postprocess_policy.skip_web_sources:
+        stages.append(
+            EnrichmentStage(
+                name="web_sources",
+                run=lambda: resolve_web_sources_for_answer_fn(
+                    user_message=user_message,
+                    intent_task_type=intent_task_type,
+                    resolved_scope=resolved_scope,
+                    tool_payload=tool_payload,
+                    intent_confidence=intent_decomposition.confidence if intent_decomposition is not None else None,
+                    model_answer=answer,
+                    next_action_id=next_action_id,
+                ),
+                fallback=([], []),
+            )
+        )
     if not suppress_internal_evidence and not postprocess_policy.skip_related_mail_enrichment:
-        major_point_evidence = enrich_major_point_related_mails_fn(
-            rows=major_point_evidence,
-            tool_payload=tool_payload,
-            mail_search_service=mail_search_service,
+        base_major_point_evidence = major_point_evidence
+        stages.append(
+            EnrichmentStage(
+                name="related_mail",
+                run=lambda: enrich_major_point_related_mails_fn(
+                    rows=base_major_point_evidence,
+                    tool_payload=tool_payload,
+                    mail_search_service=mail_search_service,
+                ),
+                fallback=base_major_point_evidence,
+            )
         )
-    stage_timings["related_mail_ms"] = round((time.perf_counter() - related_mail_started_at) * 1000, 1)
+
+    publish_stage_event(stage="enrichment", status=STAGE_STATUS_STARTED)
+    enrichment_started_at = time.perf_counter()
+    stage_timings.setdefault("web_sources_ms", 0.0)
+    stage_timings.setdefault("related_mail_ms", 0.0)
+    stage_results = run_enrichment_stages(stages=stages, stage_timings=stage_timings)
+    stage_timings["enrichment_ms"] = round((time.perf_counter() - enrichment_started_at) * 1000, 1)
+    next_actions = stage_results.get("next_actions", next_actions)
+    web_sources, web_verification_reasons = stage_results.get("web_sources", ([], []))
+    major_point_evidence = stage_results.get("related_mail", major_point_evidence)
+    publish_stage_event(stage="enrichment", status=STAGE_STATUS_COMPLETED, elapsed_ms=stage_timings["enrichment_ms"])
+
+    if isinstance(code_review_quality, dict) and code_review_quality.get("enabled"):
+        code_review_quality["web_source_count"] = len(web_sources)
+        code_review_quality["has_sources"] = bool(web_sources)
 
     contract_render_started_at = time.perf_counter()
     _, _, _, context_enrichment, semantic_contract = build_enrichment_payloads_fn(
@@ -353,10 +410,11 @@ def finalize_response_enrichment(
     )
     stage_timings["contract_render_ms"] = round((time.perf_counter() - contract_render_started_at) * 1000, 1)
     stage_timings["postprocess"] = round((time.perf_counter() - postprocess_started_at) * 1000, 1)
+    publish_stage_event(stage="postprocess", status=STAGE_STATUS_COMPLETED, elapsed_ms=stage_timings["postprocess"])
 
     logger.info(
         "%s stage_elapsed_ms: intent_parse=%.1f context_fetch=%.1f llm_call_1=%.1f llm_call_2=%.1f "
-        "postprocess=%.1f web_sources_ms=%.1f related_mail_ms=%.1f contract_render_ms=%.1f",
+        "postprocess=%.1f web_sources_ms=%.1f related_mail_ms=%.1f enrichment_ms=%.1f contract_render_ms=%.1f",
         log_prefix,
         float(stage_timings.get("intent_parse", 0.0)),
         float(stage_timings.get("context_fetch", 0.0)),
@@ -365,6 +423,7 @@ def finalize_response_enrichment(
         float(stage_timings.get("postprocess", 0.0)),
         float(stage_timings.get("web_sources_ms", 0.0)),
         float(stage_timings.get("related_mail_ms", 0.0)),
+        float(stage_timings.get("enrichment_ms", 0.0)),
         float(stage_timings.get("contract_render_ms", 0.0)),
     )
     return {
@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from contextvars import ContextVar
+from queue import Empty, Queue
+from typing import Any, Callable
+
+STAGE_STATUS_STARTED = "started"
+STAGE_STATUS_COMPLETED = "completed"
+BUS_EVENT_TOKEN = "token"
+BUS_EVENT_REPLACE = "replace"
+BUS_EVENT_STAGE = "stage"
+BUS_EVENT_RESULT = "result"
+
+_STAGE_EVENT_BUS_CTX: ContextVar["ChatStreamEventBus | None"] = ContextVar(
+    "search_chat_stage_event_bus",
+    default=None,
+)
+
+
+class ChatStreamEventBus:
+    """
+    `/search/chat` 실행 스레드가 발행한 토큰/단계/결과 이벤트를 스트림 소비자에게 전달하는 큐.
+
+    소비자는 `next_event`로 블로킹 대기하므로 주기 polling 없이 이벤트 발생 즉시 깨어난다.
+    소비자가 `cancel`하면 실행 스레드는 다음 토큰/단계 시작 지점에서 `asyncio.CancelledError`로 중단된다.
+    """
+
+    def __init__(self) -> None:
+        """이벤트 큐와 취소 플래그를 초기화한다."""
+        self._queue: Queue[tuple[str, Any]] = Queue()
+        self._cancelled = threading.Event()
+
+    @property
+    def is_cancelled(self) -> bool:
+        """소비자가 턴 실행 취소를 요청했는지 여부."""
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        """턴 실행 취소를 요청한다(클라이언트 연결 종료 등)."""
+        self._cancelled.set()
+
+    def raise_if_cancelled(self) -> None:
+        """
+        취소가 요청됐으면 실행 스레드를 중단한다.
+
+        Raises:
+            asyncio.CancelledError: 취소가 요청된 경우(`except Exception` 경로에 잡히지 않도록 BaseException 계열 사용)
+        """
+        if self._cancelled.is_set():
+            raise asyncio.CancelledError("chat_turn_cancelled")
+
+    def publish_token(self, text: str) -> None:
+        """
+        답변 토큰 이벤트를 발행한다.
+
+        Args:
+            text: 토큰 텍스트
+
+        Raises:
+            asyncio.CancelledError: 취소가 요청된 경우(모델 스트리밍 루프를 중단시킨다)
+        """
+        self.raise_if_cancelled()
+        self._put((BUS_EVENT_TOKEN, str(text or "")))
+
+    def publish_replace(self, text: str) -> None:
+        """
+        지금까지 발행한 토큰을 대체하는 이벤트를 발행한다(자동 재시도 전 미리보기 초기화 등).
+
+        Args:
+            text: 대체 텍스트(빈 문자열이면 미리보기를 비운다)
+        """
+        self._put((BUS_EVENT_REPLACE, str(text or "")))
+
+    def publish_stage(self, stage: str, status: str, elapsed_ms: float | None = None) -> None:
+        """
+        처리 단계 시작/완료 이벤트를 발행한다.
+
+        Args:
+            stage: 단계 이름(`intent_parse`/`context_fetch`/`llm_call`/`postprocess`/`enrichment`)
+            status: `started` 또는 `completed`
+            elapsed_ms: 완료 단계의 측정 시간(ms)
+        """
+        payload: dict[str, Any] = {"stage": str(stage or "").strip(), "status": str(status or "").strip()}
+        if elapsed_ms is not None:
+            payload["elapsed_ms"] = round(float(elapsed_ms), 1)
+        self._put((BUS_EVENT_STAGE, payload))
+
+    def publish_result(self, response_payload: dict[str, Any] | None) -> None:
+        """
+        최종 응답(또는 실패 시 None) 이벤트를 발행한다. 소비자는 이 이벤트를 마지막으로 처리한다.
+
+        Args:
+            response_payload: `/search/chat` 응답 payload
+        """
+        self._put((BUS_EVENT_RESULT, response_payload))
+
+    def next_event(self, timeout_sec: float) -> tuple[str, Any] | None:
+        """
+        다음 이벤트를 기다린다.
+
+        Args:
+            timeout_sec: 최대 대기 시간(초)
+
+        Returns:
+            `(이벤트 종류, 데이터)` 튜플(대기 시간 초과 시 None)
+        """
+        try:
+            return self._queue.get(timeout=max(0.0, float(timeout_sec)))
+        except Empty:
+            return None
+
+    def _put(self, item: tuple[str, Any]) -> None:
+        """
+        이벤트 1건을 큐에 넣는다.
+
+        Args:
+            item: `(이벤트 종류, 데이터)` 튜플
+        """
+        self._queue.put(item)
+
+
+class AsyncChatStreamEventBus(ChatStreamEventBus):
+    """
+    실행 스레드가 발행한 이벤트를 event loop의 asyncio 큐로 전달하는 버스.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        버스를 초기화한다.
+
+        Args:
+            loop: 소비자 코루틴이 실행되는 event loop
+        """
+        super().__init__()
+        self._loop = loop
+        self._async_queue: asyncio.Queue[tuple[str, Any]] = asyncio.Queue()
+
+    async def anext_event(self, timeout_sec: float) -> tuple[str, Any] | None:
+        """
+        다음 이벤트를 비동기로 기다린다.
+
+        Args:
+            timeout_sec: 최대 대기 시간(초)
+
+        Returns:
+            `(이벤트 종류, 데이터)` 튜플(대기 시간 초과 시 None)
+        """
+        try:
+            return await asyncio.wait_for(self._async_queue.get(), timeout=max(0.0, float(timeout_sec)))
+        except TimeoutError:
+            return None
+
+    def _put(self, item: tuple[str, Any]) -> None:
+        """
+        실행 스레드에서 event loop 큐로 이벤트를 넘긴다(loop 종료 후 발행은 무시).
+
+        Args:
+            item: `(이벤트 종류, 데이터)` 튜플
+        """
+        try:
+            self._loop.call_soon_threadsafe(self._async_queue.put_nowait, item)
+        except RuntimeError:
+            return
+
+
+def bind_stage_event_bus(bus: ChatStreamEventBus | None) -> object:
+    """
+    현재 실행 context에서 단계 이벤트를 받을 버스를 설정한다.
+
+    Args:
+        bus: 이벤트 버스(해제 시 None)
+
+    Returns:
+        contextvars reset token
+    """
+    return _STAGE_EVENT_BUS_CTX.set(bus)
+
+
+def reset_stage_event_bus(token: object) -> None:
+    """
+    단계 이벤트 버스 context를 이전 상태로 복원한다.
+
+    Args:
+        token: `bind_stage_event_bus`가 반환한 reset token
+    """
+    try:
+        _STAGE_EVENT_BUS_CTX.reset(token)
+    except Exception:
+        _STAGE_EVENT_BUS_CTX.set(None)
+
+
+def publish_stage_event(stage: str, status: str, elapsed_ms: float | None = None) -> None:
+    """
+    현재 context에 버스가 있으면 단계 이벤트를 발행한다(비스트리밍 요청에서는 no-op).
+
+    단계 시작 발행은 취소 확인 지점을 겸한다.
+
+    Args:
+        stage: 단계 이름
+        status: `started` 또는 `completed`
+        elapsed_ms: 완료 단계의 측정 시간(ms)
+
+    Raises:
+        asyncio.CancelledError: 단계 시작 시점에 취소가 요청된 경우
+    """
+    bus = _STAGE_EVENT_BUS_CTX.get()
+    if bus is None:
+        return
+    if status == STAGE_STATUS_STARTED:
+        bus.raise_if_cancelled()
+    bus.publish_stage(stage=stage, status=status, elapsed_ms=elapsed_ms)
+
+
+def publish_stream_replace(text: str) -> None:
+    """
+    현재 context에 버스가 있으면 토큰 대체 이벤트를 발행한다(비스트리밍 요청에서는 no-op).
+
+    Args:
+        text: 대체 텍스트(빈 문자열이면 미리보기를 비운다)
+    """
+    bus = _STAGE_EVENT_BUS_CTX.get()
+    if bus is not None:
+        bus.publish_replace(text=text)
+
+
+def raise_if_turn_cancelled() -> None:
+    """
+    현재 context 버스에 취소가 요청됐으면 실행을 중단한다(버스가 없으면 no-op).
+
+    Raises:
+        asyncio.CancelledError: 취소가 요청된 경우
+    """
+    bus = _STAGE_EVENT_BUS_CTX.get()
+    if bus is not None:
+        bus.raise_if_cancelled()
+
+
+def guard_turn_callback(callback: Callable[[str], None]) -> Callable[[str], None]:
+    """
+    호출마다 현재 버스의 취소 여부를 확인하는 모델 delta 콜백 래퍼를 만든다.
+
+    Args:
+        callback: 원본 delta 콜백
+
+    Returns:
+        취소 시 `asyncio.CancelledError`를 내는 콜백(버스가 없으면 원본 그대로)
+    """
+    bus = _STAGE_EVENT_BUS_CTX.get()
+    if bus is None:
+        return callback
+
+    def _guarded(delta: str) -> None:
+        bus.raise_if_cancelled()
+        callback(delta)
+
+    return _guarded
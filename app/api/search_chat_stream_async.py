@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import asyncio
+import weakref
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+from app.api.contracts import ChatRequest
+from app.api.search_chat_stage_events import (
+    BUS_EVENT_RESULT,
+    AsyncChatStreamEventBus,
+    bind_stage_event_bus,
+    reset_stage_event_bus,
+)
+from app.api.search_chat_stream_utils import (
+    STREAM_KEEPALIVE_COMMENT,
+    STREAM_KEEPALIVE_SEC,
+    build_completion_events,
+    encode_bus_event,
+    encode_stream_event,
+    resolve_phase_steps,
+    resolve_thread_id,
+)
+from app.core.env_config import resolve_positive_int_env
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+CHAT_STREAM_MAX_CONCURRENCY_ENV = "MOLDUBOT_CHAT_STREAM_MAX_CONCURRENCY"
+CHAT_STREAM_QUEUE_TIMEOUT_SEC_ENV = "MOLDUBOT_CHAT_STREAM_QUEUE_TIMEOUT_SEC"
+DEFAULT_CHAT_STREAM_MAX_CONCURRENCY = 8
+DEFAULT_CHAT_STREAM_QUEUE_TIMEOUT_SEC = 30
+STREAM_DISCONNECT_CHECK_SEC = 1.0
+_TURN_SEMAPHORES: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+async def astream_search_chat_events(
+    payload: ChatRequest,
+    runner: Callable[[ChatRequest, str, Callable[[str], None] | None], dict[str, Any]],
+    is_disconnected: Callable[[], Awaitable[bool]],
+) -> AsyncIterator[str]:
+    """
+    asyncio 기반 SSE 이벤트 스트림을 생성한다.
+
+    프로세스 동시 턴 수를 semaphore로 제한하고(대기 초과 시 busy 응답), 클라이언트 연결 종료를 감지하면
+    실행 중인 턴에 취소를 전파한다. 취소된 턴은 다음 토큰/단계 시작 지점에서 중단되며, 실제로 끝난 뒤에
+    동시 실행 슬롯을 반납한다.
+
+    Args:
+        payload: `/search/chat` 요청 본문
+        runner: 동기 턴 실행 함수(`run_search_chat` 호환)
+        is_disconnected: 클라이언트 연결 종료 여부 확인 코루틴(`Request.is_disconnected`)
+
+    Yields:
+        SSE 이벤트 문자열
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = _get_turn_semaphore(loop=loop)
+    phase_steps = resolve_phase_steps(payload=payload)
+    yield encode_stream_event(
+        event="progress",
+        payload={"phase": "received", "message": "요청을 확인했어요.", "step": 1, "total_steps": len(phase_steps)},
+    )
+    if semaphore.locked():
+        yield encode_stream_event(
+            event="progress",
+            payload={"phase": "queued", "message": "요청이 많아 순서를 기다리고 있어요.", "step": 1, "total_steps": len(phase_steps)},
+        )
+    acquired = await _acquire_turn_slot(semaphore=semaphore, is_disconnected=is_disconnected)
+    if acquired is None:
+        logger.info("search_chat_stream_abandoned_while_queued")
+        return
+    if not acquired:
+        logger.warning("search_chat_stream_rejected_busy: max_concurrency=%s", _resolve_max_concurrency())
+        yield encode_stream_event(event="completed", payload=_build_busy_response(payload=payload))
+        return
+
+    bus = AsyncChatStreamEventBus(loop=loop)
+
+    def _run_turn_worker() -> dict[str, Any] | None:
+        response_payload: dict[str, Any] | None = None
+        bus_token = bind_stage_event_bus(bus)
+        try:
+            response_payload = runner(payload, "search_chat_stream", bus.publish_token)
+        except asyncio.CancelledError:
+            logger.info("search_chat_stream_turn_cancelled: thread_id=%s", resolve_thread_id(payload=payload))
+        except Exception as exc:
+            logger.exception("search_chat_stream_turn_failed: error=%s", exc)
+        finally:
+            reset_stage_event_bus(bus_token)
+            bus.publish_result(response_payload)
+        return response_payload
+
+    worker = asyncio.ensure_future(asyncio.to_thread(_run_turn_worker))
+    worker.add_done_callback(lambda _: semaphore.release())
+    streamed_parts: list[str] = []
+    response_payload: dict[str, Any] | None = None
+    next_disconnect_check_at = loop.time() + STREAM_DISCONNECT_CHECK_SEC
+    last_sent_at = loop.time()
+    try:
+        while True:
+            bus_event = await bus.anext_event(timeout_sec=next_disconnect_check_at - loop.time())
+            if loop.time() >= next_disconnect_check_at:
+                next_disconnect_check_at = loop.time() + STREAM_DISCONNECT_CHECK_SEC
+                if await is_disconnected():
+                    logger.info("search_chat_stream_client_disconnected: thread_id=%s", resolve_thread_id(payload=payload))
+                    return
+            if bus_event is None:
+                if loop.time() - last_sent_at >= STREAM_KEEPALIVE_SEC:
+                    last_sent_at = loop.time()
+                    yield STREAM_KEEPALIVE_COMMENT
+                continue
+            event_type, event_data = bus_event
+            if event_type == BUS_EVENT_RESULT:
+                response_payload = event_data if isinstance(event_data, dict) else None
+                break
+            encoded = encode_bus_event(
+                event_type=event_type,
+                event_data=event_data,
+                phase_steps=phase_steps,
+                streamed_parts=streamed_parts,
+            )
+            if encoded:
+                last_sent_at = loop.time()
+                yield encoded
+    finally:
+        if not worker.done():
+            bus.cancel()
+    for event in build_completion_events(
+        payload=payload,
+        response_payload=response_payload,
+        streamed_parts=streamed_parts,
+        phase_steps=phase_steps,
+    ):
+        yield event
+
+
+async def _acquire_turn_slot(
+    semaphore: asyncio.Semaphore,
+    is_disconnected: Callable[[], Awaitable[bool]],
+) -> bool | None:
+    """
+    동시 실행 슬롯을 대기 시간 제한 안에서 확보한다.
+
+    Args:
+        semaphore: 프로세스 동시 턴 semaphore
+        is_disconnected: 클라이언트 연결 종료 여부 확인 코루틴
+
+    Returns:
+        확보 시 True, 대기 시간 초과 시 False, 대기 중 연결 종료 시 None
+    """
+    remaining_sec = float(_resolve_queue_timeout_sec())
+    while remaining_sec > 0:
+        wait_sec = min(STREAM_DISCONNECT_CHECK_SEC, remaining_sec)
+        try:
+            await asyncio.wait_for(semaphore.acquire(), timeout=wait_sec)
+            return True
+        except TimeoutError:
+            remaining_sec -= wait_sec
+        if await is_disconnected():
+            return None
+    return False
+
+
+def _build_busy_response(payload: ChatRequest) -> dict[str, Any]:
+    """
+    동시 실행 한도 초과 응답을 만든다.
+
+    Args:
+        payload: `/search/chat` 요청 본문
+
+    Returns:
+        completed 이벤트 payload
+    """
+    return {
+        "status": "failed",
+        "thread_id": resolve_thread_id(payload=payload),
+        "answer": "요청이 많아 지금은 처리할 수 없습니다. 잠시 후 다시 시도해 주세요.",
+        "source": "server-busy",
+        "metadata": {"elapsed_ms": 0.0},
+    }
+
+
+def _get_turn_semaphore(loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+    """
+    event loop별 동시 턴 semaphore를 반환한다(서버 프로세스는 loop 1개를 공유).
+
+    Args:
+        loop: 현재 event loop
+
+    Returns:
+        동시 턴 semaphore
+    """
+    semaphore = _TURN_SEMAPHORES.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(_resolve_max_concurrency())
+        _TURN_SEMAPHORES[loop] = semaphore
+    return semaphore
+
+
+def _resolve_max_concurrency() -> int:
+    """
+    프로세스 동시 스트리밍 턴 수 상한을 해석한다.
+
+    Returns:
+        1 이상 정수
+    """
+    return resolve_positive_int_env(CHAT_STREAM_MAX_CONCURRENCY_ENV, DEFAULT_CHAT_STREAM_MAX_CONCURRENCY)
+
+
+def _resolve_queue_timeout_sec() -> int:
+    """
+    동시 실행 슬롯 대기 시간 상한(초)을 해석한다.
+
+    Returns:
+        1 이상 정수
+    """
+    return resolve_positive_int_env(CHAT_STREAM_QUEUE_TIMEOUT_SEC_ENV, DEFAULT_CHAT_STREAM_QUEUE_TIMEOUT_SEC)
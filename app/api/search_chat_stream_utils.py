@@ -1,32 +1,36 @@
 from __future__ import annotations
 
 import json
-import threading
-import time
 from datetime import datetime, timezone
-from queue import Empty, Queue
-from typing import Any, Callable
+from typing import Any
 
 from app.api.contracts import ChatRequest
+from app.api.search_chat_stage_events import (
+    BUS_EVENT_REPLACE,
+    BUS_EVENT_TOKEN,
+    STAGE_STATUS_COMPLETED,
+)
 from app.core.intent_rules import is_code_review_query
 
-STREAM_PROGRESS_HEARTBEAT_SEC = 1.0
-STREAM_TOKEN_POLL_SEC = 0.05
+STREAM_KEEPALIVE_SEC = 10.0
+STREAM_KEEPALIVE_COMMENT = ": keepalive\n\n"
 GENERAL_STREAM_PHASE_STEPS: tuple[tuple[str, str], ...] = (
     ("received", "요청을 확인했어요."),
-    ("retrieving_context", "메일 컨텍스트를 불러오는 중입니다."),
-    ("analyzing", "요청을 처리하고 있어요."),
-    ("critic_review", "응답 품질을 점검하고 있어요."),
-    ("revising", "응답을 다듬고 있어요."),
+    ("intent_parse", "요청 의도를 분석하고 있어요."),
+    ("context_fetch", "메일 컨텍스트를 불러오는 중입니다."),
+    ("llm_call", "요청을 처리하고 있어요."),
+    ("postprocess", "응답을 정리하고 있어요."),
+    ("enrichment", "근거와 관련 메일을 보강하고 있어요."),
     ("finalizing", "최종 결과를 정리하고 있습니다."),
 )
 
 CODE_REVIEW_STREAM_PHASE_STEPS: tuple[tuple[str, str], ...] = (
     ("received", "요청을 확인했어요."),
-    ("retrieving_context", "메일 컨텍스트를 불러오는 중입니다."),
-    ("analyzing", "코드/문맥을 분석하고 있어요."),
-    ("critic_review", "품질 점검(critic)을 수행 중입니다."),
-    ("revising", "리뷰 결과를 보정하고 있어요."),
+    ("intent_parse", "요청 의도를 분석하고 있어요."),
+    ("context_fetch", "메일 컨텍스트를 불러오는 중입니다."),
+    ("llm_call", "코드/문맥을 분석하고 있어요."),
+    ("postprocess", "리뷰 결과를 보정하고 있어요."),
+    ("enrichment", "근거와 관련 메일을 보강하고 있어요."),
     ("finalizing", "최종 결과를 정리하고 있습니다."),
 )
 
@@ -45,73 +49,58 @@ def resolve_thread_id(payload: ChatRequest) -> str:
     return f"outlook_{int(datetime.now(tz=timezone.utc).timestamp())}"
 
 
-def stream_search_chat_events(
+def encode_bus_event(
+    event_type: str,
+    event_data: Any,
+    phase_steps: tuple[tuple[str, str], ...],
+    streamed_parts: list[str],
+) -> str:
+    """
+    이벤트 버스의 토큰/단계 이벤트를 SSE 이벤트로 변환한다.
+
+    Args:
+        event_type: 버스 이벤트 종류
+        event_data: 버스 이벤트 데이터
+        phase_steps: 선택된 진행 단계/문구 목록
+        streamed_parts: 지금까지 전송한 토큰 목록(토큰 전송 시 추가, 대체 시 교체)
+
+    Returns:
+        SSE 이벤트 문자열(전송할 내용이 없으면 빈 문자열)
+    """
+    if event_type == BUS_EVENT_TOKEN:
+        token_text = str(event_data or "")
+        if not token_text:
+            return ""
+        streamed_parts.append(token_text)
+        return encode_stream_event(event="token", payload={"phase": "token", "text": token_text})
+    if event_type == BUS_EVENT_REPLACE:
+        replace_text = str(event_data or "")
+        streamed_parts[:] = [replace_text] if replace_text else []
+        return encode_stream_event(event="replace", payload={"phase": "replace", "text": replace_text})
+    if isinstance(event_data, dict):
+        return _encode_stage_event(stage_event=event_data, phase_steps=phase_steps)
+    return ""
+
+
+def build_completion_events(
     payload: ChatRequest,
-    runner: Callable[[ChatRequest, str, Callable[[str], None] | None], dict[str, Any]],
-) -> Any:
-    """SSE 이벤트 스트림 제너레이터를 생성한다."""
-    result_queue: Queue[dict[str, Any]] = Queue(maxsize=1)
-    token_queue: Queue[str] = Queue()
-    phase_steps = _resolve_phase_steps(payload=payload)
-    def _run_turn_worker() -> None:
-        response_payload = runner(
-            payload,
-            "search_chat_stream",
-            lambda token: token_queue.put(str(token or "")),
-        )
-        result_queue.put(response_payload)
+    response_payload: dict[str, Any] | None,
+    streamed_parts: list[str],
+    phase_steps: tuple[tuple[str, str], ...],
+) -> list[str]:
+    """
+    턴 종료 후 보낼 replace(필요 시)/finalizing/completed 이벤트를 만든다.
 
-    worker = threading.Thread(target=_run_turn_worker, daemon=True)
-    worker.start()
+    Args:
+        payload: `/search/chat` 요청 본문
+        response_payload: 최종 응답(실행 실패 시 None)
+        streamed_parts: 전송한 토큰 목록
+        phase_steps: 선택된 진행 단계/문구 목록
 
-    yield encode_stream_event(
-        event="progress",
-        payload={"phase": "received", "message": "요청을 확인했어요.", "step": 1, "total_steps": len(phase_steps)},
-    )
-    heartbeat_count = 0
-    last_progress_at = time.monotonic()
-    while worker.is_alive() or not token_queue.empty():
-        try:
-            token_text = str(token_queue.get(timeout=STREAM_TOKEN_POLL_SEC) or "")
-        except Empty:
-            now = time.monotonic()
-            if now - last_progress_at < STREAM_PROGRESS_HEARTBEAT_SEC:
-                continue
-            heartbeat_count += 1
-            progress_phase, progress_message, progress_step = _resolve_progress_state(
-                heartbeat_count=heartbeat_count,
-                phase_steps=phase_steps,
-            )
-            yield encode_stream_event(
-                event="progress",
-                payload={
-                    "phase": progress_phase,
-                    "message": progress_message,
-                    "step": progress_step,
-                    "total_steps": len(phase_steps),
-                },
-            )
-            last_progress_at = now
-            continue
-
-        if not token_text.strip():
-            continue
-        yield encode_stream_event(
-            event="token",
-            payload={"phase": "token", "text": token_text},
-        )
-        while not token_queue.empty():
-            buffered_text = str(token_queue.get_nowait() or "")
-            if not buffered_text.strip():
-                continue
-            yield encode_stream_event(
-                event="token",
-                payload={"phase": "token", "text": buffered_text},
-            )
-
-    try:
-        response_payload = result_queue.get_nowait()
-    except Empty:
+    Returns:
+        SSE 이벤트 문자열 목록
+    """
+    if response_payload is None:
         response_payload = {
             "status": "failed",
             "thread_id": resolve_thread_id(payload=payload),
@@ -119,20 +108,26 @@ def stream_search_chat_events(
             "source": "internal-error",
             "metadata": {"elapsed_ms": 0.0},
         }
-
-    yield encode_stream_event(
-        event="progress",
-        payload={
-            "phase": "finalizing",
-            "message": "최종 결과를 정리하고 있습니다.",
-            "step": len(phase_steps),
-            "total_steps": len(phase_steps),
-        },
+    events: list[str] = []
+    final_answer = str(response_payload.get("answer") or "")
+    if streamed_parts and "".join(streamed_parts).strip() != final_answer.strip():
+        events.append(encode_stream_event(event="replace", payload={"phase": "replace", "text": final_answer}))
+    events.append(
+        encode_stream_event(
+            event="progress",
+            payload={
+                "phase": "finalizing",
+                "message": "최종 결과를 정리하고 있습니다.",
+                "step": len(phase_steps),
+                "total_steps": len(phase_steps),
+            },
+        )
     )
-    yield encode_stream_event(event="completed", payload=response_payload)
+    events.append(encode_stream_event(event="completed", payload=response_payload))
+    return events
 
 
-def _resolve_phase_steps(payload: ChatRequest) -> tuple[tuple[str, str], ...]:
+def resolve_phase_steps(payload: ChatRequest) -> tuple[tuple[str, str], ...]:
     """
     질의 성격에 따라 progress 단계 문구 세트를 선택한다.
 
@@ -147,24 +142,42 @@ def _resolve_phase_steps(payload: ChatRequest) -> tuple[tuple[str, str], ...]:
     return GENERAL_STREAM_PHASE_STEPS
 
 
-def _resolve_progress_state(
-    heartbeat_count: int,
-    phase_steps: tuple[tuple[str, str], ...],
-) -> tuple[str, str, int]:
+def _encode_stage_event(stage_event: dict[str, Any], phase_steps: tuple[tuple[str, str], ...]) -> str:
+    """
+    이벤트 버스의 단계 이벤트를 SSE 이벤트로 변환한다.
+
+    단계 시작은 진행 문구가 있는 `progress`, 단계 완료는 측정 시간(`elapsed_ms`)을 담은 `stage` 이벤트로 보낸다.
+
+    Args:
+        stage_event: `{"stage", "status", "elapsed_ms"?}` 사전
+        phase_steps: 선택된 진행 단계/문구 목록
+
+    Returns:
+        SSE 이벤트 문자열
+    """
+    stage = str(stage_event.get("stage") or "").strip()
+    status = str(stage_event.get("status") or "").strip()
+    message, step = _resolve_stage_progress(stage=stage, phase_steps=phase_steps)
+    body: dict[str, Any] = {"phase": stage, "status": status, "step": step, "total_steps": len(phase_steps)}
+    if status == STAGE_STATUS_COMPLETED:
+        body["elapsed_ms"] = stage_event.get("elapsed_ms", 0.0)
+        return encode_stream_event(event="stage", payload=body)
+    body["message"] = message
+    return encode_stream_event(event="progress", payload=body)
+
+
+def _resolve_stage_progress(stage: str, phase_steps: tuple[tuple[str, str], ...]) -> tuple[str, int]:
     """
-    heartbeat 횟수에 따라 진행 단계 문구를 순환 선택한다.
+    처리 단계 이름에 해당하는 진행 문구와 단계 번호를 찾는다.
 
     Args:
-        heartbeat_count: heartbeat 누적 횟수(1-base)
+        stage: 단계 이름
         phase_steps: 선택된 진행 단계/문구 목록
 
     Returns:
-        (phase, message, step) 튜플
+        (message, step) 튜플(목록에 없는 단계는 기본 문구와 step 0)
     """
-    normalized = max(1, int(heartbeat_count))
-    if not phase_steps:
-        return "processing", "요청을 처리하고 있어요.", 1
-    max_pre_final_index = max(0, len(phase_steps) - 2)
-    index = min(normalized, max_pre_final_index)
-    phase, message = phase_steps[index]
-    return phase, message, index + 1
+    for index, (phase, message) in enumerate(phase_steps):
+        if phase == stage:
+            return message, index + 1
+    return "요청을 처리하고 있어요.", 0
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import os
+
+
+def resolve_positive_int_env(env_name: str, default_value: int) -> int:
+    """
+    양의 정수 환경변수를 해석한다.
+
+    Args:
+        env_name: 환경변수 이름
+        default_value: 미설정/오류 시 기본값
+
+    Returns:
+        1 이상 정수(미설정/정수 아님/0 이하이면 기본값)
+    """
+    value = _parse_int_env(env_name=env_name, default_value=default_value)
+    return value if value > 0 else default_value
+
+
+def resolve_non_negative_int_env(env_name: str, default_value: int) -> int:
+    """
+    0 이상 정수 환경변수를 해석한다.
+
+    Args:
+        env_name: 환경변수 이름
+        default_value: 미설정/오류 시 기본값
+
+    Returns:
+        0 이상 정수(미설정/정수 아님/음수이면 기본값)
+    """
+    value = _parse_int_env(env_name=env_name, default_value=default_value)
+    return value if value >= 0 else default_value
+
+
+def _parse_int_env(env_name: str, default_value: int) -> int:
+    """
+    정수 환경변수 원문을 해석한다.
+
+    Args:
+        env_name: 환경변수 이름
+        default_value: 미설정/오류 시 기본값
+
+    Returns:
+        해석한 정수
+    """
+    raw = str(os.getenv(env_name, "")).strip()
+    try:
+        return int(raw) if raw else default_value
+    except ValueError:
+        return default_value
@@ -1,18 +1,20 @@
 from __future__ import annotations
 
-import re
-
 from app.core import intent_rules_date as _intent_rules_date
 from app.core import intent_rules_steps as _intent_rules_steps
+from app.core.query_features import (
+    CODE_REVIEW_SKILL_COMMANDS,
+    DEFAULT_SUMMARY_LINE_TARGET,
+    EXPLICIT_SKILL_COMMANDS,
+    MAIL_SUMMARY_SKILL_COMMANDS,
+    MAX_SUMMARY_LINE_TARGET,
+    get_query_features,
+    sanitize_user_query,
+)
 
-DEFAULT_SUMMARY_LINE_TARGET = 5
-MAX_SUMMARY_LINE_TARGET = 20
 REQUIRED_BOOKING_SLOTS = ("date", "start_time", "end_time", "attendee_count")
 ALLOWED_RELATIVE_DATE_FILTERS = ("today", "yesterday", "this_week", "last_week", "recent", "tomorrow")
 ALLOWED_MISSING_SLOTS = REQUIRED_BOOKING_SLOTS
-MAIL_SUMMARY_SKILL_COMMANDS: tuple[str, ...] = ("/메일요약", "/mailsummary")
-CODE_REVIEW_SKILL_COMMANDS: tuple[str, ...] = ("/코드분석", "/codeanalysis")
-EXPLICIT_SKILL_COMMANDS: tuple[str, ...] = MAIL_SUMMARY_SKILL_COMMANDS + CODE_REVIEW_SKILL_COMMANDS
 CHAT_MODE_SKILL = "skill"
 CHAT_MODE_FREEFORM = "freeform"
 
@@ -21,42 +23,21 @@ def is_code_review_query(user_message: str) -> bool:
     """
     사용자 질의가 코드 리뷰/코드 분석 요청인지 판별한다.
     """
-    normalized = sanitize_user_query(user_message=user_message).replace(" ", "")
-    if not normalized:
-        return False
-    has_code = "코드" in normalized
-    has_review = "리뷰" in normalized
-    has_analysis = "분석" in normalized
-    has_snippet = "코드스니펫" in normalized
-    return (has_code and (has_review or has_analysis)) or has_snippet
-
-
-def sanitize_user_query(user_message: str) -> str:
-    """
-    사용자 입력 문자열에서 구조분해에 불필요한 노이즈를 제거한다.
-    """
-    text = str(user_message or "").strip()
-    return text.strip('"').strip("'").strip()
+    return get_query_features(user_message=str(user_message or "")).is_code_review
 
 
 def is_mail_summary_skill_query(user_message: str) -> bool:
     """
     사용자 질의가 `/메일요약` 스킬 명령인지 판별한다.
     """
-    normalized = sanitize_user_query(user_message=user_message).lower()
-    if not normalized:
-        return False
-    return any(normalized == command or normalized.startswith(f"{command} ") for command in MAIL_SUMMARY_SKILL_COMMANDS)
+    return get_query_features(user_message=str(user_message or "")).is_mail_summary_skill
 
 
 def is_explicit_skill_query(user_message: str) -> bool:
     """
     사용자 질의가 명시 스킬 슬래시 명령인지 판별한다.
     """
-    normalized = sanitize_user_query(user_message=user_message).lower()
-    if not normalized:
-        return False
-    return any(normalized == command or normalized.startswith(f"{command} ") for command in EXPLICIT_SKILL_COMMANDS)
+    return get_query_features(user_message=str(user_message or "")).is_explicit_skill
 
 
 def resolve_chat_mode(user_message: str) -> str:
@@ -72,15 +53,7 @@ def extract_summary_line_target(user_message: str) -> int:
     """
     사용자 문장에서 목표 요약 줄 수를 추정한다.
     """
-    match = re.search(r"(\d{1,2})\s*(줄|개|가지)", user_message)
-    if not match:
-        return DEFAULT_SUMMARY_LINE_TARGET
-    value = int(match.group(1))
-    if value < 1:
-        return DEFAULT_SUMMARY_LINE_TARGET
-    if value > MAX_SUMMARY_LINE_TARGET:
-        return MAX_SUMMARY_LINE_TARGET
-    return value
+    return get_query_features(user_message=str(user_message or "")).summary_line_target
 
 
 def is_allowed_relative_filter(relative_value: str) -> bool:
@@ -117,3 +90,29 @@ def build_missing_slots(steps: list[str], user_message: str) -> list[str]:
 extract_date_filter_fields = _intent_rules_date.extract_date_filter_fields
 is_current_mail_reference = _intent_rules_steps.is_current_mail_reference
 is_mail_search_query = _intent_rules_steps.is_mail_search_query
+
+
+__all__ = [
+    "ALLOWED_MISSING_SLOTS",
+    "ALLOWED_RELATIVE_DATE_FILTERS",
+    "CHAT_MODE_FREEFORM",
+    "CHAT_MODE_SKILL",
+    "CODE_REVIEW_SKILL_COMMANDS",
+    "DEFAULT_SUMMARY_LINE_TARGET",
+    "EXPLICIT_SKILL_COMMANDS",
+    "MAIL_SUMMARY_SKILL_COMMANDS",
+    "MAX_SUMMARY_LINE_TARGET",
+    "REQUIRED_BOOKING_SLOTS",
+    "build_missing_slots",
+    "extract_date_filter_fields",
+    "extract_summary_line_target",
+    "infer_steps_from_query",
+    "is_allowed_relative_filter",
+    "is_code_review_query",
+    "is_current_mail_reference",
+    "is_explicit_skill_query",
+    "is_mail_search_query",
+    "is_mail_summary_skill_query",
+    "resolve_chat_mode",
+    "sanitize_user_query",
+]
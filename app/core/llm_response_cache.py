@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from app.core.env_config import resolve_positive_int_env
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+LLM_RESPONSE_CACHE_ENABLED_ENV = "MOLDUBOT_LLM_RESPONSE_CACHE_ENABLED"
+LLM_RESPONSE_CACHE_PATH_ENV = "MOLDUBOT_LLM_RESPONSE_CACHE_PATH"
+LLM_RESPONSE_CACHE_TTL_SEC_ENV = "MOLDUBOT_LLM_RESPONSE_CACHE_TTL_SEC"
+LLM_RESPONSE_CACHE_MAX_ENTRIES_ENV = "MOLDUBOT_LLM_RESPONSE_CACHE_MAX_ENTRIES"
+DEFAULT_LLM_RESPONSE_CACHE_TTL_SEC = 7 * 24 * 60 * 60
+DEFAULT_LLM_RESPONSE_CACHE_MAX_ENTRIES = 20000
+ROOT_DIR = Path(__file__).resolve().parents[2]
+DEFAULT_LLM_RESPONSE_CACHE_PATH = ROOT_DIR / "data" / "sqlite" / "llm_response_cache.db"
+_CACHE_REGISTRY: dict[tuple[str, int, int], "LLMResponseCache"] = {}
+_CACHE_REGISTRY_LOCK = threading.Lock()
+
+
+def build_llm_cache_key(
+    model_name: str,
+    messages: list[dict[str, str]],
+    temperature: float | None,
+    schema: str = "",
+) -> str:
+    """
+    LLM 응답 캐시 키(정규화 모델/메시지/temperature/출력 스키마 해시)를 생성한다.
+
+    Args:
+        model_name: 정규화된 모델명
+        messages: role/content 배열
+        temperature: 샘플링 온도
+        schema: 출력 형식 식별자(`text`/`json_object`/구조화 스키마명 등)
+
+    Returns:
+        sha256 16진수 키
+    """
+    payload = {
+        "model": str(model_name or "").strip(),
+        "messages": [
+            {"role": str(item.get("role") or "").strip().lower(), "content": str(item.get("content") or "")}
+            for item in messages
+        ],
+        "temperature": temperature,
+        "schema": str(schema or "").strip(),
+    }
+    serialized = json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """
+    TTL/최대 건수 제한이 있는 SQLite 기반 LLM 응답 캐시.
+    """
+
+    def __init__(self, db_path: Path, ttl_sec: int, max_entries: int) -> None:
+        """
+        캐시 인스턴스를 초기화한다.
+
+        Args:
+            db_path: 캐시 sqlite 경로
+            ttl_sec: 응답 보존 시간(초)
+            max_entries: 최대 보관 건수(초과 시 오래 사용하지 않은 항목부터 축출)
+        """
+        self._db_path = db_path
+        self._ttl_sec = max(1, int(ttl_sec))
+        self._max_entries = max(1, int(max_entries))
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "writes": 0, "expired": 0, "evictions": 0}
+
+    def get(self, key: str) -> str | None:
+        """
+        캐시된 응답 텍스트를 조회한다.
+
+        Args:
+            key: `build_llm_cache_key` 결과
+
+        Returns:
+            응답 텍스트(miss/만료 시 None)
+        """
+        now = time.time()
+        try:
+            with self._lock:
+                if not self._db_path.exists():
+                    self._stats["misses"] += 1
+                    return None
+                connection = self._connect()
+                try:
+                    row = connection.execute(
+                        "SELECT response_text, created_at FROM llm_response_cache WHERE cache_key = ?",
+                        (key,),
+                    ).fetchone()
+                    if row is None:
+                        self._stats["misses"] += 1
+                        return None
+                    if now - float(row[1]) > self._ttl_sec:
+                        connection.execute("DELETE FROM llm_response_cache WHERE cache_key = ?", (key,))
+                        connection.commit()
+                        self._stats["misses"] += 1
+                        self._stats["expired"] += 1
+                        return None
+                    connection.execute(
+                        "UPDATE llm_response_cache SET last_access_at = ?, hit_count = hit_count + 1 WHERE cache_key = ?",
+                        (now, key),
+                    )
+                    connection.commit()
+                    self._stats["hits"] += 1
+                    return str(row[0])
+                finally:
+                    connection.close()
+        except sqlite3.Error as exc:
+            logger.warning("llm_response_cache_read_failed: error=%s", exc)
+            return None
+
+    def put(self, key: str, response_text: str) -> None:
+        """
+        응답 텍스트를 저장하고 만료/초과 항목을 정리한다.
+
+        Args:
+            key: `build_llm_cache_key` 결과
+            response_text: 저장할 응답 텍스트
+        """
+        now = time.time()
+        try:
+            with self._lock:
+                self._db_path.parent.mkdir(parents=True, exist_ok=True)
+                connection = self._connect()
+                try:
+                    connection.execute(
+                        "INSERT OR REPLACE INTO llm_response_cache "
+                        "(cache_key, response_text, created_at, last_access_at, hit_count) "
+                        "VALUES (?, ?, ?, ?, 0)",
+                        (key, str(response_text or ""), now, now),
+                    )
+                    expired = connection.execute(
+                        "DELETE FROM llm_response_cache WHERE created_at < ?",
+                        (now - self._ttl_sec,),
+                    ).rowcount
+                    overflow = int(connection.execute("SELECT COUNT(*) FROM llm_response_cache").fetchone()[0])
+                    overflow -= self._max_entries
+                    evicted = 0
+                    if overflow > 0:
+                        evicted = connection.execute(
+                            "DELETE FROM llm_response_cache WHERE cache_key IN ("
+                            "SELECT cache_key FROM llm_response_cache ORDER BY last_access_at ASC LIMIT ?)",
+                            (overflow,),
+                        ).rowcount
+                    connection.commit()
+                    self._stats["writes"] += 1
+                    self._stats["expired"] += max(0, int(expired))
+                    self._stats["evictions"] += max(0, int(evicted))
+                finally:
+                    connection.close()
+        except sqlite3.Error as exc:
+            logger.warning("llm_response_cache_write_failed: error=%s", exc)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        프로세스 단위 hit/miss 카운터를 반환한다.
+
+        Returns:
+            카운터 사전(hit_rate 포함)
+        """
+        with self._lock:
+            stats: dict[str, Any] = dict(self._stats)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        stats["db_path"] = str(self._db_path)
+        return stats
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        캐시 sqlite 연결을 열고 테이블을 보장한다.
+
+        Returns:
+            sqlite 연결
+        """
+        connection = sqlite3.connect(str(self._db_path), timeout=5)
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS llm_response_cache ("
+            "cache_key TEXT PRIMARY KEY, "
+            "response_text TEXT NOT NULL, "
+            "created_at REAL NOT NULL, "
+            "last_access_at REAL NOT NULL, "
+            "hit_count INTEGER NOT NULL DEFAULT 0)"
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_llm_response_cache_last_access ON llm_response_cache(last_access_at)"
+        )
+        return connection
+
+
+def get_llm_response_cache() -> LLMResponseCache | None:
+    """
+    환경변수로 활성화된 경우 프로세스 공유 LLM 응답 캐시를 반환한다.
+
+    Returns:
+        캐시 인스턴스(비활성화 시 None)
+    """
+    enabled = str(os.getenv(LLM_RESPONSE_CACHE_ENABLED_ENV, "0")).strip().lower()
+    if enabled in {"", "0", "false", "off", "no"}:
+        return None
+    db_path = str(os.getenv(LLM_RESPONSE_CACHE_PATH_ENV, "")).strip() or str(DEFAULT_LLM_RESPONSE_CACHE_PATH)
+    ttl_sec = resolve_positive_int_env(LLM_RESPONSE_CACHE_TTL_SEC_ENV, DEFAULT_LLM_RESPONSE_CACHE_TTL_SEC)
+    max_entries = resolve_positive_int_env(LLM_RESPONSE_CACHE_MAX_ENTRIES_ENV, DEFAULT_LLM_RESPONSE_CACHE_MAX_ENTRIES)
+    key = (db_path, ttl_sec, max_entries)
+    with _CACHE_REGISTRY_LOCK:
+        cache = _CACHE_REGISTRY.get(key)
+        if cache is None:
+            cache = LLMResponseCache(db_path=Path(db_path), ttl_sec=ttl_sec, max_entries=max_entries)
+            _CACHE_REGISTRY[key] = cache
+        return cache
+
+
+def get_llm_response_cache_stats() -> dict[str, Any]:
+    """
+    현재 설정된 LLM 응답 캐시의 hit/miss 카운터를 반환한다.
+
+    Returns:
+        `enabled` 여부를 포함한 카운터 사전
+    """
+    cache = get_llm_response_cache()
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.get_stats()}
+
+
+def lookup_llm_response_cache(
+    enabled: bool,
+    model_name: str,
+    messages: list[dict[str, str]],
+    temperature: float | None,
+    schema: str,
+) -> tuple[LLMResponseCache | None, str, str | None]:
+    """
+    호출부가 허용하고 전역 설정이 켜진 경우 응답 캐시를 조회한다.
+
+    Args:
+        enabled: 호출부 캐시 허용 여부
+        model_name: 정규화된 모델명
+        messages: role/content 배열
+        temperature: 샘플링 온도
+        schema: 출력 형식 식별자
+
+    Returns:
+        (캐시 인스턴스, 캐시 키, 캐시된 응답) 튜플(비활성화 시 `(None, "", None)`)
+    """
+    cache = get_llm_response_cache() if enabled else None
+    if cache is None:
+        return None, "", None
+    cache_key = build_llm_cache_key(model_name=model_name, messages=messages, temperature=temperature, schema=schema)
+    return cache, cache_key, cache.get(key=cache_key)
+
+
+def store_llm_response_cache(cache: LLMResponseCache | None, cache_key: str, content: str) -> None:
+    """
+    `lookup_llm_response_cache`로 조회한 키에 비어 있지 않은 응답을 저장한다.
+
+    Args:
+        cache: 캐시 인스턴스(비활성화 시 None)
+        cache_key: 캐시 키
+        content: 응답 텍스트
+    """
+    if cache is None or not content:
+        return
+    cache.put(key=cache_key, response_text=content)
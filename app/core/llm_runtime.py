@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import os
+import threading
+from collections import OrderedDict
 from typing import Any
 
 from langchain.chat_models import init_chat_model
 from langchain_core.messages import HumanMessage, SystemMessage
 
+from app.core.env_config import resolve_positive_int_env
+from app.core.llm_response_cache import lookup_llm_response_cache, store_llm_response_cache
 from app.core.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -19,6 +24,11 @@ PROVIDER_ENV_KEYS: dict[str, tuple[str, ...]] = {
 }
 AZURE_API_VERSION_ENV = "AZURE_OPENAI_API_VERSION"
 OPENAI_API_VERSION_ENV = "OPENAI_API_VERSION"
+CHAT_MODEL_CACHE_SIZE_ENV = "MOLDUBOT_CHAT_MODEL_CACHE_SIZE"
+DEFAULT_CHAT_MODEL_CACHE_SIZE = 16
+_CHAT_MODEL_CACHE: OrderedDict[tuple[str, float, float | None, str], Any] = OrderedDict()
+_CHAT_MODEL_CACHE_LOCK = threading.Lock()
+_CHAT_MODEL_BUILD_LOCKS: dict[tuple[str, float, float | None, str], threading.Lock] = {}
 
 
 def normalize_model_name(model_name: str, default_model: str = DEFAULT_CHAT_MODEL_FALLBACK) -> str:
@@ -144,12 +154,88 @@ def ensure_azure_openai_env_compat() -> None:
     os.environ[OPENAI_API_VERSION_ENV] = azure_version
 
 
+def get_chat_model(
+    model_name: str,
+    timeout_sec: float = 60,
+    temperature: float | None = None,
+    base_url: str = "",
+) -> Any:
+    """
+    (모델, timeout, temperature, base_url) 키로 캐시된 채팅 모델 클라이언트를 반환한다.
+
+    provider 클라이언트/HTTP 연결 풀을 호출마다 새로 만들지 않도록 LRU 크기 제한 캐시에
+    보관하며, 같은 키의 동시 첫 호출도 인스턴스를 한 번만 생성한다. 생성은 키별 lock에서
+    수행하므로 느린 provider 초기화가 다른 키 조회를 막지 않는다.
+
+    Args:
+        model_name: 모델명
+        timeout_sec: 타임아웃(초)
+        temperature: 샘플링 온도
+        base_url: provider endpoint override(선택)
+
+    Returns:
+        LangChain 채팅 모델 인스턴스
+    """
+    normalized_model = normalize_model_name(model_name=model_name)
+    normalized_base_url = str(base_url or "").strip()
+    cache_key = (normalized_model, float(timeout_sec), temperature, normalized_base_url)
+    cached = _get_cached_chat_model(cache_key=cache_key)
+    if cached is not None:
+        return cached
+    with _CHAT_MODEL_CACHE_LOCK:
+        build_lock = _CHAT_MODEL_BUILD_LOCKS.setdefault(cache_key, threading.Lock())
+    # provider 클라이언트 생성은 키별 lock 안에서만 수행해 다른 모델 조회를 막지 않는다.
+    with build_lock:
+        cached = _get_cached_chat_model(cache_key=cache_key)
+        if cached is not None:
+            return cached
+        model_kwargs: dict[str, Any] = {"model": normalized_model, "timeout": timeout_sec}
+        if temperature is not None:
+            model_kwargs["temperature"] = temperature
+        if normalized_base_url:
+            model_kwargs["base_url"] = normalized_base_url
+        llm = init_chat_model(**model_kwargs)
+        with _CHAT_MODEL_CACHE_LOCK:
+            _CHAT_MODEL_CACHE[cache_key] = llm
+            _CHAT_MODEL_BUILD_LOCKS.pop(cache_key, None)
+            while len(_CHAT_MODEL_CACHE) > resolve_positive_int_env(CHAT_MODEL_CACHE_SIZE_ENV, DEFAULT_CHAT_MODEL_CACHE_SIZE):
+                evicted_key, _ = _CHAT_MODEL_CACHE.popitem(last=False)
+                logger.info("chat_model_cache_evicted: model=%s", evicted_key[0])
+        return llm
+
+
+def _get_cached_chat_model(cache_key: tuple[str, float, float | None, str]) -> Any:
+    """
+    캐시된 채팅 모델을 조회하고 LRU 순서를 갱신한다.
+
+    Args:
+        cache_key: (모델, timeout, temperature, base_url) 키
+
+    Returns:
+        캐시된 모델(없으면 None)
+    """
+    with _CHAT_MODEL_CACHE_LOCK:
+        cached = _CHAT_MODEL_CACHE.get(cache_key)
+        if cached is not None:
+            _CHAT_MODEL_CACHE.move_to_end(cache_key)
+        return cached
+
+
+def reset_chat_model_cache() -> None:
+    """
+    캐시된 채팅 모델 클라이언트를 모두 비운다(자격 증명/endpoint 교체, 테스트 격리용).
+    """
+    with _CHAT_MODEL_CACHE_LOCK:
+        _CHAT_MODEL_CACHE.clear()
+
+
 def invoke_json_object(
     model_name: str,
     system_prompt: str,
     user_prompt: str,
     timeout_sec: int = 60,
     temperature: float | None = None,
+    response_cache: bool = False,
 ) -> dict[str, Any]:
     """
     LLM 호출 결과를 JSON 객체로 파싱해 반환한다.
@@ -160,6 +246,7 @@ def invoke_json_object(
         user_prompt: 사용자 프롬프트
         timeout_sec: 타임아웃(초)
         temperature: 샘플링 온도
+        response_cache: 응답 캐시 사용 여부(`MOLDUBOT_LLM_RESPONSE_CACHE_ENABLED`가 켜진 경우에만 적용)
 
     Returns:
         파싱된 JSON 사전
@@ -167,18 +254,27 @@ def invoke_json_object(
     Raises:
         ValueError: 응답이 JSON 객체가 아닐 때
     """
+    messages = [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_prompt},
+    ]
+    cache, cache_key, cached = lookup_llm_response_cache(
+        enabled=response_cache,
+        model_name=normalize_model_name(model_name=model_name),
+        messages=messages,
+        temperature=temperature,
+        schema="json_object",
+    )
+    if cached is not None:
+        return _parse_json_object(content=cached)
     content = invoke_text_messages(
         model_name=model_name,
-        messages=[
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt},
-        ],
+        messages=messages,
         timeout_sec=timeout_sec,
         temperature=temperature,
     )
-    loaded = json.loads(content)
-    if not isinstance(loaded, dict):
-        raise ValueError("llm_response_not_json_object")
+    loaded = _parse_json_object(content=content)
+    store_llm_response_cache(cache=cache, cache_key=cache_key, content=content)
     return loaded
 
 
@@ -187,6 +283,7 @@ def invoke_text_messages(
     messages: list[dict[str, str]],
     timeout_sec: int = 60,
     temperature: float | None = None,
+    response_cache: bool = False,
 ) -> str:
     """
     LLM을 호출해 텍스트 응답을 반환한다.
@@ -196,18 +293,143 @@ def invoke_text_messages(
         messages: role/content 배열
         timeout_sec: 타임아웃(초)
         temperature: 샘플링 온도
+        response_cache: 응답 캐시 사용 여부(`MOLDUBOT_LLM_RESPONSE_CACHE_ENABLED`가 켜진 경우에만 적용)
 
     Returns:
         응답 텍스트
     """
-    normalized_model = normalize_model_name(model_name=model_name)
-    model_kwargs: dict[str, Any] = {"model": normalized_model, "timeout": timeout_sec}
-    if temperature is not None:
-        model_kwargs["temperature"] = temperature
-    llm = init_chat_model(**model_kwargs)
+    cache, cache_key, cached = lookup_llm_response_cache(
+        enabled=response_cache,
+        model_name=normalize_model_name(model_name=model_name),
+        messages=messages,
+        temperature=temperature,
+        schema="text",
+    )
+    if cached is not None:
+        return cached
+    llm = get_chat_model(model_name=model_name, timeout_sec=timeout_sec, temperature=temperature)
     lc_messages = _to_langchain_messages(messages=messages)
     response = llm.invoke(lc_messages)
-    return _coerce_message_content(content=getattr(response, "content", ""))
+    content = _coerce_message_content(content=getattr(response, "content", ""))
+    store_llm_response_cache(cache=cache, cache_key=cache_key, content=content)
+    return content
+
+
+async def ainvoke_json_object(
+    model_name: str,
+    system_prompt: str,
+    user_prompt: str,
+    timeout_sec: int = 60,
+    temperature: float | None = None,
+    response_cache: bool = False,
+) -> dict[str, Any]:
+    """
+    LLM을 비동기 호출해 결과를 JSON 객체로 파싱해 반환한다.
+
+    Args:
+        model_name: 모델명
+        system_prompt: 시스템 프롬프트
+        user_prompt: 사용자 프롬프트
+        timeout_sec: 호출 단위 타임아웃(초)
+        temperature: 샘플링 온도
+        response_cache: 응답 캐시 사용 여부(`MOLDUBOT_LLM_RESPONSE_CACHE_ENABLED`가 켜진 경우에만 적용)
+
+    Returns:
+        파싱된 JSON 사전
+
+    Raises:
+        ValueError: 응답이 JSON 객체가 아닐 때
+        TimeoutError: 호출이 timeout_sec 안에 끝나지 않았을 때
+    """
+    messages = [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_prompt},
+    ]
+    cache, cache_key, cached = lookup_llm_response_cache(
+        enabled=response_cache,
+        model_name=normalize_model_name(model_name=model_name),
+        messages=messages,
+        temperature=temperature,
+        schema="json_object",
+    )
+    if cached is not None:
+        return _parse_json_object(content=cached)
+    content = await ainvoke_text_messages(
+        model_name=model_name,
+        messages=messages,
+        timeout_sec=timeout_sec,
+        temperature=temperature,
+    )
+    loaded = _parse_json_object(content=content)
+    store_llm_response_cache(cache=cache, cache_key=cache_key, content=content)
+    return loaded
+
+
+async def ainvoke_text_messages(
+    model_name: str,
+    messages: list[dict[str, str]],
+    timeout_sec: int = 60,
+    temperature: float | None = None,
+    response_cache: bool = False,
+) -> str:
+    """
+    LLM을 비동기(`ainvoke`) 호출해 텍스트 응답을 반환한다.
+
+    이벤트 루프 스레드를 점유하지 않으며, 호출 task가 취소되면 진행 중인 요청도
+    함께 취소된다(`CancelledError`는 그대로 전파).
+
+    Args:
+        model_name: 모델명
+        messages: role/content 배열
+        timeout_sec: 호출 단위 타임아웃(초)
+        temperature: 샘플링 온도
+        response_cache: 응답 캐시 사용 여부(`MOLDUBOT_LLM_RESPONSE_CACHE_ENABLED`가 켜진 경우에만 적용)
+
+    Returns:
+        응답 텍스트
+
+    Raises:
+        TimeoutError: 호출이 timeout_sec 안에 끝나지 않았을 때
+    """
+    cache, cache_key, cached = lookup_llm_response_cache(
+        enabled=response_cache,
+        model_name=normalize_model_name(model_name=model_name),
+        messages=messages,
+        temperature=temperature,
+        schema="text",
+    )
+    if cached is not None:
+        return cached
+    llm = get_chat_model(model_name=model_name, timeout_sec=timeout_sec, temperature=temperature)
+    lc_messages = _to_langchain_messages(messages=messages)
+    try:
+        response = await asyncio.wait_for(llm.ainvoke(lc_messages), timeout=float(timeout_sec))
+    except TimeoutError:
+        logger.warning("llm_ainvoke_timeout: model=%s timeout_sec=%s", model_name, timeout_sec)
+        raise
+    content = _coerce_message_content(content=getattr(response, "content", ""))
+    store_llm_response_cache(cache=cache, cache_key=cache_key, content=content)
+    return content
+
+
+def _parse_json_object(content: str) -> dict[str, Any]:
+    """
+    모델 응답 텍스트를 JSON 객체로 파싱한다.
+
+    Args:
+        content: 응답 텍스트
+
+    Returns:
+        파싱된 JSON 사전
+
+    Raises:
+        ValueError: 응답이 JSON 객체가 아닐 때
+    """
+    loaded = json.loads(content)
+    if not isinstance(loaded, dict):
+        raise ValueError("llm_response_not_json_object")
+    return loaded
+
 
 
 def _to_langchain_messages(messages: list[dict[str, str]]) -> list[SystemMessage | HumanMessage]:
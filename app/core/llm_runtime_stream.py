@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from typing import Any, Callable
+
+from app.core.llm_runtime import _coerce_message_content, _to_langchain_messages, get_chat_model
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+def stream_text_messages(
+    model_name: str,
+    messages: list[dict[str, str]],
+    timeout_sec: int = 60,
+    temperature: float | None = None,
+    delta_callback: Callable[[str], None] | None = None,
+) -> str:
+    """
+    LLM을 스트리밍 호출해 생성되는 delta를 콜백으로 전달하고 최종 텍스트를 반환한다.
+
+    Args:
+        model_name: 모델명
+        messages: role/content 배열
+        timeout_sec: 타임아웃(초)
+        temperature: 샘플링 온도
+        delta_callback: 모델 delta 콜백(선택)
+
+    Returns:
+        `invoke_text_messages`와 같은 규칙으로 정규화한 전체 응답 텍스트
+    """
+    llm = get_chat_model(model_name=model_name, timeout_sec=timeout_sec, temperature=temperature)
+    lc_messages = _to_langchain_messages(messages=messages)
+    parts: list[str] = []
+    for chunk in llm.stream(lc_messages):
+        delta = extract_delta_text(content=getattr(chunk, "content", ""))
+        if not delta:
+            continue
+        parts.append(delta)
+        if callable(delta_callback):
+            delta_callback(delta)
+    logger.info("llm_stream_completed: model=%s chunks=%s", model_name, len(parts))
+    return _coerce_message_content(content="".join(parts))
+
+
+def extract_delta_text(content: Any) -> str:
+    """
+    스트리밍 chunk content에서 공백을 보존한 텍스트를 추출한다.
+
+    Args:
+        content: chunk content(문자열 또는 content block 목록)
+
+    Returns:
+        delta 텍스트(텍스트가 없으면 빈 문자열)
+    """
+    if isinstance(content, str):
+        return content
+    if not isinstance(content, list):
+        return ""
+    parts: list[str] = []
+    for item in content:
+        if isinstance(item, str):
+            parts.append(item)
+        elif isinstance(item, dict) and str(item.get("type") or "text") == "text":
+            parts.append(str(item.get("text") or ""))
+    return "".join(parts)
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+MAIL_SUMMARY_SKILL_COMMANDS: tuple[str, ...] = ("/메일요약", "/mailsummary")
+CODE_REVIEW_SKILL_COMMANDS: tuple[str, ...] = ("/코드분석", "/codeanalysis")
+EXPLICIT_SKILL_COMMANDS: tuple[str, ...] = MAIL_SUMMARY_SKILL_COMMANDS + CODE_REVIEW_SKILL_COMMANDS
+TRANSLATION_TOKENS: tuple[str, ...] = ("번역", "translate", "translation")
+CURRENT_MAIL_ANCHOR_TOKENS: tuple[str, ...] = (
+    "현재메일",
+    "현재선택메일",
+    "현재선택된메일",
+    "해당메일",
+    "이메일의",
+    "이이메일의",
+)
+QUERY_FEATURES_CACHE_SIZE = 512
+DEFAULT_SUMMARY_LINE_TARGET = 5
+MAX_SUMMARY_LINE_TARGET = 20
+
+# 공백 제거/소문자 질의에서 찾을 토큰 → 켜지는 플래그. 한 번의 스캔으로 모든 플래그를 모은다.
+_KEYWORD_FLAG_TABLE: tuple[tuple[str, str], ...] = (
+    ("코드", "code"),
+    ("리뷰", "review"),
+    ("분석", "analysis"),
+    ("코드스니펫", "snippet"),
+    ("현재메일", "current_mail"),
+    ("요약", "summary"),
+    *((token, "translation") for token in TRANSLATION_TOKENS),
+    *((token, "anchor") for token in CURRENT_MAIL_ANCHOR_TOKENS),
+)
+
+
+def _build_keyword_flags() -> dict[str, frozenset[str]]:
+    """
+    토큰별 플래그 집합을 만든다.
+
+    같은 위치에서는 가장 긴 토큰 하나만 매칭되므로(예: `코드스니펫`), 그 토큰이 접두어로
+    포함하는 짧은 토큰(`코드`)의 플래그도 함께 켠다.
+
+    Returns:
+        토큰 → 플래그 집합 사전
+    """
+    flags: dict[str, set[str]] = {}
+    for token, _ in _KEYWORD_FLAG_TABLE:
+        flags[token] = {flag for other, flag in _KEYWORD_FLAG_TABLE if token.startswith(other)}
+    return {token: frozenset(values) for token, values in flags.items()}
+
+
+_KEYWORD_FLAGS = _build_keyword_flags()
+_KEYWORD_PATTERN = re.compile(
+    "(?=(" + "|".join(re.escape(token) for token in sorted(_KEYWORD_FLAGS, key=len, reverse=True)) + "))"
+)
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_MAIL_SUMMARY_SKILL_PATTERN = re.compile(
+    r"^(?:" + "|".join(re.escape(command) for command in MAIL_SUMMARY_SKILL_COMMANDS) + r")(?: |\Z)"
+)
+_EXPLICIT_SKILL_PATTERN = re.compile(
+    r"^(?:" + "|".join(re.escape(command) for command in EXPLICIT_SKILL_COMMANDS) + r")(?: |\Z)"
+)
+_LINE_COUNT_PATTERN = re.compile(r"\d+\s*줄")
+_SUMMARY_LINE_TARGET_PATTERN = re.compile(r"(\d{1,2})\s*(줄|개|가지)")
+
+
+@dataclass(frozen=True)
+class QueryFeatures:
+    """
+    사용자 질의 1건에서 한 번에 추출한 규칙 기반 의도 플래그.
+
+    Attributes:
+        sanitized: 따옴표/양끝 공백을 제거한 질의
+        is_mail_summary_skill: `/메일요약` 스킬 명령 여부
+        is_explicit_skill: 명시 스킬 슬래시 명령 여부
+        is_code_review: 코드 리뷰/분석 요청 여부
+        is_translation_like: 번역 성격 요청 여부
+        has_current_mail_anchor: 현재메일 지시 앵커 포함 여부
+        is_current_mail_summary: 현재메일 대상 요약 요청 여부
+        has_explicit_line_count: `N줄`처럼 줄 수가 명시됐는지 여부
+        summary_line_target: 목표 요약 줄 수
+    """
+
+    sanitized: str
+    is_mail_summary_skill: bool
+    is_explicit_skill: bool
+    is_code_review: bool
+    is_translation_like: bool
+    has_current_mail_anchor: bool
+    is_current_mail_summary: bool
+    has_explicit_line_count: bool
+    summary_line_target: int
+
+
+def sanitize_user_query(user_message: str) -> str:
+    """
+    사용자 입력 문자열에서 구조분해에 불필요한 노이즈를 제거한다.
+    """
+    text = str(user_message or "").strip()
+    return text.strip('"').strip("'").strip()
+
+
+@lru_cache(maxsize=QUERY_FEATURES_CACHE_SIZE)
+def get_query_features(user_message: str) -> QueryFeatures:
+    """
+    질의의 규칙 기반 의도 플래그를 계산한다.
+
+    한 턴 안에서 같은 질의로 여러 판별 함수가 불려도 스캔은 질의당 한 번만 일어나도록
+    결과를 캐시한다(입력 문자열만의 순수 함수).
+
+    Args:
+        user_message: 사용자 입력 원문
+
+    Returns:
+        질의 플래그
+    """
+    raw = str(user_message or "")
+    sanitized = sanitize_user_query(user_message=raw)
+    lowered = sanitized.lower()
+    compact = _WHITESPACE_PATTERN.sub("", raw).lower()
+    flags: set[str] = set()
+    for match in _KEYWORD_PATTERN.finditer(compact):
+        flags.update(_KEYWORD_FLAGS[match.group(1)])
+    is_mail_summary_skill = bool(_MAIL_SUMMARY_SKILL_PATTERN.match(lowered))
+    return QueryFeatures(
+        sanitized=sanitized,
+        is_mail_summary_skill=is_mail_summary_skill,
+        is_explicit_skill=bool(_EXPLICIT_SKILL_PATTERN.match(lowered)),
+        is_code_review=("code" in flags and ("review" in flags or "analysis" in flags)) or "snippet" in flags,
+        is_translation_like="translation" in flags,
+        has_current_mail_anchor="anchor" in flags,
+        is_current_mail_summary=("current_mail" in flags and "summary" in flags) or is_mail_summary_skill,
+        has_explicit_line_count=bool(_LINE_COUNT_PATTERN.search(raw)),
+        summary_line_target=_resolve_summary_line_target(text=raw),
+    )
+
+
+def get_query_features_stats() -> dict[str, Any]:
+    """
+    질의 플래그 캐시 카운터를 반환한다.
+
+    Returns:
+        hits/misses/entries/hit_rate 사전
+    """
+    info = get_query_features.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "entries": info.currsize,
+        "hit_rate": round(info.hits / lookups, 4) if lookups else 0.0,
+    }
+
+
+def _resolve_summary_line_target(text: str) -> int:
+    """
+    사용자 문장에서 목표 요약 줄 수를 추정한다.
+
+    Args:
+        text: 사용자 입력 원문
+
+    Returns:
+        1~MAX_SUMMARY_LINE_TARGET 범위 줄 수(미지정 시 기본값)
+    """
+    match = _SUMMARY_LINE_TARGET_PATTERN.search(text)
+    if not match:
+        return DEFAULT_SUMMARY_LINE_TARGET
+    value = int(match.group(1))
+    if value < 1:
+        return DEFAULT_SUMMARY_LINE_TARGET
+    return min(value, MAX_SUMMARY_LINE_TARGET)
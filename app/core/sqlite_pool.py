@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+from app.core.env_config import resolve_non_negative_int_env
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+SQLITE_BUSY_TIMEOUT_MS_ENV = "MOLDUBOT_SQLITE_BUSY_TIMEOUT_MS"
+SQLITE_MMAP_SIZE_BYTES_ENV = "MOLDUBOT_SQLITE_MMAP_SIZE_BYTES"
+DEFAULT_SQLITE_BUSY_TIMEOUT_MS = 5000
+DEFAULT_SQLITE_MMAP_SIZE_BYTES = 256 * 1024 * 1024
+_POOL_REGISTRY: dict[str, "SQLiteConnectionPool"] = {}
+_POOL_REGISTRY_LOCK = threading.Lock()
+
+
+class SQLiteConnectionPool:
+    """
+    단일 SQLite 파일에 대한 프로세스 공유 연결 풀.
+
+    읽기는 스레드별로 재사용하는 연결을, 쓰기는 lock으로 직렬화한 단일 writer 연결을 사용한다.
+    모든 연결은 `journal_mode=WAL`/`synchronous=NORMAL`/`mmap_size`/`busy_timeout`로 열어 읽기가
+    summary worker 등의 쓰기 뒤에서 대기하지 않는다. DB 파일이 교체되면(inode 변경) 연결을 다시 연다.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        busy_timeout_ms: int = DEFAULT_SQLITE_BUSY_TIMEOUT_MS,
+        mmap_size_bytes: int = DEFAULT_SQLITE_MMAP_SIZE_BYTES,
+        foreign_keys: bool = False,
+    ) -> None:
+        """
+        연결 풀을 초기화한다(연결은 첫 사용 시 연다).
+
+        Args:
+            db_path: SQLite 파일 경로
+            busy_timeout_ms: lock 대기 시간(ms)
+            mmap_size_bytes: 메모리 매핑 I/O 크기(0이면 비활성화)
+            foreign_keys: `PRAGMA foreign_keys=ON` 적용 여부
+        """
+        self._db_path = Path(db_path)
+        self._busy_timeout_ms = max(0, int(busy_timeout_ms))
+        self._mmap_size_bytes = max(0, int(mmap_size_bytes))
+        self._foreign_keys = bool(foreign_keys)
+        self._local = threading.local()
+        self._write_lock = threading.RLock()
+        self._writer: sqlite3.Connection | None = None
+        self._writer_file_id: tuple[int, int] | None = None
+        self._stats_lock = threading.Lock()
+        self._stats = {"connections_opened": 0, "reads": 0, "writes": 0}
+
+    @property
+    def db_path(self) -> Path:
+        """풀 대상 SQLite 파일 경로."""
+        return self._db_path
+
+    @contextmanager
+    def read(self, row_factory: Callable[..., Any] | None = None) -> Iterator[sqlite3.Connection]:
+        """
+        현재 스레드의 읽기 연결을 빌려준다.
+
+        같은 스레드의 중첩 호출은 같은 연결을 공유하며, 가장 바깥 블록 종료 시 열린 트랜잭션이
+        남아 있으면 rollback해 WAL checkpoint를 막지 않는다.
+
+        Args:
+            row_factory: 블록 안에서만 적용할 row factory(예: `sqlite3.Row`)
+
+        Yields:
+            읽기 전용 용도로 사용할 sqlite 연결
+        """
+        depth = int(getattr(self._local, "read_depth", 0))
+        connection = self._local.reader if depth > 0 else self._get_reader()
+        previous_row_factory = connection.row_factory
+        connection.row_factory = row_factory
+        self._local.read_depth = depth + 1
+        self._count("reads")
+        try:
+            yield connection
+        finally:
+            connection.row_factory = previous_row_factory
+            self._local.read_depth = depth
+            if depth == 0 and connection.in_transaction:
+                connection.rollback()
+
+    @contextmanager
+    def write(
+        self,
+        row_factory: Callable[..., Any] | None = None,
+        immediate: bool = False,
+    ) -> Iterator[sqlite3.Connection]:
+        """
+        직렬화된 writer 연결을 빌려준다.
+
+        블록이 정상 종료되면 commit, 예외가 나면 rollback한다. 같은 스레드의 중첩 호출은
+        가장 바깥 블록에서만 commit/rollback한다.
+
+        Args:
+            row_factory: 블록 안에서만 적용할 row factory
+            immediate: True면 `BEGIN IMMEDIATE`로 시작해 다른 프로세스의 쓰기와도 SELECT~UPDATE를 원자화
+
+        Yields:
+            쓰기용 sqlite 연결
+        """
+        with self._write_lock:
+            depth = int(getattr(self._local, "write_depth", 0))
+            connection = self._writer if depth > 0 and self._writer is not None else self._get_writer()
+            previous_row_factory = connection.row_factory
+            connection.row_factory = row_factory
+            self._local.write_depth = depth + 1
+            self._count("writes")
+            try:
+                if immediate and depth == 0 and not connection.in_transaction:
+                    connection.execute("BEGIN IMMEDIATE")
+                yield connection
+                if depth == 0:
+                    connection.commit()
+            except BaseException:
+                if depth == 0:
+                    connection.rollback()
+                raise
+            finally:
+                connection.row_factory = previous_row_factory
+                self._local.write_depth = depth
+
+    def close(self) -> None:
+        """writer 연결과 현재 스레드의 읽기 연결을 닫는다."""
+        with self._write_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+                self._writer_file_id = None
+        reader = getattr(self._local, "reader", None)
+        if reader is not None:
+            reader.close()
+            self._local.reader = None
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        연결 생성/대여 카운터를 반환한다.
+
+        Returns:
+            카운터 사전
+        """
+        with self._stats_lock:
+            stats: dict[str, Any] = dict(self._stats)
+        stats["db_path"] = str(self._db_path)
+        return stats
+
+    def _get_reader(self) -> sqlite3.Connection:
+        """
+        현재 스레드의 읽기 연결을 반환한다(없거나 파일이 교체됐으면 새로 연다).
+
+        Returns:
+            sqlite 연결
+        """
+        file_id = self._resolve_file_id()
+        reader = getattr(self._local, "reader", None)
+        if reader is not None and getattr(self._local, "reader_file_id", None) == file_id:
+            return reader
+        if reader is not None:
+            reader.close()
+        reader = self._open_connection(check_same_thread=True)
+        self._local.reader = reader
+        self._local.reader_file_id = self._resolve_file_id()
+        return reader
+
+    def _get_writer(self) -> sqlite3.Connection:
+        """
+        writer 연결을 반환한다(`_write_lock` 보유 상태에서 호출).
+
+        Returns:
+            sqlite 연결
+        """
+        file_id = self._resolve_file_id()
+        if self._writer is not None and self._writer_file_id == file_id:
+            return self._writer
+        if self._writer is not None:
+            self._writer.close()
+        self._writer = self._open_connection(check_same_thread=False)
+        self._writer_file_id = self._resolve_file_id()
+        return self._writer
+
+    def _open_connection(self, check_same_thread: bool) -> sqlite3.Connection:
+        """
+        성능 PRAGMA를 적용한 새 연결을 연다.
+
+        Args:
+            check_same_thread: sqlite3 스레드 검사 여부(writer는 lock으로 보호하므로 False)
+
+        Returns:
+            sqlite 연결
+        """
+        connection = sqlite3.connect(
+            str(self._db_path),
+            timeout=self._busy_timeout_ms / 1000,
+            check_same_thread=check_same_thread,
+        )
+        try:
+            connection.execute("PRAGMA journal_mode=WAL")
+        except sqlite3.OperationalError as exc:
+            logger.warning("sqlite_pool_wal_unavailable: path=%s error=%s", self._db_path, exc)
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(f"PRAGMA busy_timeout={self._busy_timeout_ms}")
+        connection.execute(f"PRAGMA mmap_size={self._mmap_size_bytes}")
+        if self._foreign_keys:
+            connection.execute("PRAGMA foreign_keys=ON")
+        self._count("connections_opened")
+        return connection
+
+    def _resolve_file_id(self) -> tuple[int, int] | None:
+        """
+        DB 파일 식별자(device, inode)를 반환한다.
+
+        Returns:
+            파일 식별자(파일이 없으면 None)
+        """
+        try:
+            stat = os.stat(self._db_path)
+        except OSError:
+            return None
+        return stat.st_dev, stat.st_ino
+
+    def _count(self, key: str) -> None:
+        """
+        카운터를 1 증가시킨다.
+
+        Args:
+            key: 카운터 이름
+        """
+        with self._stats_lock:
+            self._stats[key] += 1
+
+
+def get_sqlite_pool(db_path: Path | str, foreign_keys: bool = False) -> SQLiteConnectionPool:
+    """
+    경로별 프로세스 공유 SQLite 연결 풀을 반환한다.
+
+    Args:
+        db_path: SQLite 파일 경로
+        foreign_keys: 풀을 새로 만들 때 `PRAGMA foreign_keys=ON` 적용 여부
+
+    Returns:
+        연결 풀
+    """
+    key = str(Path(db_path).resolve())
+    with _POOL_REGISTRY_LOCK:
+        pool = _POOL_REGISTRY.get(key)
+        if pool is None:
+            pool = SQLiteConnectionPool(
+                db_path=Path(key),
+                busy_timeout_ms=resolve_non_negative_int_env(SQLITE_BUSY_TIMEOUT_MS_ENV, DEFAULT_SQLITE_BUSY_TIMEOUT_MS),
+                mmap_size_bytes=resolve_non_negative_int_env(SQLITE_MMAP_SIZE_BYTES_ENV, DEFAULT_SQLITE_MMAP_SIZE_BYTES),
+                foreign_keys=foreign_keys,
+            )
+            _POOL_REGISTRY[key] = pool
+        return pool
+
+
+def close_sqlite_pools() -> None:
+    """등록된 모든 풀의 writer/현재 스레드 연결을 닫고 registry를 비운다."""
+    with _POOL_REGISTRY_LOCK:
+        pools = list(_POOL_REGISTRY.values())
+        _POOL_REGISTRY.clear()
+    for pool in pools:
+        pool.close()
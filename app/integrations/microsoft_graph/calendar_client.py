@@ -6,6 +6,7 @@ from typing import Any
 import requests
 
 from app.core.logging_config import get_logger
+from app.integrations.microsoft_graph.graph_transport import graph_post
 from app.integrations.microsoft_graph.mail_client import (
     GRAPH_BASE_URL,
     GraphMailClient,
@@ -178,7 +179,7 @@ class GraphCalendarClient:
                 for address in normalized_attendees
             ]
         try:
-            return requests.post(url, headers=headers, json=payload, timeout=10)
+            return graph_post(url, headers=headers, json=payload, endpoint="calendar.create_event")
         except requests.RequestException as exc:
             logger.warning("Graph 일정 생성 네트워크 실패: error=%s", exc)
             return None
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+import requests
+
+from app.core.logging_config import get_logger
+from app.integrations.microsoft_graph.graph_transport import THROTTLE_STATUS_CODES, graph_post, parse_retry_after
+
+logger = get_logger(__name__)
+GRAPH_BATCH_MAX_REQUESTS = 20
+GRAPH_BATCH_THROTTLE_MAX_ROUNDS = 3
+GRAPH_BATCH_RETRY_AFTER_MAX_SEC = 30.0
+DEFAULT_SUB_REQUEST_RETRY_SEC = 1.0
+
+
+@dataclass(frozen=True)
+class GraphBatchRequest:
+    """
+    Graph `$batch` 하위 요청 1건.
+
+    Attributes:
+        request_id: 배치 안에서 고유한 요청 ID
+        url: `GRAPH_BASE_URL` 기준 상대 경로(예: `/me/messages/{id}`)
+        method: HTTP 메서드
+        headers: 하위 요청 헤더
+        body: 하위 요청 JSON 본문
+    """
+
+    request_id: str
+    url: str
+    method: str = "GET"
+    headers: dict[str, str] = field(default_factory=dict)
+    body: Any = None
+
+
+@dataclass(frozen=True)
+class GraphBatchResponse:
+    """
+    Graph `$batch` 하위 응답 1건.
+    """
+
+    request_id: str
+    status: int
+    headers: dict[str, str]
+    body: Any
+
+
+@dataclass
+class GraphBatchResult:
+    """
+    Graph `$batch` 실행 결과.
+
+    Attributes:
+        status_code: 바깥 `$batch` 요청 상태(모두 성공하면 200, 중단되면 실패 상태, 네트워크 실패는 0)
+        responses: 요청 ID별 하위 응답
+    """
+
+    status_code: int = 200
+    responses: dict[str, GraphBatchResponse] = field(default_factory=dict)
+
+
+def send_graph_batch(
+    batch_url: str,
+    access_token: str,
+    batch_requests: list[GraphBatchRequest],
+    sleep: Callable[[float], None] = time.sleep,
+) -> GraphBatchResult:
+    """
+    하위 요청을 20건 단위 `$batch` POST로 묶어 보낸다.
+
+    하위 응답이 429/503이면 `Retry-After`(상한 `GRAPH_BATCH_RETRY_AFTER_MAX_SEC`)만큼 기다린 뒤 해당 요청만
+    다시 묶어 최대 `GRAPH_BATCH_THROTTLE_MAX_ROUNDS`회 재전송한다. 바깥 요청이 실패하면 그 지점에서 멈추고
+    그때까지 받은 하위 응답과 실패 상태를 반환한다.
+
+    Args:
+        batch_url: `$batch` 엔드포인트 URL
+        access_token: Graph Bearer 토큰
+        batch_requests: 하위 요청 목록
+        sleep: 대기 함수(테스트 주입용)
+
+    Returns:
+        배치 실행 결과
+    """
+    result = GraphBatchResult()
+    pending = list(batch_requests)
+    for round_index in range(GRAPH_BATCH_THROTTLE_MAX_ROUNDS):
+        throttled: list[GraphBatchRequest] = []
+        retry_after_sec = 0.0
+        for start in range(0, len(pending), GRAPH_BATCH_MAX_REQUESTS):
+            chunk = pending[start : start + GRAPH_BATCH_MAX_REQUESTS]
+            chunk_responses = _post_batch_chunk(
+                batch_url=batch_url,
+                access_token=access_token,
+                chunk=chunk,
+                result=result,
+            )
+            if chunk_responses is None:
+                return result
+            chunk_by_id = {item.request_id: item for item in chunk}
+            for response in chunk_responses:
+                if response.status in THROTTLE_STATUS_CODES and response.request_id in chunk_by_id:
+                    throttled.append(chunk_by_id[response.request_id])
+                    retry_after = parse_retry_after(value=str(response.headers.get("Retry-After") or ""))
+                    retry_after_sec = max(retry_after_sec, DEFAULT_SUB_REQUEST_RETRY_SEC if retry_after is None else retry_after)
+                result.responses[response.request_id] = response
+        if not throttled or round_index == GRAPH_BATCH_THROTTLE_MAX_ROUNDS - 1:
+            break
+        delay = min(retry_after_sec, GRAPH_BATCH_RETRY_AFTER_MAX_SEC)
+        logger.info("graph_batch.retry_throttled: count=%s delay=%.2f", len(throttled), delay)
+        sleep(delay)
+        pending = throttled
+    return result
+
+
+def _post_batch_chunk(
+    batch_url: str,
+    access_token: str,
+    chunk: list[GraphBatchRequest],
+    result: GraphBatchResult,
+) -> list[GraphBatchResponse] | None:
+    """
+    하위 요청 묶음 1건을 `$batch`로 보낸다.
+
+    Args:
+        batch_url: `$batch` 엔드포인트 URL
+        access_token: Graph Bearer 토큰
+        chunk: 최대 20건 하위 요청
+        result: 실패 시 상태 코드를 기록할 결과 객체
+
+    Returns:
+        하위 응답 목록. 바깥 요청 실패 시 None
+    """
+    payload = {"requests": [_serialize_request(item) for item in chunk]}
+    headers = {"Authorization": f"Bearer {access_token}", "Content-Type": "application/json"}
+    try:
+        response = graph_post(batch_url, headers=headers, json=payload, endpoint="batch")
+    except requests.RequestException as exc:
+        logger.warning("Graph $batch 네트워크 실패: size=%s error=%s", len(chunk), exc)
+        result.status_code = 0
+        return None
+    if response.status_code != 200:
+        logger.warning("Graph $batch 실패: status=%s size=%s", response.status_code, len(chunk))
+        result.status_code = int(response.status_code)
+        return None
+    body = response.json()
+    items = body.get("responses", []) if isinstance(body, dict) else []
+    return [_parse_response(item) for item in items if isinstance(item, dict)]
+
+
+def _serialize_request(item: GraphBatchRequest) -> dict[str, Any]:
+    """
+    하위 요청을 `$batch` JSON 항목으로 변환한다.
+
+    Args:
+        item: 하위 요청
+
+    Returns:
+        JSON 직렬화용 사전
+    """
+    serialized: dict[str, Any] = {"id": item.request_id, "method": item.method.upper(), "url": item.url}
+    if item.headers:
+        serialized["headers"] = dict(item.headers)
+    if item.body is not None:
+        serialized["body"] = item.body
+    return serialized
+
+
+def _parse_response(item: dict[str, Any]) -> GraphBatchResponse:
+    """
+    `$batch` 하위 응답 JSON을 모델로 변환한다.
+
+    Args:
+        item: 하위 응답 JSON
+
+    Returns:
+        하위 응답 모델
+    """
+    headers = item.get("headers")
+    return GraphBatchResponse(
+        request_id=str(item.get("id") or ""),
+        status=int(item.get("status") or 0),
+        headers={str(key): str(value) for key, value in headers.items()} if isinstance(headers, dict) else {},
+        body=item.get("body"),
+    )
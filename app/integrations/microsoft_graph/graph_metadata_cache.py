@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from typing import Callable
+
+from app.core.env_config import resolve_positive_int_env
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+GRAPH_METADATA_TTL_SEC_ENV = "MOLDUBOT_GRAPH_METADATA_TTL_SEC"
+DEFAULT_GRAPH_METADATA_TTL_SEC = 3600
+TODO_DEFAULT_LIST_ID = "todo_default_list_id"
+_CACHE: "GraphMetadataCache | None" = None
+_CACHE_LOCK = threading.Lock()
+
+
+class GraphMetadataCache:
+    """
+    사용자별 Graph 메타데이터(기본 ToDo 목록 ID 등) TTL 캐시.
+
+    쓰기 요청마다 반복되던 조회 GET을 없애기 위한 것으로, 값이 잘못된 것으로 드러나면(404 등)
+    호출자가 `invalidate`로 비우고 다시 조회한다. 빈 값은 캐시하지 않는다.
+    """
+
+    def __init__(self, ttl_sec: float = DEFAULT_GRAPH_METADATA_TTL_SEC, clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        캐시를 초기화한다.
+
+        Args:
+            ttl_sec: 항목 보존 시간(초)
+            clock: 단조 시계(테스트 주입용)
+        """
+        self._ttl_sec = max(0.0, float(ttl_sec))
+        self._clock = clock
+        self._entries: dict[tuple[str, str], tuple[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, user_key: str, name: str) -> str:
+        """
+        만료되지 않은 캐시 값을 반환한다.
+
+        Args:
+            user_key: 사용자 식별 키
+            name: 메타데이터 이름
+
+        Returns:
+            캐시 값(없거나 만료되면 빈 문자열)
+        """
+        with self._lock:
+            entry = self._entries.get((user_key, name))
+            if entry is None:
+                return ""
+            value, expires_at = entry
+            if self._clock() >= expires_at:
+                self._entries.pop((user_key, name), None)
+                return ""
+            return value
+
+    def set(self, user_key: str, name: str, value: str) -> None:
+        """
+        값을 저장한다(빈 값은 무시).
+
+        Args:
+            user_key: 사용자 식별 키
+            name: 메타데이터 이름
+            value: 저장할 값
+        """
+        normalized_value = str(value or "").strip()
+        if not normalized_value:
+            return
+        with self._lock:
+            self._entries[(user_key, name)] = (normalized_value, self._clock() + self._ttl_sec)
+
+    def get_or_load(self, user_key: str, name: str, loader: Callable[[], str]) -> str:
+        """
+        캐시 값을 반환하고, 없으면 `loader`로 조회해 저장한다.
+
+        Args:
+            user_key: 사용자 식별 키
+            name: 메타데이터 이름
+            loader: 캐시 미스 시 Graph에서 값을 조회하는 함수
+
+        Returns:
+            메타데이터 값(조회 실패 시 빈 문자열)
+        """
+        cached = self.get(user_key=user_key, name=name)
+        if cached:
+            return cached
+        loaded = str(loader() or "").strip()
+        self.set(user_key=user_key, name=name, value=loaded)
+        return loaded
+
+    def invalidate(self, user_key: str, name: str = "") -> None:
+        """
+        항목을 비운다.
+
+        Args:
+            user_key: 사용자 식별 키
+            name: 메타데이터 이름(빈 값이면 해당 사용자 전체)
+        """
+        with self._lock:
+            if name:
+                self._entries.pop((user_key, name), None)
+                return
+            for key in [key for key in self._entries if key[0] == user_key]:
+                self._entries.pop(key, None)
+        logger.info("graph_metadata_cache.invalidated: user=%s name=%s", user_key, name or "*")
+
+
+def get_graph_metadata_cache() -> GraphMetadataCache:
+    """
+    프로세스 공유 Graph 메타데이터 캐시를 반환한다.
+
+    Returns:
+        메타데이터 캐시
+    """
+    global _CACHE
+    with _CACHE_LOCK:
+        if _CACHE is None:
+            _CACHE = GraphMetadataCache(ttl_sec=resolve_positive_int_env(GRAPH_METADATA_TTL_SEC_ENV, DEFAULT_GRAPH_METADATA_TTL_SEC))
+        return _CACHE
+
+
+def reset_graph_metadata_cache() -> None:
+    """공유 캐시를 버린다(설정 변경/테스트 격리용)."""
+    global _CACHE
+    with _CACHE_LOCK:
+        _CACHE = None
+
+
+def resolve_graph_user_key() -> str:
+    """
+    Delegated 사용자 캐시 키를 반환한다.
+
+    Returns:
+        `MICROSOFT_EMAIL_ADDRESS`(소문자) 또는 `me`
+    """
+    return str(os.getenv("MICROSOFT_EMAIL_ADDRESS", "")).strip().lower() or "me"
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import os
+import threading
+
+from app.core.logging_config import get_logger
+from app.integrations.microsoft_graph.todo_client import GraphTodoClient
+
+logger = get_logger(__name__)
+
+GRAPH_METADATA_WARMUP_ENV = "MOLDUBOT_GRAPH_METADATA_WARMUP"
+
+
+def start_graph_metadata_warmup() -> threading.Thread | None:
+    """
+    설정된 Delegated 사용자의 Graph 메타데이터를 background thread에서 미리 캐시한다.
+
+    서버 기동을 막지 않도록 daemon thread로 실행하며, 캐시 토큰이 없으면 대화형 로그인 없이 건너뛴다.
+
+    Returns:
+        시작한 thread(비활성화 또는 Graph 미설정이면 None)
+    """
+    if str(os.getenv(GRAPH_METADATA_WARMUP_ENV, "1")).strip().lower() in {"0", "false", "off", "no"}:
+        return None
+    if not str(os.getenv("MICROSOFT_APP_ID", "")).strip():
+        return None
+    thread = threading.Thread(target=_warm_up, name="graph-metadata-warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+def _warm_up() -> None:
+    """기본 ToDo 목록 ID를 조회해 캐시한다."""
+    try:
+        warmed = GraphTodoClient().warm_up()
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("graph_metadata_warmup_failed: error=%s", exc)
+        return
+    logger.info("graph_metadata_warmup_completed: todo_list_cached=%s", warmed)
@@ -0,0 +1,372 @@
+from __future__ import annotations
+
+import os
+import random
+import threading
+import time
+from dataclasses import asdict, dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.core.env_config import resolve_non_negative_int_env, resolve_positive_int_env
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+GRAPH_HTTP_MAX_RETRIES_ENV = "MOLDUBOT_GRAPH_HTTP_MAX_RETRIES"
+GRAPH_HTTP_BACKOFF_BASE_MS_ENV = "MOLDUBOT_GRAPH_HTTP_BACKOFF_BASE_MS"
+GRAPH_HTTP_BACKOFF_MAX_MS_ENV = "MOLDUBOT_GRAPH_HTTP_BACKOFF_MAX_MS"
+GRAPH_HTTP_RETRY_AFTER_MAX_SEC_ENV = "MOLDUBOT_GRAPH_HTTP_RETRY_AFTER_MAX_SEC"
+GRAPH_HTTP_MAX_CONCURRENCY_ENV = "MOLDUBOT_GRAPH_HTTP_MAX_CONCURRENCY"
+GRAPH_HTTP_POOL_SIZE_ENV = "MOLDUBOT_GRAPH_HTTP_POOL_SIZE"
+GRAPH_HTTP_TIMEOUT_SEC_ENV = "MOLDUBOT_GRAPH_HTTP_TIMEOUT_SEC"
+DEFAULT_GRAPH_HTTP_MAX_RETRIES = 3
+DEFAULT_GRAPH_HTTP_BACKOFF_BASE_MS = 500
+DEFAULT_GRAPH_HTTP_BACKOFF_MAX_MS = 8000
+DEFAULT_GRAPH_HTTP_RETRY_AFTER_MAX_SEC = 60
+DEFAULT_GRAPH_HTTP_MAX_CONCURRENCY = 4
+DEFAULT_GRAPH_HTTP_POOL_SIZE = 10
+DEFAULT_GRAPH_HTTP_TIMEOUT_SEC = 10
+THROTTLE_STATUS_CODES = {429, 503}
+RETRYABLE_STATUS_CODES = {429, 502, 503, 504}
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+_TRANSPORT_REGISTRY: dict[str, "GraphTransport"] = {}
+_TRANSPORT_REGISTRY_LOCK = threading.Lock()
+
+
+@dataclass
+class GraphEndpointStats:
+    """
+    endpoint별 Graph 호출 지표.
+    """
+
+    requests: int = 0
+    retries: int = 0
+    throttled: int = 0
+    errors: int = 0
+    total_latency_ms: float = 0.0
+    max_latency_ms: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        평균 지연을 포함한 직렬화 사전을 반환한다.
+
+        Returns:
+            지표 사전
+        """
+        payload = asdict(self)
+        payload["avg_latency_ms"] = round(self.total_latency_ms / self.requests, 2) if self.requests else 0.0
+        payload["total_latency_ms"] = round(self.total_latency_ms, 2)
+        payload["max_latency_ms"] = round(self.max_latency_ms, 2)
+        return payload
+
+
+class GraphTransport:
+    """
+    tenant 단위로 공유하는 Microsoft Graph HTTP 전송 계층.
+
+    keep-alive 세션(연결 풀)을 재사용하고, 429/503 `Retry-After`를 준수하며 그 외 일시 오류는
+    jitter를 섞은 지수 backoff로 재시도한다. 동시 요청 수는 semaphore로 제한하고 endpoint별 지연/throttle
+    지표를 기록한다. POST 등 비멱등 요청은 Graph가 처리하지 않았음이 확실한 429/503에서만 재시도한다.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = DEFAULT_GRAPH_HTTP_MAX_RETRIES,
+        backoff_base_sec: float = DEFAULT_GRAPH_HTTP_BACKOFF_BASE_MS / 1000,
+        backoff_max_sec: float = DEFAULT_GRAPH_HTTP_BACKOFF_MAX_MS / 1000,
+        retry_after_max_sec: float = DEFAULT_GRAPH_HTTP_RETRY_AFTER_MAX_SEC,
+        max_concurrency: int = DEFAULT_GRAPH_HTTP_MAX_CONCURRENCY,
+        pool_size: int = DEFAULT_GRAPH_HTTP_POOL_SIZE,
+        timeout_sec: float = DEFAULT_GRAPH_HTTP_TIMEOUT_SEC,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        전송 계층을 초기화한다.
+
+        Args:
+            max_retries: 최초 요청 이후 최대 재시도 횟수
+            backoff_base_sec: 지수 backoff 기준 대기(초)
+            backoff_max_sec: backoff 최대 대기(초)
+            retry_after_max_sec: 따를 수 있는 `Retry-After` 최대값(초, 초과 시 재시도하지 않고 응답 반환)
+            max_concurrency: 동시 요청 상한
+            pool_size: keep-alive 연결 풀 크기
+            timeout_sec: 기본 요청 timeout(초)
+            sleep: 대기 함수(테스트 주입용)
+        """
+        self._max_retries = max(0, int(max_retries))
+        self._backoff_base_sec = max(0.0, float(backoff_base_sec))
+        self._backoff_max_sec = max(self._backoff_base_sec, float(backoff_max_sec))
+        self._retry_after_max_sec = max(0.0, float(retry_after_max_sec))
+        self._timeout_sec = float(timeout_sec)
+        self._sleep = sleep
+        self._semaphore = threading.BoundedSemaphore(max(1, int(max_concurrency)))
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max(1, int(pool_size)), pool_maxsize=max(1, int(pool_size)))
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._stats: dict[str, GraphEndpointStats] = {}
+        self._stats_lock = threading.Lock()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        endpoint: str,
+        headers: dict[str, str] | None = None,
+        json: Any = None,
+        timeout: float | None = None,
+    ) -> requests.Response:
+        """
+        Graph 요청을 재시도 정책에 따라 보낸다.
+
+        Args:
+            method: HTTP 메서드
+            url: 요청 URL
+            endpoint: 지표 집계용 endpoint 이름(예: `mail.get_message`)
+            headers: 요청 헤더
+            json: JSON 본문
+            timeout: 요청 timeout(초, None이면 기본값)
+
+        Returns:
+            마지막 Graph HTTP 응답
+
+        Raises:
+            requests.RequestException: 재시도 후에도 네트워크 오류가 계속되는 경우
+        """
+        normalized_method = str(method or "GET").upper()
+        attempt = 0
+        while True:
+            started = time.perf_counter()
+            try:
+                with self._semaphore:
+                    response = self._session.request(
+                        normalized_method,
+                        url,
+                        headers=headers,
+                        json=json,
+                        timeout=self._timeout_sec if timeout is None else timeout,
+                    )
+            except requests.RequestException:
+                will_retry = attempt < self._max_retries and normalized_method in IDEMPOTENT_METHODS
+                self._record(endpoint=endpoint, started=started, status_code=None, retried=will_retry)
+                if not will_retry:
+                    raise
+                delay = self._compute_backoff(attempt=attempt)
+                logger.info("graph_transport.retry_network: endpoint=%s attempt=%s delay=%.2f", endpoint, attempt + 1, delay)
+            else:
+                delay = self._resolve_retry_delay(method=normalized_method, response=response, attempt=attempt)
+                self._record(endpoint=endpoint, started=started, status_code=response.status_code, retried=delay is not None)
+                if delay is None:
+                    return response
+                logger.info(
+                    "graph_transport.retry_status: endpoint=%s status=%s attempt=%s delay=%.2f",
+                    endpoint,
+                    response.status_code,
+                    attempt + 1,
+                    delay,
+                )
+                response.close()
+            self._sleep(delay)
+            attempt += 1
+
+    def get_stats(self) -> dict[str, dict[str, Any]]:
+        """
+        endpoint별 지표를 반환한다.
+
+        Returns:
+            endpoint -> 지표 사전
+        """
+        with self._stats_lock:
+            return {endpoint: stats.as_dict() for endpoint, stats in sorted(self._stats.items())}
+
+    def close(self) -> None:
+        """keep-alive 세션을 닫는다."""
+        self._session.close()
+
+    def _resolve_retry_delay(self, method: str, response: requests.Response, attempt: int) -> float | None:
+        """
+        응답 상태로 재시도 여부와 대기 시간을 결정한다.
+
+        Args:
+            method: HTTP 메서드
+            response: Graph HTTP 응답
+            attempt: 지금까지의 재시도 횟수
+
+        Returns:
+            재시도 전 대기(초). 재시도하지 않으면 None
+        """
+        status_code = int(response.status_code)
+        if status_code not in RETRYABLE_STATUS_CODES or attempt >= self._max_retries:
+            return None
+        if method not in IDEMPOTENT_METHODS and status_code not in THROTTLE_STATUS_CODES:
+            return None
+        retry_after = parse_retry_after(value=str(response.headers.get("Retry-After") or ""))
+        if retry_after is None:
+            return self._compute_backoff(attempt=attempt)
+        if retry_after > self._retry_after_max_sec:
+            logger.warning("graph_transport.retry_after_too_long: status=%s retry_after=%.1f", status_code, retry_after)
+            return None
+        return retry_after
+
+    def _compute_backoff(self, attempt: int) -> float:
+        """
+        jitter를 섞은 지수 backoff 대기 시간을 계산한다.
+
+        Args:
+            attempt: 지금까지의 재시도 횟수
+
+        Returns:
+            대기 시간(초)
+        """
+        ceiling = min(self._backoff_max_sec, self._backoff_base_sec * (2**attempt))
+        return ceiling * random.uniform(0.5, 1.0)
+
+    def _record(self, endpoint: str, started: float, status_code: int | None, retried: bool) -> None:
+        """
+        요청 1회의 지표를 기록한다.
+
+        Args:
+            endpoint: endpoint 이름
+            started: 요청 시작 시각(perf_counter)
+            status_code: 응답 상태 코드(네트워크 오류면 None)
+            retried: 이 응답 뒤 재시도했는지 여부
+        """
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with self._stats_lock:
+            stats = self._stats.setdefault(endpoint, GraphEndpointStats())
+            stats.requests += 1
+            stats.total_latency_ms += elapsed_ms
+            stats.max_latency_ms = max(stats.max_latency_ms, elapsed_ms)
+            if retried:
+                stats.retries += 1
+            if status_code in THROTTLE_STATUS_CODES:
+                stats.throttled += 1
+            if status_code is None or status_code >= 500:
+                stats.errors += 1
+
+
+def parse_retry_after(value: str) -> float | None:
+    """
+    `Retry-After` 헤더(초 또는 HTTP-date)를 대기 시간(초)으로 변환한다.
+
+    Args:
+        value: 헤더 값
+
+    Returns:
+        0 이상 대기 시간(초). 해석할 수 없으면 None
+    """
+    normalized = str(value or "").strip()
+    if not normalized:
+        return None
+    try:
+        return max(0.0, float(normalized))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(normalized)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def get_graph_transport(tenant_id: str = "") -> GraphTransport:
+    """
+    tenant별 프로세스 공유 Graph 전송 계층을 반환한다.
+
+    Args:
+        tenant_id: Azure tenant ID(빈 값이면 `MICROSOFT_TENANT_ID` 또는 `common`)
+
+    Returns:
+        Graph 전송 계층
+    """
+    key = str(tenant_id or os.getenv("MICROSOFT_TENANT_ID", "") or "common").strip() or "common"
+    with _TRANSPORT_REGISTRY_LOCK:
+        transport = _TRANSPORT_REGISTRY.get(key)
+        if transport is None:
+            transport = GraphTransport(
+                max_retries=resolve_non_negative_int_env(GRAPH_HTTP_MAX_RETRIES_ENV, DEFAULT_GRAPH_HTTP_MAX_RETRIES),
+                backoff_base_sec=resolve_non_negative_int_env(
+                    GRAPH_HTTP_BACKOFF_BASE_MS_ENV, DEFAULT_GRAPH_HTTP_BACKOFF_BASE_MS
+                )
+                / 1000,
+                backoff_max_sec=resolve_non_negative_int_env(GRAPH_HTTP_BACKOFF_MAX_MS_ENV, DEFAULT_GRAPH_HTTP_BACKOFF_MAX_MS)
+                / 1000,
+                retry_after_max_sec=resolve_non_negative_int_env(
+                    GRAPH_HTTP_RETRY_AFTER_MAX_SEC_ENV, DEFAULT_GRAPH_HTTP_RETRY_AFTER_MAX_SEC
+                ),
+                max_concurrency=resolve_positive_int_env(GRAPH_HTTP_MAX_CONCURRENCY_ENV, DEFAULT_GRAPH_HTTP_MAX_CONCURRENCY),
+                pool_size=resolve_positive_int_env(GRAPH_HTTP_POOL_SIZE_ENV, DEFAULT_GRAPH_HTTP_POOL_SIZE),
+                timeout_sec=resolve_positive_int_env(GRAPH_HTTP_TIMEOUT_SEC_ENV, DEFAULT_GRAPH_HTTP_TIMEOUT_SEC),
+            )
+            _TRANSPORT_REGISTRY[key] = transport
+        return transport
+
+
+def graph_get(url: str, headers: dict[str, str], endpoint: str, timeout: float | None = None) -> requests.Response:
+    """
+    공유 전송 계층으로 Graph GET 요청을 보낸다.
+
+    Args:
+        url: 요청 URL
+        headers: 요청 헤더
+        endpoint: 지표 집계용 endpoint 이름
+        timeout: 요청 timeout(초, None이면 기본값)
+
+    Returns:
+        Graph HTTP 응답
+
+    Raises:
+        requests.RequestException: 재시도 후에도 네트워크 오류가 계속되는 경우
+    """
+    return get_graph_transport().request("GET", url, endpoint=endpoint, headers=headers, timeout=timeout)
+
+
+def graph_post(
+    url: str,
+    headers: dict[str, str],
+    json: Any,
+    endpoint: str,
+    timeout: float | None = None,
+) -> requests.Response:
+    """
+    공유 전송 계층으로 Graph POST 요청을 보낸다.
+
+    Args:
+        url: 요청 URL
+        headers: 요청 헤더
+        json: JSON 본문
+        endpoint: 지표 집계용 endpoint 이름
+        timeout: 요청 timeout(초, None이면 기본값)
+
+    Returns:
+        Graph HTTP 응답
+
+    Raises:
+        requests.RequestException: 재시도 후에도 네트워크 오류가 계속되는 경우
+    """
+    return get_graph_transport().request("POST", url, endpoint=endpoint, headers=headers, json=json, timeout=timeout)
+
+
+def get_graph_transport_stats() -> dict[str, dict[str, dict[str, Any]]]:
+    """
+    등록된 tenant별 endpoint 지표를 반환한다.
+
+    Returns:
+        tenant -> endpoint -> 지표 사전
+    """
+    with _TRANSPORT_REGISTRY_LOCK:
+        transports = dict(_TRANSPORT_REGISTRY)
+    return {tenant: transport.get_stats() for tenant, transport in sorted(transports.items())}
+
+
+def reset_graph_transports() -> None:
+    """등록된 전송 계층 세션을 닫고 registry를 비운다(설정 변경/테스트 격리용)."""
+    with _TRANSPORT_REGISTRY_LOCK:
+        transports = list(_TRANSPORT_REGISTRY.values())
+        _TRANSPORT_REGISTRY.clear()
+    for transport in transports:
+        transport.close()
@@ -12,6 +12,8 @@ import msal
 import requests
 
 from app.core.logging_config import get_logger
+from app.integrations.microsoft_graph.graph_batch import GraphBatchRequest, GraphBatchResult, send_graph_batch
+from app.integrations.microsoft_graph.graph_transport import graph_get
 from app.integrations.microsoft_graph.mail_client_parsing import (
     extract_aadsts_metadata as _extract_aadsts_metadata,
 )
@@ -148,12 +150,13 @@ class GraphMailClient:
             )
         return self._msal_app
 
-    def _acquire_access_token(self, force_refresh: bool = False) -> str:
+    def _acquire_access_token(self, force_refresh: bool = False, allow_interactive: bool = True) -> str:
         """
         Silent -> Interactive 순서로 Delegated 토큰을 획득한다.
 
         Args:
             force_refresh: True이면 메모리 토큰을 무시하고 다시 획득한다.
+            allow_interactive: False이면 캐시 토큰이 없을 때 대화형 로그인 없이 실패한다(시작 시 warm-up용).
 
         Returns:
             access token 문자열. 실패 시 빈 문자열
@@ -172,6 +175,8 @@ class GraphMailClient:
         if accounts:
             result = app.acquire_token_silent(scopes=GRAPH_SCOPE, account=accounts[0])
 
+        if not result and not allow_interactive:
+            return ""
         if not result:
             logger.info("Graph 토큰 캐시 없음 -> Interactive 로그인 시작")
             result = app.acquire_token_interactive(
@@ -248,6 +253,46 @@ class GraphMailClient:
 
         return _parse_graph_mail_payload(payload=response.json())
 
+    def get_messages(self, message_ids: list[str]) -> dict[str, GraphMailMessage]:
+        """
+        여러 메일을 `$batch`(요청당 최대 20건)로 묶어 조회한다.
+
+        Args:
+            message_ids: Graph 메시지 ID 목록
+
+        Returns:
+            조회에 성공한 message_id -> GraphMailMessage 사전(찾지 못한 메일은 제외)
+        """
+        normalized_ids = list(dict.fromkeys(str(item or "").strip() for item in message_ids if str(item or "").strip()))
+        if not normalized_ids or not self.is_configured():
+            return {}
+        batch_requests = [
+            GraphBatchRequest(
+                request_id=str(index),
+                url=f"/me/messages/{requests.utils.quote(message_id, safe='')}?$select={MESSAGE_SELECT_FIELDS}",
+                headers={"Prefer": 'outlook.body-content-type="html"'},
+            )
+            for index, message_id in enumerate(normalized_ids)
+        ]
+        result = GraphBatchResult(status_code=401)
+        for force_refresh in (False, True):
+            access_token = self._acquire_access_token(force_refresh=force_refresh)
+            if not access_token:
+                return {}
+            result = send_graph_batch(f"{GRAPH_BASE_URL}/$batch", access_token, batch_requests)
+            if result.status_code != 401:
+                break
+            logger.info("Graph $batch 메일 조회 401 -> 토큰 초기화 후 재시도")
+            self._access_token = ""
+        messages: dict[str, GraphMailMessage] = {}
+        for response in result.responses.values():
+            if response.status == 200 and isinstance(response.body, dict):
+                message = _parse_graph_mail_payload(payload=response.body)
+                messages[message.message_id] = message
+        if len(messages) < len(normalized_ids):
+            logger.info("Graph $batch 메일 일부 조회 실패: requested=%s fetched=%s", len(normalized_ids), len(messages))
+        return messages
+
     def list_recent_messages(self, limit: int = 20) -> list[GraphMailMessage]:
         """
         최근 수신 메일 목록을 최신순으로 조회한다.
@@ -289,17 +334,18 @@ class GraphMailClient:
         values = payload.get("value", []) if isinstance(payload, dict) else []
         return [_parse_graph_mail_payload(item) for item in values if isinstance(item, dict)]
 
-    def acquire_access_token(self, force_refresh: bool = False) -> str:
+    def acquire_access_token(self, force_refresh: bool = False, allow_interactive: bool = True) -> str:
         """
         Graph Delegated access token을 반환한다.
 
         Args:
             force_refresh: True이면 캐시 토큰을 무시하고 재획득한다.
+            allow_interactive: False이면 대화형 로그인 없이 캐시 토큰만 사용한다.
 
         Returns:
             Bearer access token. 실패 시 빈 문자열
         """
-        return self._acquire_access_token(force_refresh=force_refresh)
+        return self._acquire_access_token(force_refresh=force_refresh, allow_interactive=allow_interactive)
 
     def reset_access_token(self) -> None:
         """
@@ -332,7 +378,7 @@ class GraphMailClient:
             "Prefer": 'outlook.body-content-type="html"',
         }
         try:
-            return requests.get(url, headers=headers, timeout=10)
+            return graph_get(url, headers=headers, endpoint="mail.get_message")
         except requests.RequestException as exc:
             logger.warning(
                 "Graph 메시지 조회 네트워크 실패: message_id=%s error=%s",
@@ -368,7 +414,7 @@ class GraphMailClient:
             "Prefer": 'outlook.body-content-type="html"',
         }
         try:
-            return requests.get(url, headers=headers, timeout=10)
+            return graph_get(url, headers=headers, endpoint="mail.list_recent_messages")
         except requests.RequestException as exc:
             logger.warning("Graph 최근 메일 조회 네트워크 실패: error=%s", str(exc))
             return None
@@ -16,3 +16,17 @@ class GraphMailMessage:
     body_text: str
     internet_message_id: str
     web_link: str
+
+
+@dataclass
+class GraphMailDeltaPage:
+    """
+    Graph `messages/delta` 응답 한 페이지 모델.
+
+    `next_link`가 있으면 이어서 조회할 페이지가 남아 있고, 마지막 페이지에만 `delta_link`가 채워진다.
+    """
+
+    messages: list[GraphMailMessage]
+    removed_message_ids: list[str]
+    next_link: str = ""
+    delta_link: str = ""
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import requests
+
+from app.core.env_config import resolve_non_negative_int_env
+from app.core.logging_config import get_logger
+from app.integrations.microsoft_graph.graph_transport import graph_get
+from app.integrations.microsoft_graph.mail_client import (
+    GRAPH_BASE_URL,
+    MESSAGE_SELECT_FIELDS,
+    GraphMailClient,
+    _extract_graph_error_metadata,
+)
+from app.integrations.microsoft_graph.mail_client_parsing import parse_graph_mail_payload
+from app.integrations.microsoft_graph.mail_client_types import GraphMailDeltaPage
+
+logger = get_logger(__name__)
+DEFAULT_DELTA_PAGE_SIZE = 50
+MAIL_DELTA_INITIAL_DAYS_ENV = "MOLDUBOT_MAIL_DELTA_INITIAL_DAYS"
+DEFAULT_MAIL_DELTA_INITIAL_DAYS = 7
+DELTA_EXPIRED_ERROR_CODES = {"syncstatenotfound", "syncstateinvalid", "resyncrequired"}
+
+
+class GraphMailDeltaExpiredError(RuntimeError):
+    """
+    저장된 deltaLink가 만료되어 전체 재동기화가 필요할 때 발생한다.
+    """
+
+
+class GraphMailDeltaClient:
+    """
+    Microsoft Graph `/me/mailFolders/{folder}/messages/delta` 증분 조회 클라이언트.
+    """
+
+    def __init__(self, auth_client: GraphMailClient | None = None) -> None:
+        """
+        Graph 메일 delta 클라이언트를 초기화한다.
+
+        Args:
+            auth_client: 토큰 획득에 사용할 GraphMailClient 인스턴스
+        """
+        self._auth_client = auth_client or GraphMailClient()
+
+    def is_configured(self) -> bool:
+        """
+        Graph 설정 여부를 반환한다.
+
+        Returns:
+            설정되어 있으면 True
+        """
+        return self._auth_client.is_configured()
+
+    def iter_delta_pages(
+        self,
+        delta_link: str = "",
+        folder_id: str = "inbox",
+        page_size: int = DEFAULT_DELTA_PAGE_SIZE,
+    ) -> Iterator[GraphMailDeltaPage]:
+        """
+        delta 페이지를 `@odata.nextLink`를 따라 `@odata.deltaLink`가 나올 때까지 순서대로 반환한다.
+
+        요청이 실패하면 그 지점에서 조회를 멈추며, 이 경우 마지막으로 받은 페이지에는 `delta_link`가 없다.
+
+        Args:
+            delta_link: 이전 동기화에서 저장한 deltaLink(빈 값이면 초기 동기화)
+            folder_id: 메일 폴더 ID 또는 well-known 이름
+            page_size: 페이지당 최대 메일 수(`odata.maxpagesize`)
+
+        Yields:
+            delta 응답 페이지
+
+        Raises:
+            GraphMailDeltaExpiredError: deltaLink 만료로 전체 재동기화가 필요한 경우
+        """
+        if not self.is_configured():
+            logger.warning("GraphMailDeltaClient 설정 누락으로 delta 조회를 건너뜁니다.")
+            return
+        url = str(delta_link or "").strip() or self._build_initial_url(folder_id=folder_id)
+        normalized_page_size = max(1, min(int(page_size), 1000))
+        while url:
+            payload = self._request_page(url=url, page_size=normalized_page_size)
+            if payload is None:
+                return
+            page = _parse_delta_page(payload=payload)
+            yield page
+            url = page.next_link
+
+    def _build_initial_url(self, folder_id: str) -> str:
+        """
+        초기 동기화용 delta URL을 만든다.
+
+        deltaLink가 없는 첫 실행(또는 만료 후 재동기화)이 폴더 전체를 받아 메일마다 요약을 적재하지 않도록
+        최근 `MOLDUBOT_MAIL_DELTA_INITIAL_DAYS`일(기본 7일, 0이면 제한 없음) 수신 메일로 범위를 제한한다.
+        Graph는 이 필터를 이후 nextLink/deltaLink에도 유지한다.
+
+        Args:
+            folder_id: 메일 폴더 ID 또는 well-known 이름
+
+        Returns:
+            delta 요청 URL
+        """
+        encoded_folder_id = requests.utils.quote(str(folder_id or "inbox").strip() or "inbox", safe="")
+        url = f"{GRAPH_BASE_URL}/me/mailFolders/{encoded_folder_id}/messages/delta?$select={MESSAGE_SELECT_FIELDS}"
+        initial_days = resolve_non_negative_int_env(MAIL_DELTA_INITIAL_DAYS_ENV, DEFAULT_MAIL_DELTA_INITIAL_DAYS)
+        if initial_days <= 0:
+            return url
+        received_after = (datetime.now(timezone.utc) - timedelta(days=initial_days)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        return f"{url}&$filter=receivedDateTime%20ge%20{received_after}"
+
+    def _request_page(self, url: str, page_size: int) -> dict[str, Any] | None:
+        """
+        delta 페이지 1건을 요청한다(401이면 토큰 갱신 후 1회 재시도).
+
+        Args:
+            url: delta/next/deltaLink URL
+            page_size: 페이지당 최대 메일 수
+
+        Returns:
+            응답 JSON. 실패 시 None
+
+        Raises:
+            GraphMailDeltaExpiredError: deltaLink 만료 응답(410 또는 sync state 오류 코드)인 경우
+        """
+        access_token = self._auth_client.acquire_access_token()
+        if not access_token:
+            return None
+        response = self._send(url=url, access_token=access_token, page_size=page_size)
+        if response is not None and response.status_code == 401:
+            logger.info("Graph 메일 delta 조회 401 -> 토큰 초기화 후 재시도")
+            self._auth_client.reset_access_token()
+            refreshed_token = self._auth_client.acquire_access_token(force_refresh=True)
+            if not refreshed_token:
+                return None
+            response = self._send(url=url, access_token=refreshed_token, page_size=page_size)
+        if response is None:
+            return None
+        if response.status_code == 200:
+            payload = response.json()
+            return payload if isinstance(payload, dict) else {}
+        error_meta = _extract_graph_error_metadata(response=response)
+        if response.status_code == 410 or error_meta["error_code"].lower() in DELTA_EXPIRED_ERROR_CODES:
+            raise GraphMailDeltaExpiredError(error_meta["error_code"])
+        logger.warning(
+            "Graph 메일 delta 조회 실패: status=%s graph_error_code=%s request_id=%s",
+            response.status_code,
+            error_meta["error_code"],
+            error_meta["request_id"],
+        )
+        return None
+
+    def _send(self, url: str, access_token: str, page_size: int) -> requests.Response | None:
+        """
+        delta GET 요청을 보낸다.
+
+        Args:
+            url: 요청 URL
+            access_token: Graph Delegated Bearer 토큰
+            page_size: 페이지당 최대 메일 수
+
+        Returns:
+            Graph HTTP 응답. 네트워크 실패 시 None
+        """
+        headers = {
+            "Authorization": f"Bearer {access_token}",
+            "Prefer": f'outlook.body-content-type="html", odata.maxpagesize={page_size}',
+        }
+        try:
+            return graph_get(url, headers=headers, endpoint="mail.delta", timeout=20)
+        except requests.RequestException as exc:
+            logger.warning("Graph 메일 delta 조회 네트워크 실패: error=%s", str(exc))
+            return None
+
+
+def _parse_delta_page(payload: dict[str, Any]) -> GraphMailDeltaPage:
+    """
+    delta 응답 JSON을 변경/삭제 목록으로 나눈다.
+
+    Args:
+        payload: Graph delta 응답 JSON
+
+    Returns:
+        delta 페이지
+    """
+    messages = []
+    removed_message_ids = []
+    values = payload.get("value", [])
+    for item in values if isinstance(values, list) else []:
+        if not isinstance(item, dict):
+            continue
+        if "@removed" in item:
+            message_id = str(item.get("id") or "").strip()
+            if message_id:
+                removed_message_ids.append(message_id)
+            continue
+        messages.append(parse_graph_mail_payload(item))
+    return GraphMailDeltaPage(
+        messages=messages,
+        removed_message_ids=removed_message_ids,
+        next_link=str(payload.get("@odata.nextLink") or ""),
+        delta_link=str(payload.get("@odata.deltaLink") or ""),
+    )
@@ -6,6 +6,12 @@ from typing import Any
 import requests
 
 from app.core.logging_config import get_logger
+from app.integrations.microsoft_graph.graph_metadata_cache import (
+    TODO_DEFAULT_LIST_ID,
+    get_graph_metadata_cache,
+    resolve_graph_user_key,
+)
+from app.integrations.microsoft_graph.graph_transport import graph_get, graph_post
 from app.integrations.microsoft_graph.mail_client import (
     GRAPH_BASE_URL,
     GraphMailClient,
@@ -85,14 +91,26 @@ class GraphTodoClient:
         if response.status_code == 401:
             logger.info("Graph ToDo 생성 401 -> 토큰 초기화 후 재시도")
             self._auth_client.reset_access_token()
-            refreshed = self._auth_client.acquire_access_token(force_refresh=True)
-            if not refreshed:
+            token = self._auth_client.acquire_access_token(force_refresh=True)
+            if not token:
                 return None
-            list_id = self._resolve_list_id(access_token=refreshed)
+            response = self._request_create_task(
+                access_token=token,
+                list_id=list_id,
+                title=title,
+                due_date=due_date,
+                body_text=body_text,
+            )
+            if response is None:
+                return None
+        if response.status_code == 404:
+            logger.info("Graph ToDo 생성 404 -> 기본 목록 캐시 무효화 후 재시도")
+            get_graph_metadata_cache().invalidate(user_key=resolve_graph_user_key(), name=TODO_DEFAULT_LIST_ID)
+            list_id = self._resolve_list_id(access_token=token)
             if not list_id:
                 return None
             response = self._request_create_task(
-                access_token=refreshed,
+                access_token=token,
                 list_id=list_id,
                 title=title,
                 due_date=due_date,
@@ -115,7 +133,37 @@ class GraphTodoClient:
             web_link=str(payload.get("webLink") or ""),
         )
 
+    def warm_up(self) -> bool:
+        """
+        기본 ToDo 목록 ID를 미리 캐시한다(대화형 로그인 없이 캐시 토큰만 사용).
+
+        Returns:
+            목록 ID를 캐시했으면 True
+        """
+        if not self.is_configured():
+            return False
+        token = self._auth_client.acquire_access_token(allow_interactive=False)
+        if not token:
+            return False
+        return bool(self._resolve_list_id(access_token=token))
+
     def _resolve_list_id(self, access_token: str) -> str:
+        """
+        기본 ToDo 목록 ID를 사용자별 메타데이터 캐시에서 찾고, 없으면 Graph에서 조회한다.
+
+        Args:
+            access_token: Graph Bearer 토큰
+
+        Returns:
+            목록 ID. 찾지 못하면 빈 문자열
+        """
+        return get_graph_metadata_cache().get_or_load(
+            user_key=resolve_graph_user_key(),
+            name=TODO_DEFAULT_LIST_ID,
+            loader=lambda: self._fetch_default_list_id(access_token=access_token),
+        )
+
+    def _fetch_default_list_id(self, access_token: str) -> str:
         """
         사용자 ToDo 목록에서 기본 list id를 찾는다.
 
@@ -165,7 +213,7 @@ class GraphTodoClient:
         url = f"{GRAPH_BASE_URL}/me/todo/lists?$top=50"
         headers = {"Authorization": f"Bearer {access_token}"}
         try:
-            return requests.get(url, headers=headers, timeout=10)
+            return graph_get(url, headers=headers, endpoint="todo.list_lists")
         except requests.RequestException as exc:
             logger.warning("Graph ToDo 목록 조회 네트워크 실패: error=%s", exc)
             return None
@@ -208,7 +256,7 @@ class GraphTodoClient:
             },
         }
         try:
-            return requests.post(url, headers=headers, json=payload, timeout=10)
+            return graph_post(url, headers=headers, json=payload, endpoint="todo.create_task")
         except requests.RequestException as exc:
             logger.warning("Graph ToDo 생성 네트워크 실패: error=%s", exc)
             return None
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -12,13 +15,24 @@ from app.api.bootstrap_routes import router as bootstrap_router
 from app.api.report_routes import router as report_router
 from app.api.routes import router as api_router
 from app.core.logging_config import configure_logging, get_logger
+from app.integrations.microsoft_graph.graph_metadata_warmup import start_graph_metadata_warmup
+from app.services.mail_summary_background import shutdown_mail_summary_background_runners
 
 ROOT_DIR = Path(__file__).resolve().parents[1]
 load_dotenv(dotenv_path=ROOT_DIR / ".env")
 configure_logging()
 logger = get_logger(__name__)
 
-app = FastAPI(title="MolduBot API", version="0.1.0")
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    """기동 시 Graph 메타데이터 warm-up을 시작하고, 종료 시 background 요약 실행기를 정리한다."""
+    start_graph_metadata_warmup()
+    yield
+    await asyncio.to_thread(shutdown_mail_summary_background_runners)
+
+
+app = FastAPI(title="MolduBot API", version="0.1.0", lifespan=lifespan)
 
 # Outlook WebView and ngrok environments can vary by origin during development.
 app.add_middleware(
@@ -6,6 +6,7 @@ from typing import Sequence
 from langchain_core.messages import BaseMessage, HumanMessage
 
 from app.agents.intent_parser import get_intent_parser
+from app.agents.intent_turn_context import get_intent_turn_context
 from app.core.intent_rules import infer_steps_from_query, is_code_review_query, is_mail_summary_skill_query
 from app.agents.intent_schema import (
     ExecutionStep,
@@ -109,7 +110,7 @@ def compose_intent_augmented_text(user_message: str) -> str:
     Returns:
         구조분해 컨텍스트 + 원본 입력 문자열
     """
-    original_user_message, decomposition_json, context_text, routing_instruction = _compose_intent_context_payload(
+    original_user_message, decomposition_json, context_text, routing_instruction = _resolve_intent_context_payload(
         user_message=user_message
     )
     logger.info("미들웨어 의도 구조분해 결과(JSON): %s", decomposition_json)
@@ -126,7 +127,7 @@ def compose_intent_system_context(user_message: str) -> str:
     Returns:
         system 메시지로 주입할 의도 컨텍스트 문자열
     """
-    original_user_message, decomposition_json, context_text, routing_instruction = _compose_intent_context_payload(
+    original_user_message, decomposition_json, context_text, routing_instruction = _resolve_intent_context_payload(
         user_message=user_message
     )
     logger.info("미들웨어 의도 구조분해 결과(JSON): %s", decomposition_json)
@@ -138,6 +139,24 @@ def compose_intent_system_context(user_message: str) -> str:
     )
 
 
+def _resolve_intent_context_payload(user_message: str) -> tuple[str, str, str, str]:
+    """
+    의도 컨텍스트 조합 결과를 반환한다.
+
+    턴 컨텍스트 안에서는 flow가 확정한 구조분해를 재사용하므로 입력 기준 캐시를 거치지 않는다
+    (같은 문장이라도 턴마다 선택 메일/범위가 달라 이전 턴 결과를 쓰면 안 된다).
+
+    Args:
+        user_message: 원본 사용자 입력
+
+    Returns:
+        (원본 사용자 입력, decomposition_json, context_text, routing_instruction)
+    """
+    if get_intent_turn_context() is not None:
+        return _compose_intent_context_payload.__wrapped__(user_message)
+    return _compose_intent_context_payload(user_message=user_message)
+
+
 @lru_cache(maxsize=256)
 def _compose_intent_context_payload(user_message: str) -> tuple[str, str, str, str]:
     """
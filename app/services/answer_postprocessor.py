@@ -2,7 +2,8 @@ from __future__ import annotations
 from typing import Any
 
 from app.core.logging_config import get_logger
-from app.core.intent_rules import CHAT_MODE_FREEFORM, is_code_review_query, is_mail_summary_skill_query
+from app.core.intent_rules import CHAT_MODE_FREEFORM
+from app.core.query_features import get_query_features
 from app.models.response_contracts import FinalAnswerContract, LLMResponseContract
 from app.services.answer_postprocessor_contract_utils import (
     augment_contract_with_tool_payload,
@@ -21,7 +22,6 @@ from app.services.answer_postprocessor_current_mail import (
     render_current_mail_recipients_table,
 )
 from app.services.answer_postprocessor_fallback import render_fallback_answer
-from app.services.current_mail_intent_policy import is_translation_like_request_text
 from app.services.format_contract_renderer import render_template_driven_contract
 from app.services.format_exception_policy import should_apply_template_driven_contract
 from app.services.format_policy_selector import select_format_template
@@ -40,7 +40,6 @@ from app.services.answer_postprocessor_guards import (
 from app.services.answer_postprocessor_rendering import render_contract_answer
 from app.services.answer_postprocessor_summary import (
     extract_original_user_message,
-    is_current_mail_summary_request,
     is_summary_request,
     normalize_multiline_text,
     sanitize_summary_lines,
@@ -125,10 +124,11 @@ def postprocess_final_answer(
         return FinalAnswerContract(answer=deterministic_rendered).answer
 
     parsed_contract = None
-    strict_json_parse = is_mail_summary_skill_query(user_message=normalized_user_message)
+    query_features = get_query_features(user_message=normalized_user_message)
+    strict_json_parse = query_features.is_mail_summary_skill
     skip_contract_parse = (
-        (is_code_review_query(user_message=normalized_user_message) and not looks_like_json_contract_text(text=normalized_answer))
-        or (is_translation_like_request_text(user_message=normalized_user_message) and not looks_like_json_contract_text(text=normalized_answer))
+        (query_features.is_code_review or query_features.is_translation_like)
+        and not looks_like_json_contract_text(text=normalized_answer)
     )
     if not skip_contract_parse:
         parse_source: Any = raw_model_content if raw_model_content is not None else answer
@@ -141,7 +141,7 @@ def postprocess_final_answer(
             parsed_contract = parse_llm_response_contract(raw_answer=parse_source)
     if parsed_contract is not None:
         if (
-            is_current_mail_summary_request(user_message=normalized_user_message)
+            query_features.is_current_mail_summary
             and '"format_type"' in normalized_answer
             and not looks_like_json_contract_text(text=normalized_answer)
         ):
@@ -278,7 +278,7 @@ def _try_render_deterministic_answer(
     """
     normalized_answer_for_preserve = str(answer or "").strip()
     preserve_llm_code_review_answer = (
-        is_code_review_query(user_message=user_message)
+        get_query_features(user_message=user_message).is_code_review
         and bool(normalized_answer_for_preserve)
         and not looks_like_json_contract_text(text=normalized_answer_for_preserve)
         and (
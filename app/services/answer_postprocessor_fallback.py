@@ -3,7 +3,7 @@ from __future__ import annotations
 import json
 from typing import Any
 
-from app.core.intent_rules import is_code_review_query, is_mail_summary_skill_query
+from app.core.query_features import get_query_features
 from app.services.answer_postprocessor_code_snippet import render_auto_code_snippet_text
 from app.models.response_contracts import LLMResponseContract, SummaryResponseContract
 from app.services.answer_postprocessor_contract_utils import augment_contract_with_tool_payload
@@ -18,7 +18,6 @@ from app.services.answer_postprocessor_reply_draft import (
 )
 from app.services.answer_postprocessor_summary import (
     extract_summary_lines,
-    is_current_mail_summary_request,
     is_report_request,
     is_summary_request,
     render_summary_lines_for_request,
@@ -72,7 +71,8 @@ def render_fallback_answer(
     if malformed_current_mail_fallback:
         return "current_mail_summary_recovery", malformed_current_mail_fallback
 
-    if is_code_review_query(user_message=user_message) and not looks_like_json_contract_text(text=answer):
+    query_features = get_query_features(user_message=str(user_message or ""))
+    if query_features.is_code_review and not looks_like_json_contract_text(text=answer):
         return "code_review_text", answer
 
     if is_report_request(user_message=user_message):
@@ -89,13 +89,13 @@ def render_fallback_answer(
 
     if is_summary_request(user_message=user_message):
         if (
-            is_current_mail_summary_request(user_message=user_message)
-            and not is_mail_summary_skill_query(user_message=user_message)
+            query_features.is_current_mail_summary
+            and not query_features.is_mail_summary_skill
             and '"format_type"' not in answer
         ):
             return "summary_freeform_text", answer
         if '"format_type"' in answer:
-            if is_current_mail_summary_request(user_message=user_message):
+            if query_features.is_current_mail_summary:
                 return "summary_json_template_guard_current_mail", "현재메일 요약 형식 변환에 실패했습니다. 다시 시도해 주세요."
             return "summary_json_template_guard", "응답 형식 변환에 실패했습니다. 다시 시도해 주세요."
         line_target = resolve_summary_line_target(user_message=user_message)
@@ -138,9 +138,8 @@ def _recover_current_mail_summary_from_tool_payload(
     Returns:
         복구 렌더 문자열. 조건 불충족 시 빈 문자열
     """
-    if not is_current_mail_summary_request(user_message=user_message):
-        return ""
-    if is_mail_summary_skill_query(user_message=user_message):
+    query_features = get_query_features(user_message=str(user_message or ""))
+    if not query_features.is_current_mail_summary or query_features.is_mail_summary_skill:
         return ""
     if '"format_type"' not in str(answer or ""):
         return ""
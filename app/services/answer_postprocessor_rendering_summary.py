@@ -3,7 +3,7 @@ from __future__ import annotations
 import re
 
 from app.core.logging_config import get_logger
-from app.core.intent_rules import is_mail_summary_skill_query
+from app.core.query_features import get_query_features
 from app.models.response_contracts import LLMResponseContract, SummaryResponseContract
 from app.services.answer_postprocessor_rendering_standard import (
     resolve_basic_info_value,
@@ -20,7 +20,6 @@ from app.services.answer_postprocessor_rendering_utils import (
 )
 from app.services.answer_postprocessor_summary import (
     extract_summary_lines,
-    is_current_mail_summary_request,
     is_explicit_line_summary_request,
     is_summary_request,
     render_summary_lines_for_request,
@@ -77,11 +76,12 @@ def should_render_standard_summary(user_message: str, contract: LLMResponseContr
         표준 요약 템플릿 사용 시 True
     """
     text = str(user_message or "")
-    is_mail_summary_skill = is_mail_summary_skill_query(user_message=text)
-    is_current_mail_summary = is_current_mail_summary_request(user_message=text)
+    query_features = get_query_features(user_message=text)
+    is_mail_summary_skill = query_features.is_mail_summary_skill
+    is_current_mail_summary = query_features.is_current_mail_summary
     if not (is_mail_summary_skill or is_current_mail_summary or contract.format_type in ("standard_summary", "detailed_summary")):
         return False
-    if is_current_mail_summary and is_explicit_line_summary_request(user_message=text):
+    if is_current_mail_summary and query_features.has_explicit_line_count:
         return False
     if is_current_mail_summary and not is_mail_summary_skill and contract.format_type == "standard_summary":
         return False
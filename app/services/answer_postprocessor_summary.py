@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import re
 
-from app.core.intent_rules import extract_summary_line_target, is_mail_summary_skill_query
+from app.core.intent_rules import extract_summary_line_target
+from app.core.query_features import get_query_features
 from app.services.answer_postprocessor_line_filters import (
     is_header_like_line,
     is_low_value_summary_line,
@@ -60,9 +61,7 @@ def is_current_mail_summary_request(user_message: str) -> bool:
     Returns:
         현재메일 요약 질의면 True
     """
-    text = str(user_message or "")
-    compact = re.sub(r"\s+", "", text)
-    return ("현재메일" in compact and "요약" in compact) or is_mail_summary_skill_query(user_message=text)
+    return get_query_features(user_message=str(user_message or "")).is_current_mail_summary
 
 
 def is_explicit_line_summary_request(user_message: str) -> bool:
@@ -75,7 +74,7 @@ def is_explicit_line_summary_request(user_message: str) -> bool:
     Returns:
         줄 수 명시 요약 요청이면 True
     """
-    return bool(re.search(r"\d+\s*줄", str(user_message or "")))
+    return get_query_features(user_message=str(user_message or "")).has_explicit_line_count
 
 
 def resolve_summary_line_target(user_message: str) -> int:
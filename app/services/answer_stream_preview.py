@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import json
+from typing import Callable
+
+PREVIEW_SCALAR_KEYS = frozenset({"title", "one_line_summary", "answer", "core_issue"})
+PREVIEW_LIST_KEYS = frozenset(
+    {"summary_lines", "key_points", "major_points", "required_actions", "action_items", "aggregated_summary"}
+)
+
+
+class AnswerStreamPreview:
+    """
+    모델 delta를 받아 사용자 노출용 미리보기 텍스트로 흘려보내는 증분 변환기.
+
+    일반 텍스트 응답은 delta를 그대로 전달하고, JSON 출력 계약 응답은 원문 JSON 대신
+    완성된 주요 문자열 필드(요약 줄/핵심 항목 등)를 한 줄씩 전달한다. 후처리된 최종 답변과
+    다를 수 있으므로 스트림 계층이 완료 시점에 replace 이벤트로 교정한다.
+    """
+
+    def __init__(self, emit: Callable[[str], None]) -> None:
+        """
+        변환기를 초기화한다.
+
+        Args:
+            emit: 미리보기 텍스트 콜백
+        """
+        self._emit = emit
+        self.reset()
+
+    def reset(self) -> None:
+        """변환 상태를 비운다(같은 턴에서 모델 호출을 다시 시작할 때)."""
+        self._mode = ""
+        self._pending = ""
+        self._has_output = False
+        self._stack: list[str] = []
+        self._keys: list[str] = []
+        self._expect_key: list[bool] = []
+        self._in_string = False
+        self._escape = False
+        self._string_is_key = False
+        self._string_buffer: list[str] = []
+
+    @property
+    def has_output(self) -> bool:
+        """미리보기 텍스트를 한 번이라도 전달했는지 여부."""
+        return self._has_output
+
+    def feed(self, delta: str) -> None:
+        """
+        모델 delta 1건을 처리한다.
+
+        Args:
+            delta: 모델 출력 조각
+        """
+        text = str(delta or "")
+        if not text:
+            return
+        if not self._mode:
+            self._pending += text
+            stripped = self._pending.lstrip()
+            if not stripped:
+                return
+            self._mode = "json" if stripped[0] in "{[`" else "text"
+            text, self._pending = stripped, ""
+        if self._mode == "text":
+            self._write(text)
+            return
+        for char in text:
+            self._consume(char)
+
+    def _consume(self, char: str) -> None:
+        """
+        JSON 출력의 문자 1개를 스캔한다.
+
+        Args:
+            char: 입력 문자
+        """
+        if self._in_string:
+            if self._escape:
+                self._escape = False
+            elif char == "\\":
+                self._escape = True
+            elif char == '"':
+                self._in_string = False
+                self._finish_string()
+                return
+            self._string_buffer.append(char)
+            return
+        if char == '"':
+            self._in_string = True
+            self._string_buffer = []
+            self._string_is_key = bool(self._stack) and self._stack[-1] == "{" and self._expect_key[-1]
+        elif char in "{[":
+            parent_key = self._keys[-1] if self._keys else ""
+            self._stack.append(char)
+            self._keys.append(parent_key if char == "[" else "")
+            self._expect_key.append(char == "{")
+        elif char in "}]" and self._stack:
+            self._stack.pop()
+            self._keys.pop()
+            self._expect_key.pop()
+        elif char in ":," and self._stack and self._stack[-1] == "{":
+            self._expect_key[-1] = char == ","
+
+    def _finish_string(self) -> None:
+        """완성된 JSON 문자열을 key로 기록하거나 미리보기 대상이면 전달한다."""
+        raw = "".join(self._string_buffer)
+        try:
+            value = str(json.loads(f'"{raw}"'))
+        except ValueError:
+            value = raw
+        if self._string_is_key:
+            self._keys[-1] = value
+            return
+        value = value.strip()
+        if not value or not self._stack or self._stack[0] != "{":
+            return
+        if len(self._stack) == 1 and self._keys[0] in PREVIEW_SCALAR_KEYS:
+            self._write_line(value)
+        elif len(self._stack) == 2 and self._stack[1] == "[" and self._keys[1] in PREVIEW_LIST_KEYS:
+            self._write_line(f"- {value}")
+
+    def _write_line(self, line: str) -> None:
+        """
+        미리보기 한 줄을 전달한다.
+
+        Args:
+            line: 전달할 줄
+        """
+        self._write(f"\n{line}" if self._has_output else line)
+
+    def _write(self, text: str) -> None:
+        """
+        미리보기 텍스트를 콜백으로 전달한다.
+
+        Args:
+            text: 전달할 텍스트
+        """
+        if not text:
+            return
+        self._has_output = True
+        self._emit(text)
@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Any
 
 from app.core.logging_config import get_logger
+from app.core.sqlite_pool import SQLiteConnectionPool, get_sqlite_pool
 
 logger = get_logger(__name__)
 
@@ -39,7 +40,7 @@ def record_chat_eval_run(report: dict[str, Any]) -> int:
     created_at = datetime.now(tz=timezone.utc).isoformat()
     report_json = json.dumps(report, ensure_ascii=False)
 
-    with _connect() as conn:
+    with _get_pool().write() as conn:
         cursor = conn.cursor()
         cursor.execute(
             (
@@ -61,7 +62,6 @@ def record_chat_eval_run(report: dict[str, Any]) -> int:
         )
         run_no = int(cursor.lastrowid or 0)
         _insert_case_rows(cursor=cursor, run_no=run_no, cases=cases)
-        conn.commit()
 
     logger.info("chat_eval.history.saved: run_no=%s cases=%s", run_no, len(cases) if isinstance(cases, list) else 0)
     return run_no
@@ -79,7 +79,7 @@ def list_chat_eval_runs(limit: int = 20) -> list[dict[str, Any]]:
     """
     _ensure_schema()
     normalized_limit = max(1, min(int(limit or 20), 200))
-    with _connect() as conn:
+    with _get_pool().read() as conn:
         cursor = conn.cursor()
         cursor.execute(
             (
@@ -115,7 +115,7 @@ def get_chat_eval_run(run_no: int) -> dict[str, Any] | None:
         리포트 dict 또는 None
     """
     _ensure_schema()
-    with _connect() as conn:
+    with _get_pool().read() as conn:
         cursor = conn.cursor()
         cursor.execute("SELECT report_json FROM eval_runs WHERE run_no = ?", (int(run_no),))
         row = cursor.fetchone()
@@ -168,25 +168,22 @@ def _insert_case_rows(cursor: sqlite3.Cursor, run_no: int, cases: Any) -> None:
         )
 
 
-def _connect() -> sqlite3.Connection:
+def _get_pool() -> SQLiteConnectionPool:
     """
-    Chat Eval SQLite DB 연결을 생성한다.
+    Chat Eval SQLite DB 공유 연결 풀을 반환한다.
 
     Returns:
-        sqlite3 연결 객체
+        `foreign_keys=ON`으로 여는 SQLite 연결 풀
     """
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(str(DB_PATH))
-    conn.execute("PRAGMA journal_mode=WAL")
-    conn.execute("PRAGMA foreign_keys=ON")
-    return conn
+    return get_sqlite_pool(DB_PATH, foreign_keys=True)
 
 
 def _ensure_schema() -> None:
     """
     Chat Eval 이력 저장용 스키마를 보장한다.
     """
-    with _connect() as conn:
+    with _get_pool().write() as conn:
         cursor = conn.cursor()
         cursor.execute(
             (
@@ -226,4 +223,3 @@ def _ensure_schema() -> None:
         )
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_eval_runs_created_at ON eval_runs(created_at DESC)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_eval_case_results_run_no ON eval_case_results(run_no)")
-        conn.commit()
@@ -9,7 +9,8 @@ from statistics import mean
 from typing import Any
 from urllib import error, request
 
-from app.core.llm_runtime import invoke_text_messages, resolve_env_model
+from app.core.llm_response_cache import lookup_llm_response_cache, store_llm_response_cache
+from app.core.llm_runtime import invoke_text_messages, normalize_model_name, resolve_env_model
 from app.core.logging_config import get_logger
 from app.services.chat_eval_quality_metrics import build_quality_metrics
 
@@ -122,22 +123,38 @@ def build_default_judge_caller(judge_model: str) -> Any:
 
 
 def _run_judge_once(model_name: str, system_prompt: str, user_prompt: str) -> dict[str, Any]:
-    """Judge LLM 응답 1회를 실행하고 파싱한다."""
+    """
+    Judge LLM 응답 1회를 실행하고 파싱한다.
+
+    응답 캐시는 JSON 객체로 파싱된 응답만 저장해, 파싱 실패 응답이 재실행마다 재사용되지 않게 한다.
+    """
+    messages = [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_prompt},
+    ]
     try:
-        raw_text = invoke_text_messages(
-            model_name=model_name,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            timeout_sec=60,
+        cache, cache_key, cached = lookup_llm_response_cache(
+            enabled=True,
+            model_name=normalize_model_name(model_name=model_name),
+            messages=messages,
+            temperature=None,
+            schema="judge_json",
         )
+        raw_text = cached
+        if raw_text is None:
+            raw_text = invoke_text_messages(model_name=model_name, messages=messages, timeout_sec=60)
         logger.info(
-            "chat_eval.judge_raw_response: length=%s content=%s",
+            "chat_eval.judge_raw_response: length=%s cached=%s content=%s",
             len(str(raw_text or "")),
+            cached is not None,
             _truncate_log_text(text=raw_text, max_chars=JUDGE_RAW_LOG_MAX_CHARS),
         )
-        return normalize_judge_result(raw_result=_extract_json_payload(raw_text=raw_text))
+        payload = _extract_json_payload(raw_text=raw_text)
+        if not isinstance(json.loads(payload), dict):
+            raise ValueError("judge_payload_not_object")
+        if cached is None:
+            store_llm_response_cache(cache=cache, cache_key=cache_key, content=raw_text)
+        return normalize_judge_result(raw_result=payload)
     except (ValueError, json.JSONDecodeError, TypeError, KeyError) as exc:
         logger.warning("chat_eval.judge_parse_failed: error=%s", exc)
         return judge_failure(reason=f"judge_parse_error: {exc}")
@@ -10,6 +10,8 @@ from app.agents.intent_schema import (
     IntentOutputFormat,
     IntentTaskType,
 )
+from app.agents.intent_turn_context import get_intent_turn_context
+from app.core.query_features import get_query_features
 from app.services.current_mail_grounded_safe_policy import (
     render_current_mail_grounded_safe_message,
     should_apply_current_mail_grounded_safe_guard,
@@ -309,11 +311,7 @@ def is_translation_like_request_text(user_message: str) -> bool:
     Returns:
         번역 성격 요청이면 True
     """
-    compact = str(user_message or "").replace(" ", "").lower()
-    if not compact:
-        return False
-    translation_tokens = ("번역", "translate", "translation")
-    return any(token in compact for token in translation_tokens)
+    return get_query_features(user_message=str(user_message or "")).is_translation_like
 
 
 def resolve_current_mail_intent_contract(
@@ -398,7 +396,11 @@ def _resolve_decomposition(
     normalized = str(user_message or "").strip()
     if not normalized:
         return None
-    return _parse_intent_decomposition_cached(
+    # 턴 안에서는 flow가 확정한 구조분해를 재사용하므로 입력 기준 캐시(이전 턴 결과)를 거치지 않는다.
+    parse_fn = _parse_intent_decomposition_cached
+    if get_intent_turn_context() is not None:
+        parse_fn = _parse_intent_decomposition_cached.__wrapped__
+    return parse_fn(
         user_message=normalized,
         has_current_mail_context=bool(has_current_mail_context),
     )
@@ -9,6 +9,7 @@ from app.agents.intent_schema import (
     IntentOutputFormat,
     IntentTaskType,
 )
+from app.core.query_features import get_query_features
 
 
 def build_text_fallback_decomposition(
@@ -66,11 +67,7 @@ def build_text_fallback_decomposition(
 
 def has_current_mail_anchor_text(user_message: str) -> bool:
     """decomposition 없이도 현재메일 지시 앵커를 텍스트에서 판별한다."""
-    compact = str(user_message or "").replace(" ", "").lower()
-    if not compact:
-        return False
-    anchor_tokens = ("현재메일", "현재선택메일", "현재선택된메일", "해당메일", "이메일의", "이이메일의")
-    return any(token in compact for token in anchor_tokens)
+    return get_query_features(user_message=str(user_message or "")).has_current_mail_anchor
 
 
 def is_current_mail_decomposition(decomposition: IntentDecomposition | None) -> bool:
@@ -4,6 +4,7 @@ from typing import Any
 
 from app.agents.intent_parser import get_intent_parser
 from app.agents.intent_schema import IntentDecomposition
+from app.agents.intent_turn_context import lookup_intent_turn_decomposition
 from app.core.logging_config import get_logger
 
 SCOPE_PREFIX = "[질의 범위]"
@@ -65,6 +66,8 @@ def parse_intent_decomposition_safely(
     """
     라우팅 보조용 intent 구조분해를 안전하게 파싱한다.
 
+    같은 턴에서 같은 질의로 이미 확정된 구조분해가 있으면 파서를 다시 호출하지 않고 그 결과를 반환한다.
+
     Args:
         user_message: 사용자 질의
         parser_factory: 파서 팩토리(테스트 주입용)
@@ -77,6 +80,9 @@ def parse_intent_decomposition_safely(
     normalized = str(user_message or "").strip()
     if not normalized:
         return None
+    reused, turn_decomposition = lookup_intent_turn_decomposition(user_message=normalized)
+    if reused:
+        return turn_decomposition
     try:
         parser = parser_factory() if callable(parser_factory) else get_intent_parser()
         try:
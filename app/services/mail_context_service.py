@@ -21,12 +21,14 @@ class MailContextResult:
         source: `db-cache` 또는 `graph-api` 또는 `not-found`
         mail: 조회된 메일 레코드
         reason: 실패 사유
+        summary_pending: summary를 background에서 생성 중이라 아직 비어 있으면 True
     """
 
     status: str
     source: str
     mail: MailRecord | None
     reason: str = ""
+    summary_pending: bool = False
 
 
 class MailContextService:
@@ -67,7 +69,12 @@ class MailContextService:
         ):
             cached_mail = self._ensure_summary_generated(mail=cached_mail)
             logger.info("선택 메일 컨텍스트 캐시 조회 성공: message_id=%s", normalized_message_id)
-            return MailContextResult(status="completed", source="db-cache", mail=cached_mail)
+            return MailContextResult(
+                status="completed",
+                source="db-cache",
+                mail=cached_mail,
+                summary_pending=self._is_summary_pending(mail=cached_mail),
+            )
 
         graph_mail = self._graph_client.get_message(
             mailbox_user=mailbox_user,
@@ -92,7 +99,12 @@ class MailContextService:
         self._mail_service.upsert_mail_record(mail=mail)
         mail = self._ensure_summary_generated(mail=mail)
         logger.info("선택 메일 컨텍스트 Graph 조회 성공: message_id=%s", normalized_message_id)
-        return MailContextResult(status="completed", source="graph-api", mail=mail)
+        return MailContextResult(
+            status="completed",
+            source="graph-api",
+            mail=mail,
+            summary_pending=self._is_summary_pending(mail=mail),
+        )
 
     def _should_refresh_from_graph(self, cached_mail: MailRecord, mailbox_user: str) -> bool:
         """
@@ -113,7 +125,7 @@ class MailContextService:
 
     def _ensure_summary_generated(self, mail: MailRecord) -> MailRecord:
         """
-        summary가 비어 있으면 queue worker를 즉시 실행해 보강한다.
+        summary가 비어 있으면 background 요약을 요청하고 짧게 기다린다.
 
         Args:
             mail: 보강 대상 메일
@@ -126,10 +138,25 @@ class MailContextService:
         refreshed = self._mail_service.ensure_summary_for_message(
             message_id=str(mail.message_id or "").strip(),
             requested_by="mail_context",
-            max_attempts=3,
         )
         return refreshed if refreshed is not None else mail
 
+    def _is_summary_pending(self, mail: MailRecord) -> bool:
+        """
+        summary가 background에서 생성 중(아직 비어 있음)인지 판별한다.
+
+        Args:
+            mail: 판별 대상 메일
+
+        Returns:
+            summary가 비어 있고 background 요약 제출이 받아들여져 아직 처리 중이면 True
+        """
+        if str(mail.summary_text or "").strip():
+            return False
+        if not self._mail_service.supports_summary_storage():
+            return False
+        return self._mail_service.is_summary_pending(message_id=str(mail.message_id or ""))
+
     def run_post_action(self, action: str) -> dict[str, Any]:
         """
         현재 메일 컨텍스트 기준 후속 작업을 공통 경로로 실행한다.
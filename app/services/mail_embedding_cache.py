@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+
+from app.core.logging_config import get_logger
+from app.services.mail_vector_matrix import pack_embedding, unpack_embedding
+
+logger = get_logger(__name__)
+
+
+def build_content_key(text: str) -> str:
+    """
+    임베딩 캐시 키(본문 sha256)를 생성한다.
+
+    Args:
+        text: 임베딩 대상 텍스트
+
+    Returns:
+        16진수 해시 문자열
+    """
+    return hashlib.sha256(str(text or "").encode("utf-8")).hexdigest()
+
+
+class MailEmbeddingCache:
+    """
+    임베딩 모델 버전 태그 + 본문 해시 기준 on-disk 임베딩 캐시.
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        """
+        캐시 인스턴스를 초기화한다.
+
+        Args:
+            db_path: 캐시 sqlite 경로
+        """
+        self._db_path = db_path
+        self._lock = threading.Lock()
+
+    def get_many(self, version_tag: str, keys: list[str]) -> dict[str, list[float]]:
+        """
+        캐시에 저장된 임베딩을 조회한다.
+
+        Args:
+            version_tag: 임베딩 모델 버전 태그
+            keys: 본문 해시 키 목록
+
+        Returns:
+            key -> 임베딩 사전(캐시 miss 키는 제외)
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        if not unique_keys or not self._db_path.exists():
+            return {}
+        found: dict[str, list[float]] = {}
+        try:
+            with self._lock:
+                connection = sqlite3.connect(str(self._db_path))
+                try:
+                    self._ensure_table(connection=connection)
+                    for start in range(0, len(unique_keys), 500):
+                        chunk = unique_keys[start : start + 500]
+                        placeholders = ", ".join("?" for _ in chunk)
+                        rows = connection.execute(
+                            "SELECT content_key, embedding_blob FROM mail_embedding_cache "
+                            f"WHERE version_tag = ? AND content_key IN ({placeholders})",
+                            (version_tag, *chunk),
+                        ).fetchall()
+                        found.update({str(key): list(unpack_embedding(blob)) for key, blob in rows})
+                finally:
+                    connection.close()
+        except sqlite3.Error as exc:
+            logger.warning("mail_embedding_cache_read_failed: error=%s", exc)
+            return {}
+        return found
+
+    def put_many(self, version_tag: str, items: dict[str, list[float]]) -> None:
+        """
+        임베딩을 캐시에 저장한다.
+
+        Args:
+            version_tag: 임베딩 모델 버전 태그
+            items: key -> 임베딩 사전
+        """
+        if not items:
+            return
+        try:
+            with self._lock:
+                self._db_path.parent.mkdir(parents=True, exist_ok=True)
+                connection = sqlite3.connect(str(self._db_path))
+                try:
+                    self._ensure_table(connection=connection)
+                    connection.executemany(
+                        "INSERT OR REPLACE INTO mail_embedding_cache (version_tag, content_key, embedding_blob) "
+                        "VALUES (?, ?, ?)",
+                        [(version_tag, key, pack_embedding(embedding)) for key, embedding in items.items()],
+                    )
+                    connection.commit()
+                finally:
+                    connection.close()
+        except sqlite3.Error as exc:
+            logger.warning("mail_embedding_cache_write_failed: count=%s error=%s", len(items), exc)
+
+    def _ensure_table(self, connection: sqlite3.Connection) -> None:
+        """
+        캐시 테이블을 보장한다.
+
+        Args:
+            connection: sqlite 연결
+        """
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS mail_embedding_cache ("
+            "version_tag TEXT NOT NULL, "
+            "content_key TEXT NOT NULL, "
+            "embedding_blob BLOB NOT NULL, "
+            "created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP, "
+            "PRIMARY KEY (version_tag, content_key))"
+        )
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import importlib
+import os
+import threading
+from pathlib import Path
+from typing import Any, Protocol
+
+from app.core.env_config import resolve_positive_int_env
+from app.core.logging_config import get_logger
+from app.services.mail_embedding_cache import MailEmbeddingCache, build_content_key
+from app.services.mail_vector_embedding import EMBEDDING_DIM, embed_many
+
+logger = get_logger(__name__)
+MAIL_VECTOR_DIR_ENV = "MOLDUBOT_MAIL_VECTOR_DIR"
+MAIL_EMBEDDING_BACKEND_ENV = "MOLDUBOT_MAIL_EMBEDDING_BACKEND"
+MAIL_EMBEDDING_MODEL_ENV = "MOLDUBOT_MAIL_EMBEDDING_MODEL"
+MAIL_EMBEDDING_BATCH_SIZE_ENV = "MOLDUBOT_MAIL_EMBEDDING_BATCH_SIZE"
+MAIL_EMBEDDING_CACHE_ENABLED_ENV = "MOLDUBOT_MAIL_EMBEDDING_CACHE_ENABLED"
+DEFAULT_SENTENCE_TRANSFORMER_MODEL = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
+DEFAULT_EMBEDDING_BATCH_SIZE = 32
+HASH_EMBEDDING_VERSION = f"hash-md5-{EMBEDDING_DIM}-v1"
+_PROVIDER_REGISTRY: dict[tuple[str, str, str], "MailEmbeddingProvider"] = {}
+_PROVIDER_REGISTRY_LOCK = threading.Lock()
+
+
+class MailEmbeddingProvider(Protocol):
+    """메일 검색/색인 임베딩 provider 최소 인터페이스."""
+
+    @property
+    def version_tag(self) -> str:
+        """벡터 공간 식별용 모델/차원 버전 태그."""
+
+    def embed_many(self, texts: list[str]) -> list[list[float]]:
+        """텍스트 목록을 정규화 벡터 목록으로 변환한다."""
+
+
+class HashEmbeddingProvider:
+    """
+    md5 토큰 해시 임베딩 provider(기본값, 외부 의존성 없음).
+    """
+
+    @property
+    def version_tag(self) -> str:
+        """벡터 공간 식별용 버전 태그를 반환한다."""
+        return HASH_EMBEDDING_VERSION
+
+    def embed_many(self, texts: list[str]) -> list[list[float]]:
+        """
+        텍스트 목록을 토큰 해시 임베딩으로 변환한다.
+
+        Args:
+            texts: 입력 텍스트 목록
+
+        Returns:
+            정규화 벡터 목록
+        """
+        return embed_many(texts=texts)
+
+
+class SentenceTransformerEmbeddingProvider:
+    """
+    CPU 전용 로컬 sentence-transformer provider(모델은 최초 사용 시 1회 로드).
+    """
+
+    def __init__(self, model_name: str, batch_size: int, cache: MailEmbeddingCache | None = None) -> None:
+        """
+        provider를 초기화한다.
+
+        Args:
+            model_name: sentence-transformers 모델명 또는 로컬 경로
+            batch_size: encode 배치 크기
+            cache: on-disk 임베딩 캐시(선택)
+        """
+        self._model_name = model_name
+        self._batch_size = max(1, int(batch_size))
+        self._cache = cache
+        self._model: Any = None
+        self._dim = 0
+        self._lock = threading.Lock()
+
+    @property
+    def version_tag(self) -> str:
+        """벡터 공간 식별용 버전 태그(`st:<model>:<dim>`)를 반환한다."""
+        self._load_model()
+        return f"st:{self._model_name}:{self._dim}"
+
+    def embed_many(self, texts: list[str]) -> list[list[float]]:
+        """
+        텍스트 목록을 배치 encode하고 캐시 hit은 재사용한다.
+
+        Args:
+            texts: 입력 텍스트 목록
+
+        Returns:
+            정규화 벡터 목록(입력 순서 유지)
+        """
+        if not texts:
+            return []
+        keys = [build_content_key(text=text) for text in texts]
+        version_tag = self.version_tag
+        cached = self._cache.get_many(version_tag=version_tag, keys=keys) if self._cache is not None else {}
+        missing = {key: text for key, text in zip(keys, texts, strict=False) if key not in cached}
+        if missing:
+            encoded = self._load_model().encode(
+                list(missing.values()),
+                batch_size=self._batch_size,
+                normalize_embeddings=True,
+                convert_to_numpy=True,
+                show_progress_bar=False,
+            )
+            computed = {key: [float(value) for value in vector] for key, vector in zip(missing, encoded, strict=False)}
+            if self._cache is not None:
+                self._cache.put_many(version_tag=version_tag, items=computed)
+            cached.update(computed)
+        return [cached[key] for key in keys]
+
+    def load(self) -> None:
+        """모델을 미리 로드한다(로드 실패 시 예외 전파)."""
+        self._load_model()
+
+    def _load_model(self) -> Any:
+        """
+        sentence-transformer 모델을 CPU로 1회 로드한다.
+
+        Returns:
+            모델 객체
+        """
+        with self._lock:
+            if self._model is None:
+                module = importlib.import_module("sentence_transformers")
+                self._model = module.SentenceTransformer(self._model_name, device="cpu")
+                self._dim = int(self._model.get_sentence_embedding_dimension() or 0)
+                logger.info("mail_embedding_model_loaded: model=%s dim=%s", self._model_name, self._dim)
+            return self._model
+
+
+def get_mail_embedding_provider() -> MailEmbeddingProvider:
+    """
+    환경변수 설정에 맞는 프로세스 공유 임베딩 provider를 반환한다.
+
+    sentence-transformer backend를 로드할 수 없으면 hash provider로 fallback한다.
+
+    Returns:
+        임베딩 provider
+    """
+    backend = str(os.getenv(MAIL_EMBEDDING_BACKEND_ENV, "hash")).strip().lower() or "hash"
+    model_name = str(os.getenv(MAIL_EMBEDDING_MODEL_ENV, DEFAULT_SENTENCE_TRANSFORMER_MODEL)).strip()
+    cache_dir = str(resolve_mail_vector_dir())
+    key = (backend, model_name, cache_dir)
+    with _PROVIDER_REGISTRY_LOCK:
+        provider = _PROVIDER_REGISTRY.get(key)
+        if provider is None:
+            provider = _build_provider(backend=backend, model_name=model_name, cache_dir=Path(cache_dir))
+            _PROVIDER_REGISTRY[key] = provider
+        return provider
+
+
+def resolve_mail_vector_dir() -> Path:
+    """
+    벡터 인덱스/임베딩 캐시 저장 디렉터리를 해석한다.
+
+    Returns:
+        저장 디렉터리 경로
+    """
+    env_path = str(os.getenv(MAIL_VECTOR_DIR_ENV, "")).strip()
+    if env_path:
+        return Path(env_path)
+    root_dir = Path(__file__).resolve().parents[2]
+    return root_dir / "data" / "chroma_db"
+
+
+def _build_provider(backend: str, model_name: str, cache_dir: Path) -> MailEmbeddingProvider:
+    """
+    backend 이름에 맞는 provider를 생성한다.
+
+    Args:
+        backend: `hash` 또는 `sentence_transformer`
+        model_name: sentence-transformer 모델명
+        cache_dir: 임베딩 캐시 디렉터리
+
+    Returns:
+        임베딩 provider
+    """
+    if backend not in {"sentence_transformer", "sentence-transformers", "st"}:
+        return HashEmbeddingProvider()
+    cache_enabled = str(os.getenv(MAIL_EMBEDDING_CACHE_ENABLED_ENV, "1")).strip().lower()
+    cache = None
+    if cache_enabled not in {"0", "false", "off", "no"}:
+        cache = MailEmbeddingCache(db_path=cache_dir / "mail_embedding_cache.sqlite3")
+    provider = SentenceTransformerEmbeddingProvider(
+        model_name=model_name or DEFAULT_SENTENCE_TRANSFORMER_MODEL,
+        batch_size=resolve_positive_int_env(MAIL_EMBEDDING_BATCH_SIZE_ENV, DEFAULT_EMBEDDING_BATCH_SIZE),
+        cache=cache,
+    )
+    try:
+        provider.load()
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("mail_embedding_provider_fallback: backend=%s fallback=hash error=%s", backend, exc)
+        return HashEmbeddingProvider()
+    return provider
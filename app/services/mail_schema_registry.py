@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+
+from app.core.logging_config import get_logger
+from app.core.sqlite_pool import get_sqlite_pool
+from app.services.mail_search_service_sql import PREFERRED_OUTLOOK_LINK_COLUMNS, build_search_select_clause
+from app.services.mail_service_utils import build_upsert_insert_query, build_upsert_update_query
+
+logger = get_logger(__name__)
+
+SCHEMA_REVALIDATE_SEC = 2.0
+_MAIL_ROW_SELECT_PREFIX = (
+    "SELECT message_id, subject, from_address, received_date, "
+    "COALESCE(body_clean, body_full, body_preview, '') AS body_text, "
+    "COALESCE(body_full, body_clean, body_preview, '') AS code_body_text, "
+    "COALESCE(body_full, '') AS body_full_text, "
+)
+
+
+@dataclass(frozen=True)
+class EmailsSchemaStatements:
+    """
+    emails 컬럼 조합별로 한 번만 조립하는 SQL 문 묶음.
+
+    같은 문자열 객체를 재사용하므로 sqlite3 연결의 prepared statement 캐시도 그대로 적중한다.
+    """
+
+    search_select_clause: str
+    latest_mail_query: str
+    mail_by_id_query: str
+    upsert_update_query: str
+    upsert_insert_query: str
+    summary_update_query: str
+
+
+@dataclass(frozen=True)
+class EmailsSchema:
+    """
+    introspection한 `emails` 테이블 컬럼 정보와 캐시된 SQL 문.
+    """
+
+    columns: frozenset[str]
+    statements: EmailsSchemaStatements = field(repr=False)
+
+    @property
+    def has_summary(self) -> bool:
+        """`summary` 컬럼 존재 여부."""
+        return "summary" in self.columns
+
+    @property
+    def has_web_link(self) -> bool:
+        """`web_link` 컬럼 존재 여부."""
+        return "web_link" in self.columns
+
+    @property
+    def has_category(self) -> bool:
+        """`category` 컬럼 존재 여부."""
+        return "category" in self.columns
+
+    @property
+    def preferred_outlook_link_column(self) -> str:
+        """우선순위가 가장 높은 Outlook 전용 링크 컬럼명(없으면 빈 문자열)."""
+        return next((column for column in PREFERRED_OUTLOOK_LINK_COLUMNS if column in self.columns), "")
+
+
+@dataclass
+class _SchemaEntry:
+    """경로별 registry 항목."""
+
+    file_id: tuple[int, int]
+    schema_version: int
+    schema: EmailsSchema
+    checked_at: float
+
+
+_REGISTRY: dict[str, _SchemaEntry] = {}
+_REGISTRY_LOCK = threading.Lock()
+
+
+def get_emails_schema(db_path: Path | str) -> EmailsSchema:
+    """
+    `emails` 테이블 스키마를 프로세스 공유 registry에서 반환한다.
+
+    파일 식별자(device, inode)는 호출마다 확인하고, `PRAGMA schema_version`은
+    `SCHEMA_REVALIDATE_SEC` 간격으로만 다시 읽는다. 둘 중 하나가 바뀐 경우에만
+    `PRAGMA table_info(emails)`를 다시 실행한다.
+
+    Args:
+        db_path: 메일 SQLite 파일 경로
+
+    Returns:
+        emails 스키마(파일이 없으면 빈 컬럼 스키마)
+    """
+    path = Path(db_path)
+    file_id = _resolve_file_id(db_path=path)
+    if file_id is None:
+        return _build_schema(columns=frozenset())
+    key = str(path.resolve())
+    now = time.monotonic()
+    with _REGISTRY_LOCK:
+        entry = _REGISTRY.get(key)
+    if entry is not None and entry.file_id == file_id and now - entry.checked_at < SCHEMA_REVALIDATE_SEC:
+        return entry.schema
+    with get_sqlite_pool(path).read() as conn:
+        schema_version = int(conn.execute("PRAGMA schema_version").fetchone()[0])
+        if entry is not None and entry.file_id == file_id and entry.schema_version == schema_version:
+            entry.checked_at = now
+            return entry.schema
+        rows = conn.execute("PRAGMA table_info(emails)").fetchall()
+    columns = frozenset(str(row[1]).strip().lower() for row in rows if len(row) > 1)
+    schema = _build_schema(columns=columns)
+    with _REGISTRY_LOCK:
+        _REGISTRY[key] = _SchemaEntry(file_id=file_id, schema_version=schema_version, schema=schema, checked_at=now)
+    logger.info("mail_schema.introspected: path=%s schema_version=%s columns=%s", key, schema_version, len(columns))
+    return schema
+
+
+def invalidate_emails_schema(db_path: Path | str | None = None) -> None:
+    """
+    registry 항목을 비운다(스키마를 직접 변경한 직후 또는 테스트 격리용).
+
+    Args:
+        db_path: 비울 DB 경로(None이면 전체)
+    """
+    with _REGISTRY_LOCK:
+        if db_path is None:
+            _REGISTRY.clear()
+        else:
+            _REGISTRY.pop(str(Path(db_path).resolve()), None)
+
+
+def _build_schema(columns: frozenset[str]) -> EmailsSchema:
+    """
+    컬럼 집합으로 스키마 객체를 만든다.
+
+    Args:
+        columns: 소문자 컬럼명 집합
+
+    Returns:
+        emails 스키마
+    """
+    preferred_link_column = next((column for column in PREFERRED_OUTLOOK_LINK_COLUMNS if column in columns), "")
+    statements = _build_statements(
+        include_summary="summary" in columns,
+        include_web_link="web_link" in columns,
+        include_category="category" in columns,
+        preferred_link_column=preferred_link_column,
+    )
+    return EmailsSchema(columns=columns, statements=statements)
+
+
+@lru_cache(maxsize=64)
+def _build_statements(
+    include_summary: bool,
+    include_web_link: bool,
+    include_category: bool,
+    preferred_link_column: str,
+) -> EmailsSchemaStatements:
+    """
+    컬럼 조합별 SQL 문 묶음을 조립한다(조합당 1회).
+
+    Args:
+        include_summary: summary 컬럼 존재 여부
+        include_web_link: web_link 컬럼 존재 여부
+        include_category: category 컬럼 존재 여부
+        preferred_link_column: Outlook 전용 링크 컬럼명
+
+    Returns:
+        SQL 문 묶음
+    """
+    summary_clause = "COALESCE(summary, '') AS summary_text" if include_summary else "'' AS summary_text"
+    web_link_clause = "COALESCE(web_link, '') AS web_link" if include_web_link else "'' AS web_link"
+    search_columns = {"summary"} if include_summary else set()
+    if include_web_link:
+        search_columns.add("web_link")
+    if preferred_link_column:
+        search_columns.add(preferred_link_column)
+    mail_row_select = f"{_MAIL_ROW_SELECT_PREFIX}{summary_clause}, {web_link_clause} "
+    summary_update_query = (
+        "UPDATE emails SET summary = ?, category = ? WHERE message_id = ?"
+        if include_category
+        else "UPDATE emails SET summary = ? WHERE message_id = ?"
+    )
+    return EmailsSchemaStatements(
+        search_select_clause=build_search_select_clause(columns=search_columns),
+        latest_mail_query=f"{mail_row_select}FROM emails ORDER BY received_date DESC LIMIT 1",
+        mail_by_id_query=f"{mail_row_select}FROM emails WHERE message_id = ? LIMIT 1",
+        upsert_update_query=build_upsert_update_query(include_web_link=include_web_link, include_summary=include_summary),
+        upsert_insert_query=build_upsert_insert_query(include_web_link=include_web_link, include_summary=include_summary),
+        summary_update_query=summary_update_query,
+    )
+
+
+def _resolve_file_id(db_path: Path) -> tuple[int, int] | None:
+    """
+    DB 파일 식별자(device, inode)를 반환한다.
+
+    Args:
+        db_path: SQLite 파일 경로
+
+    Returns:
+        파일 식별자(파일이 없으면 None)
+    """
+    try:
+        stat = os.stat(db_path)
+    except OSError:
+        return None
+    return stat.st_dev, stat.st_ino
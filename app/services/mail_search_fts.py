@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+MAIL_SEARCH_FTS_ENABLED_ENV = "MOLDUBOT_MAIL_SEARCH_FTS_ENABLED"
+MAIL_SEARCH_FTS_TABLE = "emails_fts"
+MAIL_SEARCH_FTS_WORD_TABLE = "emails_fts_words"
+MAIL_SEARCH_FTS_MIN_TOKEN_CHARS = 3
+MAIL_SEARCH_FTS_WORD_MIN_TOKEN_CHARS = 2
+MAIL_SEARCH_FTS_MAX_TOKENS = 4
+MAIL_SEARCH_FTS_TRIGGERS: tuple[str, ...] = ("emails_fts_ai", "emails_fts_ad", "emails_fts_au")
+MAIL_SEARCH_FTS_BM25_WEIGHTS: tuple[float, ...] = (4.0, 1.0, 1.0, 3.0)
+
+
+def is_mail_search_fts_enabled() -> bool:
+    """
+    FTS5 후보 조회 사용 여부 환경변수를 해석한다.
+
+    Returns:
+        활성화 여부
+    """
+    normalized = str(os.getenv(MAIL_SEARCH_FTS_ENABLED_ENV, "1")).strip().lower()
+    return normalized not in {"0", "false", "off", "no"}
+
+
+def ensure_mail_search_fts_index(conn: sqlite3.Connection) -> bool:
+    """
+    `emails` FTS5 shadow 테이블(trigram/단어)과 동기화 트리거를 보장하고 누락분을 재색인한다.
+
+    Args:
+        conn: emails DB 연결
+
+    Returns:
+        FTS5 인덱스 사용 가능 여부
+    """
+    try:
+        columns = _load_email_columns(conn=conn)
+        if not columns:
+            return False
+        _create_fts_table(conn=conn)
+        _create_sync_triggers(conn=conn, columns=columns)
+        email_count = _count_rows(conn=conn, table="emails")
+        if any(
+            _count_rows(conn=conn, table=table) != email_count
+            for table in (MAIL_SEARCH_FTS_TABLE, MAIL_SEARCH_FTS_WORD_TABLE)
+        ):
+            indexed = _rebuild_rows(conn=conn, columns=columns)
+            logger.info("mail_search_fts_rebuilt: reason=row_count_mismatch indexed=%s", indexed)
+        conn.commit()
+        return True
+    except sqlite3.Error as exc:
+        conn.rollback()
+        logger.warning("mail_search_fts_unavailable: fallback=like error=%s", exc)
+        return False
+
+
+def rebuild_mail_search_fts_index(conn: sqlite3.Connection) -> int:
+    """
+    FTS5 shadow 테이블(trigram/단어)을 `emails` 전건 기준으로 재생성한다.
+
+    Args:
+        conn: emails DB 연결
+
+    Returns:
+        색인된 행 수
+
+    Raises:
+        sqlite3.OperationalError: FTS5/trigram 토크나이저를 지원하지 않는 sqlite 빌드일 때
+    """
+    columns = _load_email_columns(conn=conn)
+    if not columns:
+        return 0
+    for trigger_name in MAIL_SEARCH_FTS_TRIGGERS:
+        conn.execute(f"DROP TRIGGER IF EXISTS {trigger_name}")
+    conn.execute(f"DROP TABLE IF EXISTS {MAIL_SEARCH_FTS_TABLE}")
+    conn.execute(f"DROP TABLE IF EXISTS {MAIL_SEARCH_FTS_WORD_TABLE}")
+    _create_fts_table(conn=conn)
+    _create_sync_triggers(conn=conn, columns=columns)
+    indexed = _rebuild_rows(conn=conn, columns=columns)
+    conn.commit()
+    return indexed
+
+
+def select_fts_query_tokens(tokens: list[str]) -> list[str]:
+    """
+    trigram 인덱스로 조회 가능한(3자 이상) 토큰만 선별한다.
+
+    Args:
+        tokens: 후보 조회 토큰 목록
+
+    Returns:
+        FTS 조회 토큰 목록
+    """
+    selected: list[str] = []
+    for token in tokens:
+        normalized = str(token or "").strip()
+        if len(normalized) < MAIL_SEARCH_FTS_MIN_TOKEN_CHARS or normalized in selected:
+            continue
+        selected.append(normalized)
+    return selected[:MAIL_SEARCH_FTS_MAX_TOKENS]
+
+
+def select_fts_word_query_tokens(tokens: list[str]) -> list[str]:
+    """
+    trigram으로 조회할 수 없는 2자 토큰(`회의`/`일정` 등)을 단어 인덱스 prefix 조회용으로 선별한다.
+
+    Args:
+        tokens: 후보 조회 토큰 목록
+
+    Returns:
+        단어 인덱스 조회 토큰 목록
+    """
+    selected: list[str] = []
+    for token in tokens:
+        normalized = str(token or "").strip()
+        if not MAIL_SEARCH_FTS_WORD_MIN_TOKEN_CHARS <= len(normalized) < MAIL_SEARCH_FTS_MIN_TOKEN_CHARS:
+            continue
+        if normalized not in selected:
+            selected.append(normalized)
+    return selected[:MAIL_SEARCH_FTS_MAX_TOKENS]
+
+
+def build_fts_match_expression(tokens: list[str]) -> str:
+    """
+    토큰 목록을 OR 결합 FTS5 MATCH 식으로 변환한다.
+
+    Args:
+        tokens: FTS 조회 토큰 목록
+
+    Returns:
+        MATCH 식 문자열. 토큰이 없으면 빈 문자열
+    """
+    quoted = ['"' + str(token).replace('"', '""') + '"' for token in tokens if str(token or "").strip()]
+    return " OR ".join(quoted)
+
+
+def build_fts_prefix_match_expression(tokens: list[str]) -> str:
+    """
+    토큰 목록을 OR 결합 FTS5 prefix MATCH 식으로 변환한다(`회의` → `회의를`/`회의록` 등 일치).
+
+    Args:
+        tokens: 단어 인덱스 조회 토큰 목록
+
+    Returns:
+        MATCH 식 문자열. 토큰이 없으면 빈 문자열
+    """
+    quoted = ['"' + str(token).replace('"', '""') + '"*' for token in tokens if str(token or "").strip()]
+    return " OR ".join(quoted)
+
+
+def build_bm25_order_expression(table: str = MAIL_SEARCH_FTS_TABLE) -> str:
+    """
+    컬럼 가중치(subject/from/body/summary)를 반영한 bm25 정렬식을 반환한다.
+
+    Args:
+        table: FTS 테이블명
+
+    Returns:
+        bm25 SQL 식
+    """
+    weights = ", ".join(str(weight) for weight in MAIL_SEARCH_FTS_BM25_WEIGHTS)
+    return f"bm25({table}, {weights})"
+
+
+def _load_email_columns(conn: sqlite3.Connection) -> set[str]:
+    """
+    `emails` 테이블 컬럼 집합을 조회한다.
+
+    Args:
+        conn: emails DB 연결
+
+    Returns:
+        소문자 컬럼명 집합
+    """
+    rows = conn.execute("PRAGMA table_info(emails)").fetchall()
+    return {str(row[1]).strip().lower() for row in rows if len(row) > 1}
+
+
+def _create_fts_table(conn: sqlite3.Connection) -> None:
+    """
+    trigram FTS5 테이블과 2자 prefix 색인 단어(unicode61) FTS5 테이블을 생성한다(없으면).
+
+    Args:
+        conn: emails DB 연결
+    """
+    conn.execute(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {MAIL_SEARCH_FTS_TABLE} "
+        "USING fts5(subject, from_address, body, summary, tokenize='trigram')"
+    )
+    conn.execute(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {MAIL_SEARCH_FTS_WORD_TABLE} "
+        f"USING fts5(subject, from_address, body, summary, tokenize='unicode61', "
+        f"prefix='{MAIL_SEARCH_FTS_WORD_MIN_TOKEN_CHARS}')"
+    )
+
+
+def _create_sync_triggers(conn: sqlite3.Connection, columns: set[str]) -> None:
+    """
+    emails INSERT/UPDATE/DELETE 시 FTS 테이블(trigram/단어)을 동기화하는 트리거를 재생성한다.
+
+    Args:
+        conn: emails DB 연결
+        columns: emails 컬럼 집합
+    """
+    fts_tables = (MAIL_SEARCH_FTS_TABLE, MAIL_SEARCH_FTS_WORD_TABLE)
+    insert_new = " ".join(
+        f"INSERT INTO {table} (rowid, subject, from_address, body, summary) "
+        f"VALUES (new.rowid, {_build_value_exprs(alias='new', columns=columns)});"
+        for table in fts_tables
+    )
+    delete_old = " ".join(f"DELETE FROM {table} WHERE rowid = old.rowid;" for table in fts_tables)
+    statements = {
+        "emails_fts_ai": f"AFTER INSERT ON emails BEGIN {insert_new} END",
+        "emails_fts_ad": f"AFTER DELETE ON emails BEGIN {delete_old} END",
+        "emails_fts_au": f"AFTER UPDATE ON emails BEGIN {delete_old} {insert_new} END",
+    }
+    for trigger_name, body in statements.items():
+        conn.execute(f"DROP TRIGGER IF EXISTS {trigger_name}")
+        conn.execute(f"CREATE TRIGGER {trigger_name} {body}")
+
+
+def _rebuild_rows(conn: sqlite3.Connection, columns: set[str]) -> int:
+    """
+    FTS 테이블(trigram/단어) 내용을 비우고 emails 전건으로 다시 채운다.
+
+    Args:
+        conn: emails DB 연결
+        columns: emails 컬럼 집합
+
+    Returns:
+        색인된 행 수
+    """
+    indexed = 0
+    for table in (MAIL_SEARCH_FTS_TABLE, MAIL_SEARCH_FTS_WORD_TABLE):
+        conn.execute(f"DELETE FROM {table}")
+        cursor = conn.execute(
+            f"INSERT INTO {table} (rowid, subject, from_address, body, summary) "
+            f"SELECT rowid, {_build_value_exprs(alias='emails', columns=columns)} FROM emails"
+        )
+        indexed = max(0, int(cursor.rowcount))
+    return indexed
+
+
+def _build_value_exprs(alias: str, columns: set[str]) -> str:
+    """
+    FTS 컬럼(subject/from/body/summary)에 대응하는 SQL 값 식을 생성한다.
+
+    Args:
+        alias: 행 별칭(`new`, `emails` 등)
+        columns: emails 컬럼 집합
+
+    Returns:
+        콤마 결합 SQL 식
+    """
+    body_columns = [name for name in ("body_clean", "body_full", "body_preview") if name in columns]
+    body_expr = "COALESCE(" + ", ".join(f"{alias}.{name}" for name in body_columns) + ", '')" if body_columns else "''"
+    summary_expr = f"COALESCE({alias}.summary, '')" if "summary" in columns else "''"
+    return (
+        f"COALESCE({alias}.subject, ''), COALESCE({alias}.from_address, ''), "
+        f"{body_expr}, {summary_expr}"
+    )
+
+
+def _count_rows(conn: sqlite3.Connection, table: str) -> int:
+    """
+    테이블 행 수를 조회한다.
+
+    Args:
+        conn: emails DB 연결
+        table: 대상 테이블명
+
+    Returns:
+        행 수
+    """
+    row = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()
+    return int(row[0] or 0) if row is not None else 0
+
@@ -6,9 +6,23 @@ from dataclasses import dataclass
 from pathlib import Path
 
 from app.core.logging_config import get_logger
+from app.core.sqlite_pool import get_sqlite_pool
+from app.services.mail_search_fts import (
+    ensure_mail_search_fts_index,
+    is_mail_search_fts_enabled,
+    select_fts_query_tokens,
+    select_fts_word_query_tokens,
+)
+from app.services.mail_schema_registry import get_emails_schema
 from app.services.mail_search_service_relevance import should_reject_top_result_for_high_specific_query
+from app.services.mail_search_service_sql import (
+    build_fts_candidate_query,
+    build_like_candidate_query,
+    build_message_id_candidate_query,
+)
 from app.services.mail_search_utils import (
     build_aggregated_summary,
+    build_vector_semantic_rank,
     elapsed_ms,
     extract_person_anchor_tokens,
     extract_meaningful_query_tokens,
@@ -22,16 +36,10 @@ from app.services.mail_search_utils import (
     to_result_payload,
     tokenize_for_search,
 )
+from app.services.mail_embedding_provider import MailEmbeddingProvider, get_mail_embedding_provider
+from app.services.mail_vector_index_service import MailVectorHit, MailVectorIndexService
 
 logger = get_logger(__name__)
-PREFERRED_OUTLOOK_LINK_COLUMNS: tuple[str, ...] = (
-    "outlook_link",
-    "outlook_deep_link",
-    "outlook_uri",
-    "desktop_link",
-    "native_link",
-    "open_link",
-)
 
 
 @dataclass
@@ -63,18 +71,25 @@ class MailSearchService:
     SQLite 메일 DB 기반 하이브리드 검색(키워드 + 벡터 유사도) 서비스.
     """
 
-    def __init__(self, db_path: Path) -> None:
+    def __init__(
+        self,
+        db_path: Path,
+        vector_index_service: MailVectorIndexService | None = None,
+        embedding_provider: MailEmbeddingProvider | None = None,
+    ) -> None:
         """
         메일 검색 서비스 인스턴스를 초기화한다.
 
         Args:
             db_path: SQLite DB 경로
+            vector_index_service: 근접 이웃 조회용 벡터 인덱스 서비스(미지정 시 기본 설정으로 생성)
+            embedding_provider: 질의/후보 임베딩 provider(미지정 시 환경변수 기준 공유 provider)
         """
         self._db_path = db_path
-        self._has_web_link_column_cache: bool | None = None
-        self._has_summary_column_cache: bool | None = None
-        self._preferred_outlook_link_column_cache: str | None = None
-        self._table_columns_cache: set[str] | None = None
+        self._embedding_provider = embedding_provider or get_mail_embedding_provider()
+        self._vector_index_service = vector_index_service or MailVectorIndexService(self._embedding_provider)
+        self._fts_enabled = is_mail_search_fts_enabled()
+        self._fts_ready_cache: bool | None = None
 
     def search(
         self,
@@ -108,13 +123,22 @@ class MailSearchService:
             query=normalized_query,
         )
         started_at = time.perf_counter()
-        rows = self._fetch_candidates(
+        rows, candidate_source = self._fetch_candidates(
             query=normalized_query,
             person=normalized_person,
             start_date=start_date,
             end_date=end_date,
             candidate_limit=candidate_limit,
         )
+        query_embedding = self._embedding_provider.embed_many(texts=[normalized_query])[0] if normalized_query else []
+        vector_hits = self._vector_index_service.query(embedding=query_embedding, k=candidate_limit)
+        rows, vector_added_count = self._merge_vector_candidates(
+            rows=rows,
+            vector_hits=vector_hits,
+            person=normalized_person,
+            start_date=start_date,
+            end_date=end_date,
+        )
         if not rows:
             return {
                 "action": "mail_search",
@@ -122,9 +146,18 @@ class MailSearchService:
                 "results": [],
                 "count": 0,
                 "aggregated_summary": [],
-                "metrics": {"candidate_count": 0, "elapsed_ms": elapsed_ms(started_at)},
+                "metrics": {
+                    "candidate_count": 0,
+                    "candidate_source": candidate_source,
+                    "elapsed_ms": elapsed_ms(started_at),
+                },
             }
-        reranked = rerank_candidates(query=normalized_query, rows=rows)
+        reranked = rerank_candidates(
+            query=normalized_query,
+            rows=rows,
+            semantic_ranks=build_vector_semantic_rank(rows=rows, hits=vector_hits),
+            embedding_provider=self._embedding_provider,
+        )
         filtered = self._filter_low_relevance_rows(query=normalized_query, rows=reranked)
         results = [to_result_payload(row=item) for item in filtered[:target_limit]]
         aggregated_summary = build_aggregated_summary(results=results, line_target=min(5, target_limit))
@@ -140,6 +173,9 @@ class MailSearchService:
             "end_date": str(end_date or "").strip(),
             "metrics": {
                 "candidate_count": len(rows),
+                "candidate_source": candidate_source,
+                "vector_hit_count": len(vector_hits),
+                "vector_added_count": vector_added_count,
                 "reranked_count": len(reranked),
                 "filtered_count": len(filtered),
                 "returned_count": len(results),
@@ -223,10 +259,13 @@ class MailSearchService:
         start_date: str,
         end_date: str,
         candidate_limit: int,
-    ) -> list[MailSearchResult]:
+    ) -> tuple[list[MailSearchResult], str]:
         """
         DB에서 검색 후보 메일 목록을 조회한다.
 
+        3자 이상 토큰은 trigram 인덱스, 2자 토큰은 단어 인덱스 prefix 조회로 후보를 찾고,
+        인덱스로 조회할 토큰이 없거나 FTS5 후보가 없으면 기존 LIKE 스캔 경로로 조회한다.
+
         Args:
             query: 사용자 질의
             person: 사람명 필터
@@ -235,14 +274,29 @@ class MailSearchService:
             candidate_limit: 후보 조회 상한
 
         Returns:
-            후보 메일 목록
+            (후보 메일 목록, 후보 조회 경로(`fts`/`like`)) 튜플
         """
         if not self._db_path.exists():
             logger.warning("메일 검색 DB 파일이 없습니다: %s", self._db_path)
-            return []
-        conn = sqlite3.connect(str(self._db_path))
-        conn.row_factory = sqlite3.Row
-        try:
+            return [], "none"
+        candidate_tokens = self._build_candidate_query_tokens(query=query)
+        fts_tokens = select_fts_query_tokens(tokens=candidate_tokens)
+        word_tokens = select_fts_word_query_tokens(tokens=candidate_tokens)
+        fts_ready = bool(fts_tokens or word_tokens) and self._is_fts_ready()
+        with get_sqlite_pool(self._db_path).read(row_factory=sqlite3.Row) as conn:
+            if fts_ready:
+                sql, params = build_fts_candidate_query(
+                    select_clause=self._build_select_clause(),
+                    fts_tokens=fts_tokens,
+                    person=person,
+                    start_date=start_date,
+                    end_date=end_date,
+                    candidate_limit=candidate_limit,
+                    word_tokens=word_tokens,
+                )
+                rows = conn.execute(sql, params).fetchall()
+                if rows:
+                    return [_row_to_result(row=row) for row in rows], "fts"
             sql, params = self._build_candidate_query(
                 query=query,
                 person=person,
@@ -251,9 +305,65 @@ class MailSearchService:
                 candidate_limit=candidate_limit,
             )
             rows = conn.execute(sql, params).fetchall()
-        finally:
-            conn.close()
-        return [_row_to_result(row=row) for row in rows]
+        return [_row_to_result(row=row) for row in rows], "like"
+
+    def _merge_vector_candidates(
+        self,
+        rows: list[MailSearchResult],
+        vector_hits: list[MailVectorHit],
+        person: str,
+        start_date: str,
+        end_date: str,
+    ) -> tuple[list[MailSearchResult], int]:
+        """
+        어휘 후보에 없는 벡터 hit 메일을 필터 조건으로 조회해 후보에 합친다.
+
+        Args:
+            rows: 어휘 후보 목록(최신순)
+            vector_hits: 벡터 조회 결과
+            person: 사람명 필터
+            start_date: 시작일
+            end_date: 종료일
+
+        Returns:
+            (최신순 병합 후보 목록, 추가된 후보 수) 튜플
+        """
+        existing_ids = {row.message_id for row in rows}
+        missing_ids = list(dict.fromkeys(hit.message_id for hit in vector_hits if hit.message_id not in existing_ids))
+        if not missing_ids or not self._db_path.exists():
+            return rows, 0
+        sql, params = build_message_id_candidate_query(
+            select_clause=self._build_select_clause(),
+            message_ids=missing_ids,
+            person=person,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        with get_sqlite_pool(self._db_path).read(row_factory=sqlite3.Row) as conn:
+            added = [_row_to_result(row=row) for row in conn.execute(sql, params).fetchall()]
+        if not added:
+            return rows, 0
+        merged = sorted([*rows, *added], key=lambda row: row.received_date, reverse=True)
+        return merged, len(added)
+
+    def _is_fts_ready(self) -> bool:
+        """
+        FTS5 인덱스 사용 가능 여부를 인스턴스 단위로 캐시해 반환한다.
+
+        첫 확인 시 shadow 테이블/트리거 보장과 재색인이 필요할 수 있어 writer 연결을 사용한다.
+
+        Returns:
+            FTS5 후보 조회 가능 여부
+        """
+        if not self._fts_enabled:
+            return False
+        cached = self._fts_ready_cache
+        if cached is not None:
+            return cached
+        with get_sqlite_pool(self._db_path).write() as conn:
+            ready = ensure_mail_search_fts_index(conn=conn)
+        self._fts_ready_cache = ready
+        return ready
 
     def _build_candidate_query(
         self,
@@ -276,43 +386,23 @@ class MailSearchService:
         Returns:
             (SQL, 파라미터) 튜플
         """
-        conditions: list[str] = []
-        params: list[object] = []
-        query_tokens = self._build_candidate_query_tokens(query=query)
-        if query_tokens:
-            token_conditions = []
-            for token in query_tokens:
-                token_conditions.append(
-                    "(subject LIKE ? OR from_address LIKE ? OR COALESCE(body_clean, body_full, body_preview, '') LIKE ?)"
-                )
-                like_token = f"%{token}%"
-                params.extend([like_token, like_token, like_token])
-            conditions.append("(" + " OR ".join(token_conditions) + ")")
-        if person:
-            person_like = f"%{person}%"
-            conditions.append("(from_address LIKE ? OR COALESCE(body_clean, body_full, body_preview, '') LIKE ?)")
-            params.extend([person_like, person_like])
-        if start_date:
-            conditions.append("received_date >= ?")
-            params.append(str(start_date).strip())
-        if end_date:
-            conditions.append("received_date <= ?")
-            params.append(str(end_date).strip())
-        where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
-        web_link_clause = self._build_link_select_clause()
-        summary_clause = "COALESCE(summary, '') AS summary_text " if self._has_summary_column() else "'' AS summary_text "
-        sql = (
-            "SELECT message_id, subject, from_address, received_date, "
-            "COALESCE(body_clean, body_full, body_preview, '') AS body_text, "
-            f"{web_link_clause}"
-            f"{summary_clause}"
-            "FROM emails "
-            f"{where_clause} "
-            "ORDER BY received_date DESC "
-            "LIMIT ?"
+        return build_like_candidate_query(
+            select_clause=self._build_select_clause(),
+            query_tokens=self._build_candidate_query_tokens(query=query),
+            person=person,
+            start_date=start_date,
+            end_date=end_date,
+            candidate_limit=candidate_limit,
         )
-        params.append(candidate_limit)
-        return sql, tuple(params)
+
+    def _build_select_clause(self) -> str:
+        """
+        현재 emails 스키마 기준 후보 조회 공통 SELECT 절을 생성한다.
+
+        Returns:
+            `FROM` 앞까지의 SELECT 절 문자열
+        """
+        return get_emails_schema(self._db_path).statements.search_select_clause
 
     def _resolve_candidate_limit(
         self,
@@ -362,82 +452,6 @@ class MailSearchService:
         fallback_tokens = tokenize_for_search(text=query)
         return fallback_tokens[:2]
 
-    def _has_web_link_column(self) -> bool:
-        """
-        emails 테이블의 web_link 컬럼 존재 여부를 반환한다.
-
-        Returns:
-            web_link 컬럼 존재 여부
-        """
-        cached = self._has_web_link_column_cache
-        if cached is not None:
-            return cached
-        has_column = "web_link" in self._get_table_columns()
-        self._has_web_link_column_cache = has_column
-        return has_column
-
-    def _has_summary_column(self) -> bool:
-        """
-        emails 테이블의 summary 컬럼 존재 여부를 반환한다.
-
-        Returns:
-            summary 컬럼 존재 여부
-        """
-        cached = self._has_summary_column_cache
-        if cached is not None:
-            return cached
-        has_column = "summary" in self._get_table_columns()
-        self._has_summary_column_cache = has_column
-        return has_column
-
-    def _build_link_select_clause(self) -> str:
-        """
-        링크 컬럼 우선순위 정책에 맞는 SELECT 절을 생성한다.
-
-        Returns:
-            `AS web_link`가 포함된 SELECT 절 문자열
-        """
-        preferred_column = self._resolve_preferred_outlook_link_column()
-        if preferred_column:
-            return f"COALESCE({preferred_column}, web_link, '') AS web_link, "
-        if self._has_web_link_column():
-            return "COALESCE(web_link, '') AS web_link, "
-        return "'' AS web_link, "
-
-    def _resolve_preferred_outlook_link_column(self) -> str:
-        """
-        Outlook 전용 링크 컬럼명을 우선순위에 따라 해석한다.
-
-        Returns:
-            선택된 컬럼명. 없으면 빈 문자열
-        """
-        cached = self._preferred_outlook_link_column_cache
-        if cached is not None:
-            return cached
-        columns = self._get_table_columns()
-        selected = next((column for column in PREFERRED_OUTLOOK_LINK_COLUMNS if column in columns), "")
-        self._preferred_outlook_link_column_cache = selected
-        return selected
-
-    def _get_table_columns(self) -> set[str]:
-        """
-        `emails` 테이블 컬럼 집합을 캐시 기반으로 반환한다.
-
-        Returns:
-            소문자 컬럼명 집합
-        """
-        cached = self._table_columns_cache
-        if cached is not None:
-            return cached
-        conn = sqlite3.connect(str(self._db_path))
-        try:
-            rows = conn.execute("PRAGMA table_info(emails)").fetchall()
-            columns = {str(row[1]).strip().lower() for row in rows if len(row) > 1}
-            self._table_columns_cache = columns
-            return columns
-        finally:
-            conn.close()
-
 
 def _row_to_result(row: sqlite3.Row) -> MailSearchResult:
     """
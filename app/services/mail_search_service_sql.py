@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+from app.services.mail_search_fts import (
+    MAIL_SEARCH_FTS_TABLE,
+    MAIL_SEARCH_FTS_WORD_TABLE,
+    build_bm25_order_expression,
+    build_fts_match_expression,
+    build_fts_prefix_match_expression,
+)
+
+PREFERRED_OUTLOOK_LINK_COLUMNS: tuple[str, ...] = (
+    "outlook_link",
+    "outlook_deep_link",
+    "outlook_uri",
+    "desktop_link",
+    "native_link",
+    "open_link",
+)
+
+
+def build_search_select_clause(columns: set[str]) -> str:
+    """
+    emails 컬럼 구성에 맞는 후보 조회 공통 SELECT 절을 생성한다.
+
+    Outlook 전용 링크 컬럼이 있으면 우선순위에 따라 `web_link`보다 먼저 사용한다.
+
+    Args:
+        columns: emails 소문자 컬럼명 집합
+
+    Returns:
+        `FROM` 앞까지의 SELECT 절 문자열
+    """
+    preferred_column = next((column for column in PREFERRED_OUTLOOK_LINK_COLUMNS if column in columns), "")
+    if preferred_column:
+        web_link_clause = f"COALESCE({preferred_column}, web_link, '') AS web_link, "
+    elif "web_link" in columns:
+        web_link_clause = "COALESCE(web_link, '') AS web_link, "
+    else:
+        web_link_clause = "'' AS web_link, "
+    summary_clause = "COALESCE(summary, '') AS summary_text " if "summary" in columns else "'' AS summary_text "
+    return (
+        "SELECT message_id, subject, from_address, received_date, "
+        "COALESCE(body_clean, body_full, body_preview, '') AS body_text, "
+        f"{web_link_clause}"
+        f"{summary_clause}"
+    )
+
+
+def build_like_candidate_query(
+    select_clause: str,
+    query_tokens: list[str],
+    person: str,
+    start_date: str,
+    end_date: str,
+    candidate_limit: int,
+) -> tuple[str, tuple[object, ...]]:
+    """
+    LIKE 스캔 기반 후보 조회 SQL과 파라미터를 생성한다.
+
+    Args:
+        select_clause: `FROM` 앞까지의 SELECT 절
+        query_tokens: 후보 조회 토큰 목록
+        person: 사람명 필터
+        start_date: 시작일
+        end_date: 종료일
+        candidate_limit: 후보 조회 상한
+
+    Returns:
+        (SQL, 파라미터) 튜플
+    """
+    conditions: list[str] = []
+    params: list[object] = []
+    if query_tokens:
+        token_conditions = []
+        for token in query_tokens:
+            token_conditions.append(
+                "(subject LIKE ? OR from_address LIKE ? OR COALESCE(body_clean, body_full, body_preview, '') LIKE ?)"
+            )
+            like_token = f"%{token}%"
+            params.extend([like_token, like_token, like_token])
+        conditions.append("(" + " OR ".join(token_conditions) + ")")
+    filter_conditions, filter_params = build_candidate_filter_conditions(
+        person=person,
+        start_date=start_date,
+        end_date=end_date,
+    )
+    conditions.extend(filter_conditions)
+    params.extend(filter_params)
+    where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    sql = f"{select_clause}FROM emails {where_clause} ORDER BY received_date DESC LIMIT ?"
+    params.append(candidate_limit)
+    return sql, tuple(params)
+
+
+def build_fts_candidate_query(
+    select_clause: str,
+    fts_tokens: list[str],
+    person: str,
+    start_date: str,
+    end_date: str,
+    candidate_limit: int,
+    word_tokens: list[str] | None = None,
+) -> tuple[str, tuple[object, ...]]:
+    """
+    FTS5 bm25 상위 후보를 최신순으로 재정렬해 조회하는 SQL과 파라미터를 생성한다.
+
+    3자 이상 토큰은 trigram 테이블, 2자 토큰은 단어 테이블 prefix 조회로 찾고 두 후보 집합을 합친다.
+
+    Args:
+        select_clause: `FROM` 앞까지의 SELECT 절
+        fts_tokens: trigram 조회 토큰 목록
+        person: 사람명 필터
+        start_date: 시작일
+        end_date: 종료일
+        candidate_limit: 후보 조회 상한(FTS 테이블별)
+        word_tokens: 단어 인덱스 prefix 조회 토큰 목록
+
+    Returns:
+        (SQL, 파라미터) 튜플
+    """
+    filter_conditions, filter_params = build_candidate_filter_conditions(
+        person=person,
+        start_date=start_date,
+        end_date=end_date,
+        column_prefix="e.",
+    )
+    filter_clause = "".join(f" AND {condition}" for condition in filter_conditions)
+    subqueries: list[str] = []
+    params: list[object] = []
+    for table, match_expression in (
+        (MAIL_SEARCH_FTS_TABLE, build_fts_match_expression(tokens=fts_tokens)),
+        (MAIL_SEARCH_FTS_WORD_TABLE, build_fts_prefix_match_expression(tokens=word_tokens or [])),
+    ):
+        if not match_expression:
+            continue
+        subqueries.append(
+            f"rowid IN (SELECT {table}.rowid FROM {table} "
+            f"JOIN emails AS e ON e.rowid = {table}.rowid "
+            f"WHERE {table} MATCH ?{filter_clause} "
+            f"ORDER BY {build_bm25_order_expression(table=table)} LIMIT ?)"
+        )
+        params.extend([match_expression, *filter_params, candidate_limit])
+    sql = f"{select_clause}FROM emails WHERE {' OR '.join(subqueries)} ORDER BY received_date DESC"
+    return sql, tuple(params)
+
+
+def build_message_id_candidate_query(
+    select_clause: str,
+    message_ids: list[str],
+    person: str,
+    start_date: str,
+    end_date: str,
+) -> tuple[str, tuple[object, ...]]:
+    """
+    벡터 인덱스 hit `message_id` 목록을 사람/기간 필터와 함께 조회하는 SQL을 생성한다.
+
+    Args:
+        select_clause: `FROM` 앞까지의 SELECT 절
+        message_ids: 조회 대상 message_id 목록
+        person: 사람명 필터
+        start_date: 시작일
+        end_date: 종료일
+
+    Returns:
+        (SQL, 파라미터) 튜플
+    """
+    filter_conditions, filter_params = build_candidate_filter_conditions(
+        person=person,
+        start_date=start_date,
+        end_date=end_date,
+    )
+    placeholders = ", ".join("?" for _ in message_ids)
+    filter_clause = "".join(f" AND {condition}" for condition in filter_conditions)
+    sql = f"{select_clause}FROM emails WHERE message_id IN ({placeholders}){filter_clause} ORDER BY received_date DESC"
+    return sql, tuple([*message_ids, *filter_params])
+
+
+def build_candidate_filter_conditions(
+    person: str,
+    start_date: str,
+    end_date: str,
+    column_prefix: str = "",
+) -> tuple[list[str], list[object]]:
+    """
+    사람/기간 필터 조건절과 파라미터를 생성한다.
+
+    Args:
+        person: 사람명 필터
+        start_date: 시작일
+        end_date: 종료일
+        column_prefix: 컬럼 별칭 접두어(예: `e.`)
+
+    Returns:
+        (조건절 목록, 파라미터 목록) 튜플
+    """
+    prefix = str(column_prefix or "")
+    conditions: list[str] = []
+    params: list[object] = []
+    if person:
+        conditions.append(
+            f"({prefix}from_address LIKE ? OR "
+            f"COALESCE({prefix}body_clean, {prefix}body_full, {prefix}body_preview, '') LIKE ?)"
+        )
+        params.extend([f"%{person}%", f"%{person}%"])
+    if start_date:
+        conditions.append(f"{prefix}received_date >= ?")
+        params.append(str(start_date).strip())
+    if end_date:
+        conditions.append(f"{prefix}received_date <= ?")
+        params.append(str(end_date).strip())
+    return conditions, params
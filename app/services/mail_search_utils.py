@@ -1,17 +1,17 @@
 from __future__ import annotations
 
-import hashlib
-import math
 import re
 import time
 from typing import TYPE_CHECKING
 
 from app.services.mail_text_utils import extract_sender_display_name
+from app.services.mail_embedding_provider import MailEmbeddingProvider, get_mail_embedding_provider
+from app.services.mail_vector_embedding import cosine_similarities
 
 if TYPE_CHECKING:
     from app.services.mail_search_service import MailSearchResult
+    from app.services.mail_vector_document import MailVectorHit
 
-EMBEDDING_DIM = 256
 RRF_K = 50
 COMMON_QUERY_TOKENS = {
     "메일",
@@ -244,19 +244,27 @@ def has_required_body_phrases(row: "MailSearchResult", phrases: list[str]) -> bo
     return True
 
 
-def rerank_candidates(query: str, rows: list["MailSearchResult"]) -> list["MailSearchResult"]:
+def rerank_candidates(
+    query: str,
+    rows: list["MailSearchResult"],
+    semantic_ranks: dict[str, int] | None = None,
+    embedding_provider: MailEmbeddingProvider | None = None,
+) -> list["MailSearchResult"]:
     """
     후보 목록을 키워드/벡터 점수 기반으로 재정렬한다.
 
     Args:
         query: 사용자 질의
         rows: 후보 목록
+        semantic_ranks: 벡터 인덱스 조회로 계산된 순위 맵. 없으면 후보별 임베딩으로 계산
+        embedding_provider: 후보별 임베딩 provider(미지정 시 공유 provider)
 
     Returns:
         재정렬된 목록
     """
     lexical_ranks = build_lexical_rank(rows=rows, query=query)
-    semantic_ranks = build_semantic_rank(rows=rows, query=query)
+    if not semantic_ranks:
+        semantic_ranks = build_semantic_rank(rows=rows, query=query, embedding_provider=embedding_provider)
     recency_ranks = {item.message_id: index + 1 for index, item in enumerate(rows)}
     scored: list[tuple[float, "MailSearchResult"]] = []
     for item in rows:
@@ -303,67 +311,44 @@ def build_lexical_rank(rows: list["MailSearchResult"], query: str) -> dict[str,
     return {message_id: index + 1 for index, (_, message_id) in enumerate(scored)}
 
 
-def build_semantic_rank(rows: list["MailSearchResult"], query: str) -> dict[str, int]:
+def build_semantic_rank(
+    rows: list["MailSearchResult"],
+    query: str,
+    embedding_provider: MailEmbeddingProvider | None = None,
+) -> dict[str, int]:
     """
-    해시 임베딩 코사인 유사도 기반 순위 맵을 계산한다.
+    임베딩 코사인 유사도 기반 순위 맵을 계산한다.
 
     Args:
         rows: 후보 목록
         query: 사용자 질의
+        embedding_provider: 임베딩 provider(미지정 시 공유 provider)
 
     Returns:
         message_id -> rank(1부터 시작)
     """
-    query_vector = build_hash_embedding(text=query)
-    scored: list[tuple[float, str]] = []
-    for item in rows:
-        doc_text = build_summary_zone(item=item)
-        doc_vector = build_hash_embedding(text=doc_text)
-        similarity = cosine_similarity(left=query_vector, right=doc_vector)
-        scored.append((similarity, item.message_id))
+    provider = embedding_provider or get_mail_embedding_provider()
+    vectors = provider.embed_many(texts=[query, *[build_summary_zone(item=item) for item in rows]])
+    similarities = cosine_similarities(query=vectors[0], vectors=vectors[1:])
+    scored = [(similarity, item.message_id) for similarity, item in zip(similarities, rows, strict=False)]
     scored.sort(key=lambda entry: entry[0], reverse=True)
     return {message_id: index + 1 for index, (_, message_id) in enumerate(scored)}
 
 
-def build_hash_embedding(text: str, dim: int = EMBEDDING_DIM) -> list[float]:
-    """
-    토큰 해시 기반 임베딩 벡터를 생성한다.
-
-    Args:
-        text: 입력 텍스트
-        dim: 벡터 차원 수
-
-    Returns:
-        정규화된 벡터
-    """
-    vector = [0.0] * dim
-    tokens = tokenize_for_search(text=text)
-    for token in tokens:
-        digest = hashlib.md5(token.encode("utf-8")).hexdigest()
-        index = int(digest[:8], 16) % dim
-        sign = -1.0 if int(digest[8:16], 16) % 2 else 1.0
-        vector[index] += sign
-    norm = math.sqrt(sum(value * value for value in vector))
-    if norm == 0:
-        return vector
-    return [value / norm for value in vector]
-
-
-def cosine_similarity(left: list[float], right: list[float]) -> float:
+def build_vector_semantic_rank(rows: list["MailSearchResult"], hits: list["MailVectorHit"]) -> dict[str, int]:
     """
-    두 벡터의 코사인 유사도를 계산한다.
+    벡터 인덱스 근접 이웃 순서를 후보 목록 기준 순위 맵으로 변환한다.
 
     Args:
-        left: 좌측 벡터
-        right: 우측 벡터
+        rows: 후보 목록
+        hits: 유사도 내림차순 벡터 조회 결과
 
     Returns:
-        코사인 유사도 값
+        message_id -> rank(1부터 시작). 후보와 겹치는 hit가 없으면 빈 사전
     """
-    if not left or not right:
-        return 0.0
-    size = min(len(left), len(right))
-    return sum(left[index] * right[index] for index in range(size))
+    candidate_ids = {item.message_id for item in rows}
+    ranked_ids = [hit.message_id for hit in hits if hit.message_id in candidate_ids]
+    return {message_id: index + 1 for index, message_id in enumerate(dict.fromkeys(ranked_ids))}
 
 
 def to_result_payload(row: "MailSearchResult") -> dict[str, str]:
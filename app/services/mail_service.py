@@ -1,19 +1,22 @@
 from __future__ import annotations
 
 import os
-import sqlite3
 from contextvars import ContextVar
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from app.core.logging_config import get_logger
-from app.services.mail_service_utils import (
-    build_mail_record_from_row,
-    build_upsert_insert_query,
-    build_upsert_update_query,
+from app.core.sqlite_pool import get_sqlite_pool
+from app.services.mail_service_utils import build_mail_record_from_row
+from app.services.mail_schema_registry import get_emails_schema
+from app.services.mail_service_db import (
+    delete_mail_rows,
+    fetch_latest_mail_row,
+    fetch_mail_row_by_message_id,
+    has_empty_summary,
 )
-from app.services.mail_service_db import fetch_latest_mail_row, fetch_mail_row_by_message_id, has_table_column
+from app.services.mail_summary_background import get_mail_summary_background_runner, resolve_summary_pending_wait_sec
 from app.services.mail_service_actions import (
     build_context_only_post_action_payload,
     build_current_mail_post_action_payload,
@@ -60,22 +63,23 @@ class MailService:
     로컬 SQLite(`emails.db`) 기반 메일 조회/요약/추출 서비스를 제공한다.
     """
 
-    def __init__(self, db_path: Path) -> None:
+    def __init__(self, db_path: Path, summary_sync_on_upsert: bool | None = None) -> None:
         """
         메일 서비스 인스턴스를 초기화한다.
 
         Args:
             db_path: SQLite DB 경로
+            summary_sync_on_upsert: upsert 직후 background 요약 제출 여부(None이면 환경변수)
         """
         self._db_path = db_path
         self._current_mail_ctx: ContextVar[MailRecord | None] = ContextVar(
             "mail_service_current_mail",
             default=None,
         )
-        self._has_summary_column_cache: bool | None = None
-        self._has_web_link_column_cache: bool | None = None
         self._summary_queue_service = MailSummaryQueueService(db_path=db_path)
-        self._summary_sync_on_upsert = _is_enabled(value=str(os.getenv(SUMMARY_SYNC_ON_UPSERT_ENV, "1")))
+        if summary_sync_on_upsert is None:
+            summary_sync_on_upsert = _is_enabled(value=str(os.getenv(SUMMARY_SYNC_ON_UPSERT_ENV, "1")))
+        self._summary_sync_on_upsert = summary_sync_on_upsert
         logger.info(
             "mail_service.summary_sync_on_upsert: enabled=%s db_path=%s pid=%s",
             self._summary_sync_on_upsert,
@@ -150,82 +154,99 @@ class MailService:
         Args:
             mail: 저장 대상 메일 레코드
         """
+        self.upsert_mail_records(mails=[mail])
+
+    def upsert_mail_records(self, mails: list[MailRecord]) -> tuple[int, int]:
+        """
+        메일 레코드 묶음을 한 트랜잭션으로 upsert한다.
+
+        summary 없이 새로 들어왔거나 저장 요약이 비어 있는 메일은 같은 트랜잭션에서 summary queue에 적재하고,
+        커밋 후 background 요약 실행기에 넘긴다.
+
+        Args:
+            mails: 저장 대상 메일 레코드 목록
+
+        Returns:
+            (신규 삽입 건수, 갱신 건수)
+        """
+        if not mails:
+            return 0, 0
         if not self._db_path.exists():
             logger.warning("메일 DB 파일이 없어 upsert를 건너뜁니다: %s", self._db_path)
-            return
-        include_web_link = self._has_web_link_column()
-        include_summary = self._has_summary_column()
-        update_query = build_upsert_update_query(
-            include_web_link=include_web_link,
-            include_summary=include_summary,
-        )
-        insert_query = build_upsert_insert_query(
-            include_web_link=include_web_link,
-            include_summary=include_summary,
-        )
-        body_preview = mail.body_text[:400]
-        summary_text = str(mail.summary_text or "").strip()
-        conn = sqlite3.connect(str(self._db_path))
-        try:
-            update_params = self._build_upsert_update_params(
-                mail=mail,
-                body_preview=body_preview,
-                summary_text=summary_text,
-                include_web_link=include_web_link,
-                include_summary=include_summary,
-            )
-            updated = conn.execute(
-                update_query,
-                update_params,
-            )
-            if updated.rowcount == 0:
-                insert_params = self._build_upsert_insert_params(
+            return 0, 0
+        schema = get_emails_schema(self._db_path)
+        include_web_link = schema.has_web_link
+        include_summary = schema.has_summary
+        inserted = updated = 0
+        queued_message_ids: list[str] = []
+        with get_sqlite_pool(self._db_path).write() as conn:
+            for mail in mails:
+                body_preview = mail.body_text[:400]
+                summary_text = str(mail.summary_text or "").strip()
+                update_params = self._build_upsert_update_params(
                     mail=mail,
                     body_preview=body_preview,
                     summary_text=summary_text,
                     include_web_link=include_web_link,
                     include_summary=include_summary,
                 )
-                conn.execute(
-                    insert_query,
-                    insert_params,
-                )
-            conn.commit()
-        finally:
-            conn.close()
-        if include_summary and not summary_text:
-            queued = self._summary_queue_service.enqueue_message(
-                message_id=mail.message_id,
-                requested_by="upsert",
-            )
-            if queued and self._summary_sync_on_upsert:
-                self._process_summary_queue_once()
+                if conn.execute(schema.statements.upsert_update_query, update_params).rowcount == 0:
+                    insert_params = self._build_upsert_insert_params(
+                        mail=mail,
+                        body_preview=body_preview,
+                        summary_text=summary_text,
+                        include_web_link=include_web_link,
+                        include_summary=include_summary,
+                    )
+                    conn.execute(schema.statements.upsert_insert_query, insert_params)
+                    inserted += 1
+                else:
+                    updated += 1
+                if not include_summary or summary_text or not has_empty_summary(conn=conn, message_id=mail.message_id):
+                    continue
+                if self._summary_queue_service.enqueue_message(message_id=mail.message_id, requested_by="upsert"):
+                    queued_message_ids.append(mail.message_id)
+        if self._summary_sync_on_upsert and queued_message_ids:
+            runner = get_mail_summary_background_runner(self._db_path)
+            for message_id in queued_message_ids:
+                runner.submit(message_id=message_id)
+        return inserted, updated
+
+    def delete_mail_records(self, message_ids: list[str]) -> int:
+        """
+        메일 레코드와 대기 중인 summary queue 작업을 한 트랜잭션으로 삭제한다.
 
-    def _process_summary_queue_once(self) -> None:
-        """
-        upsert 직후 summary queue 작업 1건을 동기 실행한다.
-        """
-        from app.services.mail_summary_queue_worker import MailSummaryQueueWorker
+        Args:
+            message_ids: 삭제 대상 message_id 목록
 
-        worker = MailSummaryQueueWorker(db_path=self._db_path)
-        worker.process_once()
+        Returns:
+            삭제된 메일 건수
+        """
+        normalized_ids = [str(message_id or "").strip() for message_id in message_ids]
+        normalized_ids = [message_id for message_id in normalized_ids if message_id]
+        if not normalized_ids or not self._db_path.exists():
+            return 0
+        return delete_mail_rows(db_path=self._db_path, message_ids=normalized_ids)
 
     def ensure_summary_for_message(
         self,
         message_id: str,
         requested_by: str = "mail_context",
-        max_attempts: int = 3,
+        wait_sec: float | None = None,
     ) -> MailRecord | None:
         """
-        특정 message_id의 summary/category가 비어 있으면 즉시 생성 시도를 수행한다.
+        특정 message_id의 summary/category가 비어 있으면 background 요약을 요청하고 짧게 기다린다.
+
+        대기 시간 안에 끝나지 않으면 summary가 비어 있는 현재 레코드를 반환하며(요약 대기 상태),
+        요약은 background 실행기가 이어서 저장한다.
 
         Args:
             message_id: 대상 message_id
             requested_by: queue 적재 요청자 태그
-            max_attempts: worker 처리 최대 시도 횟수
+            wait_sec: 최대 대기 시간(초, None이면 `MOLDUBOT_SUMMARY_PENDING_WAIT_MS`)
 
         Returns:
-            summary 보강 후 최신 메일 레코드(없으면 None)
+            summary 보강 시도 후 최신 메일 레코드(없으면 None)
         """
         normalized_message_id = str(message_id or "").strip()
         if not normalized_message_id:
@@ -240,12 +261,30 @@ class MailService:
             requested_by=str(requested_by or "mail_context").strip(),
             force_requeue=True,
         )
-        for _ in range(max(1, int(max_attempts))):
-            self._process_summary_queue_once()
-            refreshed = self.read_mail_by_message_id(message_id=normalized_message_id)
-            if refreshed is not None and str(refreshed.summary_text or "").strip():
-                return refreshed
-        return current
+        runner = get_mail_summary_background_runner(self._db_path)
+        if not runner.submit(message_id=normalized_message_id):
+            return current
+        timeout_sec = resolve_summary_pending_wait_sec() if wait_sec is None else max(0.0, float(wait_sec))
+        if timeout_sec <= 0 or not runner.wait(message_id=normalized_message_id, timeout_sec=timeout_sec):
+            logger.info("mail_service.summary_pending: message_id=%s", normalized_message_id)
+            return current
+        refreshed = self.read_mail_by_message_id(message_id=normalized_message_id)
+        return refreshed if refreshed is not None else current
+
+    def is_summary_pending(self, message_id: str) -> bool:
+        """
+        message_id의 요약이 background 실행기에서 대기/처리 중인지 판별한다.
+
+        Args:
+            message_id: 대상 message_id
+
+        Returns:
+            background 제출이 받아들여졌고 아직 끝나지 않았으면 True
+        """
+        normalized_message_id = str(message_id or "").strip()
+        if not normalized_message_id:
+            return False
+        return get_mail_summary_background_runner(self._db_path).is_pending(message_id=normalized_message_id)
 
     def _build_upsert_update_params(
         self,
@@ -383,56 +422,18 @@ class MailService:
 
     def _fetch_latest_mail_row(self) -> dict[str, Any] | None:
         """DB에서 최신 메일 1건을 사전 형태로 조회한다."""
-        row = fetch_latest_mail_row(
-            db_path=self._db_path,
-            summary_select_clause=self._summary_select_clause(),
-            web_link_select_clause=self._web_link_select_clause(),
-        )
+        row = fetch_latest_mail_row(db_path=self._db_path)
         if row is None and not self._db_path.exists():
             logger.error("메일 DB 파일이 없습니다: %s", self._db_path)
         return row
 
     def _fetch_mail_row_by_message_id(self, message_id: str) -> dict[str, Any] | None:
         """DB에서 `message_id`로 메일 1건을 조회한다."""
-        row = fetch_mail_row_by_message_id(
-            db_path=self._db_path,
-            message_id=message_id,
-            summary_select_clause=self._summary_select_clause(),
-            web_link_select_clause=self._web_link_select_clause(),
-        )
+        row = fetch_mail_row_by_message_id(db_path=self._db_path, message_id=message_id)
         if row is None and not self._db_path.exists():
             logger.error("메일 DB 파일이 없습니다: %s", self._db_path)
         return row
 
-    def _summary_select_clause(self) -> str:
-        """
-        summary 컬럼 지원 여부에 따라 SELECT 절 별칭을 반환한다.
-
-        Returns:
-            summary_text 별칭 SQL 조각
-        """
-        if self._has_summary_column():
-            return "COALESCE(summary, '') AS summary_text"
-        return "'' AS summary_text"
-
-    def _has_summary_column(self) -> bool:
-        """
-        emails 테이블에 `summary` 컬럼이 존재하는지 확인한다.
-
-        Returns:
-            summary 컬럼이 있으면 True
-        """
-        cached = self._has_summary_column_cache
-        if cached is not None:
-            return cached
-        if not self._db_path.exists():
-            self._has_summary_column_cache = False
-            return False
-
-        has_column = has_table_column(db_path=self._db_path, table="emails", column="summary")
-        self._has_summary_column_cache = has_column
-        return has_column
-
     def supports_summary_storage(self) -> bool:
         """
         emails 테이블의 summary 저장 지원 여부를 반환한다.
@@ -440,7 +441,7 @@ class MailService:
         Returns:
             summary 컬럼이 존재하면 True
         """
-        return self._has_summary_column()
+        return get_emails_schema(self._db_path).has_summary
 
     def _build_context_only_post_action_payload(self, action: str) -> dict[str, Any]:
         """
@@ -454,34 +455,6 @@ class MailService:
         """
         return build_context_only_post_action_payload(action=action, mail=self.get_current_mail())
 
-    def _web_link_select_clause(self) -> str:
-        """
-        web_link 컬럼 지원 여부에 따라 SELECT 절 별칭을 반환한다.
-
-        Returns:
-            web_link 별칭 SQL 조각
-        """
-        if self._has_web_link_column():
-            return "COALESCE(web_link, '') AS web_link"
-        return "'' AS web_link"
-
-    def _has_web_link_column(self) -> bool:
-        """
-        emails 테이블에 `web_link` 컬럼이 존재하는지 확인한다.
-
-        Returns:
-            web_link 컬럼이 있으면 True
-        """
-        cached = self._has_web_link_column_cache
-        if cached is not None:
-            return cached
-        if not self._db_path.exists():
-            self._has_web_link_column_cache = False
-            return False
-        has_column = has_table_column(db_path=self._db_path, table="emails", column="web_link")
-        self._has_web_link_column_cache = has_column
-        return has_column
-
 
 def _is_enabled(value: str) -> bool:
     """
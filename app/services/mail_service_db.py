@@ -4,63 +4,52 @@ import sqlite3
 from pathlib import Path
 from typing import Any
 
+from app.core.sqlite_pool import get_sqlite_pool
+from app.services.mail_schema_registry import get_emails_schema
 
-def has_table_column(db_path: Path, table: str, column: str) -> bool:
-    """지정 테이블에 컬럼이 존재하는지 확인한다."""
-    if not db_path.exists():
-        return False
-    conn = sqlite3.connect(str(db_path))
-    try:
-        rows = conn.execute(f"PRAGMA table_info({table})").fetchall()
-        return any(str(row[1]).lower() == str(column).lower() for row in rows)
-    finally:
-        conn.close()
+_DELETE_CHUNK_SIZE = 500
 
 
-def fetch_latest_mail_row(db_path: Path, summary_select_clause: str, web_link_select_clause: str) -> dict[str, Any] | None:
+def fetch_latest_mail_row(db_path: Path) -> dict[str, Any] | None:
     """DB에서 최신 메일 1건을 사전 형태로 조회한다."""
     if not db_path.exists():
         return None
-    query = (
-        "SELECT message_id, subject, from_address, received_date, "
-        "COALESCE(body_clean, body_full, body_preview, '') AS body_text, "
-        "COALESCE(body_full, body_clean, body_preview, '') AS code_body_text, "
-        "COALESCE(body_full, '') AS body_full_text, "
-        f"{summary_select_clause}, "
-        f"{web_link_select_clause} "
-        "FROM emails ORDER BY received_date DESC LIMIT 1"
-    )
-    conn = sqlite3.connect(str(db_path))
-    conn.row_factory = sqlite3.Row
-    try:
+    query = get_emails_schema(db_path).statements.latest_mail_query
+    with get_sqlite_pool(db_path).read(row_factory=sqlite3.Row) as conn:
         row = conn.execute(query).fetchone()
-        return dict(row) if row is not None else None
-    finally:
-        conn.close()
+    return dict(row) if row is not None else None
 
 
-def fetch_mail_row_by_message_id(
-    db_path: Path,
-    message_id: str,
-    summary_select_clause: str,
-    web_link_select_clause: str,
-) -> dict[str, Any] | None:
+def fetch_mail_row_by_message_id(db_path: Path, message_id: str) -> dict[str, Any] | None:
     """DB에서 `message_id`로 메일 1건을 조회한다."""
     if not db_path.exists():
         return None
-    query = (
-        "SELECT message_id, subject, from_address, received_date, "
-        "COALESCE(body_clean, body_full, body_preview, '') AS body_text, "
-        "COALESCE(body_full, body_clean, body_preview, '') AS code_body_text, "
-        "COALESCE(body_full, '') AS body_full_text, "
-        f"{summary_select_clause}, "
-        f"{web_link_select_clause} "
-        "FROM emails WHERE message_id = ? LIMIT 1"
-    )
-    conn = sqlite3.connect(str(db_path))
-    conn.row_factory = sqlite3.Row
-    try:
+    query = get_emails_schema(db_path).statements.mail_by_id_query
+    with get_sqlite_pool(db_path).read(row_factory=sqlite3.Row) as conn:
         row = conn.execute(query, (message_id,)).fetchone()
-        return dict(row) if row is not None else None
-    finally:
-        conn.close()
+    return dict(row) if row is not None else None
+
+
+def has_empty_summary(conn: sqlite3.Connection, message_id: str) -> bool:
+    """열린 연결에서 `message_id` 메일의 저장 요약이 비어 있는지 확인한다."""
+    row = conn.execute(
+        "SELECT 1 FROM emails WHERE message_id = ? AND COALESCE(summary, '') = '' LIMIT 1",
+        (message_id,),
+    ).fetchone()
+    return row is not None
+
+
+def delete_mail_rows(db_path: Path, message_ids: list[str]) -> int:
+    """`message_id` 목록의 메일과 summary queue 작업을 한 트랜잭션으로 삭제한다."""
+    deleted = 0
+    with get_sqlite_pool(db_path).write() as conn:
+        has_queue_table = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'mail_summary_queue'"
+        ).fetchone() is not None
+        for start in range(0, len(message_ids), _DELETE_CHUNK_SIZE):
+            chunk = message_ids[start : start + _DELETE_CHUNK_SIZE]
+            placeholders = ", ".join("?" for _ in chunk)
+            deleted += conn.execute(f"DELETE FROM emails WHERE message_id IN ({placeholders})", chunk).rowcount
+            if has_queue_table:
+                conn.execute(f"DELETE FROM mail_summary_queue WHERE message_id IN ({placeholders})", chunk)
+    return deleted
@@ -82,6 +82,8 @@ def build_upsert_update_query(include_web_link: bool, include_summary: bool) ->
     """
     web_link 컬럼 포함 여부에 따라 UPDATE SQL을 생성한다.
 
+    전달된 summary가 비어 있으면 기존 저장 요약을 유지한다(동기화 갱신이 요약을 지우지 않도록).
+
     Args:
         include_web_link: web_link 컬럼 포함 여부
         include_summary: summary 컬럼 포함 여부
@@ -92,13 +94,13 @@ def build_upsert_update_query(include_web_link: bool, include_summary: bool) ->
     if include_web_link and include_summary:
         return (
             "UPDATE emails SET "
-            "subject = ?, from_address = ?, received_date = ?, body_preview = ?, body_full = ?, body_clean = ?, summary = ?, web_link = ? "
+            "subject = ?, from_address = ?, received_date = ?, body_preview = ?, body_full = ?, body_clean = ?, summary = COALESCE(NULLIF(?, ''), summary), web_link = ? "
             "WHERE message_id = ?"
         )
     if include_summary:
         return (
             "UPDATE emails SET "
-            "subject = ?, from_address = ?, received_date = ?, body_preview = ?, body_full = ?, body_clean = ?, summary = ? "
+            "subject = ?, from_address = ?, received_date = ?, body_preview = ?, body_full = ?, body_clean = ?, summary = COALESCE(NULLIF(?, ''), summary) "
             "WHERE message_id = ?"
         )
     if include_web_link:
@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from queue import Empty, Full, Queue
+from typing import Any, Callable
+
+from app.core.env_config import resolve_non_negative_int_env, resolve_positive_int_env
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+SUMMARY_BACKGROUND_WORKERS_ENV = "MOLDUBOT_SUMMARY_BACKGROUND_WORKERS"
+SUMMARY_BACKGROUND_QUEUE_SIZE_ENV = "MOLDUBOT_SUMMARY_BACKGROUND_QUEUE_SIZE"
+SUMMARY_PENDING_WAIT_MS_ENV = "MOLDUBOT_SUMMARY_PENDING_WAIT_MS"
+DEFAULT_SUMMARY_BACKGROUND_WORKERS = 2
+DEFAULT_SUMMARY_BACKGROUND_QUEUE_SIZE = 256
+DEFAULT_SUMMARY_PENDING_WAIT_MS = 800
+_IDLE_POLL_SEC = 0.5
+_RUNNER_REGISTRY: dict[str, "MailSummaryBackgroundRunner"] = {}
+_RUNNER_REGISTRY_LOCK = threading.Lock()
+
+
+class MailSummaryBackgroundRunner:
+    """
+    요청 경로 밖에서 메일 요약을 생성하는 프로세스 내 background 실행기.
+
+    제한 크기 큐와 daemon worker thread로 구성하며, 각 thread는 `MailSummaryQueueWorker`를 한 번만 만들어
+    재사용한다. 큐가 가득 차면 제출을 거절하고, 작업은 DB summary queue에 남아 배치 worker가 처리한다.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        worker_count: int = DEFAULT_SUMMARY_BACKGROUND_WORKERS,
+        queue_size: int = DEFAULT_SUMMARY_BACKGROUND_QUEUE_SIZE,
+        worker_factory: Callable[[], Any] | None = None,
+    ) -> None:
+        """
+        실행기를 초기화한다(thread는 첫 제출 시 시작).
+
+        Args:
+            db_path: SQLite DB 파일 경로
+            worker_count: worker thread 수
+            queue_size: 대기 큐 최대 크기
+            worker_factory: `process_message(message_id)`를 제공하는 worker 생성 함수(테스트 주입용)
+        """
+        self._db_path = Path(db_path)
+        self._worker_count = max(1, int(worker_count))
+        self._queue: Queue[str] = Queue(maxsize=max(1, int(queue_size)))
+        self._worker_factory = worker_factory or self._build_queue_worker
+        self._pending: dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+        self._threads: list[threading.Thread] = []
+        self._stopped = threading.Event()
+
+    def submit(self, message_id: str) -> bool:
+        """
+        메일 요약 생성을 background 큐에 넘긴다(이미 대기/처리 중이면 중복 제출하지 않음).
+
+        Args:
+            message_id: 대상 메일 식별자
+
+        Returns:
+            대기/처리 중이면 True, 큐가 가득 찼거나 종료된 실행기면 False
+        """
+        normalized_message_id = str(message_id or "").strip()
+        if not normalized_message_id or self._stopped.is_set():
+            return False
+        with self._lock:
+            if normalized_message_id in self._pending:
+                return True
+            self._ensure_threads_started()
+            try:
+                self._queue.put_nowait(normalized_message_id)
+            except Full:
+                logger.warning("mail_summary_background_queue_full: message_id=%s", normalized_message_id)
+                return False
+            self._pending[normalized_message_id] = threading.Event()
+        return True
+
+    def wait(self, message_id: str, timeout_sec: float) -> bool:
+        """
+        제출한 요약 작업이 끝날 때까지 최대 `timeout_sec`초 기다린다.
+
+        Args:
+            message_id: 대상 메일 식별자
+            timeout_sec: 최대 대기 시간(초)
+
+        Returns:
+            처리가 끝났거나 대기 중인 작업이 없으면 True, 시간 초과면 False
+        """
+        with self._lock:
+            done_event = self._pending.get(str(message_id or "").strip())
+        if done_event is None:
+            return True
+        return done_event.wait(timeout=max(0.0, float(timeout_sec)))
+
+    def is_pending(self, message_id: str) -> bool:
+        """
+        요약 작업이 background 큐에서 대기/처리 중인지 판별한다.
+
+        Args:
+            message_id: 대상 메일 식별자
+
+        Returns:
+            제출이 받아들여졌고 아직 끝나지 않았으면 True
+        """
+        with self._lock:
+            return str(message_id or "").strip() in self._pending
+
+    def shutdown(self, timeout_sec: float = 5.0) -> None:
+        """
+        새 제출을 막고 처리 중인 작업이 끝나도록 worker thread 종료를 기다린다.
+
+        아직 시작하지 않은 작업은 DB summary queue에 `pending`으로 남아 배치 worker가 이어서 처리하고,
+        대기자는 즉시 깨운다.
+
+        Args:
+            timeout_sec: thread별 최대 대기 시간(초)
+        """
+        self._stopped.set()
+        for thread in self._threads:
+            thread.join(timeout=timeout_sec)
+        with self._lock:
+            done_events = list(self._pending.values())
+            self._pending.clear()
+        for done_event in done_events:
+            done_event.set()
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        실행기 상태를 반환한다.
+
+        Returns:
+            상태 사전
+        """
+        with self._lock:
+            pending = len(self._pending)
+        return {
+            "db_path": str(self._db_path),
+            "workers": len(self._threads),
+            "queued": self._queue.qsize(),
+            "pending": pending,
+        }
+
+    def _ensure_threads_started(self) -> None:
+        """worker thread를 아직 시작하지 않았으면 시작한다(`_lock` 보유 상태에서 호출)."""
+        if self._threads:
+            return
+        for index in range(self._worker_count):
+            thread = threading.Thread(
+                target=self._run_worker_loop,
+                name=f"mail-summary-bg-{index}",
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def _run_worker_loop(self) -> None:
+        """큐에서 message_id를 꺼내 요약을 생성하고 대기자를 깨운다."""
+        worker: Any | None = None
+        while not self._stopped.is_set():
+            try:
+                message_id = self._queue.get(timeout=_IDLE_POLL_SEC)
+            except Empty:
+                continue
+            try:
+                if worker is None:
+                    worker = self._worker_factory()
+                worker.process_message(message_id=message_id)
+            except Exception as exc:  # noqa: BLE001
+                logger.error("mail_summary_background_failed: message_id=%s error=%s", message_id, exc)
+            finally:
+                with self._lock:
+                    done_event = self._pending.pop(message_id, None)
+                if done_event is not None:
+                    done_event.set()
+
+    def _build_queue_worker(self) -> Any:
+        """
+        thread 전용 summary queue worker를 만든다.
+
+        Returns:
+            `MailSummaryQueueWorker` 인스턴스
+        """
+        from app.services.mail_summary_queue_worker import MailSummaryQueueWorker
+
+        return MailSummaryQueueWorker(db_path=self._db_path)
+
+
+def get_mail_summary_background_runner(db_path: Path | str) -> MailSummaryBackgroundRunner:
+    """
+    DB 경로별 프로세스 공유 background 요약 실행기를 반환한다.
+
+    Args:
+        db_path: SQLite DB 파일 경로
+
+    Returns:
+        background 요약 실행기
+    """
+    key = str(Path(db_path).resolve())
+    with _RUNNER_REGISTRY_LOCK:
+        runner = _RUNNER_REGISTRY.get(key)
+        if runner is None:
+            runner = MailSummaryBackgroundRunner(
+                db_path=Path(key),
+                worker_count=resolve_positive_int_env(SUMMARY_BACKGROUND_WORKERS_ENV, DEFAULT_SUMMARY_BACKGROUND_WORKERS),
+                queue_size=resolve_positive_int_env(SUMMARY_BACKGROUND_QUEUE_SIZE_ENV, DEFAULT_SUMMARY_BACKGROUND_QUEUE_SIZE),
+            )
+            _RUNNER_REGISTRY[key] = runner
+        return runner
+
+
+def shutdown_mail_summary_background_runners(timeout_sec: float = 5.0) -> None:
+    """
+    등록된 모든 실행기를 종료하고 registry를 비운다.
+
+    Args:
+        timeout_sec: thread별 최대 대기 시간(초)
+    """
+    with _RUNNER_REGISTRY_LOCK:
+        runners = list(_RUNNER_REGISTRY.values())
+        _RUNNER_REGISTRY.clear()
+    for runner in runners:
+        runner.shutdown(timeout_sec=timeout_sec)
+
+
+def resolve_summary_pending_wait_sec() -> float:
+    """
+    대화형 요청이 background 요약을 기다리는 최대 시간(초)을 해석한다.
+
+    Returns:
+        0 이상 대기 시간(초, 0이면 기다리지 않음)
+    """
+    return resolve_non_negative_int_env(SUMMARY_PENDING_WAIT_MS_ENV, DEFAULT_SUMMARY_PENDING_WAIT_MS) / 1000
@@ -81,6 +81,7 @@ class MailSummaryLLMService:
                 user_prompt=json.dumps(prompt_payload, ensure_ascii=False),
                 timeout_sec=45,
                 temperature=0.1,
+                response_cache=True,
             )
             summary = self._normalize_summary(value=str(payload.get("summary") or ""))
             category = self._normalize_category(value=str(payload.get("category") or ""))
@@ -4,7 +4,10 @@ import sqlite3
 from dataclasses import dataclass
 from pathlib import Path
 
+from app.core.env_config import resolve_positive_int_env
 from app.core.logging_config import get_logger
+from app.core.sqlite_pool import get_sqlite_pool
+from app.services.mail_schema_registry import get_emails_schema
 
 logger = get_logger(__name__)
 QUEUE_STATUS_PENDING = "pending"
@@ -12,6 +15,8 @@ QUEUE_STATUS_PROCESSING = "processing"
 QUEUE_STATUS_COMPLETED = "completed"
 QUEUE_STATUS_FAILED = "failed"
 DEFAULT_MAX_RETRIES = 3
+SUMMARY_QUEUE_LEASE_SEC_ENV = "MOLDUBOT_SUMMARY_QUEUE_LEASE_SEC"
+DEFAULT_SUMMARY_QUEUE_LEASE_SEC = 600
 
 
 @dataclass
@@ -77,7 +82,7 @@ class MailSummaryQueueService:
         normalized_message_id = str(message_id or "").strip()
         if not normalized_message_id or not self._db_path.exists():
             return False
-        with sqlite3.connect(str(self._db_path)) as conn:
+        with get_sqlite_pool(self._db_path).write() as conn:
             self._ensure_queue_table(conn=conn)
             cursor = conn.execute(
                 "INSERT OR IGNORE INTO mail_summary_queue (message_id, status, requested_by) VALUES (?, ?, ?)",
@@ -89,7 +94,6 @@ class MailSummaryQueueService:
                     "WHERE message_id = ?",
                     (QUEUE_STATUS_PENDING, normalized_message_id),
                 )
-            conn.commit()
             return cursor.rowcount > 0
 
     def enqueue_backfill(self, limit: int = 0, include_existing: bool = False) -> MailSummaryQueueBackfillResult:
@@ -109,8 +113,7 @@ class MailSummaryQueueService:
         scanned = 0
         enqueued = 0
         skipped_existing = 0
-        with sqlite3.connect(str(self._db_path)) as conn:
-            conn.row_factory = sqlite3.Row
+        with get_sqlite_pool(self._db_path).write(row_factory=sqlite3.Row) as conn:
             self._ensure_queue_table(conn=conn)
             where_clause = "" if include_existing else "WHERE COALESCE(summary, '') = ''"
             limit_clause = f" LIMIT {target_limit}" if target_limit else ""
@@ -134,7 +137,6 @@ class MailSummaryQueueService:
                     enqueued += 1
                 else:
                     skipped_existing += 1
-            conn.commit()
         return MailSummaryQueueBackfillResult(scanned=scanned, enqueued=enqueued, skipped_existing=skipped_existing)
 
     def _enqueue_backfill_message(
@@ -209,32 +211,83 @@ class MailSummaryQueueService:
         Returns:
             claim 성공 시 작업 정보, 없으면 None
         """
-        if not self._db_path.exists():
+        jobs = self.claim_jobs(limit=1)
+        return jobs[0] if jobs else None
+
+    def claim_message_job(self, message_id: str) -> MailSummaryQueueJob | None:
+        """
+        지정 message_id의 작업이 처리 가능 상태면 claim한다.
+
+        Args:
+            message_id: 대상 메일 식별자
+
+        Returns:
+            claim 성공 시 작업 정보(이미 처리 중/완료면 None)
+        """
+        normalized_message_id = str(message_id or "").strip()
+        if not normalized_message_id:
             return None
-        with sqlite3.connect(str(self._db_path)) as conn:
-            conn.row_factory = sqlite3.Row
+        jobs = self.claim_jobs(limit=1, message_id=normalized_message_id)
+        return jobs[0] if jobs else None
+
+    def claim_jobs(self, limit: int, lease_sec: int | None = None, message_id: str = "") -> list[MailSummaryQueueJob]:
+        """
+        처리 가능한 작업을 최대 `limit`건 원자적으로 claim한다.
+
+        `BEGIN IMMEDIATE` 트랜잭션 안에서 조회와 상태 변경을 함께 수행하므로 여러 worker(스레드/프로세스)가
+        같은 작업을 중복 claim하지 않는다. `processing` 상태로 lease 시간(`updated_at` 기준)을 넘긴 작업은
+        worker가 중단된 것으로 보고 다시 claim한다.
+
+        Args:
+            limit: 최대 claim 건수
+            lease_sec: processing lease 시간(초, None이면 환경변수/기본값)
+            message_id: 지정 시 해당 메일 작업만 claim
+
+        Returns:
+            claim한 작업 목록(없으면 빈 목록)
+        """
+        if not self._db_path.exists():
+            return []
+        resolved_lease_sec = int(lease_sec) if lease_sec is not None else resolve_positive_int_env(SUMMARY_QUEUE_LEASE_SEC_ENV, DEFAULT_SUMMARY_QUEUE_LEASE_SEC)
+        params: list[object] = [
+            QUEUE_STATUS_PENDING,
+            QUEUE_STATUS_FAILED,
+            QUEUE_STATUS_PROCESSING,
+            f"-{max(1, resolved_lease_sec)} seconds",
+        ]
+        message_clause = ""
+        if message_id:
+            message_clause = "AND message_id = ? "
+            params.append(str(message_id))
+        params.append(max(1, int(limit)))
+        with get_sqlite_pool(self._db_path).write(row_factory=sqlite3.Row, immediate=True) as conn:
             self._ensure_queue_table(conn=conn)
-            row = conn.execute(
+            rows = conn.execute(
                 "SELECT id, message_id, status, attempt_count FROM mail_summary_queue "
-                "WHERE status IN (?, ?) "
-                "ORDER BY updated_at ASC, id ASC LIMIT 1",
-                (QUEUE_STATUS_PENDING, QUEUE_STATUS_FAILED),
-            ).fetchone()
-            if row is None:
-                return None
-            job_id = int(row["id"])
-            current_attempt = int(row["attempt_count"] or 0)
-            conn.execute(
-                "UPDATE mail_summary_queue SET status = ?, attempt_count = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
-                (QUEUE_STATUS_PROCESSING, current_attempt + 1, job_id),
-            )
-            conn.commit()
-            return MailSummaryQueueJob(
-                job_id=job_id,
-                message_id=str(row["message_id"] or "").strip(),
-                status=QUEUE_STATUS_PROCESSING,
-                attempt_count=current_attempt + 1,
-            )
+                "WHERE (status IN (?, ?) OR (status = ? AND updated_at <= datetime('now', ?))) "
+                f"{message_clause}"
+                "ORDER BY updated_at ASC, id ASC LIMIT ?",
+                tuple(params),
+            ).fetchall()
+            jobs: list[MailSummaryQueueJob] = []
+            for row in rows:
+                job_id = int(row["id"])
+                attempt_count = int(row["attempt_count"] or 0) + 1
+                if str(row["status"]) == QUEUE_STATUS_PROCESSING:
+                    logger.warning("mail_summary_queue_lease_expired: job_id=%s message_id=%s", job_id, row["message_id"])
+                conn.execute(
+                    "UPDATE mail_summary_queue SET status = ?, attempt_count = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+                    (QUEUE_STATUS_PROCESSING, attempt_count, job_id),
+                )
+                jobs.append(
+                    MailSummaryQueueJob(
+                        job_id=job_id,
+                        message_id=str(row["message_id"] or "").strip(),
+                        status=QUEUE_STATUS_PROCESSING,
+                        attempt_count=attempt_count,
+                    )
+                )
+            return jobs
 
     def load_mail_payload(self, message_id: str) -> dict[str, str] | None:
         """
@@ -248,8 +301,7 @@ class MailSummaryQueueService:
         """
         if not self._db_path.exists():
             return None
-        with sqlite3.connect(str(self._db_path)) as conn:
-            conn.row_factory = sqlite3.Row
+        with get_sqlite_pool(self._db_path).read(row_factory=sqlite3.Row) as conn:
             row = conn.execute(
                 "SELECT message_id, COALESCE(subject, '') AS subject, COALESCE(from_address, '') AS from_address, "
                 "COALESCE(received_date, '') AS received_date, "
@@ -279,25 +331,20 @@ class MailSummaryQueueService:
         """
         if not self._db_path.exists():
             return
-        with sqlite3.connect(str(self._db_path)) as conn:
+        schema = get_emails_schema(self._db_path)
+        summary_value = str(summary or "").strip()
+        normalized_message_id = str(message_id or "").strip()
+        if schema.has_category:
+            summary_params: tuple[str, ...] = (summary_value, str(category or "").strip(), normalized_message_id)
+        else:
+            summary_params = (summary_value, normalized_message_id)
+        with get_sqlite_pool(self._db_path).write() as conn:
             self._ensure_queue_table(conn=conn)
-            summary_value = str(summary or "").strip()
-            category_value = str(category or "").strip()
-            if self._has_category_column(conn=conn):
-                conn.execute(
-                    "UPDATE emails SET summary = ?, category = ? WHERE message_id = ?",
-                    (summary_value, category_value, str(message_id or "").strip()),
-                )
-            else:
-                conn.execute(
-                    "UPDATE emails SET summary = ? WHERE message_id = ?",
-                    (summary_value, str(message_id or "").strip()),
-                )
+            conn.execute(schema.statements.summary_update_query, summary_params)
             conn.execute(
                 "UPDATE mail_summary_queue SET status = ?, last_error = '', updated_at = CURRENT_TIMESTAMP WHERE id = ?",
                 (QUEUE_STATUS_COMPLETED, int(job_id)),
             )
-            conn.commit()
 
     def mark_failed(self, job_id: int, error_message: str, max_retries: int = DEFAULT_MAX_RETRIES) -> None:
         """
@@ -310,8 +357,7 @@ class MailSummaryQueueService:
         """
         if not self._db_path.exists():
             return
-        with sqlite3.connect(str(self._db_path)) as conn:
-            conn.row_factory = sqlite3.Row
+        with get_sqlite_pool(self._db_path).write(row_factory=sqlite3.Row) as conn:
             row = conn.execute(
                 "SELECT attempt_count FROM mail_summary_queue WHERE id = ? LIMIT 1",
                 (int(job_id),),
@@ -322,7 +368,6 @@ class MailSummaryQueueService:
                 "UPDATE mail_summary_queue SET status = ?, last_error = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
                 (status, str(error_message or "").strip()[:1000], int(job_id)),
             )
-            conn.commit()
 
     def _ensure_queue_table(self, conn: sqlite3.Connection) -> None:
         """
@@ -342,16 +387,7 @@ class MailSummaryQueueService:
             "created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP, "
             "updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP)"
         )
-
-    def _has_category_column(self, conn: sqlite3.Connection) -> bool:
-        """
-        emails 테이블의 category 컬럼 존재 여부를 확인한다.
-
-        Args:
-            conn: SQLite 연결 객체
-
-        Returns:
-            category 컬럼 존재 여부
-        """
-        rows = conn.execute("PRAGMA table_info(emails)").fetchall()
-        return any(str(row[1]).lower() == "category" for row in rows)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_mail_summary_queue_status_updated_at "
+            "ON mail_summary_queue(status, updated_at)"
+        )
@@ -1,15 +1,25 @@
 from __future__ import annotations
 
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from pathlib import Path
 
+from app.core.env_config import resolve_non_negative_int_env, resolve_positive_int_env
 from app.core.logging_config import get_logger
 from app.services.mail_summary_llm_service import MailSummaryLLMService
-from app.services.mail_summary_queue_service import MailSummaryQueueService
+from app.services.mail_summary_queue_service import MailSummaryQueueJob, MailSummaryQueueService
+from app.services.mail_vector_document import MailVectorDocument
 from app.services.mail_vector_index_service import MailVectorIndexService
 
 logger = get_logger(__name__)
 
+SUMMARY_WORKER_CONCURRENCY_ENV = "MOLDUBOT_SUMMARY_WORKER_CONCURRENCY"
+SUMMARY_WORKER_RATE_LIMIT_PER_MIN_ENV = "MOLDUBOT_SUMMARY_WORKER_RATE_LIMIT_PER_MIN"
+DEFAULT_SUMMARY_WORKER_CONCURRENCY = 1
+_VectorBatch = list[tuple[MailSummaryQueueJob, MailVectorDocument]]
+
 
 @dataclass
 class MailSummaryWorkerRunResult:
@@ -29,7 +39,7 @@ class MailSummaryWorkerRunResult:
 
 class MailSummaryQueueWorker:
     """
-    summary queue를 순차 처리하는 worker.
+    summary queue를 처리하는 worker(동시 실행 수 1이면 순차 처리).
     """
 
     def __init__(self, db_path: Path) -> None:
@@ -42,41 +52,200 @@ class MailSummaryQueueWorker:
         self._queue_service = MailSummaryQueueService(db_path=db_path)
         self._llm_service = MailSummaryLLMService()
         self._vector_index_service = MailVectorIndexService()
+        self._rate_limiter = _SummaryRateLimiter(
+            per_minute=resolve_non_negative_int_env(SUMMARY_WORKER_RATE_LIMIT_PER_MIN_ENV, 0),
+        )
 
     def process_once(self) -> bool:
         """
         큐 작업 1건을 처리한다.
 
+        Returns:
+            처리 수행 시 True, 큐가 비어 있으면 False
+        """
+        vector_batch: _VectorBatch = []
+        try:
+            return self._process_next_job(vector_batch=vector_batch)
+        finally:
+            self._flush_vector_documents(vector_batch=vector_batch)
+
+    def process_message(self, message_id: str) -> bool:
+        """
+        지정 메일의 큐 작업을 claim해 처리한다(다른 worker가 처리 중이거나 완료됐으면 건너뜀).
+
+        Args:
+            message_id: 대상 메일 식별자
+
+        Returns:
+            요약 저장 성공 시 True
+        """
+        job = self._queue_service.claim_message_job(message_id=message_id)
+        if job is None:
+            return False
+        vector_batch: _VectorBatch = []
+        try:
+            return self._process_job(job=job, vector_batch=vector_batch)
+        finally:
+            self._flush_vector_documents(vector_batch=vector_batch)
+
+    def process_many(self, max_jobs: int = 50, concurrency: int | None = None) -> MailSummaryWorkerRunResult:
+        """
+        큐 작업을 최대 `max_jobs`건 처리한다.
+
+        동시 실행 수가 2 이상이면 빈 슬롯 수만큼만 작업을 claim해 thread pool에서 요약하므로,
+        대기 중인 작업이 lease를 소모하지 않는다.
+
+        Args:
+            max_jobs: 최대 처리 건수
+            concurrency: 동시 요약 수(None이면 `MOLDUBOT_SUMMARY_WORKER_CONCURRENCY`)
+
+        Returns:
+            실행 집계 결과
+        """
+        target_jobs = max(1, int(max_jobs))
+        resolved_concurrency = (
+            max(1, int(concurrency))
+            if concurrency is not None
+            else resolve_positive_int_env(SUMMARY_WORKER_CONCURRENCY_ENV, DEFAULT_SUMMARY_WORKER_CONCURRENCY)
+        )
+        vector_batch: _VectorBatch = []
+        try:
+            if resolved_concurrency <= 1:
+                return self._process_sequentially(max_jobs=target_jobs, vector_batch=vector_batch)
+            return self._process_concurrently(
+                max_jobs=target_jobs,
+                concurrency=resolved_concurrency,
+                vector_batch=vector_batch,
+            )
+        finally:
+            self._flush_vector_documents(vector_batch=vector_batch)
+
+    def _process_sequentially(self, max_jobs: int, vector_batch: _VectorBatch) -> MailSummaryWorkerRunResult:
+        """
+        큐 작업을 1건씩 claim해 순차 처리한다.
+
+        Args:
+            max_jobs: 최대 처리 건수
+            vector_batch: 일괄 벡터 upsert 대기 (작업, 문서) 목록(in-place 추가)
+
+        Returns:
+            실행 집계 결과
+        """
+        processed = 0
+        failed = 0
+        empty = 0
+        for _ in range(max_jobs):
+            job = self._queue_service.claim_next_job()
+            if job is None:
+                empty += 1
+                break
+            if self._process_job(job=job, vector_batch=vector_batch):
+                processed += 1
+            else:
+                failed += 1
+        return MailSummaryWorkerRunResult(processed=processed, failed=failed, empty=empty)
+
+    def _process_concurrently(
+        self,
+        max_jobs: int,
+        concurrency: int,
+        vector_batch: _VectorBatch,
+    ) -> MailSummaryWorkerRunResult:
+        """
+        빈 슬롯 수만큼 작업을 일괄 claim해 thread pool에서 동시에 요약한다.
+
+        Args:
+            max_jobs: 최대 처리 건수
+            concurrency: 동시 요약 수
+            vector_batch: 일괄 벡터 upsert 대기 (작업, 문서) 목록(in-place 추가)
+
+        Returns:
+            실행 집계 결과
+        """
+        processed = 0
+        failed = 0
+        empty = 0
+        remaining = max_jobs
+        in_flight: set[Future[bool]] = set()
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="mail-summary") as executor:
+            while True:
+                free_slots = min(concurrency - len(in_flight), remaining)
+                if not empty and free_slots > 0:
+                    jobs = self._queue_service.claim_jobs(limit=free_slots)
+                    if not jobs:
+                        empty += 1
+                    remaining -= len(jobs)
+                    for job in jobs:
+                        in_flight.add(executor.submit(self._process_job, job, vector_batch))
+                if not in_flight:
+                    break
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future.result():
+                        processed += 1
+                    else:
+                        failed += 1
+        logger.info(
+            "mail_summary_worker_batch_completed: concurrency=%s processed=%s failed=%s",
+            concurrency,
+            processed,
+            failed,
+        )
+        return MailSummaryWorkerRunResult(processed=processed, failed=failed, empty=empty)
+
+    def _process_next_job(self, vector_batch: _VectorBatch) -> bool:
+        """
+        큐 작업 1건을 claim해 요약 처리한다.
+
+        Args:
+            vector_batch: 일괄 벡터 upsert 대기 (작업, 문서) 목록(in-place 추가)
+
         Returns:
             처리 수행 시 True, 큐가 비어 있으면 False
         """
         job = self._queue_service.claim_next_job()
         if job is None:
             return False
+        self._process_job(job=job, vector_batch=vector_batch)
+        return True
+
+    def _process_job(self, job: MailSummaryQueueJob, vector_batch: _VectorBatch) -> bool:
+        """
+        claim한 작업 1건을 요약 처리하고 벡터 색인 대상 문서를 적재한다.
+
+        Args:
+            job: claim한 queue 작업
+            vector_batch: 일괄 벡터 upsert 대기 (작업, 문서) 목록(in-place 추가)
+
+        Returns:
+            요약 저장 성공 시 True, 실패 기록 시 False
+        """
         payload = self._queue_service.load_mail_payload(message_id=job.message_id)
         if payload is None:
             self._queue_service.mark_failed(job_id=job.job_id, error_message="mail_payload_not_found")
-            return True
+            return False
         try:
+            self._rate_limiter.acquire()
             result = self._llm_service.summarize(
                 subject=str(payload.get("subject") or ""),
                 body_text=str(payload.get("body_text") or ""),
             )
-            self._vector_index_service.upsert_mail_document(
+            self._queue_service.mark_completed(
+                job_id=job.job_id,
                 message_id=job.message_id,
-                subject=str(payload.get("subject") or ""),
-                body_text=str(payload.get("body_text") or ""),
                 summary=result.summary,
                 category=result.category,
-                from_address=str(payload.get("from_address") or ""),
-                received_date=str(payload.get("received_date") or ""),
             )
-            self._queue_service.mark_completed(
-                job_id=job.job_id,
+            document = MailVectorDocument(
                 message_id=job.message_id,
+                subject=str(payload.get("subject") or ""),
+                body_text=str(payload.get("body_text") or ""),
                 summary=result.summary,
                 category=result.category,
+                from_address=str(payload.get("from_address") or ""),
+                received_date=str(payload.get("received_date") or ""),
             )
+            vector_batch.append((job, document))
             logger.info(
                 "mail_summary_worker_completed: message_id=%s source=%s category=%s",
                 job.message_id,
@@ -86,25 +255,51 @@ class MailSummaryQueueWorker:
         except Exception as exc:  # noqa: BLE001
             self._queue_service.mark_failed(job_id=job.job_id, error_message=str(exc))
             logger.error("mail_summary_worker_failed: message_id=%s error=%s", job.message_id, exc)
+            return False
         return True
 
-    def process_many(self, max_jobs: int = 50) -> MailSummaryWorkerRunResult:
+    def _flush_vector_documents(self, vector_batch: _VectorBatch) -> None:
         """
-        큐 작업을 최대 `max_jobs`건 처리한다.
+        적재된 요약 완료 문서를 벡터 인덱스에 일괄 upsert한다.
+
+        upsert가 실패하면 해당 작업을 실패로 기록해 재시도 대상으로 되돌린다(완료로 남으면 색인되지 않음).
 
         Args:
-            max_jobs: 최대 처리 건수
+            vector_batch: 일괄 벡터 upsert 대기 (작업, 문서) 목록
+        """
+        if not vector_batch:
+            return
+        try:
+            self._vector_index_service.upsert_many(documents=[document for _, document in vector_batch])
+        except Exception as exc:  # noqa: BLE001
+            logger.error("mail_summary_worker_vector_upsert_failed: count=%s error=%s", len(vector_batch), exc)
+            for job, _ in vector_batch:
+                self._queue_service.mark_failed(job_id=job.job_id, error_message=f"vector_upsert_failed: {exc}")
 
-        Returns:
-            실행 집계 결과
+
+class _SummaryRateLimiter:
+    """
+    분당 LLM 요약 호출 수를 제한하는 thread-safe 간격 limiter(0이면 무제한).
+    """
+
+    def __init__(self, per_minute: int) -> None:
         """
-        processed = 0
-        failed = 0
-        empty = 0
-        for _ in range(max(1, int(max_jobs))):
-            handled = self.process_once()
-            if not handled:
-                empty += 1
-                break
-            processed += 1
-        return MailSummaryWorkerRunResult(processed=processed, failed=failed, empty=empty)
+        limiter를 초기화한다.
+
+        Args:
+            per_minute: 분당 최대 호출 수(0이면 무제한)
+        """
+        self._interval_sec = 60.0 / per_minute if per_minute > 0 else 0.0
+        self._next_allowed_at = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """다음 호출 가능 시점까지 대기한다."""
+        if self._interval_sec <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            wait_sec = max(0.0, self._next_allowed_at - now)
+            self._next_allowed_at = max(now, self._next_allowed_at) + self._interval_sec
+        if wait_sec > 0:
+            time.sleep(wait_sec)
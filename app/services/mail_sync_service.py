@@ -3,9 +3,17 @@ from __future__ import annotations
 import sqlite3
 from dataclasses import asdict, dataclass
 from pathlib import Path
+from typing import Any
 
 from app.core.logging_config import get_logger
+from app.core.sqlite_pool import get_sqlite_pool
 from app.integrations.microsoft_graph.mail_client import GraphMailClient, GraphMailMessage
+from app.integrations.microsoft_graph.mail_client_types import GraphMailDeltaPage
+from app.integrations.microsoft_graph.mail_delta_client import (
+    DEFAULT_DELTA_PAGE_SIZE,
+    GraphMailDeltaClient,
+    GraphMailDeltaExpiredError,
+)
 from app.services.mail_service import MailRecord, MailService
 
 logger = get_logger(__name__)
@@ -32,22 +40,279 @@ class MailSyncResult:
         return asdict(self)
 
 
+@dataclass(frozen=True)
+class MailDeltaSyncResult:
+    """
+    Graph 메일 delta 증분 sync 집계 결과.
+
+    Attributes:
+        fetched: 받은 변경 메일 수
+        inserted: 신규 저장 수
+        updated: 갱신 수
+        deleted: 로컬에서 삭제한 메일 수
+        pages: 처리한 delta 페이지 수
+        full_resync: deltaLink 만료로 전체 재동기화했는지 여부
+        completed: 마지막 페이지까지 받아 새 deltaLink를 저장했는지 여부
+    """
+
+    fetched: int
+    inserted: int
+    updated: int
+    deleted: int
+    pages: int
+    full_resync: bool
+    completed: bool
+
+    def as_dict(self) -> dict[str, int | bool]:
+        """
+        결과를 직렬화 가능한 사전으로 변환한다.
+
+        Returns:
+            결과 사전
+        """
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class MailHydrateResult:
+    """
+    본문 누락 메일 Graph 일괄 보강 집계 결과.
+
+    Attributes:
+        requested: 보강 대상 메일 수
+        fetched: Graph에서 받은 메일 수
+        updated: 로컬에 갱신한 메일 수
+        missing: Graph에서 찾지 못한 메일 수
+    """
+
+    requested: int
+    fetched: int
+    updated: int
+    missing: int
+
+    def as_dict(self) -> dict[str, int]:
+        """
+        결과를 직렬화 가능한 사전으로 변환한다.
+
+        Returns:
+            결과 사전
+        """
+        return asdict(self)
+
+
 class MailSyncService:
     """
     Graph 최근 메일을 로컬 DB와 summary queue에 동기화한다.
     """
 
-    def __init__(self, db_path: Path, graph_client: GraphMailClient | None = None) -> None:
+    def __init__(
+        self,
+        db_path: Path,
+        graph_client: GraphMailClient | None = None,
+        delta_client: GraphMailDeltaClient | None = None,
+        summary_sync_on_upsert: bool | None = None,
+    ) -> None:
         """
         동기화 서비스 인스턴스를 초기화한다.
 
         Args:
             db_path: 로컬 SQLite 경로
             graph_client: Graph 메일 클라이언트
+            delta_client: Graph 메일 delta 클라이언트(None이면 delta sync 첫 호출 시 생성)
+            summary_sync_on_upsert: upsert 직후 background 요약 제출 여부(None이면 환경변수)
         """
         self._db_path = db_path
-        self._mail_service = MailService(db_path=db_path)
+        self._mail_service = MailService(db_path=db_path, summary_sync_on_upsert=summary_sync_on_upsert)
         self._graph_client = graph_client or GraphMailClient()
+        self._delta_client = delta_client
+
+    def sync_delta(self, folder_id: str = "inbox", page_size: int = DEFAULT_DELTA_PAGE_SIZE) -> MailDeltaSyncResult:
+        """
+        저장된 deltaLink 이후 변경분(신규/수정/삭제)만 Graph에서 받아 로컬 DB에 반영한다.
+
+        페이지마다 upsert/삭제를 한 트랜잭션으로 적용하고, 마지막 페이지의 deltaLink는 그 페이지와 같은
+        트랜잭션에서 저장한다. 중간에 실패하면 기존 deltaLink를 유지하므로 다음 실행이 같은 지점부터 다시 받는다.
+        deltaLink가 만료되면 비우고 전체 재동기화한다.
+
+        Args:
+            folder_id: 메일 폴더 ID 또는 well-known 이름
+            page_size: 페이지당 최대 메일 수
+
+        Returns:
+            delta 동기화 집계 결과
+        """
+        if not self._db_path.exists():
+            logger.warning("mail_sync_delta_skipped_missing_db: db_path=%s", self._db_path)
+            return MailDeltaSyncResult(
+                fetched=0, inserted=0, updated=0, deleted=0, pages=0, full_resync=False, completed=False
+            )
+        scope = f"me:{str(folder_id or 'inbox').strip() or 'inbox'}"
+        delta_link = self._load_delta_link(scope=scope)
+        full_resync = False
+        try:
+            counts = self._apply_delta_pages(
+                scope=scope,
+                delta_link=delta_link,
+                folder_id=folder_id,
+                page_size=page_size,
+            )
+        except GraphMailDeltaExpiredError as exc:
+            logger.warning("mail_sync_delta_expired: scope=%s error_code=%s", scope, exc)
+            self._save_delta_link(scope=scope, delta_link="")
+            full_resync = True
+            counts = self._apply_delta_pages(scope=scope, delta_link="", folder_id=folder_id, page_size=page_size)
+        result = MailDeltaSyncResult(**counts, full_resync=full_resync)
+        logger.info("mail_sync_delta_completed: scope=%s %s", scope, result.as_dict())
+        return result
+
+    def _apply_delta_pages(self, scope: str, delta_link: str, folder_id: str, page_size: int) -> dict[str, Any]:
+        """
+        delta 페이지를 순서대로 받아 페이지 단위 트랜잭션으로 반영한다.
+
+        Args:
+            scope: 동기화 상태 키
+            delta_link: 시작 deltaLink(빈 값이면 초기 동기화)
+            folder_id: 메일 폴더 ID
+            page_size: 페이지당 최대 메일 수
+
+        Returns:
+            집계 사전(fetched/inserted/updated/deleted/pages/completed)
+        """
+        counts: dict[str, Any] = {
+            "fetched": 0,
+            "inserted": 0,
+            "updated": 0,
+            "deleted": 0,
+            "pages": 0,
+            "completed": False,
+        }
+        delta_client = self._get_delta_client()
+        for page in delta_client.iter_delta_pages(delta_link=delta_link, folder_id=folder_id, page_size=page_size):
+            with get_sqlite_pool(self._db_path).write() as connection:
+                inserted, updated, deleted = self._apply_delta_page(page=page)
+                if page.delta_link:
+                    self._write_delta_link(connection=connection, scope=scope, delta_link=page.delta_link)
+            counts["fetched"] += len(page.messages)
+            counts["inserted"] += inserted
+            counts["updated"] += updated
+            counts["deleted"] += deleted
+            counts["pages"] += 1
+            counts["completed"] = bool(page.delta_link)
+        return counts
+
+    def _apply_delta_page(self, page: GraphMailDeltaPage) -> tuple[int, int, int]:
+        """
+        delta 페이지 1건의 변경/삭제를 현재 쓰기 트랜잭션 안에서 반영한다.
+
+        Args:
+            page: delta 페이지
+
+        Returns:
+            (신규 삽입 건수, 갱신 건수, 삭제 건수)
+        """
+        inserted, updated = self._mail_service.upsert_mail_records(
+            mails=[self._build_mail_record(message=message) for message in page.messages if message.message_id]
+        )
+        deleted = self._mail_service.delete_mail_records(message_ids=page.removed_message_ids)
+        return inserted, updated, deleted
+
+    def hydrate_missing_bodies(self, limit: int = 200) -> MailHydrateResult:
+        """
+        원문 본문(`body_full`)이 비어 있는 최근 메일을 Graph `$batch`로 묶어 다시 받아 채운다.
+
+        Args:
+            limit: 보강 대상 최대 건수
+
+        Returns:
+            보강 집계 결과
+        """
+        message_ids = self._load_message_ids_missing_body(limit=limit)
+        if not message_ids:
+            return MailHydrateResult(requested=0, fetched=0, updated=0, missing=0)
+        messages = self._graph_client.get_messages(message_ids=message_ids)
+        mails = [self._build_mail_record(message=messages[message_id]) for message_id in message_ids if message_id in messages]
+        _, updated = self._mail_service.upsert_mail_records(mails=mails)
+        result = MailHydrateResult(
+            requested=len(message_ids),
+            fetched=len(messages),
+            updated=updated,
+            missing=len(message_ids) - len(messages),
+        )
+        logger.info("mail_sync_hydrate_completed: %s", result.as_dict())
+        return result
+
+    def _load_message_ids_missing_body(self, limit: int) -> list[str]:
+        """
+        원문 본문이 비어 있는 최근 메일 message_id를 조회한다.
+
+        Args:
+            limit: 최대 건수
+
+        Returns:
+            message_id 목록(최신순)
+        """
+        if not self._db_path.exists():
+            return []
+        with get_sqlite_pool(self._db_path).read() as connection:
+            rows = connection.execute(
+                "SELECT message_id FROM emails WHERE COALESCE(body_full, '') = '' AND COALESCE(message_id, '') != '' "
+                "ORDER BY received_date DESC LIMIT ?",
+                (max(1, int(limit)),),
+            ).fetchall()
+        return [str(row[0]) for row in rows]
+
+    def _get_delta_client(self) -> GraphMailDeltaClient:
+        """
+        delta 클라이언트를 반환한다(없으면 메일 클라이언트 토큰을 공유해 생성).
+
+        Returns:
+            Graph 메일 delta 클라이언트
+        """
+        if self._delta_client is None:
+            self._delta_client = GraphMailDeltaClient(auth_client=self._graph_client)
+        return self._delta_client
+
+    def _load_delta_link(self, scope: str) -> str:
+        """
+        저장된 deltaLink를 조회한다.
+
+        Args:
+            scope: 동기화 상태 키
+
+        Returns:
+            deltaLink(없으면 빈 문자열)
+        """
+        with get_sqlite_pool(self._db_path).write() as connection:
+            _ensure_sync_state_table(connection=connection)
+            row = connection.execute("SELECT delta_link FROM mail_sync_state WHERE scope = ?", (scope,)).fetchone()
+        return str(row[0] or "") if row is not None else ""
+
+    def _save_delta_link(self, scope: str, delta_link: str) -> None:
+        """
+        deltaLink를 저장한다.
+
+        Args:
+            scope: 동기화 상태 키
+            delta_link: 저장할 deltaLink(빈 값이면 초기화)
+        """
+        with get_sqlite_pool(self._db_path).write() as connection:
+            self._write_delta_link(connection=connection, scope=scope, delta_link=delta_link)
+
+    def _write_delta_link(self, connection: sqlite3.Connection, scope: str, delta_link: str) -> None:
+        """
+        열린 쓰기 연결에서 deltaLink를 upsert한다.
+
+        Args:
+            connection: 쓰기 연결
+            scope: 동기화 상태 키
+            delta_link: 저장할 deltaLink
+        """
+        _ensure_sync_state_table(connection=connection)
+        connection.execute(
+            "INSERT INTO mail_sync_state (scope, delta_link, updated_at) VALUES (?, ?, CURRENT_TIMESTAMP) "
+            "ON CONFLICT(scope) DO UPDATE SET delta_link = excluded.delta_link, updated_at = CURRENT_TIMESTAMP",
+            (scope, delta_link),
+        )
 
     def sync_recent_messages(self, limit: int = 20) -> MailSyncResult:
         """
@@ -60,18 +325,20 @@ class MailSyncService:
             동기화 집계 결과
         """
         latest_received_date = self._load_latest_received_date()
-        fetched = inserted = updated = skipped_older = 0
-        for message in self._graph_client.list_recent_messages(limit=limit):
-            fetched += 1
-            if self._should_skip_older_message(message=message, latest_received_date=latest_received_date):
-                skipped_older += 1
-                continue
-            existed = self._mail_service.read_mail_by_message_id(message.message_id) is not None
-            self._mail_service.upsert_mail_record(mail=self._build_mail_record(message=message))
-            if existed:
-                updated += 1
-            else:
-                inserted += 1
+        messages = [message for message in self._graph_client.list_recent_messages(limit=limit) if message.message_id]
+        existing_ids = self._load_existing_message_ids(message_ids=[message.message_id for message in messages])
+        targets = [
+            message
+            for message in messages
+            if message.message_id in existing_ids
+            or not latest_received_date
+            or str(message.received_date or "") >= latest_received_date
+        ]
+        fetched = len(messages)
+        skipped_older = fetched - len(targets)
+        inserted, updated = self._mail_service.upsert_mail_records(
+            mails=[self._build_mail_record(message=message) for message in targets]
+        )
         logger.info(
             "mail_sync_recent_completed: fetched=%s inserted=%s updated=%s skipped_older=%s",
             fetched,
@@ -95,26 +362,29 @@ class MailSyncService:
         """
         if not self._db_path.exists():
             return ""
-        with sqlite3.connect(str(self._db_path)) as connection:
+        with get_sqlite_pool(self._db_path).read() as connection:
             row = connection.execute("SELECT COALESCE(MAX(received_date), '') FROM emails").fetchone()
         return str(row[0] or "") if row is not None else ""
 
-    def _should_skip_older_message(self, message: GraphMailMessage, latest_received_date: str) -> bool:
+    def _load_existing_message_ids(self, message_ids: list[str]) -> set[str]:
         """
-        로컬 최신 메일보다 오래된 신규 메일인지 판별한다.
+        로컬 DB에 이미 있는 message_id를 한 번에 조회한다.
 
         Args:
-            message: Graph 메일
-            latest_received_date: 로컬 최신 수신일시
+            message_ids: 확인할 message_id 목록
 
         Returns:
-            skip 대상이면 True
+            로컬에 존재하는 message_id 집합
         """
-        if self._mail_service.read_mail_by_message_id(message.message_id) is not None:
-            return False
-        if not latest_received_date:
-            return False
-        return str(message.received_date or "") < str(latest_received_date or "")
+        if not message_ids or not self._db_path.exists():
+            return set()
+        placeholders = ", ".join("?" for _ in message_ids)
+        with get_sqlite_pool(self._db_path).read() as connection:
+            rows = connection.execute(
+                f"SELECT message_id FROM emails WHERE message_id IN ({placeholders})",
+                message_ids,
+            ).fetchall()
+        return {str(row[0]) for row in rows}
 
     def _build_mail_record(self, message: GraphMailMessage) -> MailRecord:
         """
@@ -134,3 +404,18 @@ class MailSyncService:
             body_text=message.body_text,
             web_link=message.web_link,
         )
+
+
+def _ensure_sync_state_table(connection: sqlite3.Connection) -> None:
+    """
+    동기화 상태(deltaLink) 테이블을 보장한다.
+
+    Args:
+        connection: 쓰기 연결
+    """
+    connection.execute(
+        "CREATE TABLE IF NOT EXISTS mail_sync_state ("
+        "scope TEXT PRIMARY KEY, "
+        "delta_link TEXT NOT NULL DEFAULT '', "
+        "updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP)"
+    )
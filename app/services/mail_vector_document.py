@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class MailVectorDocument:
+    """
+    벡터 인덱스 upsert 대상 메일 문서.
+
+    Attributes:
+        message_id: 메일 식별자
+        subject: 메일 제목
+        body_text: 본문 텍스트
+        summary: 요약 텍스트
+        category: 카테고리
+        from_address: 발신자
+        received_date: 수신일시
+    """
+
+    message_id: str
+    subject: str = ""
+    body_text: str = ""
+    summary: str = ""
+    category: str = ""
+    from_address: str = ""
+    received_date: str = ""
+
+    def build_text(self) -> str:
+        """
+        벡터화 대상 문서 본문을 생성한다.
+
+        Returns:
+            결합 문서 텍스트
+        """
+        normalized_subject = str(self.subject or "").strip()
+        normalized_summary = str(self.summary or "").strip()
+        normalized_body = str(self.body_text or "").strip()[:2000]
+        lines = [
+            f"subject: {normalized_subject}",
+            f"summary: {normalized_summary}",
+            f"body: {normalized_body}",
+        ]
+        return "\n".join(lines).strip()
+
+    def build_metadata(self) -> dict[str, str]:
+        """
+        Chroma 메타데이터를 생성한다.
+
+        Returns:
+            메타데이터 사전
+        """
+        return {
+            "category": str(self.category or "").strip(),
+            "from_address": str(self.from_address or "").strip(),
+            "received_date": str(self.received_date or "").strip(),
+            "summary": str(self.summary or "").strip()[:500],
+            "subject": str(self.subject or "").strip()[:300],
+        }
+
+
+@dataclass(frozen=True)
+class MailVectorHit:
+    """
+    벡터 인덱스 근접 이웃 조회 결과 단건.
+
+    Attributes:
+        message_id: 메일 식별자
+        score: 코사인 유사도(정규화 벡터 기준)
+        metadata: 색인 시 저장한 메타데이터
+    """
+
+    message_id: str
+    score: float
+    metadata: dict[str, str]
+
+
+def build_vector_hits(result: dict[str, Any]) -> list[MailVectorHit]:
+    """
+    Chroma 형식 query 결과(squared L2 거리)를 유사도 조회 결과로 변환한다.
+
+    Args:
+        result: `ids`/`distances`/`metadatas` 중첩 리스트 결과
+
+    Returns:
+        유사도 내림차순 조회 결과 목록
+    """
+    ids = (result.get("ids") or [[]])[0] or []
+    distances = (result.get("distances") or [[]])[0] or []
+    metadatas = (result.get("metadatas") or [[]])[0] or []
+    hits: list[MailVectorHit] = []
+    for index, message_id in enumerate(ids):
+        distance = float(distances[index]) if index < len(distances) else 2.0
+        metadata = metadatas[index] if index < len(metadatas) and metadatas[index] else {}
+        hits.append(
+            MailVectorHit(
+                message_id=str(message_id or ""),
+                score=round(1.0 - distance / 2.0, 6),
+                metadata={str(key): str(value) for key, value in dict(metadata).items()},
+            )
+        )
+    return hits
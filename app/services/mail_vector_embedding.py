@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import hashlib
+import importlib
+import math
+import operator
+import re
+from functools import lru_cache
+from types import ModuleType
+from typing import Any
+
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+EMBEDDING_DIM = 256
+TOKEN_SLOT_CACHE_SIZE = 65536
+_NUMPY_UNRESOLVED = object()
+_numpy_module: Any = _NUMPY_UNRESOLVED
+
+
+def _tokenize(text: str) -> list[str]:
+    """
+    임베딩 대상 텍스트를 소문자 토큰 목록으로 분해한다.
+
+    저장된 벡터와의 호환을 위해 검색 토큰화 정책 변경과 분리해 고정한다.
+
+    Args:
+        text: 입력 텍스트
+
+    Returns:
+        토큰 목록
+    """
+    return [token.strip().lower() for token in re.findall(r"[가-힣A-Za-z0-9]+", str(text or "")) if token.strip()]
+
+
+@lru_cache(maxsize=TOKEN_SLOT_CACHE_SIZE)
+def _token_slot(token: str, dim: int) -> tuple[int, float]:
+    """
+    토큰의 md5 해시 버킷 index/부호를 계산한다(LRU 캐시).
+
+    Args:
+        token: 정규화 토큰
+        dim: 벡터 차원 수
+
+    Returns:
+        `(index, sign)` 튜플
+    """
+    digest = hashlib.md5(token.encode("utf-8")).hexdigest()
+    index = int(digest[:8], 16) % dim
+    sign = -1.0 if int(digest[8:16], 16) % 2 else 1.0
+    return index, sign
+
+
+def build_hash_embedding(text: str, dim: int = EMBEDDING_DIM) -> list[float]:
+    """
+    토큰 해시 기반 임베딩 벡터를 생성한다.
+
+    Args:
+        text: 입력 텍스트
+        dim: 벡터 차원 수
+
+    Returns:
+        정규화된 벡터
+    """
+    return embed_many(texts=[text], dim=dim)[0]
+
+
+def embed_many(texts: list[str], dim: int = EMBEDDING_DIM) -> list[list[float]]:
+    """
+    여러 텍스트의 토큰 해시 임베딩을 일괄 생성한다.
+
+    numpy가 있으면 `bincount` 1회로 전체 행을 누적하고, 없으면 캐시된 토큰 슬롯으로
+    순수 Python 누적을 수행한다. 두 경로 모두 `build_hash_embedding`과 같은 값을 반환한다.
+
+    Args:
+        texts: 입력 텍스트 목록
+        dim: 벡터 차원 수
+
+    Returns:
+        정규화된 벡터 목록(입력 순서 유지)
+    """
+    slots_per_text = [[_token_slot(token, dim) for token in _tokenize(text=text)] for text in texts]
+    numpy_module = load_numpy_module()
+    if numpy_module is None or not texts:
+        return [_accumulate_python(slots=slots, dim=dim) for slots in slots_per_text]
+    return _accumulate_numpy(numpy_module, slots_per_text=slots_per_text, dim=dim)
+
+
+def cosine_similarity(left: list[float], right: list[float]) -> float:
+    """
+    두 벡터의 코사인 유사도를 계산한다.
+
+    Args:
+        left: 좌측 벡터
+        right: 우측 벡터
+
+    Returns:
+        코사인 유사도 값
+    """
+    if not left or not right:
+        return 0.0
+    return sum(map(operator.mul, left, right))
+
+
+def cosine_similarities(query: list[float], vectors: list[list[float]]) -> list[float]:
+    """
+    질의 벡터와 여러 벡터의 코사인 유사도를 한 번에 계산한다.
+
+    Args:
+        query: 정규화된 질의 벡터
+        vectors: 정규화된 비교 벡터 목록(모두 같은 차원)
+
+    Returns:
+        입력 순서의 유사도 목록
+    """
+    numpy_module = load_numpy_module()
+    if numpy_module is None or not query or not vectors:
+        return [cosine_similarity(left=query, right=vector) for vector in vectors]
+    matrix = numpy_module.asarray(vectors, dtype=numpy_module.float64)
+    return (matrix @ numpy_module.asarray(query, dtype=numpy_module.float64)).tolist()
+
+
+def load_numpy_module() -> ModuleType | None:
+    """
+    numpy 모듈을 지연 로드한다(결과는 프로세스 단위로 캐시).
+
+    Returns:
+        import 성공 시 모듈 객체, 실패 시 None
+    """
+    global _numpy_module
+    if _numpy_module is _NUMPY_UNRESOLVED:
+        try:
+            _numpy_module = importlib.import_module("numpy")
+        except Exception as exc:  # noqa: BLE001
+            logger.info("mail_vector_numpy_unavailable: fallback=python error=%s", exc)
+            _numpy_module = None
+    return _numpy_module
+
+
+def _accumulate_python(slots: list[tuple[int, float]], dim: int) -> list[float]:
+    """
+    토큰 슬롯을 순수 Python으로 누적/정규화한다.
+
+    Args:
+        slots: `(index, sign)` 목록
+        dim: 벡터 차원 수
+
+    Returns:
+        정규화된 벡터
+    """
+    vector = [0.0] * dim
+    for index, sign in slots:
+        vector[index] += sign
+    norm = math.sqrt(sum(value * value for value in vector))
+    if norm == 0:
+        return vector
+    return [value / norm for value in vector]
+
+
+def _accumulate_numpy(numpy_module: ModuleType, slots_per_text: list[list[tuple[int, float]]], dim: int) -> list[list[float]]:
+    """
+    전체 텍스트의 토큰 슬롯을 numpy `bincount` 1회로 누적/정규화한다.
+
+    버킷 값은 정수 합이므로 순수 Python 누적과 비트 단위로 같은 결과가 나온다.
+
+    Args:
+        numpy_module: numpy 모듈
+        slots_per_text: 텍스트별 `(index, sign)` 목록
+        dim: 벡터 차원 수
+
+    Returns:
+        정규화된 벡터 목록
+    """
+    flat_indexes = [row * dim + index for row, slots in enumerate(slots_per_text) for index, _ in slots]
+    flat_signs = [sign for slots in slots_per_text for _, sign in slots]
+    matrix = numpy_module.bincount(
+        numpy_module.asarray(flat_indexes, dtype=numpy_module.int64),
+        weights=numpy_module.asarray(flat_signs, dtype=numpy_module.float64),
+        minlength=len(slots_per_text) * dim,
+    ).reshape(len(slots_per_text), dim)
+    norms = numpy_module.sqrt((matrix * matrix).sum(axis=1))
+    safe_norms = numpy_module.where(norms == 0, 1.0, norms)
+    return (matrix / safe_norms[:, None]).tolist()
@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+from array import array
+from contextlib import contextmanager
+from json import dumps, loads
+from pathlib import Path
+from typing import Any, Iterator
+
+from app.services.mail_vector_matrix import MailVectorMatrix, get_shared_matrix, pack_embedding, unpack_embedding
+
+
+class SQLiteFallbackVectorCollection:
+    """
+    Chroma 비가용 시 로컬 sqlite에 임베딩을 저장하는 fallback 컬렉션.
+
+    임베딩은 float32 BLOB(`embedding_blob`)으로 저장하고, 조회 시에는 프로세스 공유
+    float32 행렬을 지연 적재해 전건 코사인 검색을 메모리에서 수행한다.
+    """
+
+    _UPSERT_SQL = (
+        "INSERT INTO mail_vector_index "
+        "(collection_name, message_id, document, metadata_json, embedding_json, embedding_blob) "
+        "VALUES (?, ?, ?, ?, '', ?) "
+        "ON CONFLICT(collection_name, message_id) DO UPDATE SET "
+        "document = excluded.document, metadata_json = excluded.metadata_json, "
+        "embedding_json = '', embedding_blob = excluded.embedding_blob, updated_at = CURRENT_TIMESTAMP"
+    )
+
+    def __init__(self, db_path: Path, collection_name: str) -> None:
+        """
+        fallback 컬렉션을 초기화한다.
+
+        Args:
+            db_path: fallback sqlite 경로
+            collection_name: 컬렉션명
+        """
+        self._db_path = db_path
+        self._collection_name = collection_name
+        self._local = threading.local()
+
+    def upsert(
+        self,
+        ids: list[str],
+        documents: list[str],
+        metadatas: list[dict[str, str]],
+        embeddings: list[list[float]],
+    ) -> None:
+        """
+        임베딩 배치를 sqlite 테이블에 upsert한다(진행 중인 `transaction`이 없으면 단독 트랜잭션).
+
+        Args:
+            ids: 문서 id 목록
+            documents: 문서 본문 목록
+            metadatas: 메타데이터 목록
+            embeddings: 임베딩 목록
+        """
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            with self.transaction():
+                self.upsert(ids=ids, documents=documents, metadatas=metadatas, embeddings=embeddings)
+            return
+        connection.executemany(
+            self._UPSERT_SQL,
+            [
+                (
+                    self._collection_name,
+                    message_id,
+                    document,
+                    dumps(metadata, ensure_ascii=False, separators=(",", ":")),
+                    pack_embedding(embedding),
+                )
+                for message_id, document, metadata, embedding in zip(ids, documents, metadatas, embeddings, strict=False)
+            ],
+        )
+        self._local.pending.append((list(ids), list(metadatas), list(embeddings)))
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        하나의 sqlite 연결/트랜잭션 안에서 여러 upsert 배치를 묶는다.
+
+        중첩 호출은 바깥 트랜잭션에 합류하며, commit 성공 후에만 메모리 행렬에 반영한다.
+
+        Yields:
+            없음
+        """
+        if getattr(self._local, "connection", None) is not None:
+            yield
+            return
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        matrix = self._get_matrix()
+        stamp_before = _read_file_stamp(db_path=self._db_path)
+        connection = sqlite3.connect(str(self._db_path))
+        self._local.connection = connection
+        self._local.pending = []
+        try:
+            self._ensure_table(connection=connection)
+            yield
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            pending = self._local.pending
+            self._local.connection = None
+            self._local.pending = []
+            connection.close()
+        if matrix.stamp is None or matrix.stamp != stamp_before:
+            return
+        stamp_after = _read_file_stamp(db_path=self._db_path)
+        for pending_ids, pending_metadatas, pending_embeddings in pending:
+            matrix.upsert(ids=pending_ids, metadatas=pending_metadatas, embeddings=pending_embeddings, stamp=stamp_after)
+
+    def query(
+        self,
+        query_embeddings: list[list[float]],
+        n_results: int,
+        where: dict[str, str] | None = None,
+        include: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """
+        메모리 행렬에서 코사인 유사도 상위 n건을 반환한다.
+
+        fallback DB 파일 스탬프(mtime/size)가 적재 시점과 다르면 전건을 다시 적재한다.
+
+        Args:
+            query_embeddings: 질의 임베딩 목록(첫 번째만 사용)
+            n_results: 최대 반환 개수
+            where: 메타데이터 동등 조건
+            include: Chroma 호환용 인자(무시)
+
+        Returns:
+            Chroma `collection.query`와 같은 형태의 결과 사전
+        """
+        del include
+        empty: dict[str, Any] = {"ids": [[]], "distances": [[]], "metadatas": [[]]}
+        if not query_embeddings or not self._db_path.exists():
+            return empty
+        matrix = self._get_matrix()
+        stamp = _read_file_stamp(db_path=self._db_path)
+        if matrix.stamp is None or matrix.stamp != stamp:
+            matrix.load(rows=self._load_rows(), stamp=stamp)
+        top = matrix.search(query_vector=query_embeddings[0], n_results=n_results, where=where)
+        return {
+            "ids": [[message_id for _, message_id, _ in top]],
+            "distances": [[2.0 - 2.0 * similarity for similarity, _, _ in top]],
+            "metadatas": [[metadata for _, _, metadata in top]],
+        }
+
+    def count(self) -> int:
+        """
+        컬렉션 저장 행 수를 반환한다.
+
+        Returns:
+            저장 행 수
+        """
+        if not self._db_path.exists():
+            return 0
+        connection = sqlite3.connect(str(self._db_path))
+        try:
+            self._ensure_table(connection=connection)
+            row = connection.execute(
+                "SELECT COUNT(*) FROM mail_vector_index WHERE collection_name = ?",
+                (self._collection_name,),
+            ).fetchone()
+        finally:
+            connection.close()
+        return int(row[0] or 0) if row is not None else 0
+
+    def get_embedding_version(self) -> str:
+        """
+        컬렉션에 기록된 임베딩 버전 태그를 조회한다.
+
+        Returns:
+            버전 태그. 기록이 없으면 빈 문자열
+        """
+        if not self._db_path.exists():
+            return ""
+        connection = sqlite3.connect(str(self._db_path))
+        try:
+            self._ensure_table(connection=connection)
+            row = connection.execute(
+                "SELECT embedding_version FROM mail_vector_collection_meta WHERE collection_name = ?",
+                (self._collection_name,),
+            ).fetchone()
+        finally:
+            connection.close()
+        return str(row[0] or "") if row is not None else ""
+
+    def set_embedding_version(self, embedding_version: str, clear: bool = False) -> None:
+        """
+        컬렉션 임베딩 버전 태그를 기록한다.
+
+        Args:
+            embedding_version: 임베딩 버전 태그
+            clear: True면 기존 임베딩 행을 모두 삭제(재색인 준비)
+        """
+        with self.transaction():
+            connection = self._local.connection
+            if clear:
+                connection.execute("DELETE FROM mail_vector_index WHERE collection_name = ?", (self._collection_name,))
+            connection.execute(
+                "INSERT INTO mail_vector_collection_meta (collection_name, embedding_version) VALUES (?, ?) "
+                "ON CONFLICT(collection_name) DO UPDATE SET embedding_version = excluded.embedding_version, "
+                "updated_at = CURRENT_TIMESTAMP",
+                (self._collection_name, embedding_version),
+            )
+
+    def _get_matrix(self) -> MailVectorMatrix:
+        """
+        현재 DB/컬렉션의 공유 임베딩 행렬을 반환한다.
+
+        Returns:
+            공유 임베딩 행렬
+        """
+        return get_shared_matrix(db_path=self._db_path, collection_name=self._collection_name)
+
+    def _load_rows(self) -> list[tuple[str, dict[str, str], array]]:
+        """
+        컬렉션 전건 임베딩을 읽는다(BLOB 우선, 구버전 JSON 행 호환).
+
+        Returns:
+            `(message_id, metadata, embedding)` 목록
+        """
+        connection = sqlite3.connect(str(self._db_path))
+        try:
+            self._ensure_table(connection=connection)
+            rows = connection.execute(
+                "SELECT message_id, metadata_json, embedding_json, embedding_blob "
+                "FROM mail_vector_index WHERE collection_name = ?",
+                (self._collection_name,),
+            ).fetchall()
+        finally:
+            connection.close()
+        loaded: list[tuple[str, dict[str, str], array]] = []
+        for message_id, metadata_json, embedding_json, embedding_blob in rows:
+            embedding = unpack_embedding(embedding_blob) if embedding_blob else array("f", loads(embedding_json or "[]"))
+            loaded.append((str(message_id), loads(metadata_json), embedding))
+        return loaded
+
+    def _ensure_table(self, connection: sqlite3.Connection) -> None:
+        """
+        fallback 저장/메타 테이블과 `embedding_blob` 컬럼을 보장한다.
+
+        Args:
+            connection: sqlite 연결
+        """
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS mail_vector_index ("
+            "collection_name TEXT NOT NULL, "
+            "message_id TEXT NOT NULL, "
+            "document TEXT NOT NULL, "
+            "metadata_json TEXT NOT NULL, "
+            "embedding_json TEXT NOT NULL, "
+            "updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP, "
+            "embedding_blob BLOB, "
+            "PRIMARY KEY (collection_name, message_id))"
+        )
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS mail_vector_collection_meta ("
+            "collection_name TEXT PRIMARY KEY, "
+            "embedding_version TEXT NOT NULL, "
+            "updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP)"
+        )
+        columns = {str(row[1]) for row in connection.execute("PRAGMA table_info(mail_vector_index)").fetchall()}
+        if "embedding_blob" not in columns:
+            connection.execute("ALTER TABLE mail_vector_index ADD COLUMN embedding_blob BLOB")
+
+
+def _read_file_stamp(db_path: Path) -> tuple[int, int] | None:
+    """
+    fallback DB 파일의 변경 감지용 스탬프(mtime_ns, size)를 읽는다.
+
+    Args:
+        db_path: fallback sqlite 경로
+
+    Returns:
+        스탬프. 파일이 없으면 None
+    """
+    try:
+        stat = db_path.stat()
+    except OSError:
+        return None
+    return (int(stat.st_mtime_ns), int(stat.st_size))
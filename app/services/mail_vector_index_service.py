@@ -2,23 +2,32 @@ from __future__ import annotations
 
 import importlib
 import os
-import sqlite3
 import sys
+import threading
+from contextlib import AbstractContextManager, nullcontext
 from dataclasses import asdict, dataclass
 from importlib import metadata
-from json import dumps
-from pathlib import Path
 from types import ModuleType
-from typing import Protocol
+from typing import Any, Protocol
 
+from app.core.env_config import resolve_positive_int_env
 from app.core.logging_config import get_logger
-from app.services.mail_search_utils import build_hash_embedding
+from app.services.mail_embedding_provider import (
+    HASH_EMBEDDING_VERSION,
+    MailEmbeddingProvider,
+    get_mail_embedding_provider,
+    resolve_mail_vector_dir,
+)
+from app.services.mail_vector_document import MailVectorDocument, MailVectorHit, build_vector_hits
+from app.services.mail_vector_fallback_collection import SQLiteFallbackVectorCollection
 
 logger = get_logger(__name__)
 DEFAULT_MAIL_VECTOR_COLLECTION = "moldubot_emails"
 MAIL_VECTOR_ENABLED_ENV = "MOLDUBOT_MAIL_VECTOR_INDEX_ENABLED"
-MAIL_VECTOR_DIR_ENV = "MOLDUBOT_MAIL_VECTOR_DIR"
 MAIL_VECTOR_COLLECTION_ENV = "MOLDUBOT_MAIL_VECTOR_COLLECTION"
+MAIL_VECTOR_UPSERT_CHUNK_SIZE_ENV = "MOLDUBOT_MAIL_VECTOR_UPSERT_CHUNK_SIZE"
+DEFAULT_MAIL_VECTOR_UPSERT_CHUNK_SIZE = 256
+EMBEDDING_VERSION_METADATA_KEY = "embedding_version"
 
 
 @dataclass(frozen=True)
@@ -36,6 +45,9 @@ class MailVectorIndexStatus:
         persist_dir: persist 디렉터리 문자열
         backend: 실제 저장 backend
         runtime_blocker: 사전 탐지된 런타임 차단 사유
+        embedding_version: 현재 임베딩 provider 버전 태그
+        stored_embedding_version: 컬렉션에 기록된 임베딩 버전 태그
+        reindex_required: 버전 불일치로 재색인이 필요한지 여부
     """
 
     enabled: bool
@@ -47,6 +59,9 @@ class MailVectorIndexStatus:
     persist_dir: str
     backend: str
     runtime_blocker: str
+    embedding_version: str = ""
+    stored_embedding_version: str = ""
+    reindex_required: bool = False
 
     def as_dict(self) -> dict[str, str | bool]:
         """
@@ -63,12 +78,17 @@ class MailVectorIndexService:
     메일 요약 문서를 Chroma 벡터 스토어에 색인하는 서비스.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, embedding_provider: MailEmbeddingProvider | None = None) -> None:
         """
         벡터 색인 서비스 인스턴스를 초기화한다.
+
+        Args:
+            embedding_provider: 임베딩 provider. 미지정 시 환경변수 기준 공유 provider
         """
         self._enabled = _is_enabled(value=os.getenv(MAIL_VECTOR_ENABLED_ENV, "1"))
-        self._persist_dir = _resolve_persist_dir()
+        self._persist_dir = resolve_mail_vector_dir()
+        self._embedding_provider = embedding_provider or get_mail_embedding_provider()
+        self._stored_embedding_version: str | None = None
         self._collection_name = str(os.getenv(MAIL_VECTOR_COLLECTION_ENV, DEFAULT_MAIL_VECTOR_COLLECTION)).strip()
         self._collection_name = self._collection_name or DEFAULT_MAIL_VECTOR_COLLECTION
         self._disabled_reason = "disabled_by_env" if not self._enabled else ""
@@ -84,10 +104,13 @@ class MailVectorIndexService:
             logger.warning("mail_vector_index_disabled: reason=%s", blocker)
             self._backend_type = "sqlite_fallback"
             self._disabled_reason = "fallback_active"
-        self._fallback_collection = _SQLiteFallbackCollection(
+        self._fallback_collection = SQLiteFallbackVectorCollection(
             db_path=self._persist_dir / "mail_vector_fallback.sqlite3",
             collection_name=self._collection_name,
         )
+        self._chroma_client: Any = None
+        self._chroma_collection: _CollectionProtocol | None = None
+        self._collection_lock = threading.Lock()
 
     def upsert_mail_document(
         self,
@@ -114,32 +137,140 @@ class MailVectorIndexService:
         Returns:
             upsert 수행 여부
         """
-        normalized_id = str(message_id or "").strip()
-        if not self._enabled or not normalized_id:
-            return False
-        document = _build_document_text(subject=subject, body_text=body_text, summary=summary)
-        embedding = build_hash_embedding(text=document)
-        metadata = _build_metadata(
+        document = MailVectorDocument(
+            message_id=str(message_id or "").strip(),
+            subject=subject,
+            body_text=body_text,
+            summary=summary,
             category=category,
             from_address=from_address,
             received_date=received_date,
-            summary=summary,
-            subject=subject,
         )
+        return self.upsert_many(documents=[document]) > 0
+
+    def upsert_many(self, documents: list[MailVectorDocument], chunk_size: int | None = None) -> int:
+        """
+        메일 문서 목록을 일괄 임베딩해 청크 단위로 upsert한다.
+
+        sqlite fallback은 전체 청크를 하나의 트랜잭션으로 기록하고, Chroma는 캐시된
+        컬렉션에 청크별로 기록한다. 컬렉션 임베딩 버전이 현재 provider와 다르면
+        벡터 공간 혼합을 막기 위해 기록하지 않는다(`reset_index` 후 재색인 필요).
+
+        Args:
+            documents: upsert 대상 문서 목록
+            chunk_size: 청크 크기. 미지정 시 `MOLDUBOT_MAIL_VECTOR_UPSERT_CHUNK_SIZE`
+
+        Returns:
+            upsert 수행 건수(message_id 중복 시 마지막 문서 기준)
+        """
+        if not self._enabled:
+            return 0
+        if self.is_reindex_required():
+            logger.warning(
+                "mail_vector_index_upsert_skipped: reason=reindex_required stored=%s active=%s",
+                self._stored_embedding_version,
+                self._embedding_provider.version_tag,
+            )
+            return 0
+        unique: dict[str, MailVectorDocument] = {}
+        for document in documents:
+            normalized_id = str(document.message_id or "").strip()
+            if normalized_id:
+                unique[normalized_id] = document
+        if not unique:
+            return 0
+        ids = list(unique)
+        texts = [document.build_text() for document in unique.values()]
+        metadatas = [document.build_metadata() for document in unique.values()]
+        embeddings = self._embedding_provider.embed_many(texts=texts)
+        size = max(1, int(chunk_size or resolve_positive_int_env(MAIL_VECTOR_UPSERT_CHUNK_SIZE_ENV, DEFAULT_MAIL_VECTOR_UPSERT_CHUNK_SIZE)))
         collection = self._get_collection()
-        collection.upsert(
-            ids=[normalized_id],
-            documents=[document],
-            metadatas=[metadata],
-            embeddings=[embedding],
-        )
+        with self._open_write_scope():
+            for start in range(0, len(ids), size):
+                collection.upsert(
+                    ids=ids[start : start + size],
+                    documents=texts[start : start + size],
+                    metadatas=metadatas[start : start + size],
+                    embeddings=embeddings[start : start + size],
+                )
+        if not self._stored_embedding_version:
+            self._write_embedding_version(clear=False)
         logger.info(
-            "mail_vector_index_upserted: message_id=%s collection=%s backend=%s",
-            normalized_id,
+            "mail_vector_index_upserted: count=%s chunk_size=%s collection=%s backend=%s",
+            len(ids),
+            size,
             self._collection_name,
             self._backend_type,
         )
-        return True
+        return len(ids)
+
+    def query(
+        self,
+        embedding: list[float],
+        k: int = 10,
+        where: dict[str, str] | None = None,
+    ) -> list[MailVectorHit]:
+        """
+        질의 임베딩과 가까운 메일을 벡터 인덱스에서 조회한다.
+
+        Args:
+            embedding: 질의 임베딩(정규화 벡터)
+            k: 최대 반환 개수
+            where: 메타데이터 동등 조건(예: `{"category": "일반"}`)
+
+        Returns:
+            유사도 내림차순 조회 결과 목록. 비활성/조회 실패 시 빈 목록
+        """
+        if not self._enabled or not embedding or k < 1:
+            return []
+        try:
+            if self.is_reindex_required():
+                logger.warning("mail_vector_index_query_skipped: reason=reindex_required")
+                return []
+            collection = self._get_collection()
+            result = collection.query(
+                query_embeddings=[embedding],
+                n_results=int(k),
+                where=where or None,
+                include=["distances", "metadatas"],
+            )
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("mail_vector_index_query_failed: backend=%s error=%s", self._backend_type, exc)
+            return []
+        return build_vector_hits(result=result)
+
+    def is_reindex_required(self) -> bool:
+        """
+        컬렉션 임베딩 버전이 현재 provider 버전과 다른지 확인한다.
+
+        버전 기록이 없는 기존 컬렉션은 행이 있으면 hash 임베딩으로 간주한다.
+
+        Returns:
+            재색인 필요 여부
+        """
+        if not self._enabled:
+            return False
+        if self._stored_embedding_version is None:
+            try:
+                self._stored_embedding_version = self._read_embedding_version()
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("mail_vector_index_version_read_failed: backend=%s error=%s", self._backend_type, exc)
+                return False
+        stored = self._stored_embedding_version
+        return bool(stored) and stored != self._embedding_provider.version_tag
+
+    def reset_index(self) -> None:
+        """
+        컬렉션 임베딩을 모두 비우고 현재 provider 버전 태그를 기록한다(재색인 준비).
+        """
+        if not self._enabled:
+            return
+        self._write_embedding_version(clear=True)
+        logger.info(
+            "mail_vector_index_reset: collection=%s embedding_version=%s",
+            self._collection_name,
+            self._stored_embedding_version,
+        )
 
     def get_status(self) -> MailVectorIndexStatus:
         """
@@ -149,6 +280,7 @@ class MailVectorIndexService:
             벡터 인덱스 상태 모델
         """
         reason = self._disabled_reason if not self._enabled else "ready"
+        reindex_required = self.is_reindex_required()
         return MailVectorIndexStatus(
             enabled=self._enabled,
             reason=reason,
@@ -159,11 +291,14 @@ class MailVectorIndexService:
             persist_dir=str(self._persist_dir),
             backend=self._backend_type,
             runtime_blocker=self._runtime_blocker,
+            embedding_version=self._embedding_provider.version_tag,
+            stored_embedding_version=str(self._stored_embedding_version or ""),
+            reindex_required=reindex_required,
         )
 
     def _get_collection(self) -> "_CollectionProtocol":
         """
-        활성 backend 컬렉션을 조회/생성한다.
+        활성 backend 컬렉션을 조회/생성한다(Chroma 클라이언트/컬렉션은 인스턴스 단위 캐시).
 
         Returns:
             컬렉션 객체
@@ -172,39 +307,70 @@ class MailVectorIndexService:
             return self._fallback_collection
         if self._chromadb is None:
             raise RuntimeError("vector_backend_unavailable")
-        self._persist_dir.mkdir(parents=True, exist_ok=True)
-        client = self._chromadb.PersistentClient(path=str(self._persist_dir))
-        return client.get_or_create_collection(name=self._collection_name)
-
-
-class _CollectionProtocol(Protocol):
-    """벡터 컬렉션 최소 upsert 인터페이스."""
-
-    def upsert(
-        self,
-        ids: list[str],
-        documents: list[str],
-        metadatas: list[dict[str, str]],
-        embeddings: list[list[float]],
-    ) -> None:
-        """문서 배치를 upsert한다."""
-
-
-class _SQLiteFallbackCollection:
-    """
-    Chroma 비가용 시 로컬 sqlite에 임베딩을 저장하는 fallback 컬렉션.
-    """
+        with self._collection_lock:
+            if self._chroma_collection is None:
+                self._persist_dir.mkdir(parents=True, exist_ok=True)
+                self._chroma_client = self._chromadb.PersistentClient(path=str(self._persist_dir))
+                self._chroma_collection = self._chroma_client.get_or_create_collection(name=self._collection_name)
+            return self._chroma_collection
+
+    def _read_embedding_version(self) -> str:
+        """
+        컬렉션에 기록된 임베딩 버전 태그를 읽는다.
 
-    def __init__(self, db_path: Path, collection_name: str) -> None:
+        Returns:
+            버전 태그. 기록이 없으면 행 존재 시 hash 버전, 빈 컬렉션이면 빈 문자열
         """
-        fallback 컬렉션을 초기화한다.
+        if self._backend_type == "sqlite_fallback":
+            stored = self._fallback_collection.get_embedding_version()
+            count = self._fallback_collection.count() if not stored else 0
+        else:
+            collection = self._get_collection()
+            metadata = getattr(collection, "metadata", None)
+            stored = str(metadata.get(EMBEDDING_VERSION_METADATA_KEY) or "") if isinstance(metadata, dict) else ""
+            count = int(collection.count()) if not stored else 0
+        if stored:
+            return stored
+        return HASH_EMBEDDING_VERSION if count > 0 else ""
+
+    def _write_embedding_version(self, clear: bool) -> None:
+        """
+        현재 provider 임베딩 버전 태그를 컬렉션에 기록한다.
 
         Args:
-            db_path: fallback sqlite 경로
-            collection_name: 컬렉션명
+            clear: True면 기존 임베딩을 모두 삭제
+        """
+        version = self._embedding_provider.version_tag
+        if self._backend_type == "sqlite_fallback":
+            self._fallback_collection.set_embedding_version(embedding_version=version, clear=clear)
+        else:
+            collection = self._get_collection()
+            metadata = {EMBEDDING_VERSION_METADATA_KEY: version}
+            with self._collection_lock:
+                if clear:
+                    self._chroma_client.delete_collection(name=self._collection_name)
+                    self._chroma_collection = self._chroma_client.get_or_create_collection(
+                        name=self._collection_name,
+                        metadata=metadata,
+                    )
+                else:
+                    collection.modify(metadata=metadata)
+        self._stored_embedding_version = version
+
+    def _open_write_scope(self) -> AbstractContextManager[None]:
         """
-        self._db_path = db_path
-        self._collection_name = collection_name
+        일괄 upsert를 감쌀 쓰기 범위를 반환한다.
+
+        Returns:
+            sqlite fallback이면 단일 트랜잭션, 그 외에는 no-op 컨텍스트
+        """
+        if self._backend_type == "sqlite_fallback":
+            return self._fallback_collection.transaction()
+        return nullcontext()
+
+
+class _CollectionProtocol(Protocol):
+    """벡터 컬렉션 최소 upsert/query 인터페이스."""
 
     def upsert(
         self,
@@ -213,55 +379,16 @@ class _SQLiteFallbackCollection:
         metadatas: list[dict[str, str]],
         embeddings: list[list[float]],
     ) -> None:
-        """
-        임베딩 배치를 sqlite 테이블에 upsert한다.
-
-        Args:
-            ids: 문서 id 목록
-            documents: 문서 본문 목록
-            metadatas: 메타데이터 목록
-            embeddings: 임베딩 목록
-        """
-        self._db_path.parent.mkdir(parents=True, exist_ok=True)
-        connection = sqlite3.connect(str(self._db_path))
-        try:
-            self._ensure_table(connection=connection)
-            for message_id, document, metadata, embedding in zip(ids, documents, metadatas, embeddings, strict=False):
-                connection.execute(
-                    "INSERT INTO mail_vector_index (collection_name, message_id, document, metadata_json, embedding_json) "
-                    "VALUES (?, ?, ?, ?, ?) "
-                    "ON CONFLICT(collection_name, message_id) DO UPDATE SET "
-                    "document = excluded.document, metadata_json = excluded.metadata_json, "
-                    "embedding_json = excluded.embedding_json, updated_at = CURRENT_TIMESTAMP",
-                    (
-                        self._collection_name,
-                        message_id,
-                        document,
-                        dumps(metadata, ensure_ascii=False, separators=(",", ":")),
-                        dumps(embedding),
-                    ),
-                )
-            connection.commit()
-        finally:
-            connection.close()
-
-    def _ensure_table(self, connection: sqlite3.Connection) -> None:
-        """
-        fallback 저장 테이블을 보장한다.
+        """문서 배치를 upsert한다."""
 
-        Args:
-            connection: sqlite 연결
-        """
-        connection.execute(
-            "CREATE TABLE IF NOT EXISTS mail_vector_index ("
-            "collection_name TEXT NOT NULL, "
-            "message_id TEXT NOT NULL, "
-            "document TEXT NOT NULL, "
-            "metadata_json TEXT NOT NULL, "
-            "embedding_json TEXT NOT NULL, "
-            "updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP, "
-            "PRIMARY KEY (collection_name, message_id))"
-        )
+    def query(
+        self,
+        query_embeddings: list[list[float]],
+        n_results: int,
+        where: dict[str, str] | None,
+        include: list[str],
+    ) -> dict[str, Any]:
+        """질의 임베딩 근접 이웃을 Chroma 응답 형식으로 반환한다."""
 
 
 def _load_chromadb_module() -> ModuleType | None:
@@ -316,71 +443,6 @@ def _get_python_version() -> str:
     return f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
 
 
-def _build_document_text(subject: str, body_text: str, summary: str) -> str:
-    """
-    벡터화 대상 문서 본문을 생성한다.
-
-    Args:
-        subject: 메일 제목
-        body_text: 메일 본문
-        summary: 요약 텍스트
-
-    Returns:
-        결합 문서 텍스트
-    """
-    normalized_subject = str(subject or "").strip()
-    normalized_summary = str(summary or "").strip()
-    normalized_body = str(body_text or "").strip()[:2000]
-    lines = [
-        f"subject: {normalized_subject}",
-        f"summary: {normalized_summary}",
-        f"body: {normalized_body}",
-    ]
-    return "\n".join(lines).strip()
-
-
-def _build_metadata(
-    category: str,
-    from_address: str,
-    received_date: str,
-    summary: str,
-    subject: str,
-) -> dict[str, str]:
-    """
-    Chroma 메타데이터를 생성한다.
-
-    Args:
-        category: 카테고리
-        from_address: 발신자
-        received_date: 수신일시
-        summary: 요약
-        subject: 제목
-
-    Returns:
-        메타데이터 사전
-    """
-    return {
-        "category": str(category or "").strip(),
-        "from_address": str(from_address or "").strip(),
-        "received_date": str(received_date or "").strip(),
-        "summary": str(summary or "").strip()[:500],
-        "subject": str(subject or "").strip()[:300],
-    }
-
-
-def _resolve_persist_dir() -> Path:
-    """
-    Chroma persist 디렉터리를 해석한다.
-
-    Returns:
-        persist 디렉터리 경로
-    """
-    env_path = str(os.getenv(MAIL_VECTOR_DIR_ENV, "")).strip()
-    if env_path:
-        return Path(env_path)
-    root_dir = Path(__file__).resolve().parents[2]
-    return root_dir / "data" / "chroma_db"
-
 
 def _is_enabled(value: str | None) -> bool:
     """
@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+import heapq
+import operator
+import threading
+from array import array
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Iterable
+
+from app.services.mail_vector_embedding import load_numpy_module
+
+_MATRIX_REGISTRY: dict[tuple[str, str], "MailVectorMatrix"] = {}
+_MATRIX_REGISTRY_LOCK = threading.Lock()
+
+
+def pack_embedding(embedding: list[float]) -> bytes:
+    """
+    임베딩을 float32 little-endian BLOB으로 직렬화한다.
+
+    Args:
+        embedding: 임베딩 벡터
+
+    Returns:
+        BLOB 바이트열
+    """
+    return array("f", [float(value) for value in embedding]).tobytes()
+
+
+def unpack_embedding(blob: bytes) -> array:
+    """
+    float32 BLOB을 임베딩 배열로 역직렬화한다.
+
+    Args:
+        blob: BLOB 바이트열
+
+    Returns:
+        float32 배열
+    """
+    values = array("f")
+    values.frombytes(bytes(blob or b""))
+    return values
+
+
+def get_shared_matrix(db_path: Path, collection_name: str) -> "MailVectorMatrix":
+    """
+    fallback DB/컬렉션 단위로 프로세스 공유 임베딩 행렬을 반환한다.
+
+    Args:
+        db_path: fallback sqlite 경로
+        collection_name: 컬렉션명
+
+    Returns:
+        공유 임베딩 행렬
+    """
+    key = (str(db_path.resolve()), collection_name)
+    with _MATRIX_REGISTRY_LOCK:
+        matrix = _MATRIX_REGISTRY.get(key)
+        if matrix is None:
+            matrix = MailVectorMatrix()
+            _MATRIX_REGISTRY[key] = matrix
+        return matrix
+
+
+class MailVectorMatrix:
+    """
+    fallback 임베딩 전건을 연속 float32 행렬로 보관하고 top-k 코사인 검색을 수행한다.
+
+    numpy가 있으면 행렬-벡터 곱 + `argpartition`, 없으면 순수 Python 내적으로 동작한다.
+    """
+
+    def __init__(self) -> None:
+        """빈 행렬을 초기화한다."""
+        self.stamp: tuple[int, int] | None = None
+        self._lock = threading.RLock()
+        self._ids: list[str] = []
+        self._metadatas: list[dict[str, str]] = []
+        self._row_index: dict[str, int] = {}
+        self._dim = 0
+        self._rows: list[array] = []
+        self._matrix: Any = None
+
+    @property
+    def size(self) -> int:
+        """적재된 행 수를 반환한다."""
+        return len(self._ids)
+
+    def load(self, rows: Iterable[tuple[str, dict[str, str], array]], stamp: tuple[int, int] | None) -> None:
+        """
+        저장소 전건으로 행렬을 다시 적재한다.
+
+        Args:
+            rows: `(message_id, metadata, embedding)` 목록
+            stamp: 적재 시점 저장소 파일 스탬프
+        """
+        with self._lock:
+            self._ids, self._metadatas, self._row_index = [], [], {}
+            self._dim, self._rows, self._matrix = 0, [], None
+            self._append_or_replace(rows=rows)
+            self.stamp = stamp
+
+    def upsert(
+        self,
+        ids: list[str],
+        metadatas: list[dict[str, str]],
+        embeddings: list[list[float]],
+        stamp: tuple[int, int] | None,
+    ) -> None:
+        """
+        upsert 배치를 적재된 행렬에 증분 반영한다.
+
+        Args:
+            ids: 문서 id 목록
+            metadatas: 메타데이터 목록
+            embeddings: 임베딩 목록
+            stamp: 반영 후 저장소 파일 스탬프
+        """
+        with self._lock:
+            rows = [
+                (str(message_id), dict(metadata), array("f", [float(value) for value in embedding]))
+                for message_id, metadata, embedding in zip(ids, metadatas, embeddings, strict=False)
+            ]
+            self._append_or_replace(rows=rows)
+            self.stamp = stamp
+
+    def search(
+        self,
+        query_vector: list[float],
+        n_results: int,
+        where: dict[str, str] | None = None,
+    ) -> list[tuple[float, str, dict[str, str]]]:
+        """
+        질의 벡터와 코사인 유사도 상위 n건을 반환한다.
+
+        Args:
+            query_vector: 정규화된 질의 벡터
+            n_results: 최대 반환 개수
+            where: 메타데이터 동등 조건
+
+        Returns:
+            `(similarity, message_id, metadata)` 유사도 내림차순 목록
+        """
+        limit = max(0, int(n_results))
+        with self._lock:
+            if not self._ids or limit == 0:
+                return []
+            candidates = self._filter_rows(where=where)
+            if not candidates:
+                return []
+            query = _fit_dimension(values=query_vector, dim=self._dim)
+            numpy_module = load_numpy_module()
+            if numpy_module is not None:
+                scored = self._search_numpy(numpy_module, query=query, candidates=candidates, limit=limit)
+            else:
+                scored = self._search_python(query=query, candidates=candidates, limit=limit)
+            return [(score, self._ids[index], dict(self._metadatas[index])) for score, index in scored]
+
+    def _append_or_replace(self, rows: Iterable[tuple[str, dict[str, str], array]]) -> None:
+        """
+        행을 추가하거나 기존 id 행을 교체한다.
+
+        Args:
+            rows: `(message_id, metadata, embedding)` 목록
+        """
+        appended: list[array] = []
+        replaced: dict[int, array] = {}
+        existing = self.size
+        for message_id, metadata, embedding in rows:
+            if not self._dim:
+                self._dim = len(embedding)
+            vector = _fit_dimension(values=embedding, dim=self._dim)
+            index = self._row_index.get(message_id)
+            if index is None:
+                self._row_index[message_id] = len(self._ids)
+                self._ids.append(message_id)
+                self._metadatas.append(metadata)
+                appended.append(vector)
+                continue
+            self._metadatas[index] = metadata
+            if index >= existing:
+                appended[index - existing] = vector
+            else:
+                replaced[index] = vector
+        numpy_module = load_numpy_module()
+        if numpy_module is None:
+            for index, vector in replaced.items():
+                self._rows[index] = vector
+            self._rows.extend(appended)
+            return
+        self._apply_numpy_rows(numpy_module, appended=appended, replaced=replaced)
+
+    def _apply_numpy_rows(self, numpy_module: ModuleType, appended: list[array], replaced: dict[int, array]) -> None:
+        """
+        numpy 행렬에 교체/추가 행을 반영한다(용량은 2배씩 확장).
+
+        Args:
+            numpy_module: numpy 모듈
+            appended: 추가 행 목록
+            replaced: 교체 행 사전(index -> 벡터)
+        """
+        existing = self.size - len(appended)
+        capacity = 0 if self._matrix is None else int(self._matrix.shape[0])
+        if self._matrix is None or self.size > capacity:
+            grown = numpy_module.zeros((max(self.size, capacity * 2, 64), self._dim), dtype=numpy_module.float32)
+            if self._matrix is not None and existing:
+                grown[:existing] = self._matrix[:existing]
+            self._matrix = grown
+        for index, vector in replaced.items():
+            self._matrix[index] = numpy_module.frombuffer(vector.tobytes(), dtype=numpy_module.float32)
+        if appended:
+            block = numpy_module.frombuffer(b"".join(vector.tobytes() for vector in appended), dtype=numpy_module.float32)
+            self._matrix[existing : self.size] = block.reshape(len(appended), self._dim)
+
+    def _filter_rows(self, where: dict[str, str] | None) -> list[int]:
+        """
+        메타데이터 조건을 만족하는 행 index를 반환한다.
+
+        Args:
+            where: 메타데이터 동등 조건
+
+        Returns:
+            조건이 없으면 전체 행 index, 있으면 일치 행 index 목록
+        """
+        if not where:
+            return list(range(self.size))
+        expected = {str(key): str(value) for key, value in where.items()}
+        return [
+            index
+            for index, metadata in enumerate(self._metadatas)
+            if all(str(metadata.get(key, "")) == value for key, value in expected.items())
+        ]
+
+    def _search_numpy(
+        self,
+        numpy_module: ModuleType,
+        query: array,
+        candidates: list[int],
+        limit: int,
+    ) -> list[tuple[float, int]]:
+        """
+        행렬-벡터 곱 1회와 `argpartition`으로 top-k를 계산한다.
+
+        Args:
+            numpy_module: numpy 모듈
+            query: 질의 벡터
+            candidates: 검색 대상 행 index
+            limit: 최대 반환 개수
+
+        Returns:
+            `(similarity, row_index)` 유사도 내림차순 목록
+        """
+        query_array = numpy_module.frombuffer(query.tobytes(), dtype=numpy_module.float32)
+        if len(candidates) == self.size:
+            row_indexes = numpy_module.arange(self.size)
+            scores = self._matrix[: self.size] @ query_array
+        else:
+            row_indexes = numpy_module.asarray(candidates, dtype=numpy_module.int64)
+            scores = self._matrix[row_indexes] @ query_array
+        top_count = min(limit, int(scores.shape[0]))
+        if top_count < int(scores.shape[0]):
+            top = numpy_module.argpartition(-scores, top_count - 1)[:top_count]
+        else:
+            top = numpy_module.arange(int(scores.shape[0]))
+        ordered = top[numpy_module.argsort(-scores[top], kind="stable")]
+        return [(float(scores[position]), int(row_indexes[position])) for position in ordered]
+
+    def _search_python(self, query: array, candidates: list[int], limit: int) -> list[tuple[float, int]]:
+        """
+        numpy 미설치 환경에서 순수 Python 내적으로 top-k를 계산한다.
+
+        Args:
+            query: 질의 벡터
+            candidates: 검색 대상 행 index
+            limit: 최대 반환 개수
+
+        Returns:
+            `(similarity, row_index)` 유사도 내림차순 목록
+        """
+        scored = ((sum(map(operator.mul, self._rows[index], query)), index) for index in candidates)
+        return heapq.nlargest(limit, scored, key=lambda item: item[0])
+
+
+def _fit_dimension(values: Iterable[float], dim: int) -> array:
+    """
+    벡터를 행렬 차원에 맞게 자르거나 0으로 채운다.
+
+    Args:
+        values: 입력 벡터
+        dim: 목표 차원 수
+
+    Returns:
+        float32 배열
+    """
+    vector = values if isinstance(values, array) and values.typecode == "f" else array("f", values)
+    if len(vector) == dim:
+        return vector
+    if len(vector) > dim:
+        return vector[:dim]
+    return vector + array("f", [0.0] * (dim - len(vector)))
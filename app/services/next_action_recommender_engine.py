@@ -215,6 +215,7 @@ def _select_actions_with_llm(
             user_prompt=user_prompt,
             timeout_sec=ACTION_SELECTOR_TIMEOUT_SEC,
             temperature=0.0,
+            response_cache=True,
         )
     except (ValueError, RuntimeError, TypeError) as exc:
         logger.warning("next_action_recommender.selector_failed: %s", exc)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 import re
+import threading
 from urllib.parse import urlparse
 
 import httpx
@@ -23,6 +24,8 @@ CODE_REVIEW_INCLUDE_DOMAINS = [
     "docs.oracle.com",
     "learn.microsoft.com",
 ]
+_HTTP_CLIENT: httpx.Client | None = None
+_HTTP_CLIENT_LOCK = threading.Lock()
 
 
 def should_search_web_sources(
@@ -128,7 +131,7 @@ def search_web_sources(
     if include_domains:
         payload["include_domains"] = include_domains
     try:
-        response = httpx.post(TAVILY_SEARCH_URL, json=payload, timeout=TAVILY_TIMEOUT_SECONDS)
+        response = _get_http_client().post(TAVILY_SEARCH_URL, json=payload, timeout=TAVILY_TIMEOUT_SECONDS)
         response.raise_for_status()
     except Exception as exc:
         logger.warning("web_source_search.tavily_request_failed: %s", exc)
@@ -137,6 +140,20 @@ def search_web_sources(
     return _normalize_tavily_results(results=data.get("results"), max_results=max_results)
 
 
+def _get_http_client() -> httpx.Client:
+    """
+    Tavily 호출에 재사용할 keep-alive HTTP 클라이언트를 반환한다.
+
+    Returns:
+        프로세스 공유 httpx 클라이언트
+    """
+    global _HTTP_CLIENT
+    with _HTTP_CLIENT_LOCK:
+        if _HTTP_CLIENT is None:
+            _HTTP_CLIENT = httpx.Client(limits=httpx.Limits(max_connections=8, max_keepalive_connections=4))
+        return _HTTP_CLIENT
+
+
 def build_web_search_query(
     user_message: str,
     intent_task_type: str = "",
@@ -61,6 +61,10 @@
           onToken(parsed.data || {});
           return;
         }
+        if (parsed.event === 'replace' && typeof onToken === 'function') {
+          onToken(Object.assign({}, parsed.data || {}, { replace: true }));
+          return;
+        }
         if (parsed.event === 'completed') {
           completedPayload = parsed.data || null;
         }
@@ -192,8 +192,13 @@
           null,
           function handleToken(tokenEvent) {
             const tokenText = String(tokenEvent && tokenEvent.text ? tokenEvent.text : '');
-            if (!tokenText) return;
-            streamedText += tokenText;
+            if (tokenEvent && tokenEvent.replace) {
+              streamedText = tokenText;
+            } else if (tokenText) {
+              streamedText += tokenText;
+            } else {
+              return;
+            }
             if (messageUi && typeof messageUi.updateStreamingAssistantMessage === 'function') {
               messageUi.updateStreamingAssistantMessage(streamedText);
             }
@@ -11,6 +11,7 @@ ROOT_DIR = Path(__file__).resolve().parents[1]
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
+from app.services.mail_vector_document import MailVectorDocument
 from app.services.mail_vector_index_service import MailVectorIndexService
 
 
@@ -24,6 +25,12 @@ def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Backfill mail vector index from emails.db")
     parser.add_argument("--db-path", type=Path, default=ROOT_DIR / "data" / "sqlite" / "emails.db")
     parser.add_argument("--vector-dir", type=Path, default=None)
+    parser.add_argument("--chunk-size", type=int, default=None)
+    parser.add_argument(
+        "--reset",
+        action="store_true",
+        help="Clear the collection and stamp the current embedding version before reindexing",
+    )
     return parser.parse_args()
 
 
@@ -38,25 +45,32 @@ def main() -> int:
     if args.vector_dir is not None:
         os.environ["MOLDUBOT_MAIL_VECTOR_DIR"] = str(args.vector_dir)
     service = MailVectorIndexService()
-    indexed = backfill_vectors(db_path=args.db_path, service=service)
+    reset = bool(args.reset or service.is_reindex_required())
+    if reset:
+        service.reset_index()
+    indexed = backfill_vectors(db_path=args.db_path, service=service, chunk_size=args.chunk_size)
+    status = service.get_status()
     payload = {
         "db_path": str(args.db_path),
-        "vector_dir": str(args.vector_dir or service.get_status().persist_dir),
+        "vector_dir": str(args.vector_dir or status.persist_dir),
         "indexed": indexed,
-        "backend": service.get_status().backend,
+        "backend": status.backend,
+        "embedding_version": status.embedding_version,
+        "reset": reset,
     }
     json.dump(payload, sys.stdout, ensure_ascii=False)
     sys.stdout.write("\n")
     return 0
 
 
-def backfill_vectors(db_path: Path, service: MailVectorIndexService) -> int:
+def backfill_vectors(db_path: Path, service: MailVectorIndexService, chunk_size: int | None = None) -> int:
     """
-    emails 테이블 전건을 벡터 인덱스로 upsert한다.
+    emails 테이블 전건을 벡터 인덱스로 일괄 upsert한다.
 
     Args:
         db_path: source emails DB 경로
         service: 벡터 인덱스 서비스
+        chunk_size: upsert 청크 크기(미지정 시 서비스 기본값)
 
     Returns:
         upsert 성공 건수
@@ -72,9 +86,8 @@ def backfill_vectors(db_path: Path, service: MailVectorIndexService) -> int:
         ).fetchall()
     finally:
         connection.close()
-    indexed = 0
-    for row in rows:
-        if service.upsert_mail_document(
+    documents = [
+        MailVectorDocument(
             message_id=str(row[0] or ""),
             subject=str(row[1] or ""),
             body_text=str(row[2] or ""),
@@ -82,10 +95,10 @@ def backfill_vectors(db_path: Path, service: MailVectorIndexService) -> int:
             category=str(row[4] or ""),
             from_address=str(row[5] or ""),
             received_date=str(row[6] or ""),
-        ):
-            indexed += 1
-    return indexed
-
+        )
+        for row in rows
+    ]
+    return service.upsert_many(documents=documents, chunk_size=chunk_size)
 
 if __name__ == "__main__":
     raise SystemExit(main())
@@ -29,6 +29,12 @@ def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Process mail summary queue jobs")
     parser.add_argument("--db-path", default="data/sqlite/emails.db", help="SQLite DB path")
     parser.add_argument("--max-jobs", type=int, default=100, help="Max queue jobs per run")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="Concurrent summarizations (default: MOLDUBOT_SUMMARY_WORKER_CONCURRENCY or 1)",
+    )
     return parser.parse_args()
 
 
@@ -38,10 +44,11 @@ def main() -> None:
     """
     args = parse_args()
     worker = MailSummaryQueueWorker(db_path=Path(str(args.db_path)))
-    result = worker.process_many(max_jobs=int(args.max_jobs))
+    result = worker.process_many(max_jobs=int(args.max_jobs), concurrency=args.concurrency)
     payload = {
         "db_path": str(args.db_path),
         "max_jobs": int(args.max_jobs),
+        "concurrency": args.concurrency,
         "result": {
             "processed": result.processed,
             "failed": result.failed,
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from app.services.mail_search_fts import (
+    MAIL_SEARCH_FTS_TABLE,
+    MAIL_SEARCH_FTS_WORD_TABLE,
+    rebuild_mail_search_fts_index,
+)
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    메일 검색 FTS 인덱스 재생성 스크립트 인자를 파싱한다.
+
+    Returns:
+        파싱된 인자 객체
+    """
+    parser = argparse.ArgumentParser(description="Rebuild emails FTS5 search index")
+    parser.add_argument("--db-path", type=Path, default=ROOT_DIR / "data" / "sqlite" / "emails.db")
+    return parser.parse_args()
+
+
+def main() -> int:
+    """
+    emails 테이블 전건으로 FTS5 shadow 테이블과 동기화 트리거를 재생성한다.
+
+    Returns:
+        프로세스 종료 코드
+    """
+    args = parse_args()
+    payload: dict[str, object] = {
+        "db_path": str(args.db_path),
+        "table": MAIL_SEARCH_FTS_TABLE,
+        "word_table": MAIL_SEARCH_FTS_WORD_TABLE,
+        "indexed": 0,
+    }
+    exit_code = 0
+    if not args.db_path.exists():
+        payload["error"] = "db_not_found"
+        exit_code = 1
+    else:
+        connection = sqlite3.connect(str(args.db_path))
+        try:
+            payload["indexed"] = rebuild_mail_search_fts_index(conn=connection)
+        except sqlite3.OperationalError as exc:
+            payload["error"] = f"fts5_unavailable: {exc}"
+            exit_code = 1
+        finally:
+            connection.close()
+    json.dump(payload, sys.stdout, ensure_ascii=False)
+    sys.stdout.write("\n")
+    return exit_code
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -20,21 +20,30 @@ def parse_args() -> argparse.Namespace:
     Returns:
         파싱된 네임스페이스
     """
-    parser = argparse.ArgumentParser(description="Sync recent mail from Microsoft Graph into emails.db.")
+    parser = argparse.ArgumentParser(description="Sync mail from Microsoft Graph into emails.db.")
     parser.add_argument(
         "--db-path",
         type=Path,
         default=ROOT_DIR / "data" / "sqlite" / "emails.db",
         help="SQLite database path",
     )
-    parser.add_argument("--limit", type=int, default=20, help="Maximum number of messages to fetch")
+    parser.add_argument(
+        "--mode",
+        choices=("delta", "recent", "hydrate"),
+        default="delta",
+        help="delta: incremental sync via messages/delta, recent: fetch latest N messages, "
+        "hydrate: refetch up to --limit mails missing body_full via $batch",
+    )
+    parser.add_argument("--folder", default="inbox", help="Mail folder id or well-known name for delta mode")
+    parser.add_argument("--page-size", type=int, default=50, help="Messages per delta page")
+    parser.add_argument("--limit", type=int, default=20, help="Maximum number of messages for recent/hydrate mode")
     parser.add_argument("--dry-run", action="store_true", help="Print config only without Graph call")
     return parser.parse_args()
 
 
 def main() -> int:
     """
-    최근 Graph 메일 sync를 실행하고 JSON 결과를 출력한다.
+    Graph 메일 sync(delta/최근 N건/본문 누락 보강)를 실행하고 JSON 결과를 출력한다.
 
     Returns:
         종료 코드
@@ -44,6 +53,7 @@ def main() -> int:
     if args.dry_run:
         payload = {
             "db_path": str(args.db_path),
+            "mode": args.mode,
             "limit": int(args.limit),
             "dry_run": True,
             "graph_configured": client.is_configured(),
@@ -51,9 +61,18 @@ def main() -> int:
         json.dump(payload, sys.stdout, ensure_ascii=False, indent=2)
         sys.stdout.write("\n")
         return 0
-    result = MailSyncService(db_path=args.db_path, graph_client=client).sync_recent_messages(limit=args.limit)
+    # CLI는 곧 종료되므로 요약을 daemon thread에 넘기지 않고 DB summary queue에만 남긴다
+    # (`scripts/process_mail_summary_queue.py`가 처리).
+    service = MailSyncService(db_path=args.db_path, graph_client=client, summary_sync_on_upsert=False)
+    if args.mode == "delta":
+        result = service.sync_delta(folder_id=args.folder, page_size=args.page_size)
+    elif args.mode == "hydrate":
+        result = service.hydrate_missing_bodies(limit=args.limit)
+    else:
+        result = service.sync_recent_messages(limit=args.limit)
     payload = {
         "db_path": str(args.db_path),
+        "mode": args.mode,
         "limit": int(args.limit),
         "dry_run": False,
         **result.as_dict(),
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+
+@dataclass
+class FakeGraphResponse:
+    """
+    fake Graph 서버가 돌려줄 응답 1건.
+
+    Attributes:
+        status: HTTP 상태 코드
+        body: JSON 본문
+        headers: 추가 응답 헤더
+        delay_sec: 응답 전 대기(초, 동시성 테스트용)
+    """
+
+    status: int = 200
+    body: Any = field(default_factory=dict)
+    headers: dict[str, str] = field(default_factory=dict)
+    delay_sec: float = 0.0
+
+
+@dataclass
+class FakeGraphRequest:
+    """
+    fake Graph 서버가 받은 요청 기록.
+
+    Attributes:
+        method: HTTP 메서드
+        path: 쿼리 문자열을 포함한 경로
+        headers: 요청 헤더
+        body: JSON 본문(없으면 None)
+        client_port: 클라이언트 소켓 포트(keep-alive 재사용 확인용)
+    """
+
+    method: str
+    path: str
+    headers: dict[str, str]
+    body: Any
+    client_port: int
+
+
+class FakeGraphServer:
+    """
+    오프라인 테스트용 로컬 Microsoft Graph 모의 서버.
+
+    `(METHOD, 경로)`별로 응답을 순서대로 등록하고, 등록한 응답을 다 쓰면 마지막 응답을 반복한다.
+    등록되지 않은 경로는 404 Graph 에러를 반환한다. `with` 블록으로 시작/종료한다.
+    """
+
+    def __init__(self) -> None:
+        """서버 상태를 초기화한다(포트는 시작 시 OS가 할당)."""
+        self.requests: list[FakeGraphRequest] = []
+        self.max_in_flight = 0
+        self._responses: dict[tuple[str, str], deque[FakeGraphResponse]] = defaultdict(deque)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        """서버 기본 URL(`http://127.0.0.1:<port>`)."""
+        if self._server is None:
+            raise RuntimeError("FakeGraphServer is not started")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def enqueue(self, method: str, path: str, *responses: FakeGraphResponse) -> None:
+        """
+        경로별 응답을 순서대로 등록한다.
+
+        Args:
+            method: HTTP 메서드
+            path: 쿼리 문자열을 제외한 경로(예: `/v1.0/me/messages`)
+            responses: 순서대로 반환할 응답
+        """
+        with self._lock:
+            self._responses[(method.upper(), path)].extend(responses)
+
+    def __enter__(self) -> "FakeGraphServer":
+        """서버 thread를 시작한다."""
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._build_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """서버를 종료한다."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def _next_response(self, method: str, path: str) -> FakeGraphResponse:
+        """
+        요청에 맞는 다음 응답을 꺼낸다.
+
+        Args:
+            method: HTTP 메서드
+            path: 쿼리 문자열을 제외한 경로
+
+        Returns:
+            반환할 응답
+        """
+        with self._lock:
+            queue = self._responses.get((method, path))
+            if not queue:
+                return FakeGraphResponse(status=404, body={"error": {"code": "ResourceNotFound", "message": path}})
+            return queue.popleft() if len(queue) > 1 else queue[0]
+
+    def _build_handler(self) -> type[BaseHTTPRequestHandler]:
+        """
+        요청 처리기 클래스를 만든다.
+
+        Returns:
+            이 서버 상태를 참조하는 요청 처리기 클래스
+        """
+        server = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:  # noqa: N802
+                self._handle()
+
+            def do_POST(self) -> None:  # noqa: N802
+                self._handle()
+
+            def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+                del format, args
+
+            def _handle(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                raw_body = self.rfile.read(length) if length else b""
+                body = json.loads(raw_body) if raw_body else None
+                path = self.path.split("?", 1)[0]
+                with server._lock:
+                    server.requests.append(
+                        FakeGraphRequest(
+                            method=self.command,
+                            path=self.path,
+                            headers=dict(self.headers.items()),
+                            body=body,
+                            client_port=int(self.client_address[1]),
+                        )
+                    )
+                    server._in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server._in_flight)
+                response = server._next_response(method=self.command, path=path)
+                try:
+                    if response.delay_sec:
+                        time.sleep(response.delay_sec)
+                    payload = json.dumps(response.body).encode("utf-8")
+                    self.send_response(response.status)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(payload)))
+                    for name, value in response.headers.items():
+                        self.send_header(name, value)
+                    self.end_headers()
+                    self.wfile.write(payload)
+                finally:
+                    with server._lock:
+                        server._in_flight -= 1
+
+        return _Handler
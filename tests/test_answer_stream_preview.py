@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import unittest
+
+from app.services.answer_stream_preview import AnswerStreamPreview
+
+
+class AnswerStreamPreviewTest(unittest.TestCase):
+    """모델 delta 미리보기 변환 규칙을 검증한다."""
+
+    def test_plain_text_deltas_pass_through(self) -> None:
+        """일반 텍스트 응답은 선행 공백만 제외하고 delta를 그대로 전달해야 한다."""
+        emitted: list[str] = []
+        preview = AnswerStreamPreview(emit=emitted.append)
+        for delta in ["  ", "안녕", " 하세요\n", "끝"]:
+            preview.feed(delta)
+        self.assertEqual(["안녕", " 하세요\n", "끝"], emitted)
+        self.assertTrue(preview.has_output)
+
+    def test_json_contract_emits_completed_fields_as_lines(self) -> None:
+        """JSON 계약 응답은 원문 대신 완성된 주요 필드를 줄 단위로 전달해야 한다."""
+        raw = (
+            '{"format_type":"standard_summary","title":"보안 \\"점검\\"",'
+            '"summary_lines":["첫 줄","둘째, 줄"],"suggested_action_ids":["create_todo"],'
+            '"major_points":[{"point":"무시"}]}'
+        )
+        emitted: list[str] = []
+        preview = AnswerStreamPreview(emit=emitted.append)
+        for index in range(0, len(raw), 7):
+            preview.feed(raw[index : index + 7])
+        self.assertEqual(['보안 "점검"', "\n- 첫 줄", "\n- 둘째, 줄"], emitted)
+
+    def test_json_without_preview_fields_emits_nothing(self) -> None:
+        """미리보기 대상 필드가 없으면 출력하지 않아야 한다."""
+        emitted: list[str] = []
+        preview = AnswerStreamPreview(emit=emitted.append)
+        preview.feed('{"format_type":"general","suggested_action_ids":["web_search"]}')
+        self.assertEqual([], emitted)
+        self.assertFalse(preview.has_output)
+
+    def test_reset_restarts_mode_detection(self) -> None:
+        """reset 이후에는 이전 JSON 상태 없이 새 응답의 형식을 다시 판별해야 한다."""
+        emitted: list[str] = []
+        preview = AnswerStreamPreview(emit=emitted.append)
+        preview.feed('{"title":"첫 시도","summary_lines":["미완')
+        preview.reset()
+        self.assertFalse(preview.has_output)
+        preview.feed("재시도 답변")
+        self.assertEqual(["첫 시도", "재시도 답변"], emitted)
+
+
+if __name__ == "__main__":
+    unittest.main()
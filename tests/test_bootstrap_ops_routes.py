@@ -7,7 +7,7 @@ from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from app.api.bootstrap_ops_routes import _CODE7000_SUPPRESSION_COUNTS, router
-from app.services.mail_sync_service import MailSyncResult
+from app.services.mail_sync_service import MailDeltaSyncResult, MailSyncResult
 
 
 class BootstrapOpsRoutesTest(unittest.TestCase):
@@ -90,6 +90,35 @@ class BootstrapOpsRoutesTest(unittest.TestCase):
             response.json(),
         )
 
+    def test_mail_sync_delta_reports_incomplete_when_delta_link_missing(self) -> None:
+        """deltaLink까지 받지 못한 delta sync는 incomplete 상태로 반환해야 한다."""
+        with (
+            patch("app.api.bootstrap_ops_routes.GraphMailClient"),
+            patch("app.api.bootstrap_ops_routes.MailSyncService") as sync_service_cls,
+        ):
+            sync_service_cls.return_value.sync_delta.return_value = MailDeltaSyncResult(
+                fetched=3,
+                inserted=3,
+                updated=0,
+                deleted=0,
+                pages=1,
+                full_resync=False,
+                completed=False,
+            )
+            response = self.client.post("/ops/mail-sync/delta?folder=inbox&page_size=25")
+        self.assertEqual(200, response.status_code)
+        self.assertEqual("incomplete", response.json()["status"])
+        self.assertEqual(3, response.json()["result"]["inserted"])
+        sync_service_cls.return_value.sync_delta.assert_called_once_with(folder_id="inbox", page_size=25)
+
+    def test_graph_transport_stats_returns_tenant_metrics(self) -> None:
+        """Graph 전송 계층 지표를 tenant 단위로 반환해야 한다."""
+        stats = {"common": {"mail.get_message": {"requests": 2, "throttled": 1}}}
+        with patch("app.api.bootstrap_ops_routes.get_graph_transport_stats", return_value=stats):
+            response = self.client.get("/ops/graph-transport/stats")
+        self.assertEqual(200, response.status_code)
+        self.assertEqual({"tenants": stats}, response.json())
+
 
 if __name__ == "__main__":
     unittest.main()
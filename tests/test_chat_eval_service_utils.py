@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import os
+import tempfile
 import unittest
+from pathlib import Path
 from unittest.mock import patch
 
+from app.core import llm_response_cache
+
 from app.services.chat_eval_service_utils import (
     build_default_judge_caller,
     build_judge_context,
@@ -42,6 +47,30 @@ class ChatEvalServiceUtilsTest(unittest.TestCase):
         self.assertFalse(parsed["pass"])
         self.assertIn("judge_parse_error", parsed["reason"])
 
+    def test_judge_response_cache_stores_only_parsed_responses(self) -> None:
+        """응답 캐시는 파싱 실패 응답을 저장하지 않고, 파싱된 응답만 재사용해야 한다."""
+        valid = '{"pass": true, "score": 4, "reason": "ok", "checks": {}}'
+        llm_response_cache._CACHE_REGISTRY.clear()
+        self.addCleanup(llm_response_cache._CACHE_REGISTRY.clear)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            env = {
+                "MOLDUBOT_LLM_RESPONSE_CACHE_ENABLED": "1",
+                "MOLDUBOT_LLM_RESPONSE_CACHE_PATH": str(Path(tmp_dir) / "llm_cache.db"),
+            }
+            judge = build_default_judge_caller(judge_model="gpt-5-mini")
+            with patch.dict(os.environ, env, clear=False), patch(
+                "app.services.chat_eval_service_utils.invoke_text_messages",
+                side_effect=["not-json", valid],
+            ) as invoke_mock:
+                failed, _ = judge("q", "a", "e", "s", {})
+                passed, _ = judge("q", "a", "e", "s", {})
+                cached, _ = judge("q", "a", "e", "s", {})
+            llm_response_cache._CACHE_REGISTRY.clear()
+        self.assertIn("judge_parse_error", failed["reason"])
+        self.assertTrue(passed["pass"])
+        self.assertEqual(passed, cached)
+        self.assertEqual(2, invoke_mock.call_count)
+
     def test_extract_evidence_top_k_uses_fallback_snippet_fields(self) -> None:
         """snippet이 비어 있으면 summary/body 필드 순서로 fallback해야 한다."""
         metadata = {
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import unittest
 
-from app.agents.deep_chat_agent_utils import extract_assistant_text
+from types import SimpleNamespace
+
+from app.agents.deep_chat_agent_utils import extract_assistant_text, stream_graph_turn
 
 
 class DeepChatAgentUtilsTest(unittest.TestCase):
@@ -27,6 +29,31 @@ class DeepChatAgentUtilsTest(unittest.TestCase):
         }
         self.assertEqual("대상 시스템 요약", extract_assistant_text(result=result))
 
+    def test_stream_graph_turn_forwards_top_level_deltas_and_merges_interrupts(self) -> None:
+        """
+        최상위 agent delta만 전달하고, 인터럽트는 최종 state에 합쳐 invoke 결과와 같아야 한다.
+        """
+        top_meta = {"langgraph_checkpoint_ns": "model:1"}
+        nested_meta = {"langgraph_checkpoint_ns": "tools:1|model:2"}
+
+        class _FakeGraph:
+            def stream(self, payload: object, config: dict[str, object], stream_mode: list[str]) -> object:
+                self.call = (payload, config, stream_mode)
+                yield "messages", (SimpleNamespace(type="AIMessageChunk", content="안녕"), top_meta)
+                yield "messages", (SimpleNamespace(type="AIMessageChunk", content="내부"), nested_meta)
+                yield "messages", (SimpleNamespace(type="tool", content="tool 결과"), top_meta)
+                yield "messages", (SimpleNamespace(type="AIMessageChunk", content=[{"type": "text", "text": " 하세요"}]), top_meta)
+                yield "values", {"messages": ["m1"]}
+                yield "updates", {"__interrupt__": ["approval"]}
+                yield "values", {"messages": ["m1", "m2"]}
+
+        graph = _FakeGraph()
+        deltas: list[str] = []
+        result = stream_graph_turn(graph=graph, payload={"messages": []}, config={"k": 1}, delta_callback=deltas.append)
+        self.assertEqual(["안녕", " 하세요"], deltas)
+        self.assertEqual({"messages": ["m1", "m2"], "__interrupt__": ["approval"]}, result)
+        self.assertEqual(["messages", "updates", "values"], graph.call[2])
+
 
 if __name__ == "__main__":
     unittest.main()
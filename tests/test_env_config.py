@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import os
+import unittest
+from unittest.mock import patch
+
+from app.core.env_config import resolve_non_negative_int_env, resolve_positive_int_env
+
+_ENV_NAME = "MOLDUBOT_TEST_ENV_CONFIG_VALUE"
+
+
+class EnvConfigTest(unittest.TestCase):
+    """공용 정수 환경변수 해석 규칙을 검증한다."""
+
+    def test_positive_int_env_falls_back_on_missing_invalid_or_non_positive(self) -> None:
+        """미설정/정수 아님/0 이하 값은 기본값으로 대체해야 한다."""
+        with patch.dict(os.environ, {}, clear=False):
+            os.environ.pop(_ENV_NAME, None)
+            self.assertEqual(7, resolve_positive_int_env(_ENV_NAME, 7))
+        for raw in ("abc", "0", "-3", "  "):
+            with patch.dict(os.environ, {_ENV_NAME: raw}, clear=False):
+                self.assertEqual(7, resolve_positive_int_env(_ENV_NAME, 7))
+        with patch.dict(os.environ, {_ENV_NAME: " 12 "}, clear=False):
+            self.assertEqual(12, resolve_positive_int_env(_ENV_NAME, 7))
+
+    def test_non_negative_int_env_accepts_zero(self) -> None:
+        """0은 허용하고 음수/정수 아님 값만 기본값으로 대체해야 한다."""
+        with patch.dict(os.environ, {_ENV_NAME: "0"}, clear=False):
+            self.assertEqual(0, resolve_non_negative_int_env(_ENV_NAME, 5))
+        for raw in ("-1", "1.5"):
+            with patch.dict(os.environ, {_ENV_NAME: raw}, clear=False):
+                self.assertEqual(5, resolve_non_negative_int_env(_ENV_NAME, 5))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import os
+import unittest
+from unittest.mock import patch
+
+from app.integrations.microsoft_graph import mail_client
+from app.integrations.microsoft_graph.graph_batch import GraphBatchRequest, send_graph_batch
+from app.integrations.microsoft_graph.graph_transport import reset_graph_transports
+from app.integrations.microsoft_graph.mail_client import GraphMailClient
+from tests.fixtures.fake_graph_server import FakeGraphResponse, FakeGraphServer
+
+
+def _batch_body(items: list[tuple[str, int, dict[str, object]]]) -> dict[str, object]:
+    """`$batch` 응답 본문을 만든다."""
+    return {"responses": [{"id": request_id, "status": status, "headers": {}, "body": body} for request_id, status, body in items]}
+
+
+class GraphBatchTest(unittest.TestCase):
+    """
+    fake Graph 서버로 `$batch` 묶음 전송/throttle 재전송/메일 일괄 조회를 검증한다.
+    """
+
+    def tearDown(self) -> None:
+        """공유 전송 계층을 정리한다."""
+        reset_graph_transports()
+
+    def test_requests_are_chunked_by_twenty_and_throttled_items_are_resent(self) -> None:
+        """
+        25건은 20+5건 두 번으로 묶고, 429 하위 응답만 Retry-After 뒤 다시 보내야 한다.
+        """
+        requests_ = [GraphBatchRequest(request_id=str(index), url=f"/me/messages/m-{index}") for index in range(25)]
+        first_chunk = [(str(index), 200, {"id": f"m-{index}"}) for index in range(20)]
+        first_chunk[3] = ("3", 429, {})
+        sleeps: list[float] = []
+        with FakeGraphServer() as server:
+            server.enqueue(
+                "POST",
+                "/v1.0/$batch",
+                FakeGraphResponse(body=_batch_body(first_chunk)),
+                FakeGraphResponse(body=_batch_body([(str(index), 200, {"id": f"m-{index}"}) for index in range(20, 25)])),
+                FakeGraphResponse(body=_batch_body([("3", 200, {"id": "m-3"})])),
+            )
+            result = send_graph_batch(f"{server.base_url}/v1.0/$batch", "token", requests_, sleep=sleeps.append)
+            sent_sizes = [len(request.body["requests"]) for request in server.requests]
+        self.assertEqual(200, result.status_code)
+        self.assertEqual([20, 5, 1], sent_sizes)
+        self.assertEqual(25, len(result.responses))
+        self.assertTrue(all(response.status == 200 for response in result.responses.values()))
+        self.assertEqual([1.0], sleeps)
+
+    def test_outer_failure_stops_and_reports_status(self) -> None:
+        """
+        바깥 `$batch` 요청이 실패하면 중단하고 실패 상태를 반환해야 한다.
+        """
+        with FakeGraphServer() as server:
+            server.enqueue("POST", "/v1.0/$batch", FakeGraphResponse(status=400, body={"error": {"code": "BadRequest"}}))
+            result = send_graph_batch(
+                f"{server.base_url}/v1.0/$batch",
+                "token",
+                [GraphBatchRequest(request_id="0", url="/me/messages/m-0")],
+            )
+        self.assertEqual(400, result.status_code)
+        self.assertEqual({}, result.responses)
+
+    def test_mail_client_get_messages_uses_single_batch_round_trip(self) -> None:
+        """
+        여러 메일 조회는 `$batch` 1회로 처리하고 찾지 못한 메일은 결과에서 제외해야 한다.
+        """
+        with FakeGraphServer() as server:
+            server.enqueue(
+                "POST",
+                "/v1.0/$batch",
+                FakeGraphResponse(
+                    body=_batch_body(
+                        [
+                            ("0", 200, {"id": "m-1", "subject": "첫 메일", "body": {"contentType": "text", "content": "본문1"}}),
+                            ("1", 404, {"error": {"code": "ErrorItemNotFound"}}),
+                        ]
+                    )
+                ),
+            )
+            with (
+                patch.dict(os.environ, {"MICROSOFT_APP_ID": "client-id"}, clear=False),
+                patch.object(mail_client, "GRAPH_BASE_URL", f"{server.base_url}/v1.0"),
+            ):
+                client = GraphMailClient()
+                with patch.object(client, "_acquire_access_token", return_value="token"):
+                    messages = client.get_messages(["m-1", "m-missing", "m-1"])
+            sub_requests = server.requests[0].body["requests"]
+        self.assertEqual(["m-1"], list(messages))
+        self.assertEqual("본문1", messages["m-1"].body_text)
+        self.assertEqual(1, len(server.requests))
+        self.assertEqual(2, len(sub_requests))
+        self.assertTrue(sub_requests[1]["url"].startswith("/me/messages/m-missing?$select="))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -20,7 +20,7 @@ class GraphCalendarClientTest(unittest.TestCase):
             json=lambda: {"id": "event-1", "webLink": "https://outlook.live.com/event/1"},
         )
         with patch(
-            "app.integrations.microsoft_graph.calendar_client.requests.post",
+            "app.integrations.microsoft_graph.calendar_client.graph_post",
             return_value=fake_response,
         ):
             client = GraphCalendarClient(auth_client=auth_client)
@@ -54,15 +54,15 @@ class GraphCalendarClientTest(unittest.TestCase):
 
         captured_payload: dict[str, object] = {}
 
-        def fake_post(url, headers=None, json=None, timeout=10):  # type: ignore[no-untyped-def]
-            del url, headers, timeout
+        def fake_post(url, headers=None, json=None, endpoint="", timeout=None):  # type: ignore[no-untyped-def]
+            del url, headers, endpoint, timeout
             captured_payload.update(json or {})
             return types.SimpleNamespace(
                 status_code=201,
                 json=lambda: {"id": "event-2", "webLink": "https://outlook.live.com/event/2"},
             )
 
-        with patch("app.integrations.microsoft_graph.calendar_client.requests.post", side_effect=fake_post):
+        with patch("app.integrations.microsoft_graph.calendar_client.graph_post", side_effect=fake_post):
             client = GraphCalendarClient(auth_client=auth_client)
             _ = client.create_event(
                 subject="[일정] 점검 회의",
@@ -190,6 +190,19 @@ class GraphMailClientTest(unittest.TestCase):
         self.assertEqual("silent-token", token)
         app_mock.acquire_token_interactive.assert_not_called()
 
+    def test_acquire_access_token_without_interactive_returns_empty(self) -> None:
+        """
+        allow_interactive=False이면 캐시 토큰이 없을 때 로그인 창 없이 빈 문자열을 반환해야 한다.
+        """
+        with patch.dict(os.environ, {"MICROSOFT_APP_ID": "client-id"}, clear=False):
+            client = GraphMailClient()
+        app_mock = Mock()
+        app_mock.get_accounts.return_value = []
+        client._msal_app = app_mock
+        token = client._acquire_access_token(allow_interactive=False)
+        self.assertEqual("", token)
+        app_mock.acquire_token_interactive.assert_not_called()
+
     def test_acquire_access_token_logs_failure_when_interactive_fails(self) -> None:
         """
         silent/interactive 모두 실패하면 경고 로그를 남기고 빈 문자열을 반환해야 한다.
@@ -218,7 +231,7 @@ class GraphMailClientTest(unittest.TestCase):
             client = GraphMailClient()
         with patch.object(client, "_acquire_access_token", return_value="token"):
             with patch(
-                "app.integrations.microsoft_graph.mail_client.requests.get",
+                "app.integrations.microsoft_graph.mail_client.graph_get",
                 return_value=_FakeResponse(),
             ):
                 with self.assertLogs(
@@ -247,7 +260,7 @@ class GraphMailClientTest(unittest.TestCase):
             side_effect=["token-first", "token-refreshed"],
         ) as acquire_mock:
             with patch(
-                "app.integrations.microsoft_graph.mail_client.requests.get",
+                "app.integrations.microsoft_graph.mail_client.graph_get",
                 side_effect=[_FakeUnauthorizedResponse(), _FakeOkResponse()],
             ) as request_mock:
                 result = client.get_message(
@@ -271,7 +284,7 @@ class GraphMailClientTest(unittest.TestCase):
             side_effect=["token-first", "token-refreshed"],
         ) as acquire_mock:
             with patch(
-                "app.integrations.microsoft_graph.mail_client.requests.get",
+                "app.integrations.microsoft_graph.mail_client.graph_get",
                 side_effect=[_FakeUnauthorizedResponse(), _FakeUnauthorizedResponse()],
             ) as request_mock:
                 result = client.get_message(
@@ -290,7 +303,7 @@ class GraphMailClientTest(unittest.TestCase):
             client = GraphMailClient()
         with patch.object(client, "_acquire_access_token", return_value="token"):
             with patch(
-                "app.integrations.microsoft_graph.mail_client.requests.get",
+                "app.integrations.microsoft_graph.mail_client.graph_get",
                 return_value=_FakeListOkResponse(),
             ) as request_mock:
                 messages = client.list_recent_messages(limit=2)
@@ -311,7 +324,7 @@ class GraphMailClientTest(unittest.TestCase):
             side_effect=["token-first", "token-refreshed"],
         ) as acquire_mock:
             with patch(
-                "app.integrations.microsoft_graph.mail_client.requests.get",
+                "app.integrations.microsoft_graph.mail_client.graph_get",
                 side_effect=[_FakeUnauthorizedResponse(), _FakeListOkResponse()],
             ) as request_mock:
                 messages = client.list_recent_messages(limit=5)
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import os
+import re
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+
+from app.integrations.microsoft_graph.mail_delta_client import (
+    MAIL_DELTA_INITIAL_DAYS_ENV,
+    GraphMailDeltaClient,
+    GraphMailDeltaExpiredError,
+)
+
+
+class _FakeJsonResponse:
+    """
+    Graph HTTP 응답 더블.
+    """
+
+    def __init__(self, status_code: int, payload: dict[str, object]) -> None:
+        """상태 코드와 본문을 저장한다."""
+        self.status_code = status_code
+        self.headers: dict[str, str] = {}
+        self._payload = payload
+
+    def json(self) -> dict[str, object]:
+        """저장된 본문을 반환한다."""
+        return self._payload
+
+
+class GraphMailDeltaClientTest(unittest.TestCase):
+    """
+    Graph 메일 delta 클라이언트의 페이지 순회/삭제 파싱/만료 처리를 검증한다.
+    """
+
+    def setUp(self) -> None:
+        """토큰을 항상 반환하는 인증 클라이언트 더블을 만든다."""
+        self._auth_client = Mock()
+        self._auth_client.is_configured.return_value = True
+        self._auth_client.acquire_access_token.return_value = "token"
+        self._client = GraphMailDeltaClient(auth_client=self._auth_client)
+
+    def test_pages_follow_next_link_until_delta_link(self) -> None:
+        """
+        nextLink를 따라가며 변경/삭제를 나누고 마지막 페이지에서 deltaLink를 반환해야 한다.
+        """
+        responses = [
+            _FakeJsonResponse(
+                200,
+                {
+                    "value": [{"id": "m-1", "subject": "첫 메일"}, {"id": "m-0", "@removed": {"reason": "deleted"}}],
+                    "@odata.nextLink": "https://graph.example/next",
+                },
+            ),
+            _FakeJsonResponse(
+                200,
+                {"value": [{"id": "m-2", "subject": "두번째"}], "@odata.deltaLink": "https://graph.example/delta"},
+            ),
+        ]
+        with patch("app.integrations.microsoft_graph.mail_delta_client.graph_get", side_effect=responses) as mocked:
+            pages = list(self._client.iter_delta_pages(page_size=10))
+        self.assertEqual(2, len(pages))
+        self.assertEqual(["m-1"], [message.message_id for message in pages[0].messages])
+        self.assertEqual(["m-0"], pages[0].removed_message_ids)
+        self.assertEqual("", pages[0].delta_link)
+        self.assertEqual("https://graph.example/delta", pages[1].delta_link)
+        first_url = mocked.call_args_list[0].args[0]
+        self.assertIn("/me/mailFolders/inbox/messages/delta?$select=", first_url)
+        self.assertEqual("https://graph.example/next", mocked.call_args_list[1].args[0])
+        self.assertIn("odata.maxpagesize=10", mocked.call_args_list[0].kwargs["headers"]["Prefer"])
+
+    def test_gone_response_raises_expired_error(self) -> None:
+        """
+        저장된 deltaLink 요청이 410이면 만료 예외를 던져야 한다.
+        """
+        response = _FakeJsonResponse(410, {"error": {"code": "SyncStateNotFound"}})
+        with patch("app.integrations.microsoft_graph.mail_delta_client.graph_get", return_value=response):
+            with self.assertRaises(GraphMailDeltaExpiredError):
+                list(self._client.iter_delta_pages(delta_link="https://graph.example/delta"))
+
+    def test_failed_page_stops_without_delta_link(self) -> None:
+        """
+        중간 페이지가 실패하면 deltaLink 없이 순회를 멈춰야 한다.
+        """
+        responses = [
+            _FakeJsonResponse(200, {"value": [], "@odata.nextLink": "https://graph.example/next"}),
+            _FakeJsonResponse(503, {"error": {"code": "serviceNotAvailable"}}),
+        ]
+        with patch("app.integrations.microsoft_graph.mail_delta_client.graph_get", side_effect=responses):
+            pages = list(self._client.iter_delta_pages())
+        self.assertEqual(1, len(pages))
+        self.assertEqual("", pages[-1].delta_link)
+
+
+    def test_initial_url_is_bounded_by_received_date(self) -> None:
+        """
+        deltaLink 없는 초기 동기화는 최근 N일 수신 메일로 범위를 제한해야 한다.
+        """
+        with patch.dict(os.environ, {MAIL_DELTA_INITIAL_DAYS_ENV: "3"}, clear=False):
+            url = self._client._build_initial_url(folder_id="inbox")
+        match = re.search(r"\$filter=receivedDateTime%20ge%20(\S+Z)$", url)
+        self.assertIsNotNone(match)
+        assert match is not None
+        received_after = datetime.strptime(match.group(1), "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
+        expected = datetime.now(timezone.utc) - timedelta(days=3)
+        self.assertLess(abs((received_after - expected).total_seconds()), 60)
+
+    def test_initial_url_is_unbounded_when_days_is_zero(self) -> None:
+        """
+        초기 동기화 일수를 0으로 두면 폴더 전체를 받아야 한다.
+        """
+        with patch.dict(os.environ, {MAIL_DELTA_INITIAL_DAYS_ENV: "0"}, clear=False):
+            url = self._client._build_initial_url(folder_id="inbox")
+        self.assertNotIn("$filter", url)
+
+if __name__ == "__main__":
+    unittest.main()
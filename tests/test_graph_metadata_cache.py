@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import unittest
+
+from app.integrations.microsoft_graph.graph_metadata_cache import GraphMetadataCache
+
+
+class GraphMetadataCacheTest(unittest.TestCase):
+    """
+    Graph 메타데이터 TTL 캐시의 적재/만료/무효화를 검증한다.
+    """
+
+    def setUp(self) -> None:
+        """수동 시계를 쓰는 캐시를 만든다."""
+        self.now = 0.0
+        self.cache = GraphMetadataCache(ttl_sec=60, clock=lambda: self.now)
+
+    def test_get_or_load_calls_loader_once_until_expiry(self) -> None:
+        """
+        TTL 안에서는 loader를 다시 호출하지 않고, 만료 후에는 다시 조회해야 한다.
+        """
+        calls: list[int] = []
+
+        def loader() -> str:
+            calls.append(1)
+            return f"list-{len(calls)}"
+
+        self.assertEqual("list-1", self.cache.get_or_load("me", "todo", loader))
+        self.assertEqual("list-1", self.cache.get_or_load("me", "todo", loader))
+        self.now = 61.0
+        self.assertEqual("list-2", self.cache.get_or_load("me", "todo", loader))
+        self.assertEqual(2, len(calls))
+
+    def test_empty_value_is_not_cached(self) -> None:
+        """
+        조회 실패(빈 값)는 캐시하지 않아 다음 호출에서 다시 조회해야 한다.
+        """
+        values = iter(["", "list-1"])
+        self.assertEqual("", self.cache.get_or_load("me", "todo", lambda: next(values)))
+        self.assertEqual("list-1", self.cache.get_or_load("me", "todo", lambda: next(values)))
+
+    def test_invalidate_by_name_and_by_user(self) -> None:
+        """
+        이름 지정 무효화는 해당 항목만, 사용자 무효화는 그 사용자 항목 전체를 비워야 한다.
+        """
+        self.cache.set("me", "todo", "list-1")
+        self.cache.set("me", "upn", "user@example.com")
+        self.cache.set("other", "todo", "list-9")
+        self.cache.invalidate("me", "todo")
+        self.assertEqual("", self.cache.get("me", "todo"))
+        self.assertEqual("user@example.com", self.cache.get("me", "upn"))
+        self.cache.invalidate("me")
+        self.assertEqual("", self.cache.get("me", "upn"))
+        self.assertEqual("list-9", self.cache.get("other", "todo"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,12 +4,26 @@ import types
 import unittest
 from unittest.mock import MagicMock, patch
 
+from app.integrations.microsoft_graph.graph_metadata_cache import reset_graph_metadata_cache
 from app.integrations.microsoft_graph.todo_client import GraphTodoClient
 
 
+def _response(status_code: int, payload: dict[str, object]) -> types.SimpleNamespace:
+    """Graph HTTP 응답 더블을 만든다."""
+    return types.SimpleNamespace(status_code=status_code, json=lambda: payload, headers={})
+
+
 class GraphTodoClientTest(unittest.TestCase):
     """GraphTodoClient 동작을 검증한다."""
 
+    def setUp(self) -> None:
+        """테스트 간 기본 목록 캐시를 비운다."""
+        reset_graph_metadata_cache()
+
+    def tearDown(self) -> None:
+        """기본 목록 캐시를 비운다."""
+        reset_graph_metadata_cache()
+
     def test_create_task_success(self) -> None:
         auth_client = MagicMock()
         auth_client.is_configured.return_value = True
@@ -25,11 +39,11 @@ class GraphTodoClientTest(unittest.TestCase):
             headers={},
         )
         with patch(
-            "app.integrations.microsoft_graph.todo_client.requests.get",
+            "app.integrations.microsoft_graph.todo_client.graph_get",
             return_value=list_response,
         ):
             with patch(
-                "app.integrations.microsoft_graph.todo_client.requests.post",
+                "app.integrations.microsoft_graph.todo_client.graph_post",
                 return_value=task_response,
             ):
                 client = GraphTodoClient(auth_client=auth_client)
@@ -54,6 +68,60 @@ class GraphTodoClientTest(unittest.TestCase):
         )
         self.assertIsNone(task)
 
+    def test_default_list_id_is_cached_across_task_creations(self) -> None:
+        """두 번째 ToDo 생성부터는 목록 조회 없이 쓰기 요청만 보내야 한다."""
+        auth_client = MagicMock()
+        auth_client.is_configured.return_value = True
+        auth_client.acquire_access_token.return_value = "token-1"
+        with (
+            patch(
+                "app.integrations.microsoft_graph.todo_client.graph_get",
+                return_value=_response(200, {"value": [{"id": "list-1", "displayName": "Tasks"}]}),
+            ) as get_mock,
+            patch(
+                "app.integrations.microsoft_graph.todo_client.graph_post",
+                return_value=_response(201, {"id": "todo-1"}),
+            ) as post_mock,
+        ):
+            client = GraphTodoClient(auth_client=auth_client)
+            client.create_task(title="첫 작업", due_date="2026-03-05")
+            client.create_task(title="둘째 작업", due_date="2026-03-06")
+        self.assertEqual(1, get_mock.call_count)
+        self.assertEqual(2, post_mock.call_count)
+
+    def test_not_found_list_invalidates_cache_and_retries(self) -> None:
+        """캐시된 목록이 404이면 캐시를 비우고 목록을 다시 조회해 재시도해야 한다."""
+        auth_client = MagicMock()
+        auth_client.is_configured.return_value = True
+        auth_client.acquire_access_token.return_value = "token-1"
+        lists = [
+            _response(200, {"value": [{"id": "list-old", "displayName": "Tasks"}]}),
+            _response(200, {"value": [{"id": "list-new", "displayName": "Tasks"}]}),
+        ]
+        with (
+            patch("app.integrations.microsoft_graph.todo_client.graph_get", side_effect=lists),
+            patch(
+                "app.integrations.microsoft_graph.todo_client.graph_post",
+                side_effect=[_response(404, {"error": {"code": "ErrorItemNotFound"}}), _response(201, {"id": "todo-2"})],
+            ) as post_mock,
+        ):
+            task = GraphTodoClient(auth_client=auth_client).create_task(title="작업", due_date="2026-03-05")
+        self.assertEqual("todo-2", task.task_id if task else "")
+        self.assertIn("/lists/list-new/tasks", post_mock.call_args_list[1].args[0])
+
+    def test_warm_up_uses_silent_token_only(self) -> None:
+        """warm-up은 대화형 로그인 없이 캐시 토큰으로 기본 목록을 미리 적재해야 한다."""
+        auth_client = MagicMock()
+        auth_client.is_configured.return_value = True
+        auth_client.acquire_access_token.return_value = "token-1"
+        with patch(
+            "app.integrations.microsoft_graph.todo_client.graph_get",
+            return_value=_response(200, {"value": [{"id": "list-1", "displayName": "Tasks"}]}),
+        ):
+            warmed = GraphTodoClient(auth_client=auth_client).warm_up()
+        self.assertTrue(warmed)
+        auth_client.acquire_access_token.assert_called_once_with(allow_interactive=False)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import os
+import threading
+import unittest
+from unittest.mock import patch
+
+import requests
+
+from app.integrations.microsoft_graph import mail_client
+from app.integrations.microsoft_graph.graph_transport import (
+    GraphTransport,
+    parse_retry_after,
+    reset_graph_transports,
+)
+from app.integrations.microsoft_graph.mail_client import GraphMailClient
+from tests.fixtures.fake_graph_server import FakeGraphResponse, FakeGraphServer
+
+
+class GraphTransportTest(unittest.TestCase):
+    """
+    fake Graph 서버로 공유 전송 계층의 재시도/Retry-After/연결 재사용/동시성 제한을 검증한다.
+    """
+
+    def setUp(self) -> None:
+        """대기 시간을 기록만 하는 전송 계층을 만든다."""
+        self.sleeps: list[float] = []
+        self.transport = GraphTransport(
+            max_retries=2,
+            backoff_base_sec=0.2,
+            backoff_max_sec=1.0,
+            retry_after_max_sec=30,
+            sleep=self.sleeps.append,
+        )
+
+    def tearDown(self) -> None:
+        """세션과 공유 registry를 정리한다."""
+        self.transport.close()
+        reset_graph_transports()
+
+    def test_throttled_request_honors_retry_after_then_succeeds(self) -> None:
+        """
+        429 응답의 Retry-After만큼 기다린 뒤 재시도하고 지표에 throttle을 기록해야 한다.
+        """
+        with FakeGraphServer() as server:
+            server.enqueue(
+                "GET",
+                "/v1.0/me/messages",
+                FakeGraphResponse(status=429, headers={"Retry-After": "3"}),
+                FakeGraphResponse(status=200, body={"value": []}),
+            )
+            response = self.transport.request("GET", f"{server.base_url}/v1.0/me/messages", endpoint="mail.list")
+        self.assertEqual(200, response.status_code)
+        self.assertEqual([3.0], self.sleeps)
+        stats = self.transport.get_stats()["mail.list"]
+        self.assertEqual(2, stats["requests"])
+        self.assertEqual(1, stats["retries"])
+        self.assertEqual(1, stats["throttled"])
+
+    def test_gateway_errors_use_bounded_jittered_backoff_and_give_up(self) -> None:
+        """
+        Retry-After 없는 504는 상한 안의 backoff로 재시도하고, 재시도 소진 시 마지막 응답을 반환해야 한다.
+        """
+        with FakeGraphServer() as server:
+            server.enqueue("GET", "/v1.0/me/todo/lists", FakeGraphResponse(status=504))
+            response = self.transport.request("GET", f"{server.base_url}/v1.0/me/todo/lists", endpoint="todo.lists")
+            request_count = len(server.requests)
+        self.assertEqual(504, response.status_code)
+        self.assertEqual(3, request_count)
+        self.assertEqual(2, len(self.sleeps))
+        self.assertTrue(0.1 <= self.sleeps[0] <= 0.2)
+        self.assertTrue(0.2 <= self.sleeps[1] <= 0.4)
+
+    def test_post_is_not_retried_on_ambiguous_gateway_error(self) -> None:
+        """
+        비멱등 POST는 처리 여부가 불확실한 502에서 재시도하지 않아야 한다.
+        """
+        with FakeGraphServer() as server:
+            server.enqueue("POST", "/v1.0/me/events", FakeGraphResponse(status=502))
+            response = self.transport.request(
+                "POST",
+                f"{server.base_url}/v1.0/me/events",
+                endpoint="calendar.create_event",
+                json={"subject": "회의"},
+            )
+            request_count = len(server.requests)
+        self.assertEqual(502, response.status_code)
+        self.assertEqual(1, request_count)
+        self.assertEqual([], self.sleeps)
+
+    def test_retry_after_longer_than_limit_returns_response(self) -> None:
+        """
+        허용 상한보다 긴 Retry-After는 기다리지 않고 응답을 그대로 반환해야 한다.
+        """
+        with FakeGraphServer() as server:
+            server.enqueue("GET", "/v1.0/me/messages", FakeGraphResponse(status=503, headers={"Retry-After": "120"}))
+            response = self.transport.request("GET", f"{server.base_url}/v1.0/me/messages", endpoint="mail.list")
+        self.assertEqual(503, response.status_code)
+        self.assertEqual([], self.sleeps)
+
+    def test_network_error_is_raised_after_retries(self) -> None:
+        """
+        연결 실패가 계속되면 재시도 후 requests 예외를 그대로 던져야 한다.
+        """
+        with self.assertRaises(requests.RequestException):
+            self.transport.request("GET", "http://127.0.0.1:9/v1.0/me/messages", endpoint="mail.list", timeout=1)
+        self.assertEqual(2, len(self.sleeps))
+        stats = self.transport.get_stats()["mail.list"]
+        self.assertEqual(3, stats["errors"])
+        self.assertEqual(2, stats["retries"])
+
+    def test_connection_failure_retry_is_counted(self) -> None:
+        """
+        연결 실패 후 재시도해 성공하면 실패한 시도를 retries 지표에 기록해야 한다.
+        """
+        original_request = self.transport._session.request
+        outcomes: list[Exception | None] = [requests.ConnectionError("connection reset"), None]
+
+        def _flaky_request(*args, **kwargs):
+            error = outcomes.pop(0)
+            if error is not None:
+                raise error
+            return original_request(*args, **kwargs)
+
+        with FakeGraphServer() as server:
+            server.enqueue("GET", "/v1.0/me/messages", FakeGraphResponse(status=200, body={"value": []}))
+            with patch.object(self.transport._session, "request", side_effect=_flaky_request):
+                response = self.transport.request("GET", f"{server.base_url}/v1.0/me/messages", endpoint="mail.list")
+        self.assertEqual(200, response.status_code)
+        stats = self.transport.get_stats()["mail.list"]
+        self.assertEqual(2, stats["requests"])
+        self.assertEqual(1, stats["errors"])
+        self.assertEqual(1, stats["retries"])
+
+    def test_keep_alive_connection_is_reused(self) -> None:
+        """
+        연속 요청은 같은 keep-alive 연결(같은 클라이언트 포트)을 재사용해야 한다.
+        """
+        with FakeGraphServer() as server:
+            server.enqueue("GET", "/v1.0/me", FakeGraphResponse(status=200, body={"id": "me"}))
+            for _ in range(3):
+                self.transport.request("GET", f"{server.base_url}/v1.0/me", endpoint="me")
+            ports = {request.client_port for request in server.requests}
+        self.assertEqual(1, len(ports))
+
+    def test_concurrency_is_capped(self) -> None:
+        """
+        동시 요청 수는 max_concurrency를 넘지 않아야 한다.
+        """
+        transport = GraphTransport(max_concurrency=2, pool_size=4)
+        with FakeGraphServer() as server:
+            server.enqueue("GET", "/v1.0/me", FakeGraphResponse(status=200, delay_sec=0.1))
+            threads = [
+                threading.Thread(target=transport.request, args=("GET", f"{server.base_url}/v1.0/me"), kwargs={"endpoint": "me"})
+                for _ in range(6)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(timeout=5)
+            max_in_flight = server.max_in_flight
+        transport.close()
+        self.assertEqual(2, max_in_flight)
+
+    def test_parse_retry_after_supports_seconds_and_http_date(self) -> None:
+        """
+        Retry-After는 초 단위와 HTTP-date를 모두 해석해야 한다.
+        """
+        self.assertEqual(2.5, parse_retry_after("2.5"))
+        self.assertEqual(0.0, parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"))
+        self.assertIsNone(parse_retry_after("soon"))
+
+    def test_mail_client_uses_shared_transport_against_fake_server(self) -> None:
+        """
+        GraphMailClient 최근 메일 조회가 공유 전송 계층을 통해 throttle 후 재시도에 성공해야 한다.
+        """
+        with FakeGraphServer() as server:
+            server.enqueue(
+                "GET",
+                "/v1.0/me/messages",
+                FakeGraphResponse(status=429, headers={"Retry-After": "0"}),
+                FakeGraphResponse(status=200, body={"value": [{"id": "m-1", "subject": "제목"}]}),
+            )
+            with (
+                patch.dict(os.environ, {"MICROSOFT_APP_ID": "client-id"}, clear=False),
+                patch.object(mail_client, "GRAPH_BASE_URL", f"{server.base_url}/v1.0"),
+            ):
+                client = GraphMailClient()
+                with patch.object(client, "_acquire_access_token", return_value="token"):
+                    messages = client.list_recent_messages(limit=1)
+            authorization = server.requests[-1].headers.get("Authorization")
+        self.assertEqual(["m-1"], [message.message_id for message in messages])
+        self.assertEqual("Bearer token", authorization)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import unittest
+from unittest.mock import patch
+
+from app.agents.intent_near_duplicate import NearDuplicateIntentIndex, build_intent_query_signature
+from app.agents.intent_parser import IntentParser
+from app.agents.intent_schema import (
+    DateFilter,
+    DateFilterMode,
+    ExecutionStep,
+    IntentDecomposition,
+    IntentOutputFormat,
+    IntentTaskType,
+)
+
+
+def _summary(query: str, lines: int = 5, date_filter: DateFilter | None = None) -> IntentDecomposition:
+    """테스트용 요약 구조분해를 만든다."""
+    return IntentDecomposition(
+        original_query=query,
+        steps=[ExecutionStep.READ_CURRENT_MAIL, ExecutionStep.SUMMARIZE_MAIL],
+        summary_line_target=lines,
+        date_filter=date_filter or DateFilter(mode=DateFilterMode.NONE),
+        missing_slots=[],
+        task_type=IntentTaskType.SUMMARY,
+        output_format=IntentOutputFormat.LINE_SUMMARY,
+    )
+
+
+def _build_parser(index: NearDuplicateIntentIndex) -> IntentParser:
+    """LLM 경로를 타도록 fast-path를 끈 파서를 만든다."""
+    return IntentParser(model_name="gpt-4o-mini", base_url="", fast_path_mode="never", near_duplicate_index=index)
+
+
+class IntentQuerySignatureTest(unittest.TestCase):
+    """
+    질의 정규화 시그니처가 표기 차이를 흡수하는지 검증한다.
+    """
+
+    def test_spacing_particles_and_request_endings_share_signature(self) -> None:
+        """
+        띄어쓰기/조사/요청 어미만 다른 질의는 같은 시그니처여야 한다.
+        """
+        expected = build_intent_query_signature("현재메일 요약해줘").template
+        for variant in ("현재 메일 요약해 줘", "현재 메일을 요약해주세요", "현재메일 요약 부탁해요!"):
+            self.assertEqual(expected, build_intent_query_signature(variant).template)
+
+    def test_line_and_date_values_become_slots(self) -> None:
+        """
+        줄 수/날짜 값은 자리표시자로 바뀌고 추출 값은 슬롯으로 남아야 한다.
+        """
+        three = build_intent_query_signature("현재메일 3줄 요약해줘")
+        five = build_intent_query_signature("현재 메일을 5줄로 요약해 주세요")
+        self.assertEqual(three.template, five.template)
+        self.assertTrue(five.has_line_slot)
+        self.assertEqual(5, five.summary_line_target)
+        self.assertEqual(
+            build_intent_query_signature("2월 조영득 관련 메일 찾아줘").template,
+            build_intent_query_signature("3월 조영득 관련 메일 찾아 주세요").template,
+        )
+
+
+class NearDuplicateIntentParserTest(unittest.TestCase):
+    """
+    근사 중복 질의가 LLM 호출 없이 슬롯 치환된 구조분해를 재사용하는지 검증한다.
+    """
+
+    def test_line_slot_is_resubstituted_without_llm_call(self) -> None:
+        """
+        줄 수만 다른 질의는 캐시 구조분해를 재사용하되 새 줄 수와 원문으로 치환해야 한다.
+        """
+        index = NearDuplicateIntentIndex()
+        parser = _build_parser(index=index)
+        with patch.object(parser, "_invoke_structured_llm", return_value=_summary("현재메일 3줄 요약해줘", lines=3)) as invoke_mock:
+            parser.parse("현재메일 3줄 요약해줘")
+            reused = parser.parse("현재 메일을 5줄로 요약해 주세요")
+        invoke_mock.assert_called_once()
+        self.assertEqual(5, reused.summary_line_target)
+        self.assertEqual("현재 메일을 5줄로 요약해 주세요", reused.original_query)
+        self.assertEqual("llm_cached", reused.origin)
+        self.assertEqual(1, parser.get_cache_stats()["near_duplicate"]["signature_hits"])
+
+    def test_date_slot_is_resubstituted(self) -> None:
+        """
+        상대 날짜 표현만 다른 질의는 새 질의 기준 날짜 필터로 치환해야 한다.
+        """
+        parser = _build_parser(index=NearDuplicateIntentIndex())
+        last_week = _summary("지난주 메일 요약해줘", date_filter=DateFilter(mode=DateFilterMode.RELATIVE, relative="last_week"))
+        with patch.object(parser, "_invoke_structured_llm", return_value=last_week) as invoke_mock:
+            parser.parse("지난주 메일 요약해줘")
+            reused = parser.parse("이번주 메일 요약해 줘")
+        invoke_mock.assert_called_once()
+        self.assertEqual("this_week", reused.date_filter.relative)
+
+    def test_inconsistent_cached_slot_is_not_reused(self) -> None:
+        """
+        캐시 값이 자기 원문 규칙 추출과 다르면(LLM 문맥 해석) 재사용하지 않고 LLM을 호출해야 한다.
+        """
+        parser = _build_parser(index=NearDuplicateIntentIndex())
+        with patch.object(parser, "_invoke_structured_llm", return_value=_summary("현재메일 3줄 요약해줘", lines=7)) as invoke_mock:
+            parser.parse("현재메일 3줄 요약해줘")
+            parser.parse("현재메일 5줄 요약해줘")
+        self.assertEqual(2, invoke_mock.call_count)
+        self.assertEqual(1, parser.get_cache_stats()["near_duplicate"]["rejected"])
+
+    def test_similarity_is_last_resort_with_threshold(self) -> None:
+        """
+        시그니처가 달라도 해시 임베딩 유사도가 임계값 이상이면 재사용하고, 미만이면 LLM을 호출해야 한다.
+        """
+        loose = _build_parser(index=NearDuplicateIntentIndex(similarity_threshold=0.75))
+        strict = _build_parser(index=NearDuplicateIntentIndex())
+        for parser, expected_calls in ((loose, 1), (strict, 2)):
+            with patch.object(parser, "_invoke_structured_llm", return_value=_summary("조영득 관련 메일 요약해줘")) as invoke_mock:
+                parser.parse("조영득 관련 메일 요약해줘")
+                parser.parse("조영득님 관련 메일 요약해줘")
+            self.assertEqual(expected_calls, invoke_mock.call_count)
+        self.assertEqual(1, loose.get_cache_stats()["near_duplicate"]["similarity_hits"])
+
+    def test_similarity_is_not_reused_when_output_format_keyword_differs(self) -> None:
+        """
+        `표로`처럼 출력 형식 키워드만 다른 질의는 유사도가 높아도 재사용하지 않아야 한다.
+        """
+        parser = _build_parser(index=NearDuplicateIntentIndex(similarity_threshold=0.85))
+        general = _summary("KISTI 보안장비 도입 관련 회의 결과 메일 정리해줘").model_copy(
+            update={"output_format": IntentOutputFormat.GENERAL}
+        )
+        table = general.model_copy(update={"output_format": IntentOutputFormat.TABLE})
+        with patch.object(parser, "_invoke_structured_llm", side_effect=[general, table]) as invoke_mock:
+            parser.parse("KISTI 보안장비 도입 관련 회의 결과 메일 정리해줘")
+            reused = parser.parse("KISTI 보안장비 도입 관련 회의 결과 메일 표로 정리해줘")
+        self.assertEqual(2, invoke_mock.call_count)
+        self.assertEqual(IntentOutputFormat.TABLE, reused.output_format)
+        self.assertEqual(0, parser.get_cache_stats()["near_duplicate"]["similarity_hits"])
+
+    def test_similarity_is_not_reused_when_translation_differs_from_drafting(self) -> None:
+        """
+        `번역`/`작성`처럼 작업 키워드만 다른 질의는 기본 임계값 이상이어도 재사용하지 않아야 한다.
+        """
+        index = NearDuplicateIntentIndex()
+        draft = IntentDecomposition(
+            original_query="지난번 KISTI 보안장비 견적 메일에 대한 답장 초안 작성해줘",
+            steps=[ExecutionStep.READ_CURRENT_MAIL],
+            missing_slots=[],
+            task_type=IntentTaskType.ACTION,
+            output_format=IntentOutputFormat.GENERAL,
+        )
+        index.remember(draft.original_query, "ns", draft)
+        self.assertIsNone(index.lookup("지난번 KISTI 보안장비 견적 메일에 대한 답장 초안 번역해줘", "ns"))
+        self.assertEqual(1, index.get_stats()["misses"])
+
+    def test_booking_intent_is_never_reused(self) -> None:
+        """
+        회의실 예약처럼 문장 속 값이 슬롯인 의도는 근사 재사용하지 않아야 한다.
+        """
+        index = NearDuplicateIntentIndex()
+        booking = IntentDecomposition(
+            original_query="내일 회의실 예약해줘",
+            steps=[ExecutionStep.BOOK_MEETING_ROOM],
+            date_filter=DateFilter(mode=DateFilterMode.RELATIVE, relative="tomorrow"),
+            missing_slots=["start_time", "end_time", "attendee_count"],
+        )
+        index.remember("내일 회의실 예약해줘", "ns", booking)
+        self.assertIsNone(index.lookup("오늘 회의실 예약해줘", "ns"))
+
+
+if __name__ == "__main__":
+    unittest.main()
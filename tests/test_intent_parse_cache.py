@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from app.agents.intent_parse_cache import (
+    MemoryIntentParseCache,
+    SqliteIntentParseCache,
+    TieredIntentParseCache,
+    build_intent_parse_cache_key,
+)
+from app.agents.intent_parser import IntentParser
+from app.agents.intent_schema import DateFilter, DateFilterMode, ExecutionStep, IntentDecomposition
+
+
+def _decomposition(query: str) -> IntentDecomposition:
+    """테스트용 요약 구조분해를 만든다."""
+    return IntentDecomposition(
+        original_query=query,
+        steps=[ExecutionStep.SUMMARIZE_MAIL],
+        summary_line_target=5,
+        date_filter=DateFilter(mode=DateFilterMode.NONE),
+        missing_slots=[],
+        origin="llm_fresh",
+    )
+
+
+class IntentParseCacheTest(unittest.TestCase):
+    """
+    intent 구조분해 캐시 backend(메모리 LRU/SQLite/2단)를 검증한다.
+    """
+
+    def setUp(self) -> None:
+        """임시 SQLite 경로를 준비한다."""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db_path = Path(self._tmp.name) / "intent_parse_cache.db"
+
+    def tearDown(self) -> None:
+        """임시 경로를 정리한다."""
+        self._tmp.cleanup()
+
+    def test_memory_cache_expires_and_evicts_least_recent(self) -> None:
+        """
+        메모리 캐시는 TTL 만료와 LRU 축출을 지키고 hit_rate를 집계해야 한다.
+        """
+        now = [0.0]
+        cache = MemoryIntentParseCache(max_entries=2, ttl_sec=10, clock=lambda: now[0])
+        cache.put("a", _decomposition("a"))
+        cache.put("b", _decomposition("b"))
+        self.assertIsNotNone(cache.get("a"))
+        cache.put("c", _decomposition("c"))
+        self.assertIsNone(cache.get("b"))
+        now[0] = 11.0
+        self.assertIsNone(cache.get("a"))
+        stats = cache.get_stats()
+        self.assertEqual(1, stats["hits"])
+        self.assertEqual(2, stats["misses"])
+        self.assertEqual(1, stats["evictions"])
+        self.assertEqual(1, stats["expired"])
+        self.assertEqual(0.3333, stats["hit_rate"])
+
+    def test_memory_cache_is_thread_safe_under_concurrent_writes(self) -> None:
+        """
+        여러 요청 thread가 동시에 쓰고 읽어도 최대 건수를 넘지 않아야 한다.
+        """
+        cache = MemoryIntentParseCache(max_entries=16)
+
+        def _worker(prefix: str) -> None:
+            for index in range(200):
+                key = f"{prefix}-{index % 40}"
+                cache.put(key, _decomposition(key))
+                cache.get(key)
+
+        threads = [threading.Thread(target=_worker, args=(f"t{index}",)) for index in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+        self.assertEqual(16, cache.get_stats()["entries"])
+
+    def test_tiered_cache_shares_sqlite_between_workers(self) -> None:
+        """
+        다른 worker의 메모리 캐시가 비어 있어도 공유 SQLite hit를 메모리로 올려야 한다.
+        """
+        writer = TieredIntentParseCache(
+            memory=MemoryIntentParseCache(),
+            disk=SqliteIntentParseCache(db_path=self.db_path, ttl_sec=60, max_entries=100),
+        )
+        reader = TieredIntentParseCache(
+            memory=MemoryIntentParseCache(),
+            disk=SqliteIntentParseCache(db_path=self.db_path, ttl_sec=60, max_entries=100),
+        )
+        writer.put("k", _decomposition("현재메일 요약해줘"))
+        first = reader.get("k")
+        second = reader.get("k")
+        self.assertEqual("현재메일 요약해줘", first.original_query if first else "")
+        self.assertIsNotNone(second)
+        stats = reader.get_stats()
+        self.assertEqual(1, stats["memory"]["hits"])
+        self.assertEqual(1, stats["sqlite"]["hits"])
+        self.assertEqual(1.0, stats["hit_rate"])
+
+    def test_cache_key_separates_namespace_and_version(self) -> None:
+        """
+        같은 질의라도 선택메일 namespace나 파서 버전이 다르면 키가 달라야 한다.
+        """
+        base = build_intent_parse_cache_key("요약해줘", False, False, "v1")
+        self.assertNotEqual(base, build_intent_parse_cache_key("요약해줘", True, True, "v1"))
+        self.assertNotEqual(base, build_intent_parse_cache_key("요약해줘", False, False, "v2"))
+
+    def test_parser_reuses_decomposition_across_worker_instances(self) -> None:
+        """
+        한 worker가 파싱한 질의는 다른 worker 파서가 LLM 호출 없이 공유 캐시에서 재사용해야 한다.
+        """
+
+        def _build_parser() -> IntentParser:
+            return IntentParser(
+                model_name="gpt-4o-mini",
+                base_url="",
+                fast_path_mode="never",
+                parse_cache=TieredIntentParseCache(
+                    memory=MemoryIntentParseCache(),
+                    disk=SqliteIntentParseCache(db_path=self.db_path, ttl_sec=60, max_entries=100),
+                ),
+            )
+
+        first_worker = _build_parser()
+        second_worker = _build_parser()
+        with patch.object(first_worker, "_invoke_structured_llm", return_value=_decomposition("현재메일 요약해줘")):
+            first_worker.parse("현재메일 요약해줘")
+        with patch.object(second_worker, "_invoke_structured_llm", side_effect=AssertionError("should not call")):
+            cached = second_worker.parse("현재메일 요약해줘")
+        self.assertEqual("llm_cached", cached.origin)
+
+    def test_parser_cache_version_changes_with_fast_path_mode(self) -> None:
+        """
+        fast-path 설정이 다른 파서는 서로의 캐시 항목을 재사용하지 않아야 한다.
+        """
+        never = IntentParser(model_name="gpt-4o-mini", base_url="", fast_path_mode="never")
+        always = IntentParser(model_name="gpt-4o-mini", base_url="", fast_path_mode="always")
+        self.assertNotEqual(
+            never._build_cache_key("요약해줘", False, False),
+            always._build_cache_key("요약해줘", False, False),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
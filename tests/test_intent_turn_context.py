@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import unittest
+from unittest.mock import patch
+
+from app.agents.intent_parser import IntentParser
+from app.agents.intent_schema import DateFilter, DateFilterMode, ExecutionStep, IntentDecomposition
+from app.agents.intent_turn_context import (
+    get_intent_turn_context,
+    get_intent_turn_stats,
+    intent_turn,
+    record_intent_turn_decomposition,
+    reset_intent_turn_stats,
+    try_acquire_intent_llm_parse,
+)
+from app.api import routes
+from app.middleware.policies import clear_intent_context_payload_cache, compose_intent_system_context
+from app.services.intent_decomposition_service import parse_intent_decomposition_safely
+
+
+def _decomposition(query: str) -> IntentDecomposition:
+    """테스트용 요약 구조분해를 만든다."""
+    return IntentDecomposition(
+        original_query=query,
+        steps=[ExecutionStep.READ_CURRENT_MAIL, ExecutionStep.SUMMARIZE_MAIL],
+        summary_line_target=3,
+        date_filter=DateFilter(mode=DateFilterMode.NONE),
+        missing_slots=[],
+    )
+
+
+class _FailingParser:
+    """호출되면 실패하는 파서 더블."""
+
+    def parse(self, **_: object) -> IntentDecomposition:
+        """턴 재사용 경로에서는 호출되면 안 된다."""
+        raise AssertionError("parser should not be called")
+
+
+class IntentTurnContextTest(unittest.TestCase):
+    """
+    턴 단위 intent 컨텍스트의 구조분해 재사용과 LLM 호출 예산을 검증한다.
+    """
+
+    def setUp(self) -> None:
+        """카운터와 미들웨어 캐시를 초기화한다."""
+        reset_intent_turn_stats()
+        clear_intent_context_payload_cache()
+
+    def tearDown(self) -> None:
+        """카운터와 미들웨어 캐시를 초기화한다."""
+        reset_intent_turn_stats()
+        clear_intent_context_payload_cache()
+
+    def test_parse_reuses_turn_decomposition_without_parser_call(self) -> None:
+        """
+        턴에 기록된 같은 질의는 파서를 다시 호출하지 않고 기록된 구조분해를 반환해야 한다.
+        """
+        with intent_turn():
+            record_intent_turn_decomposition(user_message="현재메일 3줄 요약해줘", decomposition=_decomposition("현재메일 3줄 요약해줘"))
+            parsed = parse_intent_decomposition_safely(
+                user_message=" 현재메일 3줄 요약해줘 ",
+                parser_factory=_FailingParser,
+                has_selected_mail=True,
+            )
+        self.assertIsNotNone(parsed)
+        self.assertEqual(3, parsed.summary_line_target if parsed else 0)
+        self.assertEqual(1, get_intent_turn_stats()["reused"])
+
+    def test_recorded_parse_failure_is_not_reparsed(self) -> None:
+        """
+        flow 파싱이 실패(None)한 턴에서도 미들웨어가 다시 파싱하지 않아야 한다.
+        """
+        with intent_turn():
+            record_intent_turn_decomposition(user_message="메일 찾아줘", decomposition=None)
+            parsed = parse_intent_decomposition_safely(user_message="메일 찾아줘", parser_factory=_FailingParser)
+        self.assertIsNone(parsed)
+
+    def test_middleware_system_context_uses_turn_decomposition(self) -> None:
+        """
+        scope prefix가 붙은 미들웨어 입력도 턴 구조분해를 재사용해 컨텍스트를 만들어야 한다.
+        """
+        with (
+            intent_turn(),
+            patch("app.services.intent_decomposition_service.get_intent_parser", side_effect=AssertionError("no parse")),
+            patch("app.middleware.policies.get_intent_parser", side_effect=AssertionError("no parse")),
+        ):
+            record_intent_turn_decomposition(user_message="현재메일 3줄 요약해줘", decomposition=_decomposition("현재메일 3줄 요약해줘"))
+            context = compose_intent_system_context("[질의 범위] 현재 선택 메일\n현재메일 3줄 요약해줘")
+        self.assertIn("현재메일 3줄 요약해줘", context)
+        self.assertIn("summarize_mail", context)
+
+    def test_llm_parse_budget_is_one_per_turn(self) -> None:
+        """
+        한 턴에서 두 번째 LLM 파싱은 차단되고 규칙 기반 분해로 대체되어야 한다.
+        """
+        parser = IntentParser(model_name="gpt-4o-mini", base_url="", fast_path_mode="never")
+        with (
+            patch("app.agents.intent_parser.lookup_llm_response_cache", return_value=(None, "", None)),
+            patch.object(parser, "_invoke_structured_llm_uncached", return_value=_decomposition("첫 질의")) as invoke_mock,
+            intent_turn() as turn,
+        ):
+            parser.parse("현재메일 요약해줘")
+            fallback = parser.parse("지난주 회의 메일 찾아줘")
+        invoke_mock.assert_called_once()
+        self.assertEqual(1, turn.llm_parse_count)
+        self.assertIn(ExecutionStep.SEARCH_MAILS, fallback.steps)
+        stats = get_intent_turn_stats()
+        self.assertEqual(1, stats["turns"])
+        self.assertEqual(1, stats["llm_parses"])
+        self.assertEqual(1, stats["blocked_llm_parses"])
+        self.assertEqual(1.0, stats["llm_parses_per_turn"])
+
+    def test_search_chat_runs_inside_intent_turn(self) -> None:
+        """
+        `/search/chat` 공통 처리는 턴 컨텍스트 안에서 flow를 실행하고 종료 후 컨텍스트를 닫아야 한다.
+        """
+        observed: list[bool] = []
+
+        def _fake_run(**_: object) -> dict[str, object]:
+            observed.append(get_intent_turn_context() is not None)
+            return {}
+
+        with patch.object(routes.search_chat_flow, "run_search_chat", side_effect=_fake_run):
+            routes._run_search_chat(payload=object(), log_prefix="test")
+        self.assertEqual([True], observed)
+        self.assertIsNone(get_intent_turn_context())
+
+    def test_budget_is_not_applied_outside_turn(self) -> None:
+        """
+        턴 밖 호출(배치/스크립트)은 LLM 호출을 막지 않아야 한다.
+        """
+        self.assertTrue(try_acquire_intent_llm_parse())
+        self.assertTrue(try_acquire_intent_llm_parse())
+        self.assertEqual(0, get_intent_turn_stats()["blocked_llm_parses"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from app.core import llm_response_cache
+from app.core.llm_response_cache import (
+    LLMResponseCache,
+    build_llm_cache_key,
+    get_llm_response_cache,
+    get_llm_response_cache_stats,
+    lookup_llm_response_cache,
+    store_llm_response_cache,
+)
+
+
+class LLMResponseCacheTest(unittest.TestCase):
+    """LLM 응답 캐시 키/TTL/크기 축출/카운터/opt-in 규칙을 검증한다."""
+
+    def setUp(self) -> None:
+        """임시 캐시 경로와 공유 registry를 준비한다."""
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp_dir.cleanup)
+        self.db_path = Path(self._tmp_dir.name) / "llm_cache.db"
+        llm_response_cache._CACHE_REGISTRY.clear()
+        self.addCleanup(llm_response_cache._CACHE_REGISTRY.clear)
+
+    def test_cache_key_separates_model_temperature_and_schema(self) -> None:
+        """모델/temperature/스키마/메시지가 다르면 서로 다른 키여야 한다."""
+        messages = [{"role": "system", "content": "s"}, {"role": "user", "content": "u"}]
+        base = build_llm_cache_key(model_name="openai:gpt-4o-mini", messages=messages, temperature=0.0, schema="text")
+        self.assertEqual(
+            base,
+            build_llm_cache_key(model_name="openai:gpt-4o-mini", messages=list(messages), temperature=0.0, schema="text"),
+        )
+        variants = {
+            build_llm_cache_key(model_name="openai:gpt-4o", messages=messages, temperature=0.0, schema="text"),
+            build_llm_cache_key(model_name="openai:gpt-4o-mini", messages=messages, temperature=0.1, schema="text"),
+            build_llm_cache_key(model_name="openai:gpt-4o-mini", messages=messages, temperature=0.0, schema="json_object"),
+            build_llm_cache_key(
+                model_name="openai:gpt-4o-mini",
+                messages=[{"role": "user", "content": "u"}],
+                temperature=0.0,
+                schema="text",
+            ),
+        }
+        self.assertNotIn(base, variants)
+        self.assertEqual(4, len(variants))
+
+    def test_get_put_counts_hits_and_expires_by_ttl(self) -> None:
+        """저장 후 조회는 hit, TTL이 지나면 miss/expired로 집계되어야 한다."""
+        cache = LLMResponseCache(db_path=self.db_path, ttl_sec=60, max_entries=10)
+        self.assertIsNone(cache.get(key="k"))
+        with patch("app.core.llm_response_cache.time.time", return_value=1000.0):
+            cache.put(key="k", response_text="응답")
+            self.assertEqual("응답", cache.get(key="k"))
+        with patch("app.core.llm_response_cache.time.time", return_value=1061.0):
+            self.assertIsNone(cache.get(key="k"))
+        stats = cache.get_stats()
+        self.assertEqual(1, stats["hits"])
+        self.assertEqual(2, stats["misses"])
+        self.assertEqual(1, stats["expired"])
+        self.assertEqual(0.3333, stats["hit_rate"])
+
+    def test_put_evicts_least_recently_used_over_max_entries(self) -> None:
+        """최대 건수를 넘으면 최근 사용이 가장 오래된 항목부터 축출해야 한다."""
+        cache = LLMResponseCache(db_path=self.db_path, ttl_sec=3600, max_entries=2)
+        with patch("app.core.llm_response_cache.time.time", side_effect=[100.0, 101.0, 102.0, 103.0, 104.0, 105.0, 106.0]):
+            cache.put(key="a", response_text="A")
+            cache.put(key="b", response_text="B")
+            self.assertEqual("A", cache.get(key="a"))
+            cache.put(key="c", response_text="C")
+            self.assertIsNone(cache.get(key="b"))
+            self.assertEqual("A", cache.get(key="a"))
+            self.assertEqual("C", cache.get(key="c"))
+        self.assertEqual(1, cache.get_stats()["evictions"])
+
+    def test_lookup_requires_env_opt_in_and_caller_opt_in(self) -> None:
+        """전역 env와 호출부 허용이 모두 켜졌을 때만 캐시를 사용해야 한다."""
+        messages = [{"role": "user", "content": "u"}]
+        with patch.dict(os.environ, {"MOLDUBOT_LLM_RESPONSE_CACHE_ENABLED": "0"}, clear=False):
+            self.assertIsNone(get_llm_response_cache())
+            self.assertEqual({"enabled": False}, get_llm_response_cache_stats())
+        env = {"MOLDUBOT_LLM_RESPONSE_CACHE_ENABLED": "1", "MOLDUBOT_LLM_RESPONSE_CACHE_PATH": str(self.db_path)}
+        with patch.dict(os.environ, env, clear=False):
+            self.assertEqual(
+                (None, "", None),
+                lookup_llm_response_cache(enabled=False, model_name="m", messages=messages, temperature=0.0, schema="text"),
+            )
+            cache, key, cached = lookup_llm_response_cache(
+                enabled=True, model_name="m", messages=messages, temperature=0.0, schema="text"
+            )
+            self.assertIsNone(cached)
+            store_llm_response_cache(cache=cache, cache_key=key, content="결과")
+            _, _, cached = lookup_llm_response_cache(
+                enabled=True, model_name="m", messages=messages, temperature=0.0, schema="text"
+            )
+            stats = get_llm_response_cache_stats()
+        self.assertEqual("결과", cached)
+        self.assertTrue(stats["enabled"])
+        self.assertEqual(1, stats["hits"])
+
+
+if __name__ == "__main__":
+    unittest.main()
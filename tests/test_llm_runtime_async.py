@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.core.llm_runtime import ainvoke_json_object, ainvoke_text_messages, reset_chat_model_cache
+
+
+class LLMRuntimeAsyncTest(unittest.TestCase):
+    """비동기 LLM 호출 API의 응답 정규화/타임아웃/취소 규칙을 검증한다."""
+
+    def setUp(self) -> None:
+        """테스트마다 클라이언트 캐시를 비운다."""
+        reset_chat_model_cache()
+        self.addCleanup(reset_chat_model_cache)
+
+    @patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}, clear=True)
+    def test_ainvoke_text_messages_uses_cached_client_ainvoke(self) -> None:
+        """비동기 호출은 캐시된 클라이언트의 ainvoke를 사용하고 content를 정규화해야 한다."""
+        fake_llm = MagicMock()
+        fake_llm.ainvoke = AsyncMock(return_value=MagicMock(content=[{"text": " 첫 줄 "}, "둘째 줄"]))
+        with patch("app.core.llm_runtime.init_chat_model", return_value=fake_llm) as init_mock:
+            result = asyncio.run(
+                ainvoke_text_messages(model_name="gpt-4o-mini", messages=[{"role": "user", "content": "a"}])
+            )
+        self.assertEqual("첫 줄\n둘째 줄", result)
+        init_mock.assert_called_once_with(model="openai:gpt-4o-mini", timeout=60)
+        fake_llm.invoke.assert_not_called()
+
+    @patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}, clear=True)
+    def test_ainvoke_json_object_rejects_non_object(self) -> None:
+        """JSON 객체 응답은 사전으로 반환하고, 배열 응답은 ValueError여야 한다."""
+        fake_llm = MagicMock()
+        fake_llm.ainvoke = AsyncMock(side_effect=[MagicMock(content='{"ok": true}'), MagicMock(content="[1]")])
+        with patch("app.core.llm_runtime.init_chat_model", return_value=fake_llm):
+            loaded = asyncio.run(ainvoke_json_object(model_name="gpt-4o-mini", system_prompt="s", user_prompt="u"))
+            with self.assertRaises(ValueError):
+                asyncio.run(ainvoke_json_object(model_name="gpt-4o-mini", system_prompt="s", user_prompt="u"))
+        self.assertEqual({"ok": True}, loaded)
+
+    @patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}, clear=True)
+    def test_ainvoke_text_messages_times_out_and_cancels_request(self) -> None:
+        """호출 단위 timeout을 넘기면 TimeoutError를 내고 진행 중 요청을 취소해야 한다."""
+        async def _slow_ainvoke(_: object) -> object:
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                state["cancelled"] = True
+                raise
+            return MagicMock(content="late")
+
+        state: dict[str, bool] = {"cancelled": False}
+        fake_llm = MagicMock()
+        fake_llm.ainvoke = _slow_ainvoke
+        with patch("app.core.llm_runtime.init_chat_model", return_value=fake_llm):
+            with self.assertRaises(TimeoutError):
+                asyncio.run(
+                    ainvoke_text_messages(
+                        model_name="gpt-4o-mini",
+                        messages=[{"role": "user", "content": "a"}],
+                        timeout_sec=0.01,
+                    )
+                )
+        self.assertTrue(state["cancelled"])
+
+    @patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}, clear=True)
+    def test_caller_cancellation_propagates(self) -> None:
+        """호출 task가 취소되면 CancelledError가 그대로 전파되어야 한다."""
+        async def _slow_ainvoke(_: object) -> object:
+            await asyncio.sleep(5)
+            return MagicMock(content="late")
+
+        fake_llm = MagicMock()
+        fake_llm.ainvoke = _slow_ainvoke
+
+        async def _run() -> None:
+            task = asyncio.create_task(
+                ainvoke_text_messages(model_name="gpt-4o-mini", messages=[{"role": "user", "content": "a"}])
+            )
+            await asyncio.sleep(0.01)
+            task.cancel()
+            await task
+
+        with patch("app.core.llm_runtime.init_chat_model", return_value=fake_llm):
+            with self.assertRaises(asyncio.CancelledError):
+                asyncio.run(_run())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from app.core import llm_response_cache
+from app.core.llm_runtime import get_chat_model, invoke_json_object, invoke_text_messages, reset_chat_model_cache
+
+
+class LLMRuntimeModelCacheTest(unittest.TestCase):
+    """채팅 모델 클라이언트 캐시 재사용/축출/초기화 규칙을 검증한다."""
+
+    def setUp(self) -> None:
+        """테스트마다 클라이언트 캐시를 비운다."""
+        reset_chat_model_cache()
+        self.addCleanup(reset_chat_model_cache)
+
+    @patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}, clear=True)
+    def test_invoke_text_messages_reuses_cached_client(self) -> None:
+        """같은 모델/timeout/temperature 호출은 클라이언트를 한 번만 생성해야 한다."""
+        fake_llm = MagicMock()
+        fake_llm.invoke.return_value = MagicMock(content="ok")
+        with patch("app.core.llm_runtime.init_chat_model", return_value=fake_llm) as init_mock:
+            first = invoke_text_messages(model_name="gpt-4o-mini", messages=[{"role": "user", "content": "a"}])
+            second = invoke_text_messages(model_name="gpt-4o-mini", messages=[{"role": "user", "content": "b"}])
+        self.assertEqual(["ok", "ok"], [first, second])
+        init_mock.assert_called_once_with(model="openai:gpt-4o-mini", timeout=60)
+        self.assertEqual(2, fake_llm.invoke.call_count)
+
+    @patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}, clear=True)
+    def test_cache_key_separates_temperature_and_base_url(self) -> None:
+        """temperature/base_url가 다르면 별도 클라이언트를 생성해야 한다."""
+        with patch("app.core.llm_runtime.init_chat_model", side_effect=lambda **_: MagicMock()) as init_mock:
+            default_model = get_chat_model(model_name="gpt-4o-mini")
+            tuned_model = get_chat_model(model_name="gpt-4o-mini", temperature=0.0)
+            local_model = get_chat_model(model_name="ollama:qwen", base_url="http://127.0.0.1:11434")
+            self.assertIs(tuned_model, get_chat_model(model_name="gpt-4o-mini", temperature=0.0))
+        self.assertEqual(3, init_mock.call_count)
+        self.assertIsNot(default_model, tuned_model)
+        self.assertEqual("http://127.0.0.1:11434", init_mock.call_args_list[2].kwargs["base_url"])
+        self.assertIsNotNone(local_model)
+
+    @patch.dict(os.environ, {"OPENAI_API_KEY": "test-key", "MOLDUBOT_CHAT_MODEL_CACHE_SIZE": "2"}, clear=True)
+    def test_cache_evicts_least_recently_used_and_reset_clears(self) -> None:
+        """캐시 크기를 넘으면 가장 오래 쓰지 않은 클라이언트를 축출하고, reset은 전체를 비워야 한다."""
+        with patch("app.core.llm_runtime.init_chat_model", side_effect=lambda **_: MagicMock()) as init_mock:
+            first = get_chat_model(model_name="gpt-a")
+            get_chat_model(model_name="gpt-b")
+            self.assertIs(first, get_chat_model(model_name="gpt-a"))
+            get_chat_model(model_name="gpt-c")
+            self.assertIs(first, get_chat_model(model_name="gpt-a"))
+            get_chat_model(model_name="gpt-b")
+            self.assertIs(first, get_chat_model(model_name="gpt-a"))
+            reset_chat_model_cache()
+            self.assertIsNot(first, get_chat_model(model_name="gpt-a"))
+        self.assertEqual(5, init_mock.call_count)
+
+    @patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}, clear=True)
+    def test_concurrent_first_calls_build_single_client(self) -> None:
+        """같은 키의 동시 첫 호출도 클라이언트를 한 번만 생성해야 한다."""
+        results: list[object] = []
+        with patch("app.core.llm_runtime.init_chat_model", side_effect=lambda **_: MagicMock()) as init_mock:
+            threads = [
+                threading.Thread(target=lambda: results.append(get_chat_model(model_name="gpt-4o-mini")))
+                for _ in range(8)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        init_mock.assert_called_once()
+        self.assertEqual(1, len({id(item) for item in results}))
+
+    @patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}, clear=True)
+    def test_slow_build_does_not_block_other_keys(self) -> None:
+        """한 키의 클라이언트 생성이 느려도 다른 키 조회는 기다리지 않아야 한다."""
+        slow_started = threading.Event()
+        release_slow = threading.Event()
+
+        def _init(**kwargs: object) -> MagicMock:
+            if kwargs.get("model") == "openai:gpt-slow":
+                slow_started.set()
+                release_slow.wait(5)
+            return MagicMock()
+
+        with patch("app.core.llm_runtime.init_chat_model", side_effect=_init):
+            slow_thread = threading.Thread(target=lambda: get_chat_model(model_name="gpt-slow"))
+            slow_thread.start()
+            self.assertTrue(slow_started.wait(2))
+            fast_done = threading.Event()
+            fast_thread = threading.Thread(target=lambda: (get_chat_model(model_name="gpt-fast"), fast_done.set()))
+            fast_thread.start()
+            finished_while_slow_building = fast_done.wait(2)
+            release_slow.set()
+            slow_thread.join()
+            fast_thread.join()
+        self.assertTrue(finished_while_slow_building)
+
+    def test_invoke_json_object_response_cache_skips_second_llm_call(self) -> None:
+        """응답 캐시를 켜면 같은 프롬프트 재호출은 LLM을 다시 호출하지 않아야 한다."""
+        fake_llm = MagicMock()
+        fake_llm.invoke.return_value = MagicMock(content='{"summary": "요약"}')
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            env = {
+                "OPENAI_API_KEY": "test-key",
+                "MOLDUBOT_LLM_RESPONSE_CACHE_ENABLED": "1",
+                "MOLDUBOT_LLM_RESPONSE_CACHE_PATH": str(Path(tmp_dir) / "llm_cache.db"),
+            }
+            with patch.dict(os.environ, env, clear=True):
+                llm_response_cache._CACHE_REGISTRY.clear()
+                self.addCleanup(llm_response_cache._CACHE_REGISTRY.clear)
+                with patch("app.core.llm_runtime.init_chat_model", return_value=fake_llm):
+                    kwargs = {"model_name": "gpt-4o-mini", "system_prompt": "s", "user_prompt": "u", "temperature": 0.1}
+                    first = invoke_json_object(**kwargs, response_cache=True)
+                    second = invoke_json_object(**kwargs, response_cache=True)
+                    uncached = invoke_json_object(**kwargs)
+        self.assertEqual({"summary": "요약"}, first)
+        self.assertEqual(first, second)
+        self.assertEqual(first, uncached)
+        self.assertEqual(2, fake_llm.invoke.call_count)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,6 +8,10 @@ from unittest.mock import patch
 
 from app.integrations.microsoft_graph.mail_client import GraphMailMessage
 from app.services.mail_context_service import MailContextService
+from app.services.mail_summary_background import (
+    get_mail_summary_background_runner,
+    shutdown_mail_summary_background_runners,
+)
 
 
 class FakeGraphClient:
@@ -212,11 +216,14 @@ class MailContextServiceTest(unittest.TestCase):
 
             fake_graph = FakeGraphClient(message=None)
             service = MailContextService(db_path=db_path, graph_client=fake_graph)  # type: ignore[arg-type]
-            with patch.object(
-                service._mail_service,
-                "ensure_summary_for_message",
-                return_value=service._mail_service.read_mail_by_message_id("m-4"),
-            ) as mocked_ensure:
+            with (
+                patch.object(
+                    service._mail_service,
+                    "ensure_summary_for_message",
+                    return_value=service._mail_service.read_mail_by_message_id("m-4"),
+                ) as mocked_ensure,
+                patch.object(service._mail_service, "is_summary_pending", return_value=True),
+            ):
                 result = service.get_mail_context(message_id="m-4", mailbox_user="user@example.com")
 
         self.assertEqual("completed", result.status)
@@ -224,12 +231,52 @@ class MailContextServiceTest(unittest.TestCase):
         self.assertIsNotNone(result.mail)
         assert result.mail is not None
         self.assertEqual("", result.mail.summary_text)
+        self.assertTrue(result.summary_pending)
         mocked_ensure.assert_called_once_with(
             message_id="m-4",
             requested_by="mail_context",
-            max_attempts=3,
         )
 
 
+    def test_get_mail_context_is_not_pending_when_background_submit_is_rejected(self) -> None:
+        """
+        background 실행기가 제출을 거절하면 summary가 비어 있어도 대기 상태로 보고하면 안 된다.
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = Path(tmp_dir) / "emails.db"
+            conn = sqlite3.connect(str(db_path))
+            try:
+                conn.execute(
+                    "CREATE TABLE emails ("
+                    "message_id TEXT PRIMARY KEY, "
+                    "subject TEXT, "
+                    "from_address TEXT, "
+                    "received_date TEXT, "
+                    "body_preview TEXT, "
+                    "body_full TEXT, "
+                    "body_clean TEXT, "
+                    "summary TEXT)"
+                )
+                conn.execute(
+                    "INSERT INTO emails (message_id, subject, from_address, received_date, body_clean, body_full, summary) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    ("m-5", "요약 없음 메일", "a@example.com", "2026-01-05T00:00:00Z", "본문", "본문", ""),
+                )
+                conn.commit()
+            finally:
+                conn.close()
+
+            runner = get_mail_summary_background_runner(db_path)
+            runner.shutdown(timeout_sec=1)
+            service = MailContextService(db_path=db_path, graph_client=FakeGraphClient(message=None))  # type: ignore[arg-type]
+            try:
+                result = service.get_mail_context(message_id="m-5", mailbox_user="user@example.com")
+            finally:
+                shutdown_mail_summary_background_runners(timeout_sec=1)
+
+        self.assertEqual("completed", result.status)
+        assert result.mail is not None
+        self.assertEqual("", result.mail.summary_text)
+        self.assertFalse(result.summary_pending)
+
 if __name__ == "__main__":
     unittest.main()
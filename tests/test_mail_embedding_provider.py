@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import types
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from app.services import mail_embedding_provider
+from app.services.mail_embedding_cache import MailEmbeddingCache
+from app.services.mail_embedding_provider import (
+    HASH_EMBEDDING_VERSION,
+    HashEmbeddingProvider,
+    SentenceTransformerEmbeddingProvider,
+    get_mail_embedding_provider,
+)
+from app.services.mail_vector_embedding import build_hash_embedding
+
+
+class _FakeSentenceModel:
+    """encode 호출을 기록하는 sentence-transformer 대역."""
+
+    def __init__(self, model_name: str, device: str) -> None:
+        self.model_name = model_name
+        self.device = device
+        self.encoded: list[list[str]] = []
+
+    def get_sentence_embedding_dimension(self) -> int:
+        return 3
+
+    def encode(self, texts: list[str], **kwargs: object) -> list[list[float]]:
+        self.encoded.append(list(texts))
+        return [[float(len(text)), 0.0, 1.0] for text in texts]
+
+
+class MailEmbeddingProviderTest(unittest.TestCase):
+    """임베딩 provider 선택/모델 1회 로드/디스크 캐시 동작을 검증한다."""
+
+    def setUp(self) -> None:
+        """provider 공유 registry를 테스트마다 초기화한다."""
+        mail_embedding_provider._PROVIDER_REGISTRY.clear()
+        self.addCleanup(mail_embedding_provider._PROVIDER_REGISTRY.clear)
+
+    @patch.dict(os.environ, {"MOLDUBOT_MAIL_EMBEDDING_BACKEND": ""}, clear=False)
+    def test_default_provider_is_shared_hash_provider(self) -> None:
+        """기본 backend는 기존 해시 임베딩과 같은 벡터를 내는 공유 provider여야 한다."""
+        provider = get_mail_embedding_provider()
+        self.assertIsInstance(provider, HashEmbeddingProvider)
+        self.assertIs(provider, get_mail_embedding_provider())
+        self.assertEqual(HASH_EMBEDDING_VERSION, provider.version_tag)
+        self.assertEqual([build_hash_embedding(text="보안 점검")], provider.embed_many(texts=["보안 점검"]))
+
+    @patch.dict(os.environ, {"MOLDUBOT_MAIL_EMBEDDING_BACKEND": "sentence_transformer"}, clear=False)
+    def test_sentence_transformer_import_failure_falls_back_to_hash(self) -> None:
+        """sentence-transformers 로드에 실패하면 hash provider로 fallback해야 한다."""
+        with patch.object(mail_embedding_provider.importlib, "import_module", side_effect=ImportError("missing")):
+            provider = get_mail_embedding_provider()
+        self.assertIsInstance(provider, HashEmbeddingProvider)
+
+    def test_sentence_transformer_loads_once_and_reuses_disk_cache(self) -> None:
+        """모델은 1회만 로드하고, 같은 본문은 디스크 캐시에서 재사용해야 한다."""
+        fake_module = types.SimpleNamespace(SentenceTransformer=MagicMock(side_effect=_FakeSentenceModel))
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache = MailEmbeddingCache(db_path=Path(tmp_dir) / "cache.sqlite3")
+            with patch.object(mail_embedding_provider.importlib, "import_module", return_value=fake_module):
+                provider = SentenceTransformerEmbeddingProvider(model_name="local-model", batch_size=8, cache=cache)
+                first = provider.embed_many(texts=["가나", "다라마"])
+                second = provider.embed_many(texts=["다라마", "바"])
+                restarted = SentenceTransformerEmbeddingProvider(model_name="local-model", batch_size=8, cache=cache)
+                third = restarted.embed_many(texts=["가나"])
+        model = provider._model
+        self.assertEqual("st:local-model:3", provider.version_tag)
+        self.assertEqual(2, fake_module.SentenceTransformer.call_count)
+        self.assertEqual("cpu", model.device)
+        self.assertEqual([["가나", "다라마"], ["바"]], model.encoded)
+        self.assertEqual([[2.0, 0.0, 1.0], [3.0, 0.0, 1.0]], first)
+        self.assertEqual([[3.0, 0.0, 1.0], [1.0, 0.0, 1.0]], second)
+        self.assertEqual([[2.0, 0.0, 1.0]], third)
+        self.assertEqual([], restarted._model.encoded)
+
+
+if __name__ == "__main__":
+    unittest.main()
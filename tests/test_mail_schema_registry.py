@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from app.core.sqlite_pool import close_sqlite_pools
+from app.services import mail_schema_registry
+from app.services.mail_schema_registry import get_emails_schema, invalidate_emails_schema
+
+
+class MailSchemaRegistryTest(unittest.TestCase):
+    """
+    emails 스키마 registry의 introspection 캐시/무효화 동작을 검증한다.
+    """
+
+    def setUp(self) -> None:
+        """테스트용 임시 DB를 만든다."""
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self._db_path = Path(self._temp_dir.name) / "emails.db"
+        self._execute(
+            "CREATE TABLE emails (message_id TEXT PRIMARY KEY, subject TEXT, from_address TEXT, "
+            "received_date TEXT, body_preview TEXT, body_full TEXT, body_clean TEXT)"
+        )
+        invalidate_emails_schema()
+
+    def tearDown(self) -> None:
+        """registry/풀/임시 디렉터리를 정리한다."""
+        invalidate_emails_schema()
+        close_sqlite_pools()
+        self._temp_dir.cleanup()
+
+    def test_schema_is_introspected_once_per_schema_version(self) -> None:
+        """
+        스키마가 바뀌지 않으면 반복 호출해도 같은 객체를 반환해야 한다.
+        """
+        first = get_emails_schema(self._db_path)
+        with patch.object(mail_schema_registry, "SCHEMA_REVALIDATE_SEC", 0.0):
+            second = get_emails_schema(self._db_path)
+        self.assertIs(first, second)
+        self.assertFalse(first.has_summary)
+        self.assertIn("'' AS summary_text", first.statements.latest_mail_query)
+
+    def test_schema_change_is_detected_after_revalidate_interval(self) -> None:
+        """
+        컬럼이 추가되면 schema_version 재확인 시 새 스키마를 반환해야 한다.
+        """
+        before = get_emails_schema(self._db_path)
+        self._execute("ALTER TABLE emails ADD COLUMN summary TEXT")
+        self._execute("ALTER TABLE emails ADD COLUMN category TEXT")
+        with patch.object(mail_schema_registry, "SCHEMA_REVALIDATE_SEC", 0.0):
+            after = get_emails_schema(self._db_path)
+        self.assertFalse(before.has_summary)
+        self.assertTrue(after.has_summary)
+        self.assertTrue(after.has_category)
+        self.assertIn("summary = COALESCE(NULLIF(?, ''), summary)", after.statements.upsert_update_query)
+        self.assertIn("category = ?", after.statements.summary_update_query)
+
+    def test_statements_are_shared_per_column_combination(self) -> None:
+        """
+        같은 컬럼 조합의 DB는 SQL 문 묶음 객체를 공유해야 한다.
+        """
+        other_path = Path(self._temp_dir.name) / "other.db"
+        conn = sqlite3.connect(str(other_path))
+        conn.execute(
+            "CREATE TABLE emails (message_id TEXT PRIMARY KEY, subject TEXT, from_address TEXT, "
+            "received_date TEXT, body_preview TEXT, body_full TEXT, body_clean TEXT, extra TEXT)"
+        )
+        conn.commit()
+        conn.close()
+        self.assertIs(get_emails_schema(self._db_path).statements, get_emails_schema(other_path).statements)
+
+    def test_preferred_outlook_link_column_is_used_in_search_select(self) -> None:
+        """
+        Outlook 전용 링크 컬럼이 있으면 검색 SELECT 절에서 web_link보다 우선해야 한다.
+        """
+        self._execute("ALTER TABLE emails ADD COLUMN web_link TEXT")
+        self._execute("ALTER TABLE emails ADD COLUMN outlook_link TEXT")
+        schema = get_emails_schema(self._db_path)
+        self.assertEqual("outlook_link", schema.preferred_outlook_link_column)
+        self.assertIn("COALESCE(outlook_link, web_link, '') AS web_link", schema.statements.search_select_clause)
+
+    def test_missing_db_returns_empty_schema(self) -> None:
+        """
+        DB 파일이 없으면 빈 컬럼 스키마를 반환해야 한다.
+        """
+        schema = get_emails_schema(Path(self._temp_dir.name) / "missing.db")
+        self.assertEqual(frozenset(), schema.columns)
+
+    def _execute(self, sql: str) -> None:
+        """
+        별도 연결로 DDL을 실행한다.
+
+        Args:
+            sql: 실행할 SQL
+        """
+        conn = sqlite3.connect(str(self._db_path))
+        try:
+            conn.execute(sql)
+            conn.commit()
+        finally:
+            conn.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from app.services.mail_search_fts import (
+    build_fts_match_expression,
+    ensure_mail_search_fts_index,
+    rebuild_mail_search_fts_index,
+    select_fts_query_tokens,
+    select_fts_word_query_tokens,
+)
+from app.services.mail_search_service import MailSearchService
+
+
+class MailSearchFtsTest(unittest.TestCase):
+    """메일 검색 FTS5 shadow 인덱스 동작을 검증한다."""
+
+    def _create_db(self, root: Path) -> Path:
+        """FTS 테스트용 emails DB를 생성한다."""
+        db_path = root / "emails.db"
+        conn = sqlite3.connect(str(db_path))
+        try:
+            conn.execute(
+                "CREATE TABLE emails ("
+                "message_id TEXT, subject TEXT, from_address TEXT, received_date TEXT, "
+                "body_preview TEXT, body_full TEXT, body_clean TEXT, summary TEXT, web_link TEXT)"
+            )
+            conn.executemany(
+                "INSERT INTO emails VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    ("m-1", "KISTI 보안장비 차단 확인", "a@example.com", "2026-02-18", "", "", "차단 여부 확인", "요약1", ""),
+                    ("m-2", "사서함 자동 비우기 문의", "b@example.com", "2026-02-19", "", "", "정책 문의", "요약2", ""),
+                    ("m-3", "지난주 회의록 공유", "c@example.com", "2026-02-20", "", "", "예산 승인 요청 건", "요약3", ""),
+                    ("m-4", "보안 점검 결과 보고서", "d@example.com", "2026-02-21", "", "", "점검 일정", "요약4", ""),
+                ],
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        return db_path
+
+    def _match_ids(self, db_path: Path, token: str) -> list[str]:
+        """FTS MATCH 결과를 emails.message_id 목록으로 반환한다."""
+        conn = sqlite3.connect(str(db_path))
+        try:
+            rows = conn.execute(
+                "SELECT e.message_id FROM emails_fts JOIN emails AS e ON e.rowid = emails_fts.rowid "
+                "WHERE emails_fts MATCH ? ORDER BY e.message_id",
+                (build_fts_match_expression(tokens=[token]),),
+            ).fetchall()
+        finally:
+            conn.close()
+        return [str(row[0]) for row in rows]
+
+    def test_ensure_index_backfills_and_triggers_keep_sync(self) -> None:
+        """기존 행은 최초 보장 시 색인되고 이후 INSERT/UPDATE/DELETE는 트리거로 동기화되어야 한다."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = self._create_db(root=Path(tmp_dir))
+            conn = sqlite3.connect(str(db_path))
+            try:
+                self.assertTrue(ensure_mail_search_fts_index(conn=conn))
+                conn.execute(
+                    "INSERT INTO emails VALUES ('m-5', 'M365 구축 일정', 'e@example.com', '2026-02-22', '', '', '', '', '')"
+                )
+                conn.execute("UPDATE emails SET summary = '비우기 정책 요약' WHERE message_id = 'm-1'")
+                conn.execute("DELETE FROM emails WHERE message_id = 'm-2'")
+                conn.commit()
+            finally:
+                conn.close()
+            self.assertEqual(["m-1"], self._match_ids(db_path=db_path, token="보안장비"))
+            self.assertEqual(["m-5"], self._match_ids(db_path=db_path, token="m365"))
+            self.assertEqual(["m-1"], self._match_ids(db_path=db_path, token="비우기"))
+
+    def test_rebuild_index_returns_indexed_row_count(self) -> None:
+        """재생성 명령은 emails 전건을 다시 색인해야 한다."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = self._create_db(root=Path(tmp_dir))
+            conn = sqlite3.connect(str(db_path))
+            try:
+                indexed = rebuild_mail_search_fts_index(conn=conn)
+            finally:
+                conn.close()
+        self.assertEqual(4, indexed)
+
+    def test_select_fts_query_tokens_skips_short_tokens(self) -> None:
+        """trigram으로 조회할 수 없는 2자 이하 토큰은 FTS 조회에서 제외해야 한다."""
+        self.assertEqual(["보안장비", "m365"], select_fts_query_tokens(tokens=["보안장비", "차단", "m365", "보안장비"]))
+
+    def test_select_fts_word_query_tokens_keeps_two_char_tokens(self) -> None:
+        """2자 토큰만 단어 인덱스 prefix 조회 대상으로 선별해야 한다."""
+        self.assertEqual(["차단", "회의"], select_fts_word_query_tokens(tokens=["보안장비", "차단", "m", "회의", "차단"]))
+
+    def test_search_uses_fts_candidates_when_available(self) -> None:
+        """3자 이상 토큰 질의는 FTS 후보 조회 경로를 사용해야 한다."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = self._create_db(root=Path(tmp_dir))
+            payload = MailSearchService(db_path=db_path).search(query="KISTI 보안장비 메일", limit=3)
+        self.assertEqual("fts", payload["metrics"]["candidate_source"])
+        self.assertEqual("m-1", payload["results"][0]["message_id"])
+
+    def test_search_falls_back_to_like_when_fts_unavailable(self) -> None:
+        """FTS5 생성이 실패하면 기존 LIKE 후보 조회로 동작해야 한다."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = self._create_db(root=Path(tmp_dir))
+            with patch(
+                "app.services.mail_search_fts._create_fts_table",
+                side_effect=sqlite3.OperationalError("no such tokenizer: trigram"),
+            ):
+                payload = MailSearchService(db_path=db_path).search(query="보안장비 차단 메일", limit=3)
+        self.assertEqual("like", payload["metrics"]["candidate_source"])
+        self.assertEqual("m-1", payload["results"][0]["message_id"])
+
+    def test_short_token_queries_use_word_index_candidates(self) -> None:
+        """2자 토큰이 섞이거나 2자 토큰만 있는 질의도 LIKE 전체 스캔 없이 FTS 후보를 사용해야 한다."""
+        cases = {
+            "보안장비 문의 메일": {"m-1", "m-2"},
+            "지난주 회의 일정 메일": {"m-3", "m-4"},
+            "예산 승인 요청 메일": {"m-3"},
+            "보안 점검 결과 보고서": {"m-1", "m-4"},
+        }
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = self._create_db(root=Path(tmp_dir))
+            service = MailSearchService(db_path=db_path)
+            for query, expected_ids in cases.items():
+                with self.subTest(query=query):
+                    rows, source = service._fetch_candidates(
+                        query=query,
+                        person="",
+                        start_date="",
+                        end_date="",
+                        candidate_limit=10,
+                    )
+                    self.assertEqual("fts", source)
+                    self.assertEqual(expected_ids, {row.message_id for row in rows})
+
+    @patch.dict(os.environ, {"MOLDUBOT_MAIL_SEARCH_FTS_ENABLED": "0"}, clear=False)
+    def test_search_skips_fts_when_disabled_by_env(self) -> None:
+        """환경변수로 비활성화하면 FTS 테이블을 만들지 않아야 한다."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = self._create_db(root=Path(tmp_dir))
+            payload = MailSearchService(db_path=db_path).search(query="보안장비 차단 메일", limit=3)
+            conn = sqlite3.connect(str(db_path))
+            try:
+                tables = conn.execute("SELECT name FROM sqlite_master WHERE name = 'emails_fts'").fetchall()
+            finally:
+                conn.close()
+        self.assertEqual("like", payload["metrics"]["candidate_source"])
+        self.assertEqual([], tables)
+
+
+if __name__ == "__main__":
+    unittest.main()
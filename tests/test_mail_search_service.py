@@ -4,8 +4,10 @@ import sqlite3
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import MagicMock
 
 from app.services.mail_search_service import MailSearchService
+from app.services.mail_vector_index_service import MailVectorHit
 
 
 class MailSearchServiceTest(unittest.TestCase):
@@ -333,6 +335,34 @@ class MailSearchServiceTest(unittest.TestCase):
         first = payload["results"][0]
         self.assertEqual("outlook://message/m-100", first["web_link"])
 
+    def test_search_surfaces_vector_hit_missed_by_lexical_prefilter(self) -> None:
+        """
+        어휘 후보에 없던 메일도 벡터 인덱스 hit이면 후보에 합쳐 반환해야 한다.
+        """
+        vector_service = MagicMock()
+        vector_service.query.return_value = [MailVectorHit(message_id="m-2", score=0.82, metadata={})]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = self._create_db(root=Path(tmp_dir))
+            service = MailSearchService(db_path=db_path, vector_index_service=vector_service)
+            payload = service.search(query="메일함 용량 초과", limit=5)
+        self.assertEqual(["m-2"], [item["message_id"] for item in payload["results"]])
+        self.assertEqual(1, payload["metrics"]["vector_hit_count"])
+        self.assertEqual(1, payload["metrics"]["vector_added_count"])
+        self.assertEqual(5, vector_service.query.call_args.kwargs["k"] // 8)
+
+    def test_search_does_not_add_vector_hit_outside_date_filter(self) -> None:
+        """
+        벡터 hit 메일도 기간 필터를 벗어나면 후보에 추가하지 않아야 한다.
+        """
+        vector_service = MagicMock()
+        vector_service.query.return_value = [MailVectorHit(message_id="m-1", score=0.9, metadata={})]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = self._create_db(root=Path(tmp_dir))
+            service = MailSearchService(db_path=db_path, vector_index_service=vector_service)
+            payload = service.search(query="메일함 용량 초과", start_date="2026-02-19", limit=5)
+        self.assertEqual(0, payload["count"])
+        self.assertEqual(0, payload["metrics"]["candidate_count"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -8,6 +8,7 @@ from pathlib import Path
 from unittest.mock import patch
 
 from app.services.mail_service import MailRecord, MailService
+from app.services.mail_summary_background import get_mail_summary_background_runner
 
 
 class MailServiceSummaryColumnTest(unittest.TestCase):
@@ -65,7 +66,7 @@ class MailServiceSummaryColumnTest(unittest.TestCase):
     )
     def test_upsert_mail_record_processes_summary_job_when_summary_missing(self) -> None:
         """
-        summary가 비어 있으면 upsert 직후 summary/category가 채워지고 queue가 완료되어야 한다.
+        summary가 비어 있으면 upsert가 background 요약을 요청하고, 완료 후 summary와 queue 상태가 갱신되어야 한다.
         """
         with tempfile.TemporaryDirectory() as tmp_dir:
             db_path = Path(tmp_dir) / "emails.db"
@@ -98,6 +99,7 @@ class MailServiceSummaryColumnTest(unittest.TestCase):
                     web_link="https://outlook.live.com/owa/?ItemID=m-2",
                 )
             )
+            self.assertTrue(get_mail_summary_background_runner(db_path).wait(message_id="m-2", timeout_sec=10))
             saved = service.read_mail_by_message_id(message_id="m-2")
             conn = sqlite3.connect(str(db_path))
             try:
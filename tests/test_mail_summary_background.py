@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import threading
+import unittest
+from pathlib import Path
+
+from app.services.mail_summary_background import MailSummaryBackgroundRunner
+
+
+class _FakeQueueWorker:
+    """처리 호출을 기록하고 release 신호까지 대기하는 테스트용 worker."""
+
+    def __init__(self, release: threading.Event) -> None:
+        self.release = release
+        self.processed: list[str] = []
+        self.started = threading.Event()
+
+    def process_message(self, message_id: str) -> bool:
+        self.started.set()
+        self.release.wait(timeout=5)
+        self.processed.append(message_id)
+        return True
+
+
+class MailSummaryBackgroundRunnerTest(unittest.TestCase):
+    """
+    background 요약 실행기의 제출/대기/중복 제거 동작을 검증한다.
+    """
+
+    def setUp(self) -> None:
+        """fake worker를 쓰는 실행기를 만든다."""
+        self._release = threading.Event()
+        self._worker = _FakeQueueWorker(release=self._release)
+        self._runner = MailSummaryBackgroundRunner(
+            db_path=Path("/tmp/unused-emails.db"),
+            worker_count=1,
+            queue_size=1,
+            worker_factory=lambda: self._worker,
+        )
+
+    def tearDown(self) -> None:
+        """worker를 풀어주고 실행기를 종료한다."""
+        self._release.set()
+        self._runner.shutdown(timeout_sec=2)
+
+    def test_wait_times_out_while_summary_is_pending_then_completes(self) -> None:
+        """
+        요약이 끝나기 전 짧은 대기는 False, 완료 후 대기는 True를 반환해야 한다.
+        """
+        self.assertTrue(self._runner.submit(message_id="m-1"))
+        self.assertFalse(self._runner.wait(message_id="m-1", timeout_sec=0.05))
+        self._release.set()
+        self.assertTrue(self._runner.wait(message_id="m-1", timeout_sec=5))
+        self.assertEqual(["m-1"], self._worker.processed)
+
+    def test_duplicate_submit_is_coalesced(self) -> None:
+        """
+        처리 중인 message_id를 다시 제출하면 한 번만 처리해야 한다.
+        """
+        self.assertTrue(self._runner.submit(message_id="m-1"))
+        self.assertTrue(self._runner.submit(message_id="m-1"))
+        self._release.set()
+        self.assertTrue(self._runner.wait(message_id="m-1", timeout_sec=5))
+        self.assertEqual(["m-1"], self._worker.processed)
+
+    def test_submit_is_rejected_when_queue_is_full(self) -> None:
+        """
+        worker가 바쁘고 대기 큐가 가득 차면 제출을 거절해야 한다.
+        """
+        self.assertTrue(self._runner.submit(message_id="m-1"))
+        self.assertTrue(self._worker.started.wait(timeout=5))
+        self.assertTrue(self._runner.submit(message_id="m-2"))
+        self.assertFalse(self._runner.submit(message_id="m-3"))
+        self._release.set()
+        self.assertTrue(self._runner.wait(message_id="m-2", timeout_sec=5))
+        self.assertEqual(["m-1", "m-2"], self._worker.processed)
+
+    def test_wait_without_pending_job_returns_immediately(self) -> None:
+        """
+        대기 중인 작업이 없으면 즉시 True를 반환해야 한다.
+        """
+        self.assertTrue(self._runner.wait(message_id="unknown", timeout_sec=0))
+
+
+    def test_is_pending_reflects_accepted_submissions_only(self) -> None:
+        """
+        받아들여진 제출만 대기 상태로 보고, 거절된 제출은 대기 상태가 아니어야 한다.
+        """
+        self.assertTrue(self._runner.submit(message_id="m-1"))
+        self.assertTrue(self._worker.started.wait(timeout=5))
+        self.assertTrue(self._runner.submit(message_id="m-2"))
+        self.assertFalse(self._runner.submit(message_id="m-3"))
+        self.assertTrue(self._runner.is_pending(message_id="m-1"))
+        self.assertTrue(self._runner.is_pending(message_id="m-2"))
+        self.assertFalse(self._runner.is_pending(message_id="m-3"))
+
+    def test_shutdown_finishes_running_job_and_releases_waiters(self) -> None:
+        """
+        종료는 처리 중인 작업을 마치고, 시작하지 않은 작업의 대기자도 깨워야 한다.
+        """
+        self.assertTrue(self._runner.submit(message_id="m-1"))
+        self.assertTrue(self._worker.started.wait(timeout=5))
+        self.assertTrue(self._runner.submit(message_id="m-2"))
+        self._release.set()
+        self._runner.shutdown(timeout_sec=5)
+
+        self.assertIn("m-1", self._worker.processed)
+        self.assertTrue(self._runner.wait(message_id="m-2", timeout_sec=0))
+        self.assertFalse(self._runner.is_pending(message_id="m-2"))
+        self.assertFalse(self._runner.submit(message_id="m-4"))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import sqlite3
 import tempfile
+import threading
 import unittest
 import os
 from pathlib import Path
@@ -110,10 +111,117 @@ class MailSummaryQueueServiceTest(unittest.TestCase):
         service = MailSummaryQueueService(db_path=db_path)
         service.enqueue_message(message_id="m-empty", requested_by="test")
         worker = MailSummaryQueueWorker(db_path=db_path)
-        worker._vector_index_service.upsert_mail_document = MagicMock(return_value=True)  # type: ignore[attr-defined]
+        worker._vector_index_service.upsert_many = MagicMock(return_value=1)  # type: ignore[attr-defined]
         handled = worker.process_once()
         self.assertTrue(handled)
-        worker._vector_index_service.upsert_mail_document.assert_called_once()  # type: ignore[attr-defined]
+        worker._vector_index_service.upsert_many.assert_called_once()  # type: ignore[attr-defined]
+        documents = worker._vector_index_service.upsert_many.call_args.kwargs["documents"]  # type: ignore[attr-defined]
+        self.assertEqual(["m-empty"], [document.message_id for document in documents])
+
+    def test_worker_vector_upsert_failure_returns_job_to_retry(self) -> None:
+        """
+        벡터 일괄 upsert가 실패하면 작업을 완료로 두지 않고 재시도 대상으로 되돌려야 한다.
+        """
+        db_path = self._build_db()
+        service = MailSummaryQueueService(db_path=db_path)
+        service.enqueue_message(message_id="m-empty", requested_by="test")
+        worker = MailSummaryQueueWorker(db_path=db_path)
+        worker._vector_index_service.upsert_many = MagicMock(side_effect=RuntimeError("chroma down"))  # type: ignore[attr-defined]
+        self.assertTrue(worker.process_once())
+        conn = sqlite3.connect(str(db_path))
+        try:
+            job_row = conn.execute(
+                "SELECT status, last_error FROM mail_summary_queue WHERE message_id = ?",
+                ("m-empty",),
+            ).fetchone()
+        finally:
+            conn.close()
+        self.assertIsNotNone(job_row)
+        assert job_row is not None
+        self.assertEqual("pending", str(job_row[0]))
+        self.assertIn("vector_upsert_failed", str(job_row[1]))
+
+    @patch.dict(os.environ, {"MOLDUBOT_MAIL_VECTOR_INDEX_ENABLED": "0"}, clear=False)
+    def test_worker_process_many_flushes_vector_documents_once(self) -> None:
+        """
+        process_many는 처리한 작업의 벡터 문서를 한 번의 일괄 upsert로 반영해야 한다.
+        """
+        db_path = self._build_db()
+        service = MailSummaryQueueService(db_path=db_path)
+        service.enqueue_backfill(limit=0, include_existing=True)
+        worker = MailSummaryQueueWorker(db_path=db_path)
+        worker._vector_index_service.upsert_many = MagicMock(return_value=2)  # type: ignore[attr-defined]
+        worker.process_many(max_jobs=10)
+        worker._vector_index_service.upsert_many.assert_called_once()  # type: ignore[attr-defined]
+        documents = worker._vector_index_service.upsert_many.call_args.kwargs["documents"]  # type: ignore[attr-defined]
+        self.assertEqual({"m-empty", "m-filled"}, {document.message_id for document in documents})
+
+    def test_claim_jobs_never_returns_same_job_to_concurrent_workers(self) -> None:
+        """
+        여러 스레드가 동시에 일괄 claim해도 같은 작업을 중복 claim하지 않아야 한다.
+        """
+        db_path = self._build_db()
+        service = MailSummaryQueueService(db_path=db_path)
+        for index in range(20):
+            service.enqueue_message(message_id=f"m-extra-{index}", requested_by="test")
+        claimed: list[int] = []
+        claimed_lock = threading.Lock()
+
+        def _claim_all() -> None:
+            while True:
+                jobs = MailSummaryQueueService(db_path=db_path).claim_jobs(limit=3)
+                if not jobs:
+                    return
+                with claimed_lock:
+                    claimed.extend(job.job_id for job in jobs)
+
+        threads = [threading.Thread(target=_claim_all) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+        self.assertEqual(20, len(claimed))
+        self.assertEqual(len(claimed), len(set(claimed)))
+
+    def test_claim_jobs_reclaims_processing_job_after_lease_expires(self) -> None:
+        """
+        lease 시간을 넘긴 processing 작업은 다시 claim되고, lease 안의 작업은 claim되지 않아야 한다.
+        """
+        db_path = self._build_db()
+        service = MailSummaryQueueService(db_path=db_path)
+        service.enqueue_message(message_id="m-empty", requested_by="test")
+        first = service.claim_jobs(limit=5)
+        self.assertEqual(1, len(first))
+        self.assertEqual([], service.claim_jobs(limit=5, lease_sec=600))
+        conn = sqlite3.connect(str(db_path))
+        try:
+            conn.execute("UPDATE mail_summary_queue SET updated_at = datetime('now', '-700 seconds')")
+            conn.commit()
+        finally:
+            conn.close()
+        reclaimed = service.claim_jobs(limit=5, lease_sec=600)
+        self.assertEqual([first[0].job_id], [job.job_id for job in reclaimed])
+        self.assertEqual(2, reclaimed[0].attempt_count)
+
+    @patch.dict(os.environ, {"MOLDUBOT_MAIL_VECTOR_INDEX_ENABLED": "0"}, clear=False)
+    def test_worker_process_many_with_concurrency_processes_all_jobs(self) -> None:
+        """
+        동시 실행 모드도 모든 작업을 한 번씩 처리하고 완료 상태로 남겨야 한다.
+        """
+        db_path = self._build_db()
+        service = MailSummaryQueueService(db_path=db_path)
+        service.enqueue_backfill(limit=0, include_existing=True)
+        worker = MailSummaryQueueWorker(db_path=db_path)
+        worker._vector_index_service.upsert_many = MagicMock(return_value=2)  # type: ignore[attr-defined]
+        result = worker.process_many(max_jobs=10, concurrency=4)
+        self.assertEqual(2, result.processed)
+        self.assertEqual(0, result.failed)
+        conn = sqlite3.connect(str(db_path))
+        try:
+            statuses = {str(row[0]) for row in conn.execute("SELECT status FROM mail_summary_queue").fetchall()}
+        finally:
+            conn.close()
+        self.assertEqual({"completed"}, statuses)
 
     def _build_db(self) -> Path:
         """
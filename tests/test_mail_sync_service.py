@@ -7,7 +7,10 @@ import unittest
 from pathlib import Path
 from unittest.mock import patch
 
+from app.core.sqlite_pool import close_sqlite_pools
 from app.integrations.microsoft_graph.mail_client import GraphMailMessage
+from app.integrations.microsoft_graph.mail_client_types import GraphMailDeltaPage
+from app.integrations.microsoft_graph.mail_delta_client import GraphMailDeltaExpiredError
 from app.services.mail_sync_service import MailSyncService
 
 
@@ -20,6 +23,21 @@ class FakeGraphListClient:
         """반환할 메시지 목록을 저장한다."""
         self._messages = messages
         self.called_limits: list[int] = []
+        self.called_batches: list[list[str]] = []
+
+    def get_messages(self, message_ids: list[str]) -> dict[str, GraphMailMessage]:
+        """
+        `$batch` 일괄 조회를 모사한다(설정된 메시지 중 요청된 것만 반환).
+
+        Args:
+            message_ids: 조회 요청 message_id 목록
+
+        Returns:
+            message_id -> 메시지 사전
+        """
+        self.called_batches.append(list(message_ids))
+        by_id = {message.message_id: message for message in self._messages}
+        return {message_id: by_id[message_id] for message_id in message_ids if message_id in by_id}
 
     def list_recent_messages(self, limit: int = 20) -> list[GraphMailMessage]:
         """
@@ -35,9 +53,55 @@ class FakeGraphListClient:
         return list(self._messages)
 
 
+class FakeGraphDeltaClient:
+    """
+    MailSyncService delta 테스트용 Graph delta 조회 더블.
+    """
+
+    def __init__(self, rounds: list[list[GraphMailDeltaPage] | Exception]) -> None:
+        """호출 순서대로 반환할 페이지 목록(또는 예외)을 저장한다."""
+        self._rounds = list(rounds)
+        self.called_delta_links: list[str] = []
+
+    def iter_delta_pages(self, delta_link: str = "", folder_id: str = "inbox", page_size: int = 50):
+        """
+        delta 페이지 순회를 모사한다.
+
+        Args:
+            delta_link: 시작 deltaLink
+            folder_id: 메일 폴더
+            page_size: 페이지 크기
+
+        Yields:
+            설정된 delta 페이지
+        """
+        self.called_delta_links.append(delta_link)
+        current = self._rounds.pop(0)
+        if isinstance(current, Exception):
+            raise current
+        yield from current
+
+
+def _message(message_id: str, subject: str = "제목") -> GraphMailMessage:
+    """테스트용 Graph 메일을 만든다."""
+    return GraphMailMessage(
+        message_id=message_id,
+        subject=subject,
+        from_address="sender@example.com",
+        received_date="2026-03-18T10:00:00Z",
+        body_text="본문",
+        internet_message_id=f"<{message_id}@example.com>",
+        web_link=f"https://example.com/{message_id}",
+    )
+
+
 class MailSyncServiceTest(unittest.TestCase):
     """Graph 최근 메일 pull sync 동작을 검증한다."""
 
+    def tearDown(self) -> None:
+        """임시 DB를 지우기 전에 공유 연결 풀을 닫는다."""
+        close_sqlite_pools()
+
     @patch.dict(os.environ, {"MOLDUBOT_SUMMARY_SYNC_ON_UPSERT": "0"}, clear=False)
     def test_sync_recent_mail_upserts_new_messages_and_enqueues_summary(self) -> None:
         """신규 Graph 메일은 DB에 upsert되고 summary queue에 적재되어야 한다."""
@@ -108,6 +172,146 @@ class MailSyncServiceTest(unittest.TestCase):
         self.assertEqual(0, result.updated)
         self.assertEqual(1, result.skipped_older)
 
+    @patch.dict(os.environ, {"MOLDUBOT_SUMMARY_SYNC_ON_UPSERT": "0"}, clear=False)
+    def test_sync_delta_applies_pages_deletes_and_persists_delta_link(self) -> None:
+        """delta 페이지의 신규/수정/삭제를 반영하고 마지막 deltaLink를 저장해 다음 실행에 써야 한다."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = self._create_db(Path(tmp_dir))
+            self._set_summary(db_path=db_path, message_id="m-10", summary="기존 요약")
+            delta_client = FakeGraphDeltaClient(
+                [
+                    [
+                        GraphMailDeltaPage(
+                            messages=[_message("m-12"), _message("m-10", subject="제목 변경")],
+                            removed_message_ids=[],
+                            next_link="https://graph.example/next",
+                        ),
+                        GraphMailDeltaPage(
+                            messages=[],
+                            removed_message_ids=["m-12"],
+                            delta_link="https://graph.example/delta-1",
+                        ),
+                    ],
+                    [
+                        GraphMailDeltaPage(
+                            messages=[_message("m-13")],
+                            removed_message_ids=[],
+                            delta_link="https://graph.example/delta-2",
+                        )
+                    ],
+                ]
+            )
+            service = MailSyncService(db_path=db_path, graph_client=FakeGraphListClient([]), delta_client=delta_client)
+            first = service.sync_delta()
+            second = service.sync_delta()
+            connection = sqlite3.connect(str(db_path))
+            try:
+                rows = dict(connection.execute("SELECT message_id, subject || '|' || summary FROM emails").fetchall())
+                queued = {row[0] for row in connection.execute("SELECT message_id FROM mail_summary_queue")}
+                stored_link = connection.execute("SELECT delta_link FROM mail_sync_state").fetchone()[0]
+            finally:
+                connection.close()
+        self.assertEqual(
+            {"fetched": 2, "inserted": 1, "updated": 1, "deleted": 1, "pages": 2, "full_resync": False, "completed": True},
+            first.as_dict(),
+        )
+        self.assertEqual(["", "https://graph.example/delta-1"], delta_client.called_delta_links)
+        self.assertEqual(1, second.inserted)
+        self.assertEqual({"m-10": "제목 변경|기존 요약", "m-13": "제목|"}, rows)
+        self.assertEqual({"m-13"}, queued)
+        self.assertEqual("https://graph.example/delta-2", stored_link)
+
+    @patch.dict(os.environ, {"MOLDUBOT_SUMMARY_SYNC_ON_UPSERT": "0"}, clear=False)
+    def test_sync_delta_keeps_previous_link_when_pages_stop_early(self) -> None:
+        """마지막 페이지를 받지 못하면 deltaLink를 저장하지 않아야 한다."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = self._create_db(Path(tmp_dir))
+            delta_client = FakeGraphDeltaClient(
+                [[GraphMailDeltaPage(messages=[_message("m-12")], removed_message_ids=[], next_link="https://graph.example/next")]]
+            )
+            service = MailSyncService(db_path=db_path, graph_client=FakeGraphListClient([]), delta_client=delta_client)
+            result = service.sync_delta()
+            self.assertFalse(result.completed)
+            self.assertEqual("", service._load_delta_link(scope="me:inbox"))
+
+    @patch.dict(os.environ, {"MOLDUBOT_SUMMARY_SYNC_ON_UPSERT": "0"}, clear=False)
+    def test_sync_delta_runs_full_resync_when_delta_link_expired(self) -> None:
+        """deltaLink가 만료되면 저장값을 비우고 처음부터 다시 동기화해야 한다."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = self._create_db(Path(tmp_dir))
+            delta_client = FakeGraphDeltaClient(
+                [
+                    GraphMailDeltaExpiredError("syncStateNotFound"),
+                    [
+                        GraphMailDeltaPage(
+                            messages=[_message("m-10")],
+                            removed_message_ids=[],
+                            delta_link="https://graph.example/fresh",
+                        )
+                    ],
+                ]
+            )
+            service = MailSyncService(db_path=db_path, graph_client=FakeGraphListClient([]), delta_client=delta_client)
+            service._save_delta_link(scope="me:inbox", delta_link="https://graph.example/stale")
+            result = service.sync_delta()
+            stored_link = service._load_delta_link(scope="me:inbox")
+        self.assertTrue(result.full_resync)
+        self.assertTrue(result.completed)
+        self.assertEqual(1, result.updated)
+        self.assertEqual(["https://graph.example/stale", ""], delta_client.called_delta_links)
+        self.assertEqual("https://graph.example/fresh", stored_link)
+
+    @patch.dict(os.environ, {"MOLDUBOT_SUMMARY_SYNC_ON_UPSERT": "0"}, clear=False)
+    def test_hydrate_missing_bodies_fetches_in_one_batch(self) -> None:
+        """원문 본문이 비어 있는 메일만 한 번의 일괄 조회로 받아 채워야 한다."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = self._create_db(Path(tmp_dir))
+            connection = sqlite3.connect(str(db_path))
+            try:
+                connection.execute("UPDATE emails SET body_full = '' WHERE message_id = 'm-10'")
+                connection.execute(
+                    "INSERT INTO emails (message_id, subject, body_full, received_date) VALUES ('m-01', '완전', '원문', '2026-01-01')"
+                )
+                connection.commit()
+            finally:
+                connection.close()
+            graph_client = FakeGraphListClient([_message("m-10", subject="보강된 제목")])
+            service = MailSyncService(db_path=db_path, graph_client=graph_client)
+            result = service.hydrate_missing_bodies(limit=10)
+            hydrated = service._mail_service.read_mail_by_message_id("m-10")
+        self.assertEqual([["m-10"]], graph_client.called_batches)
+        self.assertEqual({"requested": 1, "fetched": 1, "updated": 1, "missing": 0}, result.as_dict())
+        self.assertEqual("본문", hydrated.body_full_text if hydrated else "")
+
+    def _set_summary(self, db_path: Path, message_id: str, summary: str) -> None:
+        """기존 메일의 저장 요약을 채운다."""
+        connection = sqlite3.connect(str(db_path))
+        try:
+            connection.execute("UPDATE emails SET summary = ? WHERE message_id = ?", (summary, message_id))
+            connection.commit()
+        finally:
+            connection.close()
+
+    @patch.dict(os.environ, {"MOLDUBOT_SUMMARY_SYNC_ON_UPSERT": "1"}, clear=False)
+    def test_sync_without_background_submission_leaves_jobs_in_db_queue(self) -> None:
+        """CLI처럼 background 제출을 끄면 환경변수와 무관하게 요약 작업은 DB queue에만 남아야 한다."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = self._create_db(Path(tmp_dir))
+            service = MailSyncService(
+                db_path=db_path,
+                graph_client=FakeGraphListClient([_message("m-11")]),
+                summary_sync_on_upsert=False,
+            )
+            with patch("app.services.mail_service.get_mail_summary_background_runner") as mocked_runner:
+                service.sync_recent_messages(limit=10)
+            connection = sqlite3.connect(str(db_path))
+            try:
+                statuses = connection.execute("SELECT status FROM mail_summary_queue").fetchall()
+            finally:
+                connection.close()
+        mocked_runner.assert_not_called()
+        self.assertEqual([("pending",)], statuses)
+
     def _create_db(self, root: Path) -> Path:
         """동기화 테스트용 최소 emails DB를 생성한다."""
         db_path = root / "emails.db"
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import math
+import re
+import unittest
+from unittest.mock import patch
+
+from app.services.mail_vector_embedding import (
+    _token_slot,
+    build_hash_embedding,
+    cosine_similarities,
+    cosine_similarity,
+    embed_many,
+)
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+SAMPLE_TEXTS = [
+    "보안장비 차단 확인 요청 보안장비",
+    "M365 구축 일정 공유드립니다",
+    "",
+    "!!!",
+    "사서함 자동 비우기 설정 문의 Mailbox full",
+]
+
+
+def _reference_hash_embedding(text: str, dim: int = 256) -> list[float]:
+    """기존 md5 토큰 해시 임베딩 구현(호환성 기준값)."""
+    vector = [0.0] * dim
+    tokens = [token.strip().lower() for token in re.findall(r"[가-힣A-Za-z0-9]+", text) if token.strip()]
+    for token in tokens:
+        digest = hashlib.md5(token.encode("utf-8")).hexdigest()
+        index = int(digest[:8], 16) % dim
+        sign = -1.0 if int(digest[8:16], 16) % 2 else 1.0
+        vector[index] += sign
+    norm = math.sqrt(sum(value * value for value in vector))
+    if norm == 0:
+        return vector
+    return [value / norm for value in vector]
+
+
+class MailVectorEmbeddingTest(unittest.TestCase):
+    """토큰 해시 임베딩 일괄 생성/유사도 계산 호환성을 검증한다."""
+
+    def _assert_matches_reference(self) -> None:
+        """단건/일괄 임베딩이 기존 구현과 비트 단위로 같아야 한다."""
+        expected = [_reference_hash_embedding(text) for text in SAMPLE_TEXTS]
+        self.assertEqual(expected, embed_many(texts=SAMPLE_TEXTS))
+        self.assertEqual(expected[0], build_hash_embedding(text=SAMPLE_TEXTS[0]))
+        self.assertEqual(_reference_hash_embedding(SAMPLE_TEXTS[1], dim=32), build_hash_embedding(SAMPLE_TEXTS[1], dim=32))
+
+    @patch("app.services.mail_vector_embedding.load_numpy_module", return_value=None)
+    def test_python_path_matches_reference_md5_embedding(self, _: object) -> None:
+        """numpy 미사용 경로도 기존 md5 임베딩과 같은 값을 반환해야 한다."""
+        self._assert_matches_reference()
+
+    @unittest.skipUnless(HAS_NUMPY, "numpy 미설치")
+    def test_numpy_path_matches_reference_md5_embedding(self) -> None:
+        """numpy bincount 경로도 기존 md5 임베딩과 같은 값을 반환해야 한다."""
+        self._assert_matches_reference()
+
+    def test_token_slot_is_memoized(self) -> None:
+        """같은 토큰 해시는 LRU 캐시에서 재사용되어야 한다."""
+        _token_slot.cache_clear()
+        embed_many(texts=["보안장비 보안장비 차단", "차단"])
+        info = _token_slot.cache_info()
+        self.assertEqual(2, info.misses)
+        self.assertEqual(2, info.hits)
+
+    def test_cosine_similarities_matches_pairwise_similarity(self) -> None:
+        """일괄 유사도 계산은 단건 코사인 유사도와 같은 값을 반환해야 한다."""
+        vectors = embed_many(texts=SAMPLE_TEXTS)
+        expected = [cosine_similarity(left=vectors[0], right=vector) for vector in vectors]
+        actual = cosine_similarities(query=vectors[0], vectors=vectors)
+        for left, right in zip(expected, actual, strict=True):
+            self.assertAlmostEqual(left, right, places=12)
+        self.assertEqual([], cosine_similarities(query=vectors[0], vectors=[]))
+
+
+if __name__ == "__main__":
+    unittest.main()
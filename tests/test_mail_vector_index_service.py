@@ -8,6 +8,8 @@ import unittest
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+from app.services.mail_vector_document import MailVectorDocument
+from app.services.mail_vector_embedding import build_hash_embedding
 from app.services.mail_vector_index_service import MailVectorIndexService
 
 
@@ -106,6 +108,145 @@ class MailVectorIndexServiceTest(unittest.TestCase):
         self.assertEqual(1, len(rows))
         self.assertEqual("m-3", rows[0][0])
 
+    @patch.dict(os.environ, {"MOLDUBOT_MAIL_VECTOR_INDEX_ENABLED": "1"}, clear=False)
+    @patch("app.services.mail_vector_index_service._load_chromadb_module", return_value=None)
+    def test_query_returns_nearest_documents_from_fallback_store(self, _: MagicMock) -> None:
+        """sqlite fallback backend도 질의 임베딩 근접 이웃을 유사도 순으로 반환해야 한다."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with patch.dict(os.environ, {"MOLDUBOT_MAIL_VECTOR_DIR": tmp_dir}, clear=False):
+                service = MailVectorIndexService()
+                for message_id, subject, category in (
+                    ("m-1", "보안장비 차단 확인 요청", "보안"),
+                    ("m-2", "사서함 자동 비우기 설정 문의", "일반"),
+                ):
+                    service.upsert_mail_document(
+                        message_id=message_id,
+                        subject=subject,
+                        body_text=subject,
+                        summary=subject,
+                        category=category,
+                        from_address="a@example.com",
+                        received_date="2026-03-10T00:00:00Z",
+                    )
+                embedding = build_hash_embedding(text="보안장비 차단")
+                hits = service.query(embedding=embedding, k=2)
+                filtered = service.query(embedding=embedding, k=2, where={"category": "일반"})
+        self.assertEqual(["m-1", "m-2"], [hit.message_id for hit in hits])
+        self.assertGreater(hits[0].score, hits[1].score)
+        self.assertEqual("보안", hits[0].metadata["category"])
+        self.assertEqual(["m-2"], [hit.message_id for hit in filtered])
+
+    @patch.dict(os.environ, {"MOLDUBOT_MAIL_VECTOR_INDEX_ENABLED": "1"}, clear=False)
+    def test_query_converts_chroma_distances_to_scores(self) -> None:
+        """Chroma query 결과의 squared L2 거리를 코사인 유사도 점수로 변환해야 한다."""
+        fake_collection = MagicMock()
+        fake_collection.query.return_value = {
+            "ids": [["m-9"]],
+            "distances": [[0.5]],
+            "metadatas": [[{"category": "일반"}]],
+        }
+        fake_client = MagicMock()
+        fake_client.get_or_create_collection.return_value = fake_collection
+        fake_module = types.SimpleNamespace(PersistentClient=MagicMock(return_value=fake_client))
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with patch.dict(os.environ, {"MOLDUBOT_MAIL_VECTOR_DIR": tmp_dir}, clear=False), patch(
+                "app.services.mail_vector_index_service._resolve_runtime_blocker", return_value=""
+            ), patch("app.services.mail_vector_index_service._load_chromadb_module", return_value=fake_module):
+                hits = MailVectorIndexService().query(embedding=[1.0, 0.0], k=3, where={"category": "일반"})
+        self.assertEqual(1, len(hits))
+        self.assertEqual("m-9", hits[0].message_id)
+        self.assertAlmostEqual(0.75, hits[0].score)
+        self.assertEqual({"category": "일반"}, fake_collection.query.call_args.kwargs["where"])
+
+    @patch.dict(os.environ, {"MOLDUBOT_MAIL_VECTOR_INDEX_ENABLED": "1"}, clear=False)
+    def test_upsert_many_reuses_cached_chroma_collection_in_chunks(self) -> None:
+        """일괄 upsert는 Chroma 클라이언트를 재사용하고 청크 크기로 나눠 기록해야 한다."""
+        fake_collection = MagicMock()
+        fake_client = MagicMock()
+        fake_client.get_or_create_collection.return_value = fake_collection
+        fake_module = types.SimpleNamespace(PersistentClient=MagicMock(return_value=fake_client))
+        documents = [MailVectorDocument(message_id=f"m-{index}", subject=f"제목{index}") for index in range(5)]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with patch.dict(os.environ, {"MOLDUBOT_MAIL_VECTOR_DIR": tmp_dir}, clear=False), patch(
+                "app.services.mail_vector_index_service._resolve_runtime_blocker", return_value=""
+            ), patch("app.services.mail_vector_index_service._load_chromadb_module", return_value=fake_module):
+                service = MailVectorIndexService()
+                indexed = service.upsert_many(documents=documents, chunk_size=2)
+                service.upsert_many(documents=documents[:1])
+        self.assertEqual(5, indexed)
+        fake_module.PersistentClient.assert_called_once()
+        chunk_sizes = [len(call.kwargs["ids"]) for call in fake_collection.upsert.call_args_list]
+        self.assertEqual([2, 2, 1, 1], chunk_sizes)
+
+    @patch.dict(
+        os.environ,
+        {"MOLDUBOT_MAIL_VECTOR_INDEX_ENABLED": "1", "MOLDUBOT_MAIL_VECTOR_UPSERT_CHUNK_SIZE": "2"},
+        clear=False,
+    )
+    @patch("app.services.mail_vector_index_service._load_chromadb_module", return_value=None)
+    def test_upsert_many_writes_fallback_chunks_and_skips_blank_ids(self, _: MagicMock) -> None:
+        """fallback 일괄 upsert는 빈 id를 제외하고 중복 id는 마지막 문서로 저장해야 한다."""
+        documents = [
+            MailVectorDocument(message_id="m-1", subject="처음"),
+            MailVectorDocument(message_id=" ", subject="무시"),
+            MailVectorDocument(message_id="m-2", subject="둘째"),
+            MailVectorDocument(message_id="m-3", subject="셋째"),
+            MailVectorDocument(message_id="m-1", subject="갱신"),
+        ]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with patch.dict(os.environ, {"MOLDUBOT_MAIL_VECTOR_DIR": tmp_dir}, clear=False):
+                indexed = MailVectorIndexService().upsert_many(documents=documents)
+                rows = self._read_fallback_rows(Path(tmp_dir) / "mail_vector_fallback.sqlite3")
+        self.assertEqual(3, indexed)
+        self.assertEqual(["m-1", "m-2", "m-3"], [row[0] for row in rows])
+        self.assertIn("subject: 갱신", rows[0][1])
+
+    @patch.dict(os.environ, {"MOLDUBOT_MAIL_VECTOR_INDEX_ENABLED": "1"}, clear=False)
+    @patch("app.services.mail_vector_index_service._load_chromadb_module", return_value=None)
+    def test_embedding_version_mismatch_blocks_mixing_until_reset(self, _: MagicMock) -> None:
+        """컬렉션 임베딩 버전이 다르면 조회/기록을 막고, reset 후 새 버전으로 재색인해야 한다."""
+        fake_provider = MagicMock()
+        fake_provider.version_tag = "st:fake:3"
+        fake_provider.embed_many.side_effect = lambda texts: [[1.0, 0.0, 0.0] for _ in texts]
+        document = MailVectorDocument(message_id="m-1", subject="보안장비 차단")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with patch.dict(os.environ, {"MOLDUBOT_MAIL_VECTOR_DIR": tmp_dir}, clear=False):
+                MailVectorIndexService().upsert_many(documents=[document])
+                service = MailVectorIndexService(embedding_provider=fake_provider)
+                blocked_status = service.get_status()
+                blocked_upsert = service.upsert_many(documents=[document])
+                blocked_hits = service.query(embedding=[1.0, 0.0, 0.0], k=3)
+                service.reset_index()
+                indexed = service.upsert_many(documents=[document])
+                hits = service.query(embedding=[1.0, 0.0, 0.0], k=3)
+                reopened = MailVectorIndexService(embedding_provider=fake_provider).get_status()
+        self.assertTrue(blocked_status.reindex_required)
+        self.assertEqual("hash-md5-256-v1", blocked_status.stored_embedding_version)
+        self.assertEqual(0, blocked_upsert)
+        self.assertEqual([], blocked_hits)
+        self.assertEqual(1, indexed)
+        self.assertEqual(["m-1"], [hit.message_id for hit in hits])
+        self.assertFalse(reopened.reindex_required)
+        self.assertEqual("st:fake:3", reopened.stored_embedding_version)
+
+    @patch.dict(os.environ, {"MOLDUBOT_MAIL_VECTOR_INDEX_ENABLED": "1"}, clear=False)
+    @patch("app.services.mail_vector_index_service._load_chromadb_module", return_value=None)
+    def test_legacy_fallback_rows_without_version_are_treated_as_hash(self, _: MagicMock) -> None:
+        """버전 기록이 없는 기존 fallback 행은 hash 임베딩 컬렉션으로 간주해야 한다."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = Path(tmp_dir) / "mail_vector_fallback.sqlite3"
+            with patch.dict(os.environ, {"MOLDUBOT_MAIL_VECTOR_DIR": tmp_dir}, clear=False):
+                MailVectorIndexService().upsert_many(documents=[MailVectorDocument(message_id="m-1")])
+                connection = sqlite3.connect(str(db_path))
+                try:
+                    connection.execute("DELETE FROM mail_vector_collection_meta")
+                    connection.commit()
+                finally:
+                    connection.close()
+                status = MailVectorIndexService().get_status()
+        self.assertFalse(status.reindex_required)
+        self.assertEqual("hash-md5-256-v1", status.stored_embedding_version)
+
     def _read_fallback_rows(self, db_path: Path) -> list[tuple[str, str]]:
         """sqlite fallback DB에서 저장된 message_id/document를 읽는다."""
         connection = sqlite3.connect(str(db_path))
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import importlib.util
+import sqlite3
+import tempfile
+import unittest
+from array import array
+from pathlib import Path
+from unittest.mock import patch
+
+from app.services.mail_vector_embedding import build_hash_embedding
+from app.services.mail_vector_fallback_collection import SQLiteFallbackVectorCollection
+from app.services.mail_vector_matrix import MailVectorMatrix, pack_embedding, unpack_embedding
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+
+class MailVectorMatrixTest(unittest.TestCase):
+    """fallback 임베딩 행렬 적재/증분 반영/top-k 검색을 검증한다."""
+
+    def _build_matrix(self) -> MailVectorMatrix:
+        """검색 테스트용 3행 행렬을 생성한다."""
+        matrix = MailVectorMatrix()
+        matrix.load(
+            rows=[
+                ("m-1", {"category": "보안"}, array("f", [1.0, 0.0, 0.0])),
+                ("m-2", {"category": "일반"}, array("f", [0.6, 0.8, 0.0])),
+                ("m-3", {"category": "일반"}, array("f", [0.0, 0.0, 1.0])),
+            ],
+            stamp=(1, 1),
+        )
+        return matrix
+
+    def _assert_search_contract(self) -> None:
+        """검색 정렬/where 필터/증분 교체 결과를 검증한다."""
+        matrix = self._build_matrix()
+        top = matrix.search(query_vector=[1.0, 0.0, 0.0], n_results=2)
+        filtered = matrix.search(query_vector=[1.0, 0.0, 0.0], n_results=5, where={"category": "일반"})
+        matrix.upsert(
+            ids=["m-3", "m-4"],
+            metadatas=[{"category": "일반"}, {"category": "일반"}],
+            embeddings=[[0.9, 0.1, 0.0], [0.0, 1.0, 0.0]],
+            stamp=(2, 2),
+        )
+        refreshed = matrix.search(query_vector=[1.0, 0.0, 0.0], n_results=2)
+        self.assertEqual(["m-1", "m-2"], [message_id for _, message_id, _ in top])
+        self.assertAlmostEqual(1.0, top[0][0], places=5)
+        self.assertEqual(["m-2", "m-3"], [message_id for _, message_id, _ in filtered])
+        self.assertEqual(["m-1", "m-3"], [message_id for _, message_id, _ in refreshed])
+        self.assertEqual(4, matrix.size)
+        self.assertEqual((2, 2), matrix.stamp)
+
+    @patch("app.services.mail_vector_matrix.load_numpy_module", return_value=None)
+    def test_python_search_orders_filters_and_refreshes(self, _: object) -> None:
+        """numpy가 없으면 순수 Python 내적으로 같은 결과를 반환해야 한다."""
+        self._assert_search_contract()
+
+    @unittest.skipUnless(HAS_NUMPY, "numpy 미설치")
+    def test_numpy_search_orders_filters_and_refreshes(self) -> None:
+        """numpy가 있으면 행렬-벡터 곱 경로로 같은 결과를 반환해야 한다."""
+        self._assert_search_contract()
+
+    def test_pack_and_unpack_embedding_roundtrip(self) -> None:
+        """임베딩 BLOB 직렬화는 float32 값을 그대로 복원해야 한다."""
+        blob = pack_embedding([0.5, -0.25, 1.0])
+        self.assertEqual(12, len(blob))
+        self.assertEqual([0.5, -0.25, 1.0], list(unpack_embedding(blob)))
+
+
+class SQLiteFallbackVectorCollectionMatrixTest(unittest.TestCase):
+    """fallback 컬렉션의 BLOB 저장과 행렬 재적재 동작을 검증한다."""
+
+    def test_upsert_stores_blob_and_reads_legacy_json_rows(self) -> None:
+        """신규 행은 BLOB으로 저장하고, 구버전 JSON 행도 검색 대상에 포함해야 한다."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = Path(tmp_dir) / "fallback.sqlite3"
+            self._seed_legacy_row(db_path=db_path, message_id="m-legacy", text="보안장비 차단")
+            collection = SQLiteFallbackVectorCollection(db_path=db_path, collection_name="emails")
+            collection.upsert(
+                ids=["m-new"],
+                documents=["사서함 정리"],
+                metadatas=[{"category": "일반"}],
+                embeddings=[build_hash_embedding(text="사서함 정리")],
+            )
+            result = collection.query(query_embeddings=[build_hash_embedding(text="보안장비 차단")], n_results=2)
+            stored = self._read_row(db_path=db_path, message_id="m-new")
+        self.assertEqual(["m-legacy", "m-new"], result["ids"][0])
+        self.assertAlmostEqual(0.0, result["distances"][0][0], places=5)
+        self.assertEqual("", stored[0])
+        self.assertEqual(256 * 4, len(stored[1]))
+
+    def test_query_reloads_matrix_after_external_write(self) -> None:
+        """다른 연결이 fallback DB를 갱신하면 다음 조회에서 행렬을 다시 적재해야 한다."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = Path(tmp_dir) / "fallback.sqlite3"
+            collection = SQLiteFallbackVectorCollection(db_path=db_path, collection_name="emails")
+            collection.upsert(
+                ids=["m-1"],
+                documents=["사서함 정리"],
+                metadatas=[{}],
+                embeddings=[build_hash_embedding(text="사서함 정리")],
+            )
+            query = [build_hash_embedding(text="보안장비 차단")]
+            before = collection.query(query_embeddings=query, n_results=1)
+            other = SQLiteFallbackVectorCollection(db_path=db_path, collection_name="emails")
+            with patch("app.services.mail_vector_fallback_collection.get_shared_matrix", return_value=MailVectorMatrix()):
+                other.upsert(
+                    ids=["m-2"],
+                    documents=["보안장비 차단"],
+                    metadatas=[{}],
+                    embeddings=[build_hash_embedding(text="보안장비 차단")],
+                )
+            after = collection.query(query_embeddings=query, n_results=1)
+        self.assertEqual(["m-1"], before["ids"][0])
+        self.assertEqual(["m-2"], after["ids"][0])
+
+    def _seed_legacy_row(self, db_path: Path, message_id: str, text: str) -> None:
+        """`embedding_blob` 컬럼이 없는 구버전 fallback 테이블 행을 생성한다."""
+        connection = sqlite3.connect(str(db_path))
+        try:
+            connection.execute(
+                "CREATE TABLE mail_vector_index ("
+                "collection_name TEXT NOT NULL, message_id TEXT NOT NULL, document TEXT NOT NULL, "
+                "metadata_json TEXT NOT NULL, embedding_json TEXT NOT NULL, "
+                "updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP, PRIMARY KEY (collection_name, message_id))"
+            )
+            connection.execute(
+                "INSERT INTO mail_vector_index (collection_name, message_id, document, metadata_json, embedding_json) "
+                "VALUES ('emails', ?, ?, '{}', ?)",
+                (message_id, text, str(build_hash_embedding(text=text))),
+            )
+            connection.commit()
+        finally:
+            connection.close()
+
+    def _read_row(self, db_path: Path, message_id: str) -> tuple[str, bytes]:
+        """fallback 행의 embedding_json/embedding_blob 값을 읽는다."""
+        connection = sqlite3.connect(str(db_path))
+        try:
+            return connection.execute(
+                "SELECT embedding_json, embedding_blob FROM mail_vector_index WHERE message_id = ?",
+                (message_id,),
+            ).fetchone()
+        finally:
+            connection.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import unittest
+
+from app.core.query_features import get_query_features, get_query_features_stats
+
+
+class QueryFeaturesTest(unittest.TestCase):
+    """질의 1회 스캔 규칙 플래그 계산을 검증한다."""
+
+    def setUp(self) -> None:
+        """테스트 간 캐시를 비운다."""
+        get_query_features.cache_clear()
+
+    def test_skill_commands_require_command_boundary(self) -> None:
+        """스킬 명령은 단독 또는 공백 뒤 인자가 있을 때만 인식해야 한다."""
+        self.assertTrue(get_query_features("/메일요약").is_mail_summary_skill)
+        self.assertTrue(get_query_features(' "/MailSummary 3줄" ').is_mail_summary_skill)
+        self.assertFalse(get_query_features("/메일요약해줘").is_mail_summary_skill)
+        self.assertTrue(get_query_features("/코드분석 이 함수").is_explicit_skill)
+        self.assertFalse(get_query_features("/코드분석 이 함수").is_mail_summary_skill)
+
+    def test_code_review_flag_includes_snippet_token(self) -> None:
+        """`코드스니펫`은 `코드`를 접두어로 포함해도 코드 리뷰 플래그를 켜야 한다."""
+        self.assertTrue(get_query_features("코드 스니펫 보여줘").is_code_review)
+        self.assertTrue(get_query_features("이 코드 리뷰해줘").is_code_review)
+        self.assertTrue(get_query_features("코드스니펫의 문제점 분석").is_code_review)
+        self.assertFalse(get_query_features("메일 분석해줘").is_code_review)
+
+    def test_overlapping_anchor_and_summary_tokens_are_all_detected(self) -> None:
+        """겹치는 토큰(현재메일/요약, 이이메일의)도 한 번의 스캔에서 모두 잡아야 한다."""
+        features = get_query_features("현재 메일 요약해줘")
+        self.assertTrue(features.has_current_mail_anchor)
+        self.assertTrue(features.is_current_mail_summary)
+        self.assertTrue(get_query_features("이 이메일의 수신자 알려줘").has_current_mail_anchor)
+        self.assertTrue(get_query_features("Please TRANSLATE this").is_translation_like)
+        self.assertFalse(get_query_features("메일 요약해줘").is_current_mail_summary)
+
+    def test_line_target_and_explicit_line_count(self) -> None:
+        """줄 수 명시와 목표 줄 수는 기존 규칙과 같은 범위로 계산해야 한다."""
+        features = get_query_features("현재메일 3줄 요약")
+        self.assertTrue(features.has_explicit_line_count)
+        self.assertEqual(3, features.summary_line_target)
+        self.assertEqual(20, get_query_features("99가지로 정리").summary_line_target)
+        self.assertEqual(5, get_query_features("요약해줘").summary_line_target)
+
+    def test_repeated_predicates_reuse_single_scan(self) -> None:
+        """같은 질의로 여러 판별 함수를 불러도 플래그 계산은 한 번이어야 한다."""
+        from app.core.intent_rules import is_code_review_query, is_mail_summary_skill_query
+        from app.services.answer_postprocessor_summary import is_current_mail_summary_request
+        from app.services.current_mail_intent_policy import is_translation_like_request_text
+
+        query = "현재메일 코드 리뷰 후 번역해줘"
+        self.assertTrue(is_code_review_query(user_message=query))
+        self.assertFalse(is_mail_summary_skill_query(user_message=query))
+        self.assertTrue(is_translation_like_request_text(user_message=query))
+        self.assertFalse(is_current_mail_summary_request(user_message=query))
+        stats = get_query_features_stats()
+        self.assertEqual(1, stats["misses"])
+        self.assertEqual(3, stats["hits"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import asyncio
+import os
 import types
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from app.agents.report_agent import (
     _build_fast_report_messages,
@@ -13,6 +15,7 @@ from app.agents.report_agent import (
     generate_report_html_fast,
     generate_weekly_report_html_fast,
 )
+from app.agents.report_agent_async import agenerate_report_html_fast
 
 
 class ReportAgentTest(unittest.TestCase):
@@ -92,6 +95,42 @@ class ReportAgentTest(unittest.TestCase):
                 )
         self.assertIn("<br>- ", html)
 
+    @patch.dict(
+        os.environ,
+        {"AZURE_OPENAI_ENDPOINT": "https://example", "AZURE_OPENAI_API_KEY": "k", "SUMMARIZATION_MODEL": "gpt-4o-mini"},
+        clear=True,
+    )
+    def test_agenerate_report_html_fast_uses_async_runtime(self) -> None:
+        fake_invoke = AsyncMock(return_value="```html\n<h1>테스트</h1>\n```")
+        with patch("app.agents.report_agent_async.ainvoke_text_messages", new=fake_invoke):
+            html = asyncio.run(
+                agenerate_report_html_fast(
+                    email_subject="제목",
+                    email_content="본문",
+                    report_date="2026-01-16T05:47:10Z",
+                    report_author="박제영",
+                )
+            )
+        self.assertEqual("<h1>테스트</h1>", html)
+        self.assertEqual("azure_openai:gpt-4o-mini", fake_invoke.call_args.kwargs["model_name"])
+
+    @patch.dict(
+        os.environ,
+        {"AZURE_OPENAI_ENDPOINT": "https://example", "AZURE_OPENAI_API_KEY": "k"},
+        clear=True,
+    )
+    def test_agenerate_report_html_fast_returns_empty_on_timeout(self) -> None:
+        with patch("app.agents.report_agent_async.ainvoke_text_messages", new=AsyncMock(side_effect=TimeoutError())):
+            html = asyncio.run(
+                agenerate_report_html_fast(
+                    email_subject="제목",
+                    email_content="본문",
+                    report_date="2026-01-16",
+                    report_author="박제영",
+                )
+            )
+        self.assertEqual("", html)
+
 
 if __name__ == "__main__":
     unittest.main()
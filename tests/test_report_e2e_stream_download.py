@@ -4,7 +4,7 @@ import json
 import tempfile
 import unittest
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 from docx import Document
 from fastapi import FastAPI
@@ -48,8 +48,8 @@ class ReportE2EStreamDownloadTest(unittest.TestCase):
             report_html_dir = Path(tmp_dir) / "html"
 
             with patch(
-                "app.api.report_routes.generate_report_html_fast",
-                return_value="<html><body><h1>테스트 보고서</h1><p>본문 문장</p></body></html>",
+                "app.api.report_routes.agenerate_report_html_fast",
+                new=AsyncMock(return_value="<html><body><h1>테스트 보고서</h1><p>본문 문장</p></body></html>"),
             ):
                 with patch("app.services.report_docx_service.REPORT_FILES_DIR", report_docx_dir):
                     with patch("app.services.report_docx_service.REPORT_HTML_DIR", report_html_dir):
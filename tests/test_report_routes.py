@@ -50,8 +50,8 @@ class ReportRoutesTest(unittest.TestCase):
 
     def test_report_generate_emits_steps_and_done(self) -> None:
         with patch(
-            "app.api.report_routes.generate_report_html_fast",
-            return_value="<html><body><h1>테스트</h1></body></html>",
+            "app.api.report_routes.agenerate_report_html_fast",
+            new=AsyncMock(return_value="<html><body><h1>테스트</h1></body></html>"),
         ):
             with patch(
                 "app.api.report_routes.convert_html_to_docx",
@@ -83,7 +83,7 @@ class ReportRoutesTest(unittest.TestCase):
             converted_payload["title"] = title
             return "/report/download/fallback.docx"
 
-        with patch("app.api.report_routes.generate_report_html_fast", return_value=""):
+        with patch("app.api.report_routes.agenerate_report_html_fast", new=AsyncMock(return_value="")):
             with patch("app.api.report_routes.convert_html_to_docx", new=_fake_convert):
                 response = self.client.post(
                     "/report/generate",
@@ -117,8 +117,8 @@ class ReportRoutesTest(unittest.TestCase):
 
     def test_weekly_report_generate_emits_steps_and_done(self) -> None:
         with patch(
-            "app.api.report_routes.generate_weekly_report_html_fast",
-            return_value="<html><body><h1>주간보고</h1></body></html>",
+            "app.api.report_routes.agenerate_weekly_report_html_fast",
+            new=AsyncMock(return_value="<html><body><h1>주간보고</h1></body></html>"),
         ):
             with patch(
                 "app.api.report_routes._fetch_weekly_mail_items",
@@ -151,7 +151,7 @@ class ReportRoutesTest(unittest.TestCase):
             converted_payload["layout"] = layout
             return "/report/download/weekly-fallback.docx"
 
-        with patch("app.api.report_routes.generate_weekly_report_html_fast", return_value=""):
+        with patch("app.api.report_routes.agenerate_weekly_report_html_fast", new=AsyncMock(return_value="")):
             with patch("app.api.report_routes._fetch_weekly_mail_items", return_value=[]):
                 with patch("app.api.report_routes.convert_html_to_docx", new=_fake_convert):
                     response = self.client.post(
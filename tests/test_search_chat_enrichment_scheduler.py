@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from unittest.mock import patch
+
+from app.api import search_chat_enrichment_scheduler
+from app.api.search_chat_enrichment_scheduler import (
+    ENRICHMENT_BUDGET_MS_ENV,
+    ENRICHMENT_MAX_WORKERS_ENV,
+    ENRICHMENT_PARALLEL_ENV,
+    ENRICHMENT_STAGE_TIMEOUT_MS_ENV,
+    EnrichmentStage,
+    run_enrichment_stages,
+)
+from app.api.search_chat_stream_async import CHAT_STREAM_MAX_CONCURRENCY_ENV
+
+_TEST_CTX: ContextVar[str] = ContextVar("enrichment_scheduler_test_ctx", default="")
+
+
+class SearchChatEnrichmentSchedulerTest(unittest.TestCase):
+    """후처리 enrichment 단계 병렬 실행/시간 예산 처리를 검증한다."""
+
+    def test_independent_stages_run_concurrently(self) -> None:
+        """독립 단계는 동시에 실행되어 전체 시간이 단계 합보다 짧아야 한다."""
+        barrier = threading.Barrier(2, timeout=2)
+
+        def _stage(value: str) -> str:
+            barrier.wait()
+            time.sleep(0.05)
+            return value
+
+        stage_timings: dict[str, float] = {}
+        started_at = time.perf_counter()
+        results = run_enrichment_stages(
+            stages=[
+                EnrichmentStage(name="web_sources", run=lambda: _stage("web")),
+                EnrichmentStage(name="related_mail", run=lambda: _stage("mail")),
+            ],
+            stage_timings=stage_timings,
+        )
+        elapsed = time.perf_counter() - started_at
+
+        self.assertEqual({"web_sources": "web", "related_mail": "mail"}, results)
+        self.assertLess(elapsed, 0.5)
+        self.assertIn("web_sources_ms", stage_timings)
+        self.assertNotIn("web_sources_timed_out", stage_timings)
+
+    def test_stage_over_budget_returns_fallback_and_is_marked(self) -> None:
+        """예산을 넘긴 단계는 fallback을 결과로 쓰고 stage_timings에 표시되어야 한다."""
+        release = threading.Event()
+        stage_timings: dict[str, float] = {}
+        with patch.dict(os.environ, {ENRICHMENT_BUDGET_MS_ENV: "50"}):
+            started_at = time.perf_counter()
+            results = run_enrichment_stages(
+                stages=[
+                    EnrichmentStage(name="web_sources", run=lambda: release.wait(2) and ([{"url": "x"}], []), fallback=([], [])),
+                    EnrichmentStage(name="next_actions", run=lambda: [{"action_id": "a"}], fallback=[]),
+                ],
+                stage_timings=stage_timings,
+            )
+            elapsed = time.perf_counter() - started_at
+        release.set()
+
+        self.assertEqual(([], []), results["web_sources"])
+        self.assertEqual([{"action_id": "a"}], results["next_actions"])
+        self.assertEqual(1.0, stage_timings["web_sources_timed_out"])
+        self.assertNotIn("next_actions_timed_out", stage_timings)
+        self.assertLess(elapsed, 1.0)
+
+    def test_per_stage_timeout_applies_before_total_budget(self) -> None:
+        """단계 제한 시간이 전체 예산보다 짧으면 단계 제한 시간에서 끊어야 한다."""
+        release = threading.Event()
+        stage_timings: dict[str, float] = {}
+        with patch.dict(os.environ, {ENRICHMENT_STAGE_TIMEOUT_MS_ENV: "30", ENRICHMENT_BUDGET_MS_ENV: "5000"}):
+            results = run_enrichment_stages(
+                stages=[EnrichmentStage(name="related_mail", run=lambda: release.wait(2), fallback=["partial"])],
+                stage_timings=stage_timings,
+            )
+        release.set()
+
+        self.assertEqual(["partial"], results["related_mail"])
+        self.assertLess(stage_timings["related_mail_ms"], 1000)
+
+    def test_stage_exception_propagates(self) -> None:
+        """단계 예외는 기존 순차 실행과 같이 호출자에게 전파되어야 한다."""
+
+        def _fail() -> None:
+            raise RuntimeError("boom")
+
+        with self.assertRaises(RuntimeError):
+            run_enrichment_stages(stages=[EnrichmentStage(name="web_sources", run=_fail)], stage_timings={})
+
+    def test_stages_inherit_caller_context(self) -> None:
+        """worker thread 단계도 호출자 ContextVar(턴 컨텍스트 등)를 볼 수 있어야 한다."""
+        token = _TEST_CTX.set("turn-1")
+        try:
+            results = run_enrichment_stages(
+                stages=[EnrichmentStage(name="next_actions", run=_TEST_CTX.get)],
+                stage_timings={},
+            )
+        finally:
+            _TEST_CTX.reset(token)
+
+        self.assertEqual("turn-1", results["next_actions"])
+
+    def test_parallel_disabled_runs_inline(self) -> None:
+        """병렬 실행을 끄면 호출 스레드에서 순서대로 실행해야 한다."""
+        caller_thread = threading.get_ident()
+        with patch.dict(os.environ, {ENRICHMENT_PARALLEL_ENV: "0"}):
+            results = run_enrichment_stages(
+                stages=[EnrichmentStage(name="next_actions", run=threading.get_ident)],
+                stage_timings={},
+            )
+
+        self.assertEqual(caller_thread, results["next_actions"])
+
+
+    def test_queued_fast_stages_do_not_time_out_under_concurrent_turns(self) -> None:
+        """동시 턴이 pool을 넘쳐도 빠른 단계는 대기열 시간 때문에 시간 초과되면 안 된다."""
+        turn_count = 8
+        stage_names = ("next_actions", "web_sources", "related_mail")
+        all_timings: list[dict[str, float]] = []
+        errors: list[BaseException] = []
+
+        def _turn() -> None:
+            stage_timings: dict[str, float] = {}
+            try:
+                run_enrichment_stages(
+                    stages=[EnrichmentStage(name=name, run=lambda: time.sleep(0.05)) for name in stage_names],
+                    stage_timings=stage_timings,
+                )
+            except BaseException as exc:  # noqa: BLE001
+                errors.append(exc)
+            all_timings.append(stage_timings)
+
+        env = {
+            ENRICHMENT_STAGE_TIMEOUT_MS_ENV: "150",
+            ENRICHMENT_BUDGET_MS_ENV: "5000",
+            ENRICHMENT_MAX_WORKERS_ENV: "2",
+            CHAT_STREAM_MAX_CONCURRENCY_ENV: "1",
+        }
+        with patch.dict(os.environ, env), patch.object(search_chat_enrichment_scheduler, "_EXECUTOR", None):
+            threads = [threading.Thread(target=_turn) for _ in range(turn_count)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(timeout=10)
+            executor = search_chat_enrichment_scheduler._EXECUTOR
+        assert executor is not None
+        executor.shutdown(wait=True)
+
+        self.assertEqual([], errors)
+        self.assertEqual(turn_count, len(all_timings))
+        timed_out = [key for timings in all_timings for key in timings if key.endswith("_timed_out")]
+        self.assertEqual([], timed_out)
+
+    def test_pool_is_sized_for_concurrent_stream_turns(self) -> None:
+        """pool 크기는 동시 스트리밍 턴 상한 × 단계 수보다 작으면 안 된다."""
+        with patch.dict(os.environ, {ENRICHMENT_MAX_WORKERS_ENV: "8", CHAT_STREAM_MAX_CONCURRENCY_ENV: "8"}):
+            with patch.object(search_chat_enrichment_scheduler, "_EXECUTOR", None):
+                executor = search_chat_enrichment_scheduler._get_executor()
+        self.assertIsInstance(executor, ThreadPoolExecutor)
+        self.assertEqual(24, executor._max_workers)
+        executor.shutdown(wait=True)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import unittest
+
+from app.api.search_chat_stage_events import (
+    BUS_EVENT_RESULT,
+    BUS_EVENT_STAGE,
+    BUS_EVENT_TOKEN,
+    STAGE_STATUS_COMPLETED,
+    STAGE_STATUS_STARTED,
+    ChatStreamEventBus,
+    bind_stage_event_bus,
+    publish_stage_event,
+    reset_stage_event_bus,
+)
+
+
+class SearchChatStageEventsTest(unittest.TestCase):
+    """단계 이벤트 버스의 발행 순서/context 바인딩 규칙을 검증한다."""
+
+    def test_bus_delivers_events_in_publish_order(self) -> None:
+        """토큰/단계/결과 이벤트는 발행 순서대로 전달되고, 비어 있으면 None이어야 한다."""
+        bus = ChatStreamEventBus()
+        bus.publish_stage(stage="llm_call", status=STAGE_STATUS_STARTED)
+        bus.publish_token("안녕")
+        bus.publish_stage(stage="llm_call", status=STAGE_STATUS_COMPLETED, elapsed_ms=10.06)
+        bus.publish_result({"answer": "안녕"})
+        events = [bus.next_event(timeout_sec=0.01) for _ in range(4)]
+        self.assertEqual(
+            [
+                (BUS_EVENT_STAGE, {"stage": "llm_call", "status": "started"}),
+                (BUS_EVENT_TOKEN, "안녕"),
+                (BUS_EVENT_STAGE, {"stage": "llm_call", "status": "completed", "elapsed_ms": 10.1}),
+                (BUS_EVENT_RESULT, {"answer": "안녕"}),
+            ],
+            events,
+        )
+        self.assertIsNone(bus.next_event(timeout_sec=0.01))
+
+    def test_publish_stage_event_is_noop_without_bound_bus(self) -> None:
+        """버스가 바인딩된 context에서만 발행하고, reset 이후에는 no-op이어야 한다."""
+        bus = ChatStreamEventBus()
+        publish_stage_event(stage="intent_parse", status=STAGE_STATUS_STARTED)
+        token = bind_stage_event_bus(bus)
+        try:
+            publish_stage_event(stage="intent_parse", status=STAGE_STATUS_COMPLETED, elapsed_ms=3.0)
+        finally:
+            reset_stage_event_bus(token)
+        publish_stage_event(stage="context_fetch", status=STAGE_STATUS_STARTED)
+        self.assertEqual(
+            (BUS_EVENT_STAGE, {"stage": "intent_parse", "status": "completed", "elapsed_ms": 3.0}),
+            bus.next_event(timeout_sec=0.01),
+        )
+        self.assertIsNone(bus.next_event(timeout_sec=0.01))
+
+
+if __name__ == "__main__":
+    unittest.main()
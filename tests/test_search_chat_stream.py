@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import time
 import unittest
 from unittest.mock import MagicMock
 from unittest.mock import patch
@@ -189,6 +190,75 @@ class SearchChatStreamTest(unittest.TestCase):
         self.assertNotIn("pending_approval", response.text)
         fake_agent.resume_pending_actions.assert_called_once()
 
+    def test_search_chat_reports_stage_elapsed_from_each_stage_start(self) -> None:
+        """context_fetch 시간은 앞 단계(intent_parse) 소요를 포함하지 않고, 턴 기준 시각은 별도 키로 남아야 한다."""
+        fake_agent = MagicMock()
+        fake_agent.execute_turn.return_value = {
+            "status": "completed",
+            "thread_id": "thread-1",
+            "answer": "테스트 응답",
+            "interrupts": [],
+        }
+        fake_agent.get_last_assistant_answer.return_value = "테스트 응답"
+        fake_agent.get_last_tool_payload.return_value = {}
+        with patch("app.api.routes.is_openai_key_configured", return_value=True):
+            with patch("app.api.routes.get_deep_chat_agent", return_value=fake_agent):
+                with patch(
+                    "app.api.search_chat_flow.record_intent_turn_decomposition",
+                    side_effect=lambda **_: time.sleep(0.2),
+                ):
+                    response = self.client.post("/search/chat", json={"message": "현재메일 요약"})
+
+        self.assertEqual(200, response.status_code)
+        stage_elapsed = response.json()["metadata"]["stage_elapsed_ms"]
+        self.assertGreaterEqual(stage_elapsed["intent_parse"], 200.0)
+        self.assertLess(stage_elapsed["context_fetch"], 200.0)
+        self.assertGreaterEqual(stage_elapsed["context_fetch_offset_ms"], stage_elapsed["intent_parse_offset_ms"])
+        self.assertGreaterEqual(stage_elapsed["intent_parse_offset_ms"], 200.0)
+
+    def test_search_chat_stream_clears_preview_before_auto_retry(self) -> None:
+        """자동 재시도 전에는 1차 시도 미리보기를 replace로 비워 두 시도의 토큰이 이어 붙지 않아야 한다."""
+        fake_agent = MagicMock()
+        fake_agent.resume_pending_actions.return_value = {
+            "status": "completed",
+            "answer": "요청을 취소했습니다.",
+            "thread_id": "t-1",
+            "interrupts": [],
+        }
+        turn_results = [
+            (
+                "승인 확인 ",
+                {
+                    "status": "interrupted",
+                    "answer": "회의실/일정/ToDo 실행 전 승인 확인이 필요합니다.",
+                    "thread_id": "t-1",
+                    "interrupts": [{"interrupt_id": "i-1", "actions": [{"name": "create_outlook_todo"}]}],
+                },
+            ),
+            ("요약 결과", {"status": "completed", "answer": "요약 결과", "thread_id": "t-1", "interrupts": []}),
+        ]
+
+        def _execute_turn_side_effect(agent, user_message, thread_id, delta_callback=None):
+            delta, result = turn_results.pop(0)
+            if callable(delta_callback):
+                delta_callback(delta)
+            return result
+
+        with patch("app.api.routes.is_openai_key_configured", return_value=True):
+            with patch("app.api.routes.get_deep_chat_agent", return_value=fake_agent):
+                with patch("app.api.routes._execute_agent_turn", side_effect=_execute_turn_side_effect):
+                    response = self.client.post(
+                        "/search/chat/stream",
+                        json={"message": "현재메일 3~5줄로 요약"},
+                    )
+
+        self.assertEqual(200, response.status_code)
+        first_token_at = response.text.index('"text": "승인 확인 "')
+        reset_at = response.text.index('event: replace\ndata: {"phase": "replace", "text": ""}')
+        retry_token_at = response.text.index('event: token\ndata: {"phase": "token", "text": "요약 결과"}')
+        self.assertLess(first_token_at, reset_at)
+        self.assertLess(reset_at, retry_token_at)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from app.api.contracts import ChatRequest
+from app.api.search_chat_stage_events import STAGE_STATUS_COMPLETED, STAGE_STATUS_STARTED, publish_stage_event
+from app.api.search_chat_stream_async import astream_search_chat_events
+from app.api.search_chat_stream_utils import GENERAL_STREAM_PHASE_STEPS
+
+
+async def _never_disconnected() -> bool:
+    """연결이 유지되는 클라이언트를 흉내 낸다."""
+    return False
+
+
+async def _collect(payload: ChatRequest, runner: object, is_disconnected: object = _never_disconnected) -> list[str]:
+    """비동기 스트림 이벤트를 모두 수집한다."""
+    return [item async for item in astream_search_chat_events(payload=payload, runner=runner, is_disconnected=is_disconnected)]
+
+
+class SearchChatStreamAsyncTest(unittest.TestCase):
+    """asyncio SSE 스트림의 완료/연결 종료 취소/동시 실행 제한 규칙을 검증한다."""
+
+    def test_stream_emits_tokens_and_completed(self) -> None:
+        """runner 토큰과 최종 completed 이벤트를 순서대로 전달해야 한다."""
+
+        def _runner(_payload: ChatRequest, _prefix: str, on_token: object) -> dict[str, object]:
+            if callable(on_token):
+                on_token("완료")
+            return {"status": "completed", "thread_id": "thread-1", "answer": "완료", "metadata": {}}
+
+        events = asyncio.run(_collect(payload=ChatRequest(message="테스트"), runner=_runner))
+        self.assertTrue(events[0].startswith("event: progress"))
+        self.assertTrue(any(item.startswith("event: token") for item in events))
+        self.assertTrue(events[-1].startswith("event: completed"))
+        self.assertIn("thread-1", events[-1])
+
+    def test_disconnect_cancels_running_turn(self) -> None:
+        """클라이언트 연결이 끊기면 실행 중인 턴이 다음 토큰 발행에서 취소되어야 한다."""
+        state = {"cancelled": False, "tokens": 0}
+        turn_finished = threading.Event()
+
+        def _runner(_payload: ChatRequest, _prefix: str, on_token: object) -> dict[str, object]:
+            try:
+                for _ in range(200):
+                    time.sleep(0.01)
+                    if callable(on_token):
+                        on_token("x")
+                    state["tokens"] += 1
+            except asyncio.CancelledError:
+                state["cancelled"] = True
+                raise
+            finally:
+                turn_finished.set()
+            return {"status": "completed", "thread_id": "thread-1", "answer": "x", "metadata": {}}
+
+        async def _disconnected() -> bool:
+            return True
+
+        async def _run() -> list[str]:
+            events: list[str] = []
+            stream = astream_search_chat_events(
+                payload=ChatRequest(message="테스트"),
+                runner=_runner,
+                is_disconnected=_disconnected,
+            )
+            async for item in stream:
+                events.append(item)
+                if item.startswith("event: token"):
+                    await asyncio.sleep(0.05)
+            await asyncio.to_thread(turn_finished.wait, 2.0)
+            return events
+
+        with patch("app.api.search_chat_stream_async.STREAM_DISCONNECT_CHECK_SEC", 0.02):
+            events = asyncio.run(_run())
+        self.assertTrue(state["cancelled"])
+        self.assertLess(state["tokens"], 200)
+        self.assertFalse(any(item.startswith("event: completed") for item in events))
+
+    def test_busy_response_when_concurrency_slot_unavailable(self) -> None:
+        """동시 실행 한도를 넘긴 요청은 대기 시간 초과 후 server-busy로 끝나야 한다."""
+        release = threading.Event()
+
+        def _blocking_runner(_payload: ChatRequest, _prefix: str, on_token: object) -> dict[str, object]:
+            release.wait(2.0)
+            return {"status": "completed", "thread_id": "thread-1", "answer": "첫 요청", "metadata": {}}
+
+        async def _run() -> tuple[list[str], list[str]]:
+            first = asyncio.create_task(_collect(payload=ChatRequest(message="첫 요청"), runner=_blocking_runner))
+            await asyncio.sleep(0.05)
+            second = await _collect(payload=ChatRequest(message="두번째 요청"), runner=_blocking_runner)
+            release.set()
+            return await first, second
+
+        env = {"MOLDUBOT_CHAT_STREAM_MAX_CONCURRENCY": "1"}
+        with (
+            patch.dict(os.environ, env, clear=False),
+            patch("app.api.search_chat_stream_async.STREAM_DISCONNECT_CHECK_SEC", 0.02),
+            patch("app.api.search_chat_stream_async._resolve_queue_timeout_sec", return_value=0.1),
+        ):
+            first_events, second_events = asyncio.run(_run())
+        self.assertIn("첫 요청", first_events[-1])
+        self.assertTrue(any('"phase": "queued"' in item for item in second_events))
+        self.assertIn("server-busy", second_events[-1])
+
+
+    def test_stream_emits_real_stage_events_in_publish_order(self) -> None:
+        """runner가 발행한 단계 시작/완료가 progress/stage 이벤트로 발행 순서대로 전달돼야 한다."""
+        payload = ChatRequest(message="테스트")
+
+        def _runner(_payload: ChatRequest, _prefix: str, on_token: object) -> dict[str, object]:
+            publish_stage_event(stage="intent_parse", status=STAGE_STATUS_STARTED)
+            publish_stage_event(stage="intent_parse", status=STAGE_STATUS_COMPLETED, elapsed_ms=12.34)
+            publish_stage_event(stage="llm_call", status=STAGE_STATUS_STARTED)
+            if callable(on_token):
+                on_token("완료")
+            publish_stage_event(stage="llm_call", status=STAGE_STATUS_COMPLETED, elapsed_ms=250.0)
+            return {"status": "completed", "thread_id": "thread-1", "answer": "완료", "metadata": {}}
+
+        events = asyncio.run(_collect(payload=payload, runner=_runner))
+        event_names = [item.split("\n", 1)[0].replace("event: ", "") for item in events]
+        self.assertEqual(
+            ["progress", "progress", "stage", "progress", "token", "stage", "progress", "completed"],
+            event_names,
+        )
+        intent_started = json.loads(events[1].split("data: ", 1)[1])
+        self.assertEqual("intent_parse", intent_started["phase"])
+        self.assertEqual(2, intent_started["step"])
+        self.assertEqual(len(GENERAL_STREAM_PHASE_STEPS), intent_started["total_steps"])
+        intent_completed = json.loads(events[2].split("data: ", 1)[1])
+        self.assertEqual({"phase", "status", "step", "total_steps", "elapsed_ms"}, set(intent_completed))
+        self.assertEqual(12.3, intent_completed["elapsed_ms"])
+
+    def test_stream_sends_keepalive_comment_without_fake_phase(self) -> None:
+        """이벤트가 없는 구간에는 단계 순환 대신 SSE keepalive 주석만 보내야 한다."""
+        payload = ChatRequest(message="테스트")
+
+        def _runner(_payload: ChatRequest, _prefix: str, on_token: object) -> dict[str, object]:
+            time.sleep(0.05)
+            return {"status": "completed", "thread_id": "thread-1", "answer": "", "metadata": {}}
+
+        with (
+            patch("app.api.search_chat_stream_async.STREAM_KEEPALIVE_SEC", 0.01),
+            patch("app.api.search_chat_stream_async.STREAM_DISCONNECT_CHECK_SEC", 0.01),
+        ):
+            events = asyncio.run(_collect(payload=payload, runner=_runner))
+        self.assertTrue(any(item.startswith(": keepalive") for item in events))
+        progress_events = [item for item in events if item.startswith("event: progress")]
+        self.assertEqual(2, len(progress_events))
+
+    def test_stream_returns_internal_error_when_runner_raises(self) -> None:
+        """runner가 예외로 끝나도 스트림은 internal-error completed 이벤트로 종료돼야 한다."""
+        payload = ChatRequest(message="테스트")
+
+        def _runner(_payload: ChatRequest, _prefix: str, on_token: object) -> dict[str, object]:
+            raise RuntimeError("boom")
+
+        events = asyncio.run(_collect(payload=payload, runner=_runner))
+        self.assertIn("internal-error", events[-1])
+
+    def test_stream_emits_token_events_when_runner_pushes_tokens(self) -> None:
+        """runner가 토큰 콜백을 호출하면 SSE token 이벤트가 포함돼야 한다."""
+        payload = ChatRequest(message="테스트")
+
+        def _runner(_payload: ChatRequest, _prefix: str, on_token: object) -> dict[str, object]:
+            if callable(on_token):
+                on_token("안녕")
+                on_token(" 하세요")
+            return {"status": "completed", "thread_id": "thread-1", "answer": "완료", "metadata": {}}
+
+        events = asyncio.run(_collect(payload=payload, runner=_runner))
+        token_events = [item for item in events if "event: token" in item]
+        self.assertGreaterEqual(len(token_events), 2)
+        self.assertTrue(any("안녕" in item for item in token_events))
+        self.assertTrue(any(" 하세요" in item for item in token_events))
+
+    def test_stream_emits_replace_event_when_final_answer_differs(self) -> None:
+        """스트리밍 미리보기와 최종 답변이 다르면 replace 이벤트로 교정해야 한다."""
+        payload = ChatRequest(message="테스트")
+
+        def _runner(_payload: ChatRequest, _prefix: str, on_token: object) -> dict[str, object]:
+            if callable(on_token):
+                on_token("- 첫 줄")
+            return {"status": "completed", "thread_id": "thread-1", "answer": "## 요약\n- 첫 줄", "metadata": {}}
+
+        events = asyncio.run(_collect(payload=payload, runner=_runner))
+        replace_events = [item for item in events if "event: replace" in item]
+        self.assertEqual(1, len(replace_events))
+        self.assertIn("## 요약", replace_events[0])
+        self.assertLess(
+            events.index(replace_events[0]),
+            next(index for index, item in enumerate(events) if "event: completed" in item),
+        )
+
+    def test_stream_skips_replace_event_when_tokens_match_answer(self) -> None:
+        """스트리밍 토큰이 최종 답변과 같으면 replace 이벤트를 보내면 안 된다."""
+        payload = ChatRequest(message="테스트")
+
+        def _runner(_payload: ChatRequest, _prefix: str, on_token: object) -> dict[str, object]:
+            if callable(on_token):
+                on_token("완")
+                on_token(" ")
+                on_token("료")
+            return {"status": "completed", "thread_id": "thread-1", "answer": "완 료", "metadata": {}}
+
+        events = asyncio.run(_collect(payload=payload, runner=_runner))
+        self.assertFalse(any("event: replace" in item for item in events))
+        self.assertEqual(3, len([item for item in events if "event: token" in item]))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from app.core.sqlite_pool import SQLiteConnectionPool, close_sqlite_pools, get_sqlite_pool
+
+
+class SQLiteConnectionPoolTest(unittest.TestCase):
+    """
+    공유 SQLite 연결 풀의 연결 재사용/트랜잭션/WAL 동작을 검증한다.
+    """
+
+    def setUp(self) -> None:
+        """테스트용 임시 DB를 만든다."""
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self._db_path = Path(self._temp_dir.name) / "emails.db"
+        conn = sqlite3.connect(str(self._db_path))
+        conn.execute("CREATE TABLE emails (message_id TEXT PRIMARY KEY, subject TEXT)")
+        conn.commit()
+        conn.close()
+        self._pool = SQLiteConnectionPool(db_path=self._db_path)
+
+    def tearDown(self) -> None:
+        """풀과 임시 디렉터리를 정리한다."""
+        self._pool.close()
+        close_sqlite_pools()
+        self._temp_dir.cleanup()
+
+    def test_connections_use_wal_journal_mode(self) -> None:
+        """
+        풀 연결은 WAL 모드와 busy_timeout이 적용돼야 한다.
+        """
+        with self._pool.read() as conn:
+            journal_mode = str(conn.execute("PRAGMA journal_mode").fetchone()[0]).lower()
+            busy_timeout = int(conn.execute("PRAGMA busy_timeout").fetchone()[0])
+        self.assertEqual("wal", journal_mode)
+        self.assertEqual(5000, busy_timeout)
+
+    def test_read_reuses_thread_local_connection(self) -> None:
+        """
+        같은 스레드의 반복 읽기는 연결을 새로 열지 않아야 한다.
+        """
+        with self._pool.read() as first:
+            pass
+        with self._pool.read() as second:
+            pass
+        self.assertIs(first, second)
+        self.assertEqual(1, self._pool.get_stats()["connections_opened"])
+
+    def test_read_applies_row_factory_only_inside_block(self) -> None:
+        """
+        row_factory 인자는 블록 안에서만 적용되고 종료 후 복원돼야 한다.
+        """
+        with self._pool.read(row_factory=sqlite3.Row) as conn:
+            row = conn.execute("SELECT 1 AS value").fetchone()
+            self.assertEqual(1, row["value"])
+        self.assertIsNone(conn.row_factory)
+
+    def test_write_commits_on_success_and_rolls_back_on_error(self) -> None:
+        """
+        write 블록은 정상 종료 시 commit, 예외 시 rollback해야 한다.
+        """
+        with self._pool.write() as conn:
+            conn.execute("INSERT INTO emails VALUES ('m-1', 'first')")
+        with self.assertRaises(RuntimeError):
+            with self._pool.write() as conn:
+                conn.execute("INSERT INTO emails VALUES ('m-2', 'second')")
+                raise RuntimeError("boom")
+        with self._pool.read() as conn:
+            rows = conn.execute("SELECT message_id FROM emails ORDER BY message_id").fetchall()
+        self.assertEqual([("m-1",)], rows)
+
+    def test_read_is_not_blocked_by_open_write(self) -> None:
+        """
+        다른 스레드가 쓰기 트랜잭션을 열고 있어도 읽기는 마지막 commit 상태를 바로 읽어야 한다.
+        """
+        write_started = threading.Event()
+        release_write = threading.Event()
+
+        def _writer() -> None:
+            with self._pool.write() as conn:
+                conn.execute("INSERT INTO emails VALUES ('m-pending', 'pending')")
+                write_started.set()
+                release_write.wait(timeout=5)
+
+        thread = threading.Thread(target=_writer)
+        thread.start()
+        try:
+            self.assertTrue(write_started.wait(timeout=5))
+            with self._pool.read() as conn:
+                count = int(conn.execute("SELECT COUNT(*) FROM emails").fetchone()[0])
+            self.assertEqual(0, count)
+        finally:
+            release_write.set()
+            thread.join(timeout=5)
+        with self._pool.read() as conn:
+            count = int(conn.execute("SELECT COUNT(*) FROM emails").fetchone()[0])
+        self.assertEqual(1, count)
+
+    def test_reopens_connection_when_db_file_is_replaced(self) -> None:
+        """
+        DB 파일이 교체되면 이전 파일 연결을 버리고 새 파일을 읽어야 한다.
+        """
+        with self._pool.read() as conn:
+            conn.execute("SELECT COUNT(*) FROM emails").fetchone()
+        replacement = Path(self._temp_dir.name) / "replacement.db"
+        other = sqlite3.connect(str(replacement))
+        other.execute("CREATE TABLE emails (message_id TEXT PRIMARY KEY, subject TEXT)")
+        other.execute("INSERT INTO emails VALUES ('m-new', 'new')")
+        other.commit()
+        other.close()
+        os.replace(replacement, self._db_path)
+        for suffix in ("-wal", "-shm"):
+            Path(f"{self._db_path}{suffix}").unlink(missing_ok=True)
+        with self._pool.read() as conn:
+            rows = conn.execute("SELECT message_id FROM emails").fetchall()
+        self.assertEqual([("m-new",)], rows)
+
+    def test_get_sqlite_pool_returns_shared_instance_per_path(self) -> None:
+        """
+        같은 경로는 같은 풀 인스턴스를 공유해야 한다.
+        """
+        first = get_sqlite_pool(self._db_path)
+        second = get_sqlite_pool(str(self._db_path))
+        self.assertIs(first, second)
+
+
+if __name__ == "__main__":
+    unittest.main()
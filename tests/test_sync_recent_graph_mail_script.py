@@ -36,6 +36,7 @@ class SyncRecentGraphMailScriptTest(unittest.TestCase):
         payload = json.loads(result.stdout)
         self.assertTrue(payload["dry_run"])
         self.assertEqual(5, payload["limit"])
+        self.assertEqual("delta", payload["mode"])
         self.assertEqual(str(db_path), payload["db_path"])
 
 
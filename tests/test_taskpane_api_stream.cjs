@@ -87,7 +87,8 @@ test('taskpane api uses stream response and emits progress callback', async () =
         'event: progress\ndata: {"phase":"processing","message":"처리중"}\n\n',
         'event: token\ndata: {"phase":"token","text":"완"}\n\n',
         'event: token\ndata: {"phase":"token","text":"료"}\n\n',
-        'event: completed\ndata: {"answer":"완료","metadata":{"source":"deep-agent"}}\n\n',
+        'event: replace\ndata: {"phase":"replace","text":"완료."}\n\n',
+        'event: completed\ndata: {"answer":"완료.","metadata":{"source":"deep-agent"}}\n\n',
       ]);
     }
     fallbackCalled = true;
@@ -108,14 +109,14 @@ test('taskpane api uses stream response and emits progress callback', async () =
     },
     null,
     (tokenPayload) => {
-      tokenEvents.push(String(tokenPayload && tokenPayload.text ? tokenPayload.text : ''));
+      tokenEvents.push([String(tokenPayload && tokenPayload.text ? tokenPayload.text : ''), Boolean(tokenPayload.replace)]);
     }
   );
 
   assert.equal(fallbackCalled, false);
-  assert.equal(result.answer, '완료');
+  assert.equal(result.answer, '완료.');
   assert.deepEqual(events, ['processing']);
-  assert.deepEqual(tokenEvents, ['완', '료']);
+  assert.deepEqual(tokenEvents, [['완', false], ['료', false], ['완료.', true]]);
 });
 
 test('taskpane api keeps thread_id and forwards runtime scope option', async () => {
@@ -169,8 +169,11 @@ test('taskpane send updates streaming assistant preview and finalizes message',
     chatApi: {
       requestAssistantReply: async (_message, _onProgress, _runtimeOptions, onToken) => {
         if (typeof onToken === 'function') {
+          onToken({ text: '재시도 전 ' });
+          onToken({ text: '', replace: true });
           onToken({ text: '수신실패 ' });
           onToken({ text: '주소는 A@B.COM' });
+          onToken({ text: '수신실패 주소는 A@B.COM 입니다.', replace: true });
         }
         return { answer: '수신실패 주소는 A@B.COM 입니다.', metadata: { elapsed_ms: 88 } };
       },
@@ -228,7 +231,10 @@ test('taskpane send updates streaming assistant preview and finalizes message',
   await sender.sendMessage();
 
   assert.equal(calls.some((item) => item[0] === 'begin'), true);
-  assert.equal(calls.some((item) => item[0] === 'update' && item[1] === '수신실패 주소는 A@B.COM'), true);
+  assert.deepEqual(
+    calls.filter((item) => item[0] === 'update').map((item) => item[1]),
+    ['재시도 전 ', '', '수신실패 ', '수신실패 주소는 A@B.COM', '수신실패 주소는 A@B.COM 입니다.']
+  );
   assert.equal(calls.some((item) => item[0] === 'finalize' && item[1] === '수신실패 주소는 A@B.COM 입니다.'), true);
   assert.equal(calls.some((item) => item[0] === 'addMessage' && item[1] === 'assistant'), false);
 });
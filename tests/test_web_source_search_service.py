@@ -63,10 +63,10 @@ class WebSourceSearchServiceTest(unittest.TestCase):
         )
 
     @patch("app.services.web_source_search_service.os.getenv", return_value="test-key")
-    @patch("app.services.web_source_search_service.httpx.post")
+    @patch("app.services.web_source_search_service._get_http_client")
     def test_search_web_sources_normalizes_results(
         self,
-        mocked_post: Mock,
+        mocked_get_http_client: Mock,
         _mocked_getenv: Mock,
     ) -> None:
         """
@@ -90,7 +90,7 @@ class WebSourceSearchServiceTest(unittest.TestCase):
             ]
         }
         fake_response.raise_for_status.return_value = None
-        mocked_post.return_value = fake_response
+        mocked_get_http_client.return_value.post.return_value = fake_response
 
         result = search_web_sources("latency optimization", max_results=4)
         self.assertEqual(1, len(result))